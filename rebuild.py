@@ -8,6 +8,13 @@ import os
 import subprocess
 import sys
 from datetime import datetime
+from pathlib import Path
+
+# Build steps run in this process so they share one load of the repository data
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+
+from build_research_platform import ResearchPlatformBuilder
+from generate_markdown import main as generate_markdown
 
 
 def run_command(cmd: str, description: str) -> bool:
@@ -29,6 +36,19 @@ def run_command(cmd: str, description: str) -> bool:
         return False
 
 
+def run_step(step, description: str) -> bool:
+    """Run a build step in this process and return success status."""
+    print(f"\n{'='*70}")
+    print(f"{description}")
+    print(f"{'='*70}")
+
+    try:
+        return step() is not False
+    except Exception as e:
+        print(f"ERROR: {e}")
+        return False
+
+
 def main():
     """Main execution."""
     print("=" * 70)
@@ -50,8 +70,9 @@ def main():
     print()
 
     # Step 1: Run main build
-    success = run_command(
-        f"python scripts/build_research_platform.py {org_name}",
+    builder = ResearchPlatformBuilder(org_name, token or "")
+    success = run_step(
+        lambda: not builder.build_platform()["errors"],
         "Step 1: Running complete platform build (10 phases)",
     )
 
@@ -60,9 +81,7 @@ def main():
         sys.exit(1)
 
     # Step 2: Generate markdown
-    success = run_command(
-        "python scripts/generate_markdown.py", "Step 2: Generating all markdown pages"
-    )
+    success = run_step(generate_markdown, "Step 2: Generating all markdown pages")
 
     if not success:
         print("\n[FAIL] Markdown generation failed")
@@ -6,10 +6,17 @@ Includes heatmaps, sunburst charts, treemaps, and animated visualizations.
 
 import json
 import os
+import sys
 from collections import defaultdict
+from pathlib import Path
 
 from viz_footer import inject_footer_into_html
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.research_platform.storage.dataset import load_repository_records
+
 try:
     import plotly.express as px
     import plotly.graph_objects as go
@@ -399,9 +406,8 @@ def main():
         return
 
     # Load data
-    if os.path.exists("data/repos.json"):
-        with open("data/repos.json", encoding="utf-8") as f:
-            repos_data = json.load(f)
+    if os.path.exists("data/repos") or os.path.exists("data/repos.json"):
+        repos_data = load_repository_records()
 
         citation_report = None
         if os.path.exists("data/citation_report.json"):
@@ -0,0 +1,81 @@
+"""Build the local package index used to resolve transitive dependencies.
+
+Imports a registry snapshot exported as JSON (ecosystem -> package name ->
+requirements) into data/package_index.db. The dependency report expands
+each repository's declared packages against this index without network
+access; without it, only direct dependencies are reported.
+
+Usage:
+    python scripts/build_package_index.py [SNAPSHOT] [--output PATH] [--update]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.research_platform.storage.package_index import PackageIndex
+
+DEFAULT_SNAPSHOT = Path("data/package_snapshot.json")
+DEFAULT_INDEX = Path("data/package_index.db")
+
+
+def build_package_index(
+    snapshot: Path = DEFAULT_SNAPSHOT, output: Path = DEFAULT_INDEX, update: bool = False
+) -> int:
+    """
+    Import a registry snapshot into the package index.
+
+    Args:
+        snapshot: JSON file mapping ecosystem -> package name -> requirements
+        output: Package index database to write
+        update: Add to an existing index instead of rebuilding it, so packages
+            missing from the snapshot are kept
+
+    Returns:
+        Number of packages imported
+    """
+    if not update:
+        output.unlink(missing_ok=True)
+    with PackageIndex(output) as index:
+        return index.import_json(snapshot)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Import a package registry snapshot into the local package index"
+    )
+    parser.add_argument(
+        "snapshot",
+        nargs="?",
+        type=Path,
+        default=DEFAULT_SNAPSHOT,
+        help=f"JSON snapshot (default: {DEFAULT_SNAPSHOT})",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=DEFAULT_INDEX,
+        help=f"Package index database (default: {DEFAULT_INDEX})",
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Add to the existing index instead of rebuilding it",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.snapshot.exists():
+        print(f"ERROR: Package snapshot not found: {args.snapshot}")
+        return 1
+
+    count = build_package_index(args.snapshot, args.output, update=args.update)
+    print(f"Imported {count} packages from {args.snapshot} into {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,10 @@ import json
 import os
 import sys
 from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from advanced_visualizations import generate_advanced_visualizations
 from citation_tracker import generate_citation_report
@@ -15,14 +19,25 @@ from code_quality_analyzer import analyze_all_repositories
 from collaboration_network_analyzer import analyze_collaboration_network
 from community_features import generate_reproducibility_report
 from create_landing_page_viz import generate_landing_visualizations
+from export_search_data import export_search_data
 
 # Import all phase modules
+from fetch_org_data_research import create_fetcher
 from fetch_org_data_research import main as fetch_data
+from generate_dependency_tree import main as generate_dependency_tree
+from generate_quality_heatmap import main as generate_quality_heatmap
+from generate_timeseries_dashboard import main as generate_timeseries_dashboard
 from ml_topic_modeling import analyze_repository_topics
 from repository_health_scorer import generate_health_report
 from search_indexer import build_search_index
 from visualization_builder import generate_all_visualizations
 
+from src.research_platform.analyzers.corpus import DEFAULT_CORPUS_PATH, Corpus, build_corpus
+from src.research_platform.storage.datastore import get_datastore
+
+# Statistics of each registered cache are exported here as <name>.json
+CACHE_STATS_DIR = Path("data/cache_stats")
+
 
 class ResearchPlatformBuilder:
     """Orchestrate building of complete research platform."""
@@ -31,6 +46,9 @@ class ResearchPlatformBuilder:
         self.org_name = org_name
         self.github_token = github_token
         self.build_log = []
+        # Repository data is loaded once and shared by every phase
+        self.store = get_datastore()
+        self.caches = {}
 
     def log(self, message: str):
         """Log a build message."""
@@ -54,6 +72,21 @@ class ResearchPlatformBuilder:
             self.log(error_msg)
             return None, str(e)
 
+    def register_cache(self, name: str, cache):
+        """Register a cache whose statistics are reported at the end of the build."""
+        self.caches[name] = cache
+
+    def report_cache_stats(self) -> dict:
+        """Log and export the statistics of every registered cache."""
+        cache_stats = {}
+        for name, cache in self.caches.items():
+            self.log(f"Cache statistics ({name}):")
+            for line in cache.stats.summary_lines():
+                self.log(f"  {line}")
+            cache.stats.export(CACHE_STATS_DIR / f"{name}.json")
+            cache_stats[name] = cache.stats.to_dict()
+        return cache_stats
+
     def build_platform(self, skip_phases: list = None):
         """
         Build complete research platform.
@@ -76,16 +109,21 @@ class ResearchPlatformBuilder:
 
         # Phase 1: Fetch data with research metadata
         if "fetch_data" not in skip_phases:
-            result, error = self.run_phase("Phase 1: Data Fetching", fetch_data)
+            fetcher = create_fetcher()
+            self.register_cache("github", fetcher.cache)
+            result, error = self.run_phase("Phase 1: Data Fetching", fetch_data, fetcher)
             if error:
                 errors["fetch_data"] = error
                 self.log("CRITICAL: Data fetch failed. Cannot continue.")
-                return {"errors": errors, "log": self.build_log}
+                return {
+                    "errors": errors,
+                    "log": self.build_log,
+                    "cache_stats": self.report_cache_stats(),
+                }
 
         # Load repos data for subsequent phases
         try:
-            with open("data/repos.json", encoding="utf-8") as f:
-                repos_data = json.load(f)
+            repos_data = self.store.records()
             self.log(f"Loaded {len(repos_data)} repositories")
         except Exception as e:
             self.log(f"ERROR: Could not load repos data: {e}")
@@ -110,10 +148,23 @@ class ResearchPlatformBuilder:
             except Exception:
                 pass
 
+        # Tokenize READMEs, abstracts and notebooks once for search and topic modeling
+        corpus = None
+        if "corpus" not in skip_phases:
+            corpus, error = self.run_phase(
+                "Corpus Building", build_corpus, self.store.repositories(), DEFAULT_CORPUS_PATH
+            )
+            if error:
+                errors["corpus"] = error
+            else:
+                results["corpus"] = {"documents": len(corpus), "terms": len(corpus.terms)}
+        if corpus is None:
+            corpus = Corpus(DEFAULT_CORPUS_PATH)
+
         # Phase 3: Search indexing
         if "search" not in skip_phases:
             result, error = self.run_phase(
-                "Phase 3: Search Indexing", build_search_index, repos_data
+                "Phase 3: Search Indexing", build_search_index, repos_data, corpus=corpus
             )
             if error:
                 errors["search"] = error
@@ -202,6 +253,7 @@ class ResearchPlatformBuilder:
                 analyze_repository_topics,
                 repos_data,
                 "both",  # Use both NMF and LDA
+                corpus=corpus,
             )
             if error:
                 errors["ml_topics"] = error
@@ -244,9 +296,7 @@ class ResearchPlatformBuilder:
         if "dependency_tree" not in skip_phases:
             self.log("Generating dependency tree visualizations...")
             try:
-                import subprocess
-
-                subprocess.run([sys.executable, "scripts/generate_dependency_tree.py"], check=True)
+                generate_dependency_tree()
                 self.log("Dependency tree visualizations completed")
                 results["dependency_tree"] = "Generated"
             except Exception as e:
@@ -258,9 +308,7 @@ class ResearchPlatformBuilder:
         if "quality_heatmap" not in skip_phases:
             self.log("Generating code quality heatmap...")
             try:
-                import subprocess
-
-                subprocess.run([sys.executable, "scripts/generate_quality_heatmap.py"], check=True)
+                generate_quality_heatmap()
                 self.log("Code quality heatmap completed")
                 results["quality_heatmap"] = "Generated"
             except Exception as e:
@@ -272,11 +320,7 @@ class ResearchPlatformBuilder:
         if "timeseries" not in skip_phases:
             self.log("Generating time-series analytics...")
             try:
-                import subprocess
-
-                subprocess.run(
-                    [sys.executable, "scripts/generate_timeseries_dashboard.py"], check=True
-                )
+                generate_timeseries_dashboard()
                 self.log("Time-series analytics completed")
                 results["timeseries"] = "Generated"
             except Exception as e:
@@ -288,9 +332,7 @@ class ResearchPlatformBuilder:
         if "export_search" not in skip_phases:
             self.log("Exporting search data...")
             try:
-                import subprocess
-
-                subprocess.run([sys.executable, "scripts/export_search_data.py"], check=True)
+                export_search_data()
                 self.log("Search data export completed")
                 results["export_search"] = "Generated"
             except Exception as e:
@@ -299,6 +341,7 @@ class ResearchPlatformBuilder:
                 errors["export_search"] = str(e)
 
         # Save build log
+        cache_stats = self.report_cache_stats()
         self.log("=" * 60)
         self.log("BUILD COMPLETED")
         self.log(f"Errors: {len(errors)}")
@@ -310,6 +353,7 @@ class ResearchPlatformBuilder:
             "total_repos": len(repos_data),
             "phases_completed": len(results),
             "errors": errors,
+            "cache_stats": cache_stats,
             "log": self.build_log,
         }
 
@@ -333,6 +377,7 @@ def main():
         choices=[
             "fetch_data",
             "citations",
+            "corpus",
             "search",
             "visualizations",
             "community",
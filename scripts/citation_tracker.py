@@ -6,10 +6,22 @@ Citation tracking system: build citation graphs, track impact over time.
 import json
 import os
 import re
+import sys
 from collections import defaultdict
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.research_platform.storage.dataset import load_repository_records
+from src.research_platform.storage.history import (
+    MONTH_SECONDS,
+    CitationHistoryLog,
+    snapshot_metrics,
+)
+
 
 class CitationGraph:
     """Build and analyze citation networks between repositories and papers."""
@@ -198,75 +210,62 @@ class CitationGraph:
 
 
 class CitationHistoryTracker:
-    """Track citation history over time."""
+    """Track citation history over time in an append-only snapshot log."""
 
-    def __init__(self, history_file="data/citation_history.json"):
+    def __init__(
+        self,
+        history_file="data/citation_history.db",
+        legacy_file="data/citation_history.json",
+    ):
         self.history_file = history_file
-        self.history = self.load_history()
+        self.log = CitationHistoryLog(history_file)
 
-    def load_history(self) -> dict:
-        """Load citation history from file."""
-        if os.path.exists(self.history_file):
-            with open(self.history_file) as f:
-                return json.load(f)
-        return {}
+        # One-time migration of the JSON history written by earlier versions
+        if not len(self.log) and os.path.exists(legacy_file):
+            self.log.import_json(legacy_file)
 
-    def save_history(self) -> None:
-        """Save citation history to file."""
-        os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
-        with open(self.history_file, "w") as f:
-            json.dump(self.history, f, indent=2)
+    def close(self) -> None:
+        """Close the history log."""
+        self.log.close()
 
     def record_snapshot(self, repos_data: list[dict]) -> None:
-        """Record current citation counts."""
-        timestamp = datetime.now().isoformat()
-
-        for repo in repos_data:
-            repo_name = repo["name"]
-            research_meta = repo.get("research_metadata", {})
-            publications = research_meta.get("publications", [])
-
-            if repo_name not in self.history:
-                self.history[repo_name] = []
-
-            # Calculate current metrics
-            external_citations = sum(pub.get("citation_count", 0) for pub in publications)
-
-            snapshot = {
-                "timestamp": timestamp,
-                "external_citations": external_citations,
-                "publications_count": len(publications),
-                "stars": repo.get("stars", 0),
-                "forks": repo.get("forks", 0),
-            }
-
-            self.history[repo_name].append(snapshot)
-
-        self.save_history()
-
-    def get_growth_trends(self, repo_name: str) -> dict | None:
-        """Get citation growth trends for a repository."""
-        if repo_name not in self.history or len(self.history[repo_name]) < 2:
+        """Record current citation counts, downsampling old snapshots when due."""
+        self.log.append(snapshot_metrics(repos_data))
+        self.log.compact_if_due()
+
+    def get_growth_trends(
+        self,
+        repo_name: str,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> dict | None:
+        """
+        Get citation growth trends for a repository.
+
+        Args:
+            repo_name: Repository name
+            since: Start of the time window (whole history when None)
+            until: End of the time window (latest snapshot when None)
+        """
+        growth = self.log.growth(
+            repo_name,
+            since.timestamp() if since else None,
+            until.timestamp() if until else None,
+        )
+        if growth is None:
             return None
 
-        history = self.history[repo_name]
-        first = history[0]
-        last = history[-1]
+        citation_growth = growth["delta"]["external_citations"]
 
-        # Calculate growth
-        citation_growth = last["external_citations"] - first["external_citations"]
-        pub_growth = last["publications_count"] - first["publications_count"]
-
-        # Calculate average growth rate
-        time_span = len(history)
-        avg_citation_growth = citation_growth / time_span if time_span > 0 else 0
+        # Average growth per month of elapsed time (shorter spans count as one month)
+        months = max(growth["seconds"] / MONTH_SECONDS, 1.0)
 
         return {
             "total_growth": citation_growth,
-            "publication_growth": pub_growth,
-            "average_monthly_growth": avg_citation_growth,
-            "current_citations": last["external_citations"],
-            "snapshots": len(history),
+            "publication_growth": growth["delta"]["publications_count"],
+            "average_monthly_growth": citation_growth / months,
+            "current_citations": growth["last"]["external_citations"],
+            "snapshots": growth["snapshots"],
         }
 
 
@@ -295,6 +294,7 @@ def generate_citation_report(repos_data: list[dict]) -> dict[str, Any]:
         trend = tracker.get_growth_trends(repo_name)
         if trend:
             trends[repo_name] = trend
+    tracker.close()
 
     report = {
         "generated_at": datetime.now().isoformat(),
@@ -319,9 +319,10 @@ def main():
     print("=" * 60)
 
     # Load repos data
-    if os.path.exists("data/repos.json"):
-        with open("data/repos.json") as f:
-            repos_data = json.load(f)
+    if os.path.exists("data/repos") or os.path.exists("data/repos.json"):
+        repos_data = load_repository_records(
+            columns=["name", "stars", "forks", "research_metadata"]
+        )
 
         report = generate_citation_report(repos_data)
 
@@ -7,10 +7,17 @@ Analyzes code complexity, documentation, and structure.
 import json
 import os
 import re
+import sys
 from collections import defaultdict
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.research_platform.storage.dataset import load_repository_records
+
 
 class CodeQualityAnalyzer:
     """Analyze code quality metrics for repositories."""
@@ -225,9 +232,8 @@ def main():
     print("Code Quality Analyzer")
     print("=" * 60)
 
-    if os.path.exists("data/repos.json"):
-        with open("data/repos.json", encoding="utf-8") as f:
-            repos_data = json.load(f)
+    if os.path.exists("data/repos") or os.path.exists("data/repos.json"):
+        repos_data = load_repository_records()
 
         report = analyze_all_repositories(repos_data)
 
@@ -6,12 +6,19 @@ Fetches commit data from GitHub API and builds author co-authorship networks.
 
 import json
 import os
+import sys
 from collections import defaultdict
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from viz_footer import inject_footer_into_html
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.research_platform.storage.dataset import load_repository_records
+
 try:
     from github import Github, GithubException
 
@@ -452,9 +459,8 @@ def main():
 
     org_name = os.environ.get("GITHUB_ORG", "Digital-AI-Finance")
 
-    if os.path.exists("data/repos.json"):
-        with open("data/repos.json", encoding="utf-8") as f:
-            repos_data = json.load(f)
+    if os.path.exists("data/repos") or os.path.exists("data/repos.json"):
+        repos_data = load_repository_records()
 
         results = analyze_collaboration_network(repos_data, org_name, github_token)
 
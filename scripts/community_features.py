@@ -5,10 +5,17 @@ Community features: replication tracking, verification system, reproducibility s
 
 import json
 import os
+import sys
 from collections import defaultdict
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.research_platform.storage.dataset import load_repository_records
+
 
 class ReplicationTracker:
     """Track replication attempts and results."""
@@ -353,10 +360,9 @@ def main():
     print(f"   Verification summary: {summary}")
 
     # Load and test with real data if available
-    if os.path.exists("data/repos.json"):
+    if os.path.exists("data/repos") or os.path.exists("data/repos.json"):
         print("\n3. Generating Reproducibility Report...")
-        with open("data/repos.json") as f:
-            repos_data = json.load(f)
+        repos_data = load_repository_records()
 
         report = generate_reproducibility_report(repos_data)
         print(
@@ -4,15 +4,20 @@ Create compact, content-focused repository overview.
 Optimized for information density and research content discovery.
 """
 
-import json
+import sys
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.research_platform.storage.dataset import load_repository_records
+
 
 def load_repos() -> list[dict[str, Any]]:
     """Load repository data."""
-    with open("data/repos.json", encoding="utf-8") as f:
-        return json.load(f)
+    return load_repository_records()
 
 
 def categorize_repo(repo: dict[str, Any]) -> str:
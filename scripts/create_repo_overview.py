@@ -4,12 +4,18 @@ Generate Interactive Repository Overview
 Creates a visual, clickable gallery of all repositories
 """
 
-import json
 import os
+import sys
+from pathlib import Path
 from typing import Any
 
 from viz_footer import inject_footer_into_html
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.research_platform.storage.dataset import load_repository_records
+
 try:
     import plotly.graph_objects as go
     from plotly.subplots import make_subplots
@@ -20,10 +26,9 @@ except ImportError:
     print("Warning: plotly not installed. Skipping interactive visualizations.")
 
 
-def load_repositories(repos_file: str = "data/repos.json") -> list[dict[str, Any]]:
+def load_repositories(data_dir: str = "data") -> list[dict[str, Any]]:
     """Load repository data."""
-    with open(repos_file, encoding="utf-8") as f:
-        return json.load(f)
+    return load_repository_records(data_dir)
 
 
 def categorize_repository(repo: dict[str, Any]) -> str:
@@ -5,9 +5,12 @@ import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from search_indexer import SearchIndex
 
+from src.research_platform.storage.datastore import get_datastore
+
 
 def export_search_data(output_file: str = "docs/data/search_data.json"):
     """Export search index and repository data for web interface."""
@@ -39,12 +42,11 @@ def export_search_data(output_file: str = "docs/data/search_data.json"):
     # Convert inverted index to JSON-friendly format (term -> list of doc IDs)
     inverted_index = {term: list(doc_ids) for term, doc_ids in index.inverted_index.items()}
 
-    # Load repos.json for additional metadata
-    repos_file = Path("data/repos.json")
-    repos_data = []
-    if repos_file.exists():
-        with open(repos_file, encoding="utf-8") as f:
-            repos_data = json.load(f)
+    # Repository records for additional metadata (shared with the rest of the build)
+    try:
+        repos_data = get_datastore().records()
+    except FileNotFoundError:
+        repos_data = ()
 
     # Build quick lookup for repos
     repos_lookup = {repo["name"]: repo for repo in repos_data}
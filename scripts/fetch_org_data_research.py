@@ -4,11 +4,12 @@ Enhanced fetch_org_data with research metadata extraction.
 Extends the original fetcher with academic data integration.
 """
 
+import asyncio
 import json
 import os
 import sys
-from collections import Counter
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from fetch_academic_data import AcademicDataFetcher
@@ -18,6 +19,24 @@ from github import Github, GithubException
 from parse_research_metadata import parse_repository_metadata
 from tqdm import tqdm
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.research_platform.config.settings import Settings
+from src.research_platform.fetchers.github_fetcher import RECORD_KINDS, GitHubFetcher
+from src.research_platform.models.repository import Repository
+from src.research_platform.models.table import RepositoryTable
+from src.research_platform.storage.blobs import BlobStore
+from src.research_platform.storage.datastore import get_datastore
+
+CONFIG_PATH = Path("configs/production.yaml")
+
+# Deepest path (in "/" separators) fetch_repo_contents walks to
+MAX_CONTENT_DEPTH = 4
+
+# Git tree entry types and the contents-API types they correspond to
+CONTENT_TYPES = {"blob": "file", "tree": "dir", "commit": "submodule"}
+
 
 def get_github_client() -> Github:
     """Initialize GitHub client with authentication."""
@@ -37,6 +56,74 @@ def get_github_client() -> Github:
         sys.exit(1)
 
 
+def create_fetcher() -> GitHubFetcher:
+    """GitHub fetcher whose cache keeps READMEs, file trees and releases between builds."""
+    settings = Settings.from_yaml(CONFIG_PATH) if CONFIG_PATH.exists() else Settings.from_env()
+    return GitHubFetcher(settings)
+
+
+async def read_repository_records(
+    fetcher: GitHubFetcher, repos: list, previous: list[Repository]
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """
+    Read READMEs, file trees and releases through the fetcher's cache.
+
+    When cache warming is enabled, the entries of the previous build's
+    repositories most likely to have changed are refreshed first.
+
+    Args:
+        fetcher: Fetcher whose cache holds the records
+        repos: PyGithub repositories to read records for
+        previous: Repositories from the previous build
+
+    Returns:
+        Mapping of full name to the records that could be read, by kind
+    """
+    try:
+        summary = await fetcher.warm_cache(previous)
+        if summary:
+            print(
+                f"Cache warm-up: {summary['warmed']} refreshed, "
+                f"{summary['requests']} API requests"
+            )
+
+        records = {}
+        for repo in tqdm(repos, desc="Reading cached records"):
+            model = Repository(
+                id=repo.id,
+                name=repo.name,
+                full_name=repo.full_name,
+                default_branch=repo.default_branch,
+            )
+            # Failures are logged by the cache; the record is just left out
+            results = await asyncio.gather(
+                *[fetcher.repository_record(kind, model) for kind in RECORD_KINDS],
+                return_exceptions=True,
+            )
+            records[repo.full_name] = {
+                kind: result
+                for kind, result in zip(RECORD_KINDS, results)
+                if not isinstance(result, Exception)
+            }
+        return records
+    finally:
+        await fetcher.cache.close()
+
+
+def tree_contents(tree: dict[str, Any]) -> list[dict[str, Any]]:
+    """Repository contents, as fetch_repo_contents lists them, from a cached file tree."""
+    return [
+        {
+            "name": entry["path"].rsplit("/", 1)[-1],
+            "path": entry["path"],
+            "type": CONTENT_TYPES.get(entry["type"], entry["type"]),
+            "size": entry["size"] or 0,
+        }
+        for entry in tree["entries"]
+        if entry["path"].count("/") < MAX_CONTENT_DEPTH
+    ]
+
+
 def fetch_repo_contents(repo) -> list[dict[str, Any]]:
     """
     Fetch repository contents for metadata extraction.
@@ -72,24 +159,24 @@ def fetch_repo_contents(repo) -> list[dict[str, Any]]:
         return []
 
 
-def fetch_repo_data(repo, include_research=True) -> dict[str, Any]:
+def fetch_repo_data(repo, include_research=True, records=None) -> dict[str, Any]:
     """
     Extract relevant data from a repository object.
 
     Args:
         repo: GitHub repository object
         include_research: Whether to extract research metadata
+        records: README, file tree and release records read through the
+            cache (see read_repository_records)
 
     Returns:
         Repository data dictionary
     """
+    records = records or {}
     try:
         # Get README content
-        readme_content = ""
-        try:
-            readme = repo.get_readme()
-            readme_content = readme.decoded_content.decode("utf-8")
-        except:
+        readme_content = records.get("readme", {}).get("content")
+        if readme_content is None:
             readme_content = "No README available"
 
         # Get contributors count
@@ -99,20 +186,8 @@ def fetch_repo_data(repo, include_research=True) -> dict[str, Any]:
             contributors_count = 0
 
         # Get latest release
-        latest_release = None
-        try:
-            releases = repo.get_releases()
-            if releases.totalCount > 0:
-                latest = releases[0]
-                latest_release = {
-                    "tag": latest.tag_name,
-                    "name": latest.title,
-                    "published_at": latest.published_at.isoformat()
-                    if latest.published_at
-                    else None,
-                }
-        except:
-            pass
+        releases = records.get("releases", {}).get("releases")
+        latest_release = releases[0] if releases else None
 
         # Build basic data structure
         data = {
@@ -151,8 +226,11 @@ def fetch_repo_data(repo, include_research=True) -> dict[str, Any]:
         if include_research and readme_content != "No README available":
             print("  Extracting research metadata...")
             try:
-                # Fetch repo contents for deeper analysis
-                repo_contents = fetch_repo_contents(repo)
+                # Repo contents for deeper analysis, from the cached file tree
+                if "tree" in records:
+                    repo_contents = tree_contents(records["tree"])
+                else:
+                    repo_contents = fetch_repo_contents(repo)
 
                 # Parse research metadata
                 research_metadata = parse_repository_metadata(data, repo_contents)
@@ -204,32 +282,17 @@ def calculate_statistics(repos_data: list[dict]) -> dict[str, Any]:
     """Calculate organization-wide statistics including research metrics."""
     total_repos = len(repos_data)
 
-    # Basic statistics (from original)
-    languages = [r["language"] for r in repos_data if r["language"] != "Unknown"]
-    language_counts = Counter(languages)
-
-    all_topics = []
-    for repo in repos_data:
-        all_topics.extend(repo["topics"])
-    topic_counts = Counter(all_topics)
-
-    licenses = [r["license"] for r in repos_data]
-    license_counts = Counter(licenses)
+    # Basic statistics, computed column-wise
+    table = RepositoryTable.from_records(repos_data)
+    summary = table.summary()
+    total_stars = summary["total_stars"]
+    total_forks = summary["total_forks"]
+    total_contributors = summary["total_contributors"]
+    archived_count = summary["archived_repos"]
+    active_count = summary["active_repos"]
 
-    total_stars = sum(r["stars"] for r in repos_data)
-    total_forks = sum(r["forks"] for r in repos_data)
-    total_contributors = sum(r["contributors_count"] for r in repos_data)
-
-    archived_count = sum(1 for r in repos_data if r["archived"])
-    active_count = total_repos - archived_count
-
-    sorted_by_activity = sorted(
-        [r for r in repos_data if r["pushed_at"]], key=lambda x: x["pushed_at"], reverse=True
-    )
-    recent_repos = sorted_by_activity[:10]
-
-    sorted_by_stars = sorted(repos_data, key=lambda x: x["stars"], reverse=True)
-    popular_repos = sorted_by_stars[:10]
+    recent_repos = [repos_data[i] for i in table.top_k("pushed_at", 10)]
+    popular_repos = [repos_data[i] for i in table.top_k("stars", 10)]
 
     no_readme = [r["name"] for r in repos_data if r["readme"] == "No README available"]
 
@@ -274,9 +337,9 @@ def calculate_statistics(repos_data: list[dict]) -> dict[str, Any]:
         "total_contributors": total_contributors,
         "avg_stars": round(avg_stars, 2),
         "avg_forks": round(avg_forks, 2),
-        "languages": dict(language_counts.most_common(20)),
-        "topics": dict(topic_counts.most_common(20)),
-        "licenses": dict(license_counts),
+        "languages": table.language.most_common(20, exclude=("Unknown",)),
+        "topics": table.topics.most_common(20),
+        "licenses": table.license.counts(),
         "recent_repos": [{"name": r["name"], "pushed_at": r["pushed_at"]} for r in recent_repos],
         "popular_repos": [{"name": r["name"], "stars": r["stars"]} for r in popular_repos],
         "repos_without_readme": no_readme,
@@ -293,8 +356,14 @@ def calculate_statistics(repos_data: list[dict]) -> dict[str, Any]:
     return stats
 
 
-def main():
-    """Main execution function."""
+def main(fetcher: GitHubFetcher | None = None):
+    """
+    Main execution function.
+
+    Args:
+        fetcher: Fetcher whose cache serves READMEs, file trees and releases
+            (created from the production settings when omitted)
+    """
     print("=" * 60)
     print("GitHub Organization Data Fetcher (with Research Metadata)")
     print("=" * 60)
@@ -332,11 +401,25 @@ def main():
     repos = list(org.get_repos())
     print(f"Found {len(repos)} repositories")
 
+    # Data directory (also holds the previous build, used to prioritize cache warming)
+    data_dir = "data"
+    os.makedirs(data_dir, exist_ok=True)
+
+    try:
+        previous = list(get_datastore(data_dir).repositories())
+    except FileNotFoundError:
+        previous = []
+
+    # READMEs, file trees and releases come through the cache
+    print("\nReading READMEs, file trees and releases...")
+    fetcher = fetcher or create_fetcher()
+    records = asyncio.run(read_repository_records(fetcher, repos, previous))
+
     # Fetch data for each repository
     print("\nFetching detailed data for each repository...")
     repos_data = []
     for repo in tqdm(repos, desc="Processing repos"):
-        data = fetch_repo_data(repo, include_research=True)
+        data = fetch_repo_data(repo, include_research=True, records=records[repo.full_name])
         if data:
             repos_data.append(data)
 
@@ -351,16 +434,22 @@ def main():
     stats = calculate_statistics(repos_data)
 
     # Save to JSON files
-    data_dir = "data"
-    os.makedirs(data_dir, exist_ok=True)
-
     repos_file = os.path.join(data_dir, "repos.json")
+    dataset_dir = os.path.join(data_dir, "repos")
     stats_file = os.path.join(data_dir, "stats.json")
     research_file = os.path.join(data_dir, "research_metadata.json")
 
-    print(f"\nSaving data to {repos_file}...")
-    with open(repos_file, "w", encoding="utf-8") as f:
-        json.dump(repos_data, f, indent=2, ensure_ascii=False)
+    # Keep README text in the content-addressed blob store; records hold hashes
+    blobs = BlobStore(Path(data_dir) / "blobs")
+    stored_records = [blobs.externalize(repo) for repo in repos_data]
+    removed = blobs.garbage_collect(blobs.referenced(stored_records))
+    if removed:
+        print(f"Removed {removed} unreferenced blobs")
+
+    # Partitioned dataset read by the build scripts; repos.json is kept as a
+    # single-file export for external consumers
+    print(f"\nSaving data to {dataset_dir} and {repos_file}...")
+    get_datastore(data_dir).write(stored_records)
 
     print(f"Saving statistics to {stats_file}...")
     with open(stats_file, "w", encoding="utf-8") as f:
@@ -388,6 +477,7 @@ def main():
     print(f"  - Repos with notebooks: {stats['research']['repos_with_notebooks']}")
     print(f"  - Total publications: {stats['research']['total_publications']}")
     print("\nData saved to:")
+    print(f"  - {dataset_dir}/")
     print(f"  - {repos_file}")
     print(f"  - {stats_file}")
     print(f"  - {research_file}")
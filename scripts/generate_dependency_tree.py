@@ -4,7 +4,6 @@ Creates Plotly treemap and sunburst charts showing package dependencies
 across repositories, highlighting shared dependencies and ecosystem clusters.
 """
 
-import json
 import sys
 from pathlib import Path
 
@@ -14,18 +13,15 @@ import plotly.graph_objects as go
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.research_platform.analyzers.dependency_analyzer import DependencyAnalyzer
+from src.research_platform.analyzers.manifests import ManifestExtractor, open_manifest_cache
 from src.research_platform.models.repository import Repository
+from src.research_platform.storage.datastore import get_datastore
+from src.research_platform.storage.dependency_index import DependencyIndex
 
 
-def load_repositories(repos_file: Path = Path("data/repos.json")) -> list[Repository]:
-    """Load repository data from JSON file."""
-    if not repos_file.exists():
-        raise FileNotFoundError(f"Repository data not found: {repos_file}")
-
-    with open(repos_file, encoding="utf-8") as f:
-        repos_data = json.load(f)
-
-    return [Repository.from_dict(repo_data) for repo_data in repos_data]
+def load_repositories(data_dir: Path = Path("data")) -> list[Repository]:
+    """Load repository models, shared with other phases of the same build."""
+    return list(get_datastore(data_dir).repositories())
 
 
 def create_dependency_treemap(analysis: dict, output_path: Path) -> None:
@@ -354,14 +350,18 @@ def main():
     repositories = load_repositories()
     print(f"Loaded {len(repositories)} repositories")
 
-    # Analyze dependencies
+    # Analyze dependencies (only repositories with changed manifests are re-parsed)
     print("\nAnalyzing dependency patterns...")
-    analyzer = DependencyAnalyzer()
-    analysis = analyzer.analyze_dependency_patterns(repositories)
+    with open_manifest_cache() as cache, DependencyIndex(Path("data/dependency_index.db")) as index:
+        analyzer = DependencyAnalyzer(manifests=ManifestExtractor(cache=cache))
+        updated = analyzer.update_dependency_index(repositories, index)
+        analysis = analyzer.summarize_dependency_index(repositories, index)
 
+    print(f"  - Re-indexed repositories: {updated}")
     print(f"  - Total unique packages: {analysis['total_unique_packages']}")
     print(f"  - Total dependencies: {analysis['total_dependencies']}")
     print(f"  - Shared packages: {len(analysis.get('shared_dependencies', {}))}")
+    print(f"  - Packages with version drift: {len(analysis['version_drift'])}")
     print(f"  - Network nodes: {analysis['network_stats']['nodes']}")
     print(f"  - Network edges: {analysis['network_stats']['edges']}")
 
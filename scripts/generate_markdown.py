@@ -5,16 +5,28 @@ Generate markdown files from GitHub organization data.
 
 import json
 import os
+import sys
 from collections import defaultdict
 from datetime import datetime
+from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.research_platform.analyzers.corpus import build_corpus
+from src.research_platform.analyzers.dependency_analyzer import DependencyAnalyzer
+from src.research_platform.analyzers.manifests import ManifestExtractor, open_manifest_cache
+from src.research_platform.analyzers.related import RelatedIndex
+from src.research_platform.storage.blobs import BlobStore
+from src.research_platform.storage.datastore import get_datastore
+from src.research_platform.storage.dependency_index import DependencyIndex
+
 
 def load_data():
-    """Load repos and stats data from JSON files."""
-    with open("data/repos.json", encoding="utf-8") as f:
-        repos = json.load(f)
+    """Load repos and stats data."""
+    repos = get_datastore().records()
 
     with open("data/stats.json", encoding="utf-8") as f:
         stats = json.load(f)
@@ -53,13 +65,36 @@ def generate_repo_pages(repos, env):
     os.makedirs("docs/repos", exist_ok=True)
 
     template = env.get_template("repo_research.md.j2")
-
-    for repo in repos:
-        filename = f"docs/repos/{repo['name']}.md"
-        content = template.render(repo=repo)
-
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(content)
+    blobs = BlobStore(Path("data/blobs"))
+
+    repositories = list(get_datastore().repositories())
+
+    with DependencyIndex(Path("data/dependency_index.db")) as index:
+        # Re-parses only repositories whose manifests changed since the last build
+        with open_manifest_cache() as cache:
+            analyzer = DependencyAnalyzer(manifests=ManifestExtractor(cache=cache))
+            analyzer.update_dependency_index(repositories, index)
+
+        # Recomputes only the neighbor lists that changed repositories can affect
+        related = RelatedIndex()
+        related.update(
+            repositories,
+            build_corpus(repositories),
+            lambda repo: [dep["package"] for dep in index.dependencies(repo.name)],
+        )
+        related.save()
+
+        for repo in repos:
+            filename = f"docs/repos/{repo['name']}.md"
+            # Resolve README text only for the page being rendered
+            content = template.render(
+                repo=blobs.hydrate(repo),
+                dependencies=index.dependencies(repo["name"]),
+                related=related.related(repo["name"]),
+            )
+
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write(content)
 
     print(f"  Created {len(repos)} repo pages in docs/repos/")
 
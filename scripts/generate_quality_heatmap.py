@@ -4,7 +4,6 @@ Creates a Plotly heatmap showing repository health scores across multiple
 quality dimensions, using actual Git commit history and repository metrics.
 """
 
-import json
 import os
 import sys
 from datetime import datetime, timedelta
@@ -15,18 +14,14 @@ import plotly.graph_objects as go
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.research_platform.analyzers.health_engine import HealthInputs, HealthScoringEngine
 from src.research_platform.models.repository import Repository
+from src.research_platform.storage.datastore import get_datastore
 
 
-def load_repositories(repos_file: Path = Path("data/repos.json")) -> list[Repository]:
-    """Load repository data from JSON file."""
-    if not repos_file.exists():
-        raise FileNotFoundError(f"Repository data not found: {repos_file}")
-
-    with open(repos_file, encoding="utf-8") as f:
-        repos_data = json.load(f)
-
-    return [Repository.from_dict(repo_data) for repo_data in repos_data]
+def load_repositories(data_dir: Path = Path("data")) -> list[Repository]:
+    """Load repository models, shared with other phases of the same build."""
+    return list(get_datastore(data_dir).repositories())
 
 
 def fetch_git_metrics(repositories: list[Repository]) -> dict[str, dict]:
@@ -119,9 +114,11 @@ def calculate_quality_matrix(repositories: list[Repository], git_metrics: dict)
     """
     matrix_data = []
 
-    for repo in repositories:
-        # Get base health scores from Repository model
-        health = repo.calculate_health_score()
+    # Base health scores for all repositories in one pass
+    engine = HealthScoringEngine()
+    reports = engine.category_report(HealthInputs.from_repositories(repositories))
+
+    for repo, health in zip(repositories, reports):
         scores = health["scores"]
 
         # Enhance with real Git data if available
@@ -2,9 +2,10 @@
 
 Creates Plotly time-series charts showing repository metrics over time,
 including commit frequency, contributor growth, stars/forks, and issue trends.
+Stars, forks, open issues and contributors are read from the daily metrics
+store, which gains one snapshot per run.
 """
 
-import json
 import os
 import sys
 from collections import defaultdict
@@ -18,22 +19,27 @@ from plotly.subplots import make_subplots
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.research_platform.models.repository import Repository
+from src.research_platform.storage.datastore import get_datastore
+from src.research_platform.storage.timeseries import MetricsStore, repository_metrics
 
+# Histories longer than this are charted weekly instead of daily
+WEEKLY_ROLLUP_DAYS = 180
 
-def load_repositories(repos_file: Path = Path("data/repos.json")) -> list[Repository]:
-    """Load repository data from JSON file."""
-    if not repos_file.exists():
-        raise FileNotFoundError(f"Repository data not found: {repos_file}")
 
-    with open(repos_file, encoding="utf-8") as f:
-        repos_data = json.load(f)
+def load_repositories(data_dir: Path = Path("data")) -> list[Repository]:
+    """Load repository models, shared with other phases of the same build."""
+    return list(get_datastore(data_dir).repositories())
 
-    return [Repository.from_dict(repo_data) for repo_data in repos_data]
+
+def record_snapshot(repositories: list[Repository], store: MetricsStore) -> None:
+    """Record today's stars, forks, open issues and contributors in the store."""
+    store.record(repository_metrics(repositories))
+    store.save()
 
 
 def fetch_historical_metrics(repositories: list[Repository]) -> dict:
     """
-    Fetch historical metrics using PyGithub API.
+    Fetch commit history using PyGithub API.
 
     Args:
         repositories: List of Repository models
@@ -52,10 +58,6 @@ def fetch_historical_metrics(repositories: list[Repository]) -> dict:
         g = Github(token)
         metrics = {
             "commits": defaultdict(lambda: defaultdict(int)),  # date -> repo -> count
-            "contributors": defaultdict(set),  # date -> set of contributors
-            "stars": defaultdict(lambda: defaultdict(int)),  # date -> repo -> cumulative
-            "forks": defaultdict(lambda: defaultdict(int)),
-            "issues": defaultdict(lambda: defaultdict(int)),
         }
 
         print("Fetching historical data from GitHub...")
@@ -74,27 +76,10 @@ def fetch_historical_metrics(repositories: list[Repository]) -> dict:
                     date_str = date.isoformat()
                     metrics["commits"][date_str][repo.name] += 1
 
-                    # Track contributors
-                    if commit.author:
-                        metrics["contributors"][date_str].add(commit.author.login)
-
-                # Current stars and forks (snapshot)
-                today = datetime.now().date().isoformat()
-                metrics["stars"][today][repo.name] = repo.stars
-                metrics["forks"][today][repo.name] = repo.forks
-
-                # Open issues (current)
-                metrics["issues"][today][repo.name] = repo.open_issues
-
             except Exception as e:
                 print(f"  Warning: Could not fetch data for {repo.name}: {e}")
                 continue
 
-        # Convert sets to counts for contributors
-        metrics["contributors"] = {
-            date: len(contributors) for date, contributors in metrics["contributors"].items()
-        }
-
         return metrics
 
     except ImportError:
@@ -109,10 +94,6 @@ def generate_mock_data(repositories: list[Repository]) -> dict:
     """Generate mock time-series data for testing."""
     metrics = {
         "commits": defaultdict(lambda: defaultdict(int)),
-        "contributors": {},
-        "stars": defaultdict(lambda: defaultdict(int)),
-        "forks": defaultdict(lambda: defaultdict(int)),
-        "issues": defaultdict(lambda: defaultdict(int)),
     }
 
     # Generate 90 days of mock data
@@ -125,17 +106,15 @@ def generate_mock_data(repositories: list[Repository]) -> dict:
 
             metrics["commits"][date][repo.name] = random.randint(0, max(1, (90 - i) // 10))
 
-        # Contributors (gradually increasing)
-        metrics["contributors"][date] = min(len(repositories) + (i // 10), len(repositories) * 2)
+    return metrics
 
-    # Current snapshots
-    today = datetime.now().date().isoformat()
-    for repo in repositories:
-        metrics["stars"][today][repo.name] = repo.stars
-        metrics["forks"][today][repo.name] = repo.forks
-        metrics["issues"][today][repo.name] = repo.open_issues
 
-    return metrics
+def metric_history(store: MetricsStore, metric: str) -> tuple[list[str], list[int]]:
+    """Organization total of a metric over time, rolled up weekly for long histories."""
+    dates, values = store.series(metric)
+    if len(dates) > WEEKLY_ROLLUP_DAYS:
+        dates, values = store.rollup(metric, period="week", agg="last")
+    return dates, values.tolist()
 
 
 def create_commit_frequency_chart(metrics: dict, output_path: Path) -> None:
@@ -196,31 +175,21 @@ def create_commit_frequency_chart(metrics: dict, output_path: Path) -> None:
     print(f"Commit frequency chart saved to {output_path}")
 
 
-def create_contributor_growth_chart(metrics: dict, output_path: Path) -> None:
+def create_contributor_growth_chart(store: MetricsStore, output_path: Path) -> None:
     """Create contributor growth time-series chart."""
-    contributors = metrics["contributors"]
+    dates, counts = metric_history(store, "contributors")
 
-    if not contributors:
+    if not dates:
         print("No contributor data available")
         return
 
-    dates = sorted(contributors.keys())
-    counts = [contributors[date] for date in dates]
-
-    # Calculate cumulative unique contributors
-    cumulative = []
-    total = 0
-    for count in counts:
-        total = max(total, count)  # Simplified - assumes non-decreasing
-        cumulative.append(total)
-
     fig = go.Figure()
 
     fig.add_trace(
         go.Scatter(
             x=dates,
-            y=cumulative,
-            name="Unique Contributors",
+            y=counts,
+            name="Contributors",
             fill="tozeroy",
             line={"color": "#003366", "width": 2},
             mode="lines+markers",
@@ -235,7 +204,7 @@ def create_contributor_growth_chart(metrics: dict, output_path: Path) -> None:
             "font": {"size": 20},
         },
         xaxis_title="Date",
-        yaxis_title="Cumulative Contributors",
+        yaxis_title="Contributors (summed over repositories)",
         hovermode="x",
         height=500,
         template="plotly_white",
@@ -247,29 +216,53 @@ def create_contributor_growth_chart(metrics: dict, output_path: Path) -> None:
 
 
 def create_stars_forks_chart(
-    metrics: dict, repositories: list[Repository], output_path: Path
+    store: MetricsStore, repositories: list[Repository], output_path: Path
 ) -> None:
-    """Create stars and forks accumulation chart."""
-    # Use current values from repositories
+    """Create stars and forks chart: current values per repository and organization history."""
     repo_names = [r.name for r in repositories]
-    stars = [r.stars for r in repositories]
-    forks = [r.forks for r in repositories]
+    history_titles = []
+    for metric in ("stars", "forks"):
+        rate = store.rate(metric, per_days=30)
+        suffix = f" ({rate:+.1f}/month)" if rate is not None else ""
+        history_titles.append(f"Total {metric.title()}{suffix}")
 
     fig = make_subplots(
-        rows=1,
+        rows=2,
         cols=2,
-        subplot_titles=("Stars by Repository", "Forks by Repository"),
-        specs=[[{"type": "bar"}, {"type": "bar"}]],
+        subplot_titles=("Stars by Repository", "Forks by Repository", *history_titles),
+        vertical_spacing=0.25,
     )
 
-    fig.add_trace(go.Bar(x=repo_names, y=stars, name="Stars", marker_color="#ffd700"), row=1, col=1)
-
-    fig.add_trace(go.Bar(x=repo_names, y=forks, name="Forks", marker_color="#003366"), row=1, col=2)
-
-    fig.update_xaxes(title_text="Repository", row=1, col=1, tickangle=-45)
-    fig.update_xaxes(title_text="Repository", row=1, col=2, tickangle=-45)
-    fig.update_yaxes(title_text="Count", row=1, col=1)
-    fig.update_yaxes(title_text="Count", row=1, col=2)
+    for col, (metric, color) in enumerate((("stars", "#ffd700"), ("forks", "#003366")), start=1):
+        # Current values per repository
+        fig.add_trace(
+            go.Bar(
+                x=repo_names,
+                y=[getattr(r, metric) for r in repositories],
+                name=metric.title(),
+                marker_color=color,
+            ),
+            row=1,
+            col=col,
+        )
+        fig.update_xaxes(title_text="Repository", row=1, col=col, tickangle=-45)
+        fig.update_yaxes(title_text="Count", row=1, col=col)
+
+        # Organization total over time
+        dates, values = metric_history(store, metric)
+        fig.add_trace(
+            go.Scatter(
+                x=dates,
+                y=values,
+                name=f"Total {metric.title()}",
+                line={"color": color, "width": 3},
+                mode="lines+markers",
+            ),
+            row=2,
+            col=col,
+        )
+        fig.update_xaxes(title_text="Date", row=2, col=col)
+        fig.update_yaxes(title_text="Count", row=2, col=col)
 
     fig.update_layout(
         title={
@@ -278,7 +271,7 @@ def create_stars_forks_chart(
             "xanchor": "center",
             "font": {"size": 20},
         },
-        height=500,
+        height=900,
         showlegend=False,
         template="plotly_white",
     )
@@ -289,41 +282,65 @@ def create_stars_forks_chart(
 
 
 def create_issues_trend_chart(
-    metrics: dict, repositories: list[Repository], output_path: Path
+    store: MetricsStore, repositories: list[Repository], output_path: Path
 ) -> None:
-    """Create open issues trend chart."""
+    """Create open issues chart: current issues per repository and organization trend."""
     repo_names = [r.name for r in repositories if r.open_issues > 0]
     issue_counts = [r.open_issues for r in repositories if r.open_issues > 0]
+    dates, counts = metric_history(store, "open_issues")
 
-    if not repo_names:
+    if not repo_names and not dates:
         print("No open issues data available")
         return
 
-    fig = go.Figure(
-        data=[
-            go.Bar(
-                x=repo_names,
-                y=issue_counts,
-                marker={
-                    "color": issue_counts,
-                    "colorscale": "Reds",
-                    "showscale": True,
-                    "colorbar": {"title": "Open Issues"},
-                },
-            )
-        ]
+    fig = make_subplots(
+        rows=2,
+        cols=1,
+        subplot_titles=("Open Issues by Repository", "Open Issues Over Time"),
+        vertical_spacing=0.25,
+    )
+
+    fig.add_trace(
+        go.Bar(
+            x=repo_names,
+            y=issue_counts,
+            name="Open Issues",
+            marker={
+                "color": issue_counts,
+                "colorscale": "Reds",
+                "showscale": True,
+                "colorbar": {"title": "Open Issues", "len": 0.4, "y": 0.8},
+            },
+        ),
+        row=1,
+        col=1,
+    )
+    fig.update_xaxes(title_text="Repository", tickangle=-45, row=1, col=1)
+    fig.update_yaxes(title_text="Open Issues", row=1, col=1)
+
+    fig.add_trace(
+        go.Scatter(
+            x=dates,
+            y=counts,
+            name="Total Open Issues",
+            line={"color": "#c0392b", "width": 3},
+            mode="lines+markers",
+        ),
+        row=2,
+        col=1,
     )
+    fig.update_xaxes(title_text="Date", row=2, col=1)
+    fig.update_yaxes(title_text="Open Issues", row=2, col=1)
 
     fig.update_layout(
         title={
-            "text": "Open Issues by Repository",
+            "text": "Open Issues",
             "x": 0.5,
             "xanchor": "center",
             "font": {"size": 20},
         },
-        xaxis={"title": "Repository", "tickangle": -45},
-        yaxis_title="Open Issues",
-        height=500,
+        height=900,
+        showlegend=False,
         template="plotly_white",
     )
 
@@ -343,7 +360,12 @@ def main():
     repositories = load_repositories()
     print(f"Loaded {len(repositories)} repositories")
 
-    # Fetch historical metrics
+    # Record today's snapshot in the metrics history
+    store = MetricsStore()
+    record_snapshot(repositories, store)
+    print(f"Metrics history covers {len(store)} days")
+
+    # Fetch commit history
     print("\nFetching historical metrics...")
     metrics = fetch_historical_metrics(repositories)
 
@@ -356,15 +378,15 @@ def main():
 
     # Contributor growth
     contributor_path = Path("docs/visualizations/timeseries_contributors.html")
-    create_contributor_growth_chart(metrics, contributor_path)
+    create_contributor_growth_chart(store, contributor_path)
 
     # Stars and forks
     stars_path = Path("docs/visualizations/timeseries_stars_forks.html")
-    create_stars_forks_chart(metrics, repositories, stars_path)
+    create_stars_forks_chart(store, repositories, stars_path)
 
     # Issues trend
     issues_path = Path("docs/visualizations/timeseries_issues.html")
-    create_issues_trend_chart(metrics, repositories, issues_path)
+    create_issues_trend_chart(store, repositories, issues_path)
 
     print("\n" + "=" * 60)
     print("Time-series visualizations generated successfully!")
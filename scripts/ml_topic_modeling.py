@@ -6,16 +6,21 @@ Uses scikit-learn for NMF and LDA topic extraction from README files.
 
 import json
 import os
-import re
+import sys
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from viz_footer import inject_footer_into_html
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.research_platform.storage.dataset import load_repository_records
+
 try:
-    import numpy as np
-    from sklearn.decomposition import NMF, LatentDirichletAllocation
-    from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+    from src.research_platform.analyzers.corpus import DEFAULT_CORPUS_PATH, Corpus, tokenize
+    from src.research_platform.analyzers.topic_models import DEFAULT_MODEL_DIR, TopicModel
 
     SKLEARN_AVAILABLE = True
 except ImportError:
@@ -34,37 +39,23 @@ except ImportError:
 class MLTopicModeler:
     """Machine learning-based topic modeling for repository analysis."""
 
-    def __init__(self, n_topics=5, n_top_words=10):
+    def __init__(self, n_topics=5, n_top_words=10, model_dir=None, online=False):
         self.n_topics = n_topics
         self.n_top_words = n_top_words
+        # Fitted models are kept here between runs (refitted from scratch when None)
+        self.model_dir = Path(model_dir) if model_dir is not None else None
+        self.online = online
         self.vectorizer = None
         self.model = None
 
-    def preprocess_text(self, text: str) -> str:
-        """Preprocess text for topic modeling."""
+    def preprocess_text(self, text) -> str:
+        """Preprocess text (or corpus tokens) into a space-joined token stream."""
         if not text:
             return ""
+        return " ".join(text if isinstance(text, list) else tokenize(text))
 
-        # Convert to lowercase
-        text = text.lower()
-
-        # Remove URLs
-        text = re.sub(r"http\S+|www\S+", "", text)
-
-        # Remove code blocks
-        text = re.sub(r"```[\s\S]*?```", "", text)
-        text = re.sub(r"`[^`]*`", "", text)
-
-        # Remove special characters but keep spaces
-        text = re.sub(r"[^a-z\s]", " ", text)
-
-        # Remove extra whitespace
-        text = " ".join(text.split())
-
-        return text
-
-    def extract_topics_nmf(self, documents: list[str], repo_names: list[str]) -> dict[str, Any]:
-        """Extract topics using Non-negative Matrix Factorization."""
+    def extract_topics_nmf(self, documents: list, repo_names: list[str]) -> dict[str, Any]:
+        """Extract topics using Non-negative Matrix Factorization (texts or token lists)."""
         if not SKLEARN_AVAILABLE:
             return {}
 
@@ -78,70 +69,34 @@ class MLTopicModeler:
 
         processed_docs, repo_names = zip(*valid_docs)
 
-        # TF-IDF vectorization
-        self.vectorizer = TfidfVectorizer(
-            max_features=1000, min_df=1, max_df=0.8, stop_words="english", ngram_range=(1, 2)
+        # TF-IDF vectorization + NMF, only new or changed READMEs are projected
+        topic_model = self._topic_model(
+            "nmf",
+            vectorizer_params={
+                "max_features": 1000,
+                "min_df": 1,
+                "max_df": 0.8,
+                "ngram_range": (1, 2),
+            },
+            model_params={"random_state": 42, "init": "nndsvd", "max_iter": 500},
         )
-
         try:
-            tfidf_matrix = self.vectorizer.fit_transform(processed_docs)
+            update = self._update_topic_model(topic_model, processed_docs, repo_names)
         except ValueError as e:
             return {"topics": [], "error": str(e)}
 
-        # NMF topic modeling
-        self.model = NMF(
-            n_components=min(self.n_topics, len(processed_docs)),
-            random_state=42,
-            init="nndsvd",
-            max_iter=500,
-        )
-
-        doc_topic_matrix = self.model.fit_transform(tfidf_matrix)
-
-        # Extract topics
-        feature_names = self.vectorizer.get_feature_names_out()
-        topics = []
-
-        for topic_idx, topic in enumerate(self.model.components_):
-            top_indices = topic.argsort()[-self.n_top_words :][::-1]
-            top_words = [feature_names[i] for i in top_indices]
-            top_weights = [float(topic[i]) for i in top_indices]
-
-            topics.append(
-                {
-                    "topic_id": topic_idx,
-                    "words": top_words,
-                    "weights": top_weights,
-                    "label": self._generate_topic_label(top_words),
-                }
-            )
-
-        # Assign dominant topics to repositories
-        repo_topics = []
-        for idx, repo_name in enumerate(repo_names):
-            topic_dist = doc_topic_matrix[idx]
-            dominant_topic = int(topic_dist.argmax())
-            topic_strength = float(topic_dist[dominant_topic])
-
-            repo_topics.append(
-                {
-                    "repository": repo_name,
-                    "dominant_topic": dominant_topic,
-                    "topic_strength": topic_strength,
-                    "topic_distribution": [float(x) for x in topic_dist],
-                }
-            )
-
         return {
             "method": "NMF",
-            "n_topics": len(topics),
-            "topics": topics,
-            "repository_topics": repo_topics,
-            "vocabulary_size": len(feature_names),
+            "n_topics": len(topic_model.model.components_),
+            "topics": self._topics(topic_model),
+            "repository_topics": topic_model.repository_topics(),
+            "vocabulary_size": topic_model.vocabulary_size,
+            "refit": update["refit"],
+            "assigned_repositories": update["assigned"],
         }
 
-    def extract_topics_lda(self, documents: list[str], repo_names: list[str]) -> dict[str, Any]:
-        """Extract topics using Latent Dirichlet Allocation."""
+    def extract_topics_lda(self, documents: list, repo_names: list[str]) -> dict[str, Any]:
+        """Extract topics using Latent Dirichlet Allocation (texts or token lists)."""
         if not SKLEARN_AVAILABLE:
             return {}
 
@@ -156,69 +111,61 @@ class MLTopicModeler:
         processed_docs, repo_names = zip(*valid_docs)
 
         # Count vectorization (LDA works better with raw counts)
-        self.vectorizer = CountVectorizer(
-            max_features=1000, min_df=1, max_df=0.8, stop_words="english", ngram_range=(1, 2)
+        topic_model = self._topic_model(
+            "lda",
+            vectorizer_params={
+                "max_features": 1000,
+                "min_df": 1,
+                "max_df": 0.8,
+                "ngram_range": (1, 2),
+            },
+            model_params={
+                "random_state": 42,
+                "max_iter": 50,
+                "learning_method": "online",
+            },
+            # Parallelism does not change the topics, so it stays out of the model config
+            n_jobs=-1,
         )
-
         try:
-            count_matrix = self.vectorizer.fit_transform(processed_docs)
+            update = self._update_topic_model(topic_model, processed_docs, repo_names)
         except ValueError as e:
             return {"topics": [], "error": str(e)}
 
-        # LDA topic modeling
-        self.model = LatentDirichletAllocation(
-            n_components=min(self.n_topics, len(processed_docs)),
-            random_state=42,
-            max_iter=50,
-            learning_method="online",
-            n_jobs=-1,
-        )
-
-        doc_topic_matrix = self.model.fit_transform(count_matrix)
-
-        # Extract topics
-        feature_names = self.vectorizer.get_feature_names_out()
-        topics = []
-
-        for topic_idx, topic in enumerate(self.model.components_):
-            top_indices = topic.argsort()[-self.n_top_words :][::-1]
-            top_words = [feature_names[i] for i in top_indices]
-            top_weights = [float(topic[i]) for i in top_indices]
-
-            topics.append(
-                {
-                    "topic_id": topic_idx,
-                    "words": top_words,
-                    "weights": top_weights,
-                    "label": self._generate_topic_label(top_words),
-                }
-            )
-
-        # Assign dominant topics to repositories
-        repo_topics = []
-        for idx, repo_name in enumerate(repo_names):
-            topic_dist = doc_topic_matrix[idx]
-            dominant_topic = int(topic_dist.argmax())
-            topic_strength = float(topic_dist[dominant_topic])
-
-            repo_topics.append(
-                {
-                    "repository": repo_name,
-                    "dominant_topic": dominant_topic,
-                    "topic_strength": topic_strength,
-                    "topic_distribution": [float(x) for x in topic_dist],
-                }
-            )
-
         return {
             "method": "LDA",
-            "n_topics": len(topics),
-            "topics": topics,
-            "repository_topics": repo_topics,
-            "vocabulary_size": len(feature_names),
-            "perplexity": float(self.model.perplexity(count_matrix)),
+            "n_topics": len(topic_model.model.components_),
+            "topics": self._topics(topic_model),
+            "repository_topics": topic_model.repository_topics(),
+            "vocabulary_size": topic_model.vocabulary_size,
+            "perplexity": topic_model.perplexity,
+            "refit": update["refit"],
+            "assigned_repositories": update["assigned"],
         }
 
+    def _topic_model(self, method: str, **params) -> "TopicModel":
+        """Load the persisted model of a method (or start a new one)."""
+        path = self.model_dir / f"{method}.joblib" if self.model_dir is not None else None
+        return TopicModel(path, method=method, n_topics=self.n_topics, online=self.online, **params)
+
+    def _update_topic_model(
+        self, topic_model: "TopicModel", documents, repo_names
+    ) -> dict[str, Any]:
+        """Bring a topic model up to date with the documents and persist it."""
+        update = topic_model.update(dict(zip(repo_names, documents)))
+        if topic_model.path is not None:
+            topic_model.save()
+        self.vectorizer = topic_model.vectorizer
+        self.model = topic_model.model
+        return update
+
+    def _topics(self, topic_model: "TopicModel") -> list[dict[str, Any]]:
+        """Top words of every topic, labelled for display."""
+        topics = topic_model.topics(self.n_top_words)
+        for topic in topics:
+            topic["label"] = self._generate_topic_label(topic["words"])
+        return topics
+
     def _generate_topic_label(self, top_words: list[str]) -> str:
         """Generate human-readable label for topic."""
         # Take top 3 words and create label
@@ -258,14 +205,14 @@ class MLTopicModeler:
         )
 
         fig.update_layout(
-            title=f'Repository-Topic Distribution ({topic_results["method"]})',
+            title=f"Repository-Topic Distribution ({topic_results['method']})",
             xaxis_title="Topics",
             yaxis_title="Repositories",
             height=max(400, len(repo_names) * 40),
         )
 
         output_path = os.path.join(
-            output_dir, f'topic_distribution_{topic_results["method"].lower()}.html'
+            output_dir, f"topic_distribution_{topic_results['method'].lower()}.html"
         )
         fig.write_html(output_path)
         # Inject generation footer
@@ -319,7 +266,7 @@ class MLTopicModeler:
             )
 
         fig.update_layout(
-            title=f'Topic Word Distributions ({topic_results["method"]})',
+            title=f"Topic Word Distributions ({topic_results['method']})",
             height=300 * rows,
             showlegend=False,
         )
@@ -327,7 +274,7 @@ class MLTopicModeler:
         fig.update_xaxes(title_text="Weight")
 
         output_path = os.path.join(
-            output_dir, f'topic_words_{topic_results["method"].lower()}.html'
+            output_dir, f"topic_words_{topic_results['method'].lower()}.html"
         )
         fig.write_html(output_path)
         # Inject generation footer
@@ -341,36 +288,37 @@ class MLTopicModeler:
         return output_path
 
 
-def analyze_repository_topics(repos_data: list[dict], method="both") -> dict[str, Any]:
-    """Analyze repository topics using machine learning."""
+def analyze_repository_topics(
+    repos_data: list[dict], method="both", model_dir=None, online=False, corpus=None
+) -> dict[str, Any]:
+    """
+    Analyze repository topics using machine learning.
+
+    Documents are the description and README token streams of the shared
+    corpus (``corpus``, or the one persisted at DEFAULT_CORPUS_PATH), so
+    READMEs are not tokenized again here.
+    """
     print("Analyzing repository topics with ML...")
 
     if not SKLEARN_AVAILABLE:
         print("ERROR: scikit-learn not available")
         return {"error": "scikit-learn not installed"}
 
+    if corpus is None:
+        corpus = Corpus(DEFAULT_CORPUS_PATH)
+
     # Extract documents (README + description)
     documents = []
     repo_names = []
 
     for repo in repos_data:
-        # Combine description and README
-        text_parts = []
-
-        if repo.get("description"):
-            text_parts.append(repo["description"])
-
-        # Get README content if available
-        readme = repo.get("readme_content", "")
-        if readme:
-            # Limit README to first 5000 chars to avoid overwhelming
-            text_parts.append(readme[:5000])
-
-        # Combine
-        doc_text = " ".join(text_parts)
+        tokens = corpus.repository_tokens(repo["name"], ("description", "readme"))
+        if not tokens and repo.get("description"):
+            # Not in the corpus (yet): tokenize the description directly
+            tokens = tokenize(repo["description"])
 
-        if doc_text.strip():
-            documents.append(doc_text)
+        if tokens:
+            documents.append(tokens)
             repo_names.append(repo["name"])
 
     if len(documents) < 2:
@@ -380,7 +328,12 @@ def analyze_repository_topics(repos_data: list[dict], method="both") -> dict[str
     print(f"Processing {len(documents)} repositories...")
 
     # Initialize modeler
-    modeler = MLTopicModeler(n_topics=min(5, len(documents)), n_top_words=10)
+    modeler = MLTopicModeler(
+        n_topics=min(5, len(documents)),
+        n_top_words=10,
+        model_dir=DEFAULT_MODEL_DIR if model_dir is None else model_dir,
+        online=online,
+    )
 
     results = {
         "generated_at": datetime.now().isoformat(),
@@ -432,9 +385,8 @@ def main():
         print("Install with: pip install scikit-learn")
         return
 
-    if os.path.exists("data/repos.json"):
-        with open("data/repos.json", encoding="utf-8") as f:
-            repos_data = json.load(f)
+    if os.path.exists("data/repos") or os.path.exists("data/repos.json"):
+        repos_data = load_repository_records()
 
         results = analyze_repository_topics(repos_data, method="both")
 
@@ -4,14 +4,21 @@ Full-text search indexer with faceted navigation.
 Indexes READMEs, notebooks, papers for searchability.
 """
 
-import json
 import os
 import pickle
-import re
+import sys
 from collections import defaultdict
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.research_platform.analyzers.corpus import DEFAULT_CORPUS_PATH, Corpus, tokenize
+from src.research_platform.storage.blobs import BlobStore
+from src.research_platform.storage.dataset import load_repository_records
+
 
 class SearchIndex:
     """Full-text search index with faceted navigation."""
@@ -22,8 +29,10 @@ class SearchIndex:
         self.facets = defaultdict(lambda: defaultdict(set))  # facet_name -> value -> doc_ids
         self.doc_counter = 0
 
-    def add_document(self, content: str, metadata: dict[str, Any]) -> str:
-        """Add a document to the search index."""
+    def add_document(
+        self, content: str, metadata: dict[str, Any], tokens: list[str] | None = None
+    ) -> str:
+        """Add a document to the search index (``tokens`` from the corpus, if already known)."""
         doc_id = f"doc_{self.doc_counter}"
         self.doc_counter += 1
 
@@ -35,8 +44,7 @@ class SearchIndex:
         }
 
         # Tokenize and index
-        tokens = self._tokenize(content)
-        for token in tokens:
+        for token in set(tokens) if tokens is not None else self._tokenize(content):
             self.inverted_index[token].add(doc_id)
 
         # Index metadata fields as facets
@@ -157,48 +165,8 @@ class SearchIndex:
         return sorted(suggestions)[:limit]
 
     def _tokenize(self, text: str) -> set[str]:
-        """Tokenize text into searchable terms."""
-        # Convert to lowercase
-        text = text.lower()
-
-        # Remove punctuation except hyphens in words
-        text = re.sub(r"[^\w\s-]", " ", text)
-
-        # Split into words
-        words = text.split()
-
-        # Remove common stop words
-        stop_words = {
-            "a",
-            "an",
-            "and",
-            "are",
-            "as",
-            "at",
-            "be",
-            "by",
-            "for",
-            "from",
-            "has",
-            "he",
-            "in",
-            "is",
-            "it",
-            "its",
-            "of",
-            "on",
-            "that",
-            "the",
-            "to",
-            "was",
-            "will",
-            "with",
-        }
-
-        # Filter and return
-        tokens = {word for word in words if len(word) > 2 and word not in stop_words}
-
-        return tokens
+        """Tokenize text into searchable terms (the shared corpus rules)."""
+        return set(tokenize(text))
 
     def _score_document(self, doc_id: str, query_tokens: set[str]) -> float:
         """Score a document for relevance (simple TF-IDF)."""
@@ -256,19 +224,30 @@ class SearchIndex:
         return index
 
 
-def build_search_index(repos_data: list[dict]) -> SearchIndex:
-    """Build search index from repository data."""
+def build_search_index(repos_data: list[dict], corpus: Corpus | None = None) -> SearchIndex:
+    """
+    Build search index from repository data.
+
+    Args:
+        repos_data: Repository records
+        corpus: Tokenized corpus; documents it holds are indexed from their
+            token streams instead of being tokenized again
+    """
     print("Building search index...")
     index = SearchIndex()
+    blobs = BlobStore(Path("data/blobs"))
+
+    def corpus_tokens(doc_id: str) -> list[str] | None:
+        return corpus.tokens(doc_id) if corpus is not None and doc_id in corpus else None
 
     for repo in repos_data:
         repo_name = repo["name"]
         research_meta = repo.get("research_metadata", {})
 
-        # Index README
+        # Index README (resolved from the blob store when externalized)
         if repo.get("readme") and repo["readme"] != "No README available":
             index.add_document(
-                content=repo["readme"],
+                content=blobs.resolve(repo["readme"]),
                 metadata={
                     "type": "readme",
                     "repo": repo_name,
@@ -276,10 +255,11 @@ def build_search_index(repos_data: list[dict]) -> SearchIndex:
                     "language": repo["language"],
                     "topics": repo.get("topics", []),
                 },
+                tokens=corpus_tokens(f"{repo_name}/readme"),
             )
 
         # Index publications
-        for pub in research_meta.get("publications", []):
+        for i, pub in enumerate(research_meta.get("publications", [])):
             if pub.get("title") or pub.get("abstract"):
                 content = f"{pub.get('title', '')} {pub.get('abstract', '')}"
                 index.add_document(
@@ -292,6 +272,7 @@ def build_search_index(repos_data: list[dict]) -> SearchIndex:
                         "doi": pub.get("doi"),
                         "arxiv_id": pub.get("arxiv_id"),
                     },
+                    tokens=corpus_tokens(f"{repo_name}/publication/{i}"),
                 )
 
         # Index research metadata
@@ -306,6 +287,7 @@ def build_search_index(repos_data: list[dict]) -> SearchIndex:
                         "title": research.get("title", repo_name),
                         "keywords": research.get("keywords", []),
                     },
+                    tokens=corpus_tokens(f"{repo_name}/abstract"),
                 )
 
     # Save index
@@ -346,12 +328,13 @@ def main():
     print("=" * 60)
 
     # Load repos data
-    if os.path.exists("data/repos.json"):
-        with open("data/repos.json") as f:
-            repos_data = json.load(f)
+    if os.path.exists("data/repos") or os.path.exists("data/repos.json"):
+        repos_data = load_repository_records(
+            columns=["name", "description", "language", "topics", "readme", "research_metadata"]
+        )
 
-        # Build index
-        index = build_search_index(repos_data)
+        # Build index, reusing the tokens of the persisted corpus
+        index = build_search_index(repos_data, corpus=Corpus(DEFAULT_CORPUS_PATH))
 
         # Test search
         print("\nTest search for 'machine learning':")
@@ -6,9 +6,16 @@ Creates charts, network graphs, and interactive elements.
 
 import json
 import os
+import sys
+from pathlib import Path
 
 from viz_footer import inject_footer_into_html
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.research_platform.storage.dataset import load_repository_records
+
 # Note: Plotly is optional - will generate JSON data that can be rendered client-side
 try:
     import plotly.express as px
@@ -354,9 +361,8 @@ def main():
         return
 
     # Load data
-    if os.path.exists("data/repos.json"):
-        with open("data/repos.json") as f:
-            repos_data = json.load(f)
+    if os.path.exists("data/repos") or os.path.exists("data/repos.json"):
+        repos_data = load_repository_records()
 
         citation_report = None
         if os.path.exists("data/citation_report.json"):
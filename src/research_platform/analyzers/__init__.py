@@ -1,7 +1,8 @@
 """Analysis modules for repository metrics and insights."""
 
 from .code_quality import CodeQualityAnalyzer
+from .health_engine import HealthScoringEngine
 from .health_scorer import HealthScorer
 from .topic_modeling import TopicModelingAnalyzer
 
-__all__ = ["CodeQualityAnalyzer", "HealthScorer", "TopicModelingAnalyzer"]
+__all__ = ["CodeQualityAnalyzer", "HealthScorer", "HealthScoringEngine", "TopicModelingAnalyzer"]
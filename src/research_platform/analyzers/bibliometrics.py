@@ -0,0 +1,171 @@
+"""Vectorized bibliometric indicators.
+
+Every indicator of an entity (a repository or the whole organization) is
+read off one array of citation counts, sorted once in descending order:
+h-index, g-index, i10-index, median and percentiles are prefix counts or
+index lookups on that array. Per-year windows reuse the same ranking, so
+publications are never re-sorted per metric.
+"""
+
+from collections.abc import Sequence
+from typing import overload
+
+import numpy as np
+
+# Percentiles reported for citation distributions
+PERCENTILES = (25, 50, 75, 90)
+
+# Citations a publication needs to count towards the i10-index
+HIGHLY_CITED = 10
+
+# Year of publications without (a parseable) publication year
+UNKNOWN_YEAR = -1
+
+
+def publication_year(value: object) -> int:
+    """Publication year as an integer (UNKNOWN_YEAR when missing or invalid)."""
+    try:
+        return int(str(value)[:4])
+    except (TypeError, ValueError):
+        return UNKNOWN_YEAR
+
+
+@overload
+def rank_citations(
+    citations: np.ndarray | Sequence[int], years: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]: ...
+
+
+@overload
+def rank_citations(
+    citations: np.ndarray | Sequence[int], years: None = None
+) -> tuple[np.ndarray, None]: ...
+
+
+def rank_citations(
+    citations: np.ndarray | Sequence[int], years: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """
+    Sort citation counts in descending order, carrying publication years along.
+
+    The sort is stable, so concatenating already ranked arrays (one per
+    repository) and ranking them again only merges the sorted runs.
+
+    Args:
+        citations: Citation count per publication
+        years: Publication year per publication
+
+    Returns:
+        Ranked citation counts and the matching years
+    """
+    citations = np.asarray(citations, dtype=np.int64)
+    order = np.argsort(-citations, kind="stable")
+    return citations[order], None if years is None else np.asarray(years)[order]
+
+
+def h_index(ranked: np.ndarray) -> int:
+    """Largest h such that h publications have at least h citations each."""
+    return int(np.count_nonzero(ranked >= np.arange(1, len(ranked) + 1)))
+
+
+def g_index(ranked: np.ndarray) -> int:
+    """Largest g such that the top g publications have at least g² citations together."""
+    ranks = np.arange(1, len(ranked) + 1)
+    # cumsum - g² is concave and starts at 0, so the qualifying ranks form a prefix
+    return int(np.count_nonzero(np.cumsum(ranked) >= ranks * ranks))
+
+
+def i_index(ranked: np.ndarray, threshold: int = HIGHLY_CITED) -> int:
+    """Number of publications with at least ``threshold`` citations."""
+    return len(ranked) - int(np.searchsorted(ranked[::-1], threshold, side="left"))
+
+
+def percentiles(ranked: np.ndarray, qs: tuple[int, ...] = PERCENTILES) -> dict[str, float]:
+    """
+    Linearly interpolated percentiles of ranked citation counts.
+
+    Matches numpy's default percentile method without sorting again.
+
+    Args:
+        ranked: Citation counts in descending order
+        qs: Percentiles to compute (0-100)
+
+    Returns:
+        Mapping "p<q>" -> value (zeros for an empty array)
+    """
+    if len(ranked) == 0:
+        return {f"p{q}": 0.0 for q in qs}
+    ascending = ranked[::-1]
+    positions = np.asarray(qs, dtype=float) / 100 * (len(ranked) - 1)
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.minimum(lower + 1, len(ranked) - 1)
+    values = ascending[lower] + (ascending[upper] - ascending[lower]) * (positions - lower)
+    return {f"p{q}": float(value) for q, value in zip(qs, values, strict=True)}
+
+
+def citation_metrics(ranked: np.ndarray) -> dict[str, int | float]:
+    """
+    All indicators of one entity.
+
+    Args:
+        ranked: Citation counts in descending order
+
+    Returns:
+        Publication and citation totals, average, maximum, median, h-, g- and
+        i10-index
+    """
+    count = len(ranked)
+    total = int(ranked.sum())
+    return {
+        "publications": count,
+        "total_citations": total,
+        "average_citations": total / count if count else 0.0,
+        "max_citations": int(ranked[0]) if count else 0,
+        "median_citations": percentiles(ranked, (50,))["p50"],
+        "h_index": h_index(ranked),
+        "g_index": g_index(ranked),
+        "i10_index": i_index(ranked),
+    }
+
+
+def yearly_metrics(ranked: np.ndarray, ranked_years: np.ndarray) -> dict[int, dict[str, int]]:
+    """
+    Indicators per publication year.
+
+    Each year's publications keep their order from the overall ranking, so
+    the rank of a publication within its year is a running count and every
+    year is evaluated in one vectorized pass.
+
+    Args:
+        ranked: Citation counts in descending order
+        ranked_years: Publication year of each ranked count
+
+    Returns:
+        Year -> publications, total citations, h-index and i10-index (years
+        in ascending order, unknown years omitted)
+    """
+    known = ranked_years != UNKNOWN_YEAR
+    ranked, ranked_years = ranked[known], ranked_years[known]
+    if len(ranked) == 0:
+        return {}
+
+    years, groups = np.unique(ranked_years, return_inverse=True)
+    counts = np.bincount(groups)
+    # Rank within the year: position among the year's publications (stable, so still descending)
+    order = np.argsort(groups, kind="stable")
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    ranks = np.empty(len(ranked), dtype=np.int64)
+    ranks[order] = np.arange(len(ranked)) - starts[groups[order]] + 1
+
+    totals = np.bincount(groups, weights=ranked)
+    h = np.bincount(groups, weights=ranked >= ranks)
+    i10 = np.bincount(groups, weights=ranked >= HIGHLY_CITED)
+    return {
+        int(year): {
+            "publications": int(counts[g]),
+            "total_citations": int(totals[g]),
+            "h_index": int(h[g]),
+            "i10_index": int(i10[g]),
+        }
+        for g, year in enumerate(years)
+    }
@@ -1,12 +1,12 @@
 """Code quality analyzer."""
 
-import asyncio
 import logging
 from datetime import datetime
 from typing import Any
 
 from ..models.repository import Repository
 from .base import BaseAnalyzer
+from .health_engine import HealthScoringEngine
 
 
 class CodeQualityAnalyzer(BaseAnalyzer):
@@ -25,15 +25,23 @@ class CodeQualityAnalyzer(BaseAnalyzer):
         Returns:
             Code quality report
         """
-        tasks = [self._analyze_repo(repo) for repo in repositories]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        quality_scores = {}
-        for repo, result in zip(repositories, results):
-            if isinstance(result, Exception):
-                self.logger.warning(f"Failed to analyze {repo.name}: {result}")
-                continue
-            quality_scores[repo.name] = result
+        # Health scores of all repositories in one vectorized pass serve as proxy
+        engine = HealthScoringEngine()
+        health = engine.score_repositories(
+            repositories,
+            on_error=lambda repo, e: self.logger.warning(f"Failed to analyze {repo.name}: {e}"),
+        )
+
+        quality_scores = {
+            name: {
+                "overall_score": score["overall"],
+                "activity_score": score["scores"]["activity"],
+                "community_score": score["scores"]["community"],
+                "documentation_score": score["scores"]["documentation"],
+                "code_quality_score": score["scores"]["code_quality"],
+            }
+            for name, score in health.items()
+        }
 
         return {
             "timestamp": datetime.now().isoformat(),
@@ -42,22 +50,7 @@ class CodeQualityAnalyzer(BaseAnalyzer):
             "scores": quality_scores,
         }
 
-    async def _analyze_repo(self, repo: Repository) -> dict[str, Any]:
-        """Analyze a single repository."""
-        # Use existing repo health score as proxy
-        quality_score = repo.calculate_health_score()
-
-        return {
-            "overall_score": quality_score["overall"],
-            "activity_score": quality_score["scores"]["activity"],
-            "community_score": quality_score["scores"]["community"],
-            "documentation_score": quality_score["scores"]["documentation"],
-            "code_quality_score": quality_score["scores"]["code_quality"],
-        }
-
     async def validate_results(self, results: dict[str, Any]) -> bool:
         """Validate analysis results."""
         required = ["timestamp", "scores"]
         return all(key in results for key in required)
-
-
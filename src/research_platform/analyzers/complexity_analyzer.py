@@ -2,21 +2,226 @@
 
 Analyzes code complexity metrics including cyclomatic complexity,
 maintainability index, and raw metrics for Python code.
+
+Each file is parsed and tokenized once; the AST and raw metrics are shared
+by all three metric families. Files across an organization are analyzed in
+chunks on a process pool and merged back in input order. Per-file results
+are cached by content hash, so only new or changed files are analyzed again
+and repository and organization aggregates are rebuilt from the cache.
 """
 
+import ast
 import json
 import logging
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from ..models.repository import Repository
+from ..storage.blobs import BLOB_KEY, BlobStore, LazyBlobDict, is_blob_ref
+from ..storage.datastore import get_datastore
+from ..storage.results import ResultCache
+
+# Raw metrics reported when a file cannot be tokenized
+EMPTY_RAW_METRICS = {"loc": 0, "lloc": 0, "sloc": 0, "comments": 0, "multi": 0, "blank": 0}
+
+# Functions above this cyclomatic complexity count as complex
+COMPLEX_FUNCTION_THRESHOLD = 10
+
+# Below this many files the pool start-up costs more than it saves
+MIN_PARALLEL_FILES = 32
+
+# Chunks handed to each worker (more chunks balance uneven file sizes)
+CHUNKS_PER_WORKER = 4
+
+# Bump whenever analyze_source output changes so cached results are recomputed
+ANALYZER_VERSION = 1
+
+# Default location of the per-file result cache
+DEFAULT_CACHE_PATH = Path("cache/complexity.sqlite")
+
+
+class SourceFile(NamedTuple):
+    """A file to analyze; ``code`` may be a blob reference, read only on a cache miss."""
+
+    filename: str
+    code: str | dict[str, str]
+    blobs: BlobStore | None = None
+
+    @property
+    def digest(self) -> str:
+        """Content hash of the file (taken from the reference when there is one)."""
+        if isinstance(self.code, dict):
+            return self.code[BLOB_KEY]
+        return BlobStore.digest(self.code)
+
+    def text(self) -> str | None:
+        """Source code of the file (None when a blob reference cannot be resolved)."""
+        try:
+            code = self.blobs.resolve(self.code) if self.blobs is not None else self.code
+        except KeyError:
+            return None
+        return code if isinstance(code, str) else None
+
+
+def analyzer_version() -> str:
+    """Version tag of cached results (analyzer and radon versions)."""
+    try:
+        import radon
+
+        radon_version = radon.__version__
+    except ImportError:
+        radon_version = "none"
+    return f"{ANALYZER_VERSION}-radon{radon_version}"
+
+
+def open_result_cache(path: Path | str = DEFAULT_CACHE_PATH) -> ResultCache:
+    """Open the per-file complexity result cache for the current analyzer version."""
+    return ResultCache(path, namespace="complexity", version=analyzer_version())
+
+
+def analyze_source(
+    code: str, filename: str, logger: logging.Logger | None = None
+) -> dict[str, Any]:
+    """
+    Compute all complexity metrics of one Python file in a single pass.
+
+    Args:
+        code: Python source code
+        filename: Name of the file
+        logger: Logger for analysis warnings
+
+    Returns:
+        Dictionary with all complexity metrics
+    """
+    logger = logger or logging.getLogger(__name__)
+    try:
+        from radon.complexity import cc_rank
+        from radon.metrics import h_visit_ast, mi_compute
+        from radon.raw import analyze
+        from radon.visitors import Class, ComplexityVisitor
+    except ImportError:
+        logger.warning("radon not installed, skipping complexity analysis")
+        return _failed_result(filename, "radon not installed")
+
+    try:
+        raw = analyze(code)
+    except Exception as e:
+        logger.warning(f"Error calculating raw metrics: {e}")
+        raw = None
+
+    try:
+        tree = ast.parse(code)
+    except Exception as e:
+        logger.warning(f"Error calculating complexity for {filename}: {e}")
+        return {**_file_result(filename, [], None, _raw_dict(raw)), "error": str(e)}
+
+    visitor = ComplexityVisitor.from_ast(tree, no_assert=True)
+    cc_results = [
+        {
+            "name": block.name,
+            "type": _block_type(block, Class),
+            "complexity": block.complexity,
+            "lineno": block.lineno,
+            "rank": cc_rank(block.complexity),
+        }
+        for block in visitor.blocks
+    ]
+
+    mi = None
+    if raw is not None:
+        # The maintainability index counts asserts, so only code with asserts needs a second visit
+        counted = ComplexityVisitor.from_ast(tree) if "assert" in code else visitor
+        comment_lines = raw.comments + raw.multi
+        comments = comment_lines / float(raw.sloc) * 100 if raw.sloc != 0 else 0
+        value = mi_compute(
+            h_visit_ast(tree).total.volume, counted.total_complexity, raw.lloc, comments
+        )
+        mi = round(value, 2) if value else None
+
+    return _file_result(filename, cc_results, mi, _raw_dict(raw))
+
+
+def _failed_result(filename: str, error: str) -> dict[str, Any]:
+    """Empty analysis of a file that could not be analyzed (never cached)."""
+    return {**_file_result(filename, [], None, dict(EMPTY_RAW_METRICS)), "error": error}
+
+
+def _analyze_chunk(files: list[tuple[str, str]]) -> list[dict[str, Any]]:
+    """Analyze a chunk of (filename, code) pairs (process pool entry point)."""
+    return [analyze_source(code, filename) for filename, code in files]
+
+
+def _block_type(block: Any, class_type: type) -> str:
+    """Kind of a radon block: class, method or function."""
+    if isinstance(block, class_type):
+        return "class"
+    return "method" if block.is_method else "function"
+
+
+def _raw_dict(raw: Any) -> dict[str, int]:
+    """Raw metrics as a dictionary (zeros when tokenizing failed)."""
+    if raw is None:
+        return dict(EMPTY_RAW_METRICS)
+    return {
+        "loc": raw.loc,  # Lines of code
+        "lloc": raw.lloc,  # Logical lines of code
+        "sloc": raw.sloc,  # Source lines of code
+        "comments": raw.comments,
+        "multi": raw.multi,  # Multi-line strings
+        "blank": raw.blank,
+    }
+
+
+def _file_result(
+    filename: str, cc_results: list[dict], mi: float | None, raw: dict[str, int]
+) -> dict[str, Any]:
+    """Per-file analysis record."""
+    # Calculate average complexity
+    avg_complexity = 0.0
+    max_complexity = 0
+    if cc_results:
+        complexities = [r["complexity"] for r in cc_results]
+        avg_complexity = sum(complexities) / len(complexities)
+        max_complexity = max(complexities)
+
+    return {
+        "filename": filename,
+        "cyclomatic_complexity": cc_results,
+        "average_complexity": round(avg_complexity, 2),
+        "max_complexity": max_complexity,
+        "maintainability_index": mi,
+        "raw_metrics": raw,
+        "total_functions": len(cc_results),
+        "complex_functions": len(
+            [r for r in cc_results if r["complexity"] > COMPLEX_FUNCTION_THRESHOLD]
+        ),
+    }
 
 
 class ComplexityAnalyzer:
     """Analyze code complexity metrics across repositories."""
 
-    def __init__(self, logger: logging.Logger | None = None):
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        max_workers: int | None = None,
+        cache: ResultCache | None = None,
+    ):
+        """
+        Initialize the analyzer.
+
+        Args:
+            logger: Logger instance
+            max_workers: Worker processes for analyzing many files (CPU count
+                when None; 1 analyzes serially)
+            cache: Per-file result cache keyed by content hash (no caching when None)
+        """
         self.logger = logger or logging.getLogger(__name__)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache = cache
 
     def calculate_cyclomatic_complexity(self, code: str, filename: str = "temp.py") -> list[dict]:
         """
@@ -29,26 +234,8 @@ class ComplexityAnalyzer:
         Returns:
             List of complexity results per function/class
         """
-        try:
-            from radon.complexity import cc_visit
-
-            results = cc_visit(code, no_assert=True)
-            return [
-                {
-                    "name": result.name,
-                    "type": result.type,
-                    "complexity": result.complexity,
-                    "lineno": result.lineno,
-                    "rank": result.letter,
-                }
-                for result in results
-            ]
-        except ImportError:
-            self.logger.warning("radon not installed, skipping complexity analysis")
-            return []
-        except Exception as e:
-            self.logger.warning(f"Error calculating complexity for {filename}: {e}")
-            return []
+        results: list[dict] = analyze_source(code, filename, self.logger)["cyclomatic_complexity"]
+        return results
 
     def calculate_maintainability_index(self, code: str) -> float | None:
         """
@@ -60,18 +247,8 @@ class ComplexityAnalyzer:
         Returns:
             Maintainability index (0-100) or None if calculation fails
         """
-        try:
-            from radon.metrics import mi_visit
-
-            mi = mi_visit(code, multi=True)
-            if mi:
-                return round(mi, 2)
-            return None
-        except ImportError:
-            return None
-        except Exception as e:
-            self.logger.warning(f"Error calculating maintainability index: {e}")
-            return None
+        index: float | None = analyze_source(code, "temp.py", self.logger)["maintainability_index"]
+        return index
 
     def calculate_raw_metrics(self, code: str) -> dict[str, int]:
         """
@@ -83,23 +260,8 @@ class ComplexityAnalyzer:
         Returns:
             Dictionary with raw metrics
         """
-        try:
-            from radon.raw import analyze
-
-            analysis = analyze(code)
-            return {
-                "loc": analysis.loc,  # Lines of code
-                "lloc": analysis.lloc,  # Logical lines of code
-                "sloc": analysis.sloc,  # Source lines of code
-                "comments": analysis.comments,
-                "multi": analysis.multi,  # Multi-line strings
-                "blank": analysis.blank,
-            }
-        except ImportError:
-            return {"loc": 0, "lloc": 0, "sloc": 0, "comments": 0, "multi": 0, "blank": 0}
-        except Exception as e:
-            self.logger.warning(f"Error calculating raw metrics: {e}")
-            return {"loc": 0, "lloc": 0, "sloc": 0, "comments": 0, "multi": 0, "blank": 0}
+        metrics: dict[str, int] = analyze_source(code, "temp.py", self.logger)["raw_metrics"]
+        return metrics
 
     def analyze_code_file(self, code: str, filename: str) -> dict[str, Any]:
         """
@@ -112,28 +274,74 @@ class ComplexityAnalyzer:
         Returns:
             Dictionary with all complexity metrics
         """
-        cc_results = self.calculate_cyclomatic_complexity(code, filename)
-        mi = self.calculate_maintainability_index(code)
-        raw = self.calculate_raw_metrics(code)
-
-        # Calculate average complexity
-        avg_complexity = 0.0
-        max_complexity = 0
-        if cc_results:
-            complexities = [r["complexity"] for r in cc_results]
-            avg_complexity = sum(complexities) / len(complexities)
-            max_complexity = max(complexities)
+        return analyze_source(code, filename, self.logger)
 
-        return {
-            "filename": filename,
-            "cyclomatic_complexity": cc_results,
-            "average_complexity": round(avg_complexity, 2),
-            "max_complexity": max_complexity,
-            "maintainability_index": mi,
-            "raw_metrics": raw,
-            "total_functions": len(cc_results),
-            "complex_functions": len([r for r in cc_results if r["complexity"] > 10]),
-        }
+    def analyze_files(self, files: Sequence[tuple[str, str] | SourceFile]) -> list[dict[str, Any]]:
+        """
+        Analyze many files, reusing cached results for content seen before.
+
+        Args:
+            files: (filename, code) pairs or SourceFile entries
+
+        Returns:
+            Per-file analyses in input order
+        """
+        sources = [SourceFile(*f) for f in files]
+        if self.cache is None:
+            return self._analyze_sources(sources)
+
+        digests = [s.digest for s in sources]
+        results = self.cache.get_many(digests)
+
+        # Analyze each new content once, however many files share it
+        misses: dict[str, SourceFile] = {}
+        for source, digest in zip(sources, digests):
+            if digest not in results:
+                misses.setdefault(digest, source)
+        if misses:
+            fresh = self._analyze_sources(list(misses.values()))
+            analyzed = {
+                digest: {k: v for k, v in result.items() if k != "filename"}
+                for digest, result in zip(misses, fresh)
+            }
+            # Failed analyses (unresolved text, parse errors, no radon) are retried next run
+            self.cache.put_many({d: r for d, r in analyzed.items() if "error" not in r})
+            results.update(analyzed)
+
+        self.logger.info(
+            f"Complexity analysis: {len(sources) - len(misses)} files cached, "
+            f"{len(misses)} analyzed"
+        )
+        return [
+            {"filename": source.filename, **results[digest]}
+            for source, digest in zip(sources, digests)
+        ]
+
+    def _analyze_sources(self, sources: list[SourceFile]) -> list[dict[str, Any]]:
+        """Analyze source files; files whose text cannot be read get a failed result."""
+        texts = [(s.filename, s.text()) for s in sources]
+        readable = [(filename, code) for filename, code in texts if code is not None]
+        analyzed = iter(self._analyze_texts(readable))
+        results = []
+        for filename, code in texts:
+            if code is None:
+                self.logger.warning(f"Could not read {filename}: unresolved blob reference")
+                results.append(_failed_result(filename, "unresolved blob reference"))
+            else:
+                results.append(next(analyzed))
+        return results
+
+    def _analyze_texts(self, files: list[tuple[str, str]]) -> list[dict[str, Any]]:
+        """Analyze (filename, code) pairs, in parallel when there are enough of them."""
+        workers = min(self.max_workers, len(files) // MIN_PARALLEL_FILES)
+        if workers <= 1:
+            return [self.analyze_code_file(code, filename) for filename, code in files]
+
+        # Contiguous chunks keep the merged results in input order
+        size = -(-len(files) // (workers * CHUNKS_PER_WORKER))
+        chunks = [files[i : i + size] for i in range(0, len(files), size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return [result for chunk in executor.map(_analyze_chunk, chunks) for result in chunk]
 
     def analyze_repository_complexity(self, repository: Repository) -> dict[str, Any]:
         """
@@ -145,27 +353,32 @@ class ComplexityAnalyzer:
         Returns:
             Dictionary with repository complexity metrics
         """
+        file_analyses = self.analyze_files(self._python_files(repository))
+        return self._summarize_repository(repository, file_analyses)
+
+    @staticmethod
+    def _python_files(repository: Repository) -> list[SourceFile]:
+        """Python files in a repository's metadata."""
         metadata = repository.metadata or {}
+        blobs = None
+        if isinstance(metadata, LazyBlobDict):
+            # Keep blob references unresolved; cached files are never read
+            blobs = metadata.store
+            metadata = metadata.raw()
         code_files = metadata.get("code_files", {})
+        if not code_files or not isinstance(code_files, dict) or is_blob_ref(code_files):
+            return []
+        # Only analyze Python files
+        return [
+            SourceFile(name, code, blobs)
+            for name, code in code_files.items()
+            if name.endswith(".py")
+        ]
 
-        if not code_files or not isinstance(code_files, dict):
-            return {
-                "repository": repository.name,
-                "language": repository.language,
-                "has_code_analysis": False,
-                "total_files": 0,
-                "total_loc": 0,
-                "total_functions": 0,
-                "average_complexity": 0.0,
-                "average_maintainability": 0.0,
-            }
-
-        file_analyses = []
-        for filename, code in code_files.items():
-            if filename.endswith(".py"):  # Only analyze Python files
-                analysis = self.analyze_code_file(code, filename)
-                file_analyses.append(analysis)
-
+    def _summarize_repository(
+        self, repository: Repository, file_analyses: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Aggregate per-file analyses into repository metrics."""
         if not file_analyses:
             return {
                 "repository": repository.name,
@@ -229,8 +442,13 @@ class ComplexityAnalyzer:
         total_functions = 0
         total_complex_functions = 0
 
-        for repo in repositories:
-            analysis = self.analyze_repository_complexity(repo)
+        # Analyze every file of the organization in one batch, then split per repository
+        repo_files = [self._python_files(repo) for repo in repositories]
+        results = iter(self.analyze_files([f for files in repo_files for f in files]))
+
+        for repo, files in zip(repositories, repo_files):
+            file_analyses = [next(results) for _ in files]
+            analysis = self._summarize_repository(repo, file_analyses)
             if analysis["has_code_analysis"]:
                 repo_analyses.append(analysis)
                 total_files += analysis["total_files"]
@@ -287,40 +505,53 @@ class ComplexityAnalyzer:
         self.logger.info(f"Complexity analysis report saved to {output_path}")
 
 
-def analyze_all_complexity(repos_data: list[dict[str, Any]]) -> dict[str, Any]:
+def analyze_all_complexity(
+    repos_data: list[dict[str, Any]],
+    cache_path: Path | str | None = DEFAULT_CACHE_PATH,
+    blobs_dir: Path | str = Path("data/blobs"),
+) -> dict[str, Any]:
     """
     Standalone function to analyze complexity for all repositories.
 
     Args:
         repos_data: List of repository dictionaries (from repos.json)
+        cache_path: Per-file result cache (None analyzes every file)
+        blobs_dir: Blob store that externalized code files resolve from
 
     Returns:
         Complexity analysis dictionary
     """
-    repositories = [Repository.from_dict(repo_data) for repo_data in repos_data]
+    repositories = Repository.from_dicts(repos_data, BlobStore(blobs_dir))
 
-    analyzer = ComplexityAnalyzer()
-    return analyzer.analyze_organization_complexity(repositories)
+    if cache_path is None:
+        return ComplexityAnalyzer().analyze_organization_complexity(repositories)
+    with open_result_cache(cache_path) as cache:
+        return ComplexityAnalyzer(cache=cache).analyze_organization_complexity(repositories)
 
 
-def generate_complexity_report(output_path: str | Path = "data/complexity.json") -> None:
+def generate_complexity_report(
+    output_path: str | Path = "data/complexity.json",
+    data_dir: str | Path = "data",
+    cache_path: str | Path = DEFAULT_CACHE_PATH,
+) -> None:
     """
     Generate complexity analysis report from existing repository data.
 
+    Only files whose content changed since the last run are analyzed; the
+    others are read from the result cache.
+
     Args:
         output_path: Path to save the report
+        data_dir: Repository data directory
+        cache_path: Per-file result cache
     """
-    repos_file = Path("data/repos.json")
-    if not repos_file.exists():
-        raise FileNotFoundError(f"Repository data not found: {repos_file}")
-
-    with open(repos_file, encoding="utf-8") as f:
-        repos_data = json.load(f)
-
-    analysis = analyze_all_complexity(repos_data)
+    repositories = list(get_datastore(data_dir).repositories())
 
-    analyzer = ComplexityAnalyzer()
-    analyzer.save_complexity_report(analysis, Path(output_path))
+    with open_result_cache(cache_path) as cache:
+        analyzer = ComplexityAnalyzer(cache=cache)
+        analysis = analyzer.analyze_organization_complexity(repositories)
+        analyzer.save_complexity_report(analysis, Path(output_path))
+        cache.prune()
 
     print("\nCode Complexity Summary:")
     print(f"  - Repositories analyzed: {analysis['organization_metrics']['repositories_analyzed']}")
@@ -0,0 +1,465 @@
+"""Shared tokenized corpus of repository text.
+
+READMEs, descriptions, research abstracts, publications and notebooks of
+every repository are normalized and tokenized once, with one set of rules
+(``normalize_text``, ``tokenize`` and STOP_WORDS), so search, topic
+modeling and similarity agree on what a term is.
+
+The corpus is persisted as one ``.npz`` file holding the vocabulary, the
+token stream of every document (term ids), and the sparse document-term
+count and TF-IDF matrices. Documents are re-tokenized only when their text
+changes; unchanged READMEs and notebooks are recognized by their blob
+digest without being read.
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+from ..models.repository import Repository
+from ..storage.blobs import BLOB_KEY, BlobStore, LazyBlobDict, is_blob_ref
+
+# Default location of the persisted corpus
+DEFAULT_CORPUS_PATH = Path("data/corpus.npz")
+
+# Words never indexed (scikit-learn's English list, shared with topic modeling)
+STOP_WORDS = ENGLISH_STOP_WORDS
+
+# Shortest token kept
+MIN_TOKEN_LENGTH = 3
+
+# Document kinds of a repository
+KINDS = ("description", "readme", "abstract", "publication", "notebook")
+
+# Vocabulary share of unused terms that triggers renumbering the vocabulary
+COMPACT_UNUSED = 0.5
+
+# README placeholder written by the fetchers
+_NO_README = "No README available"
+
+_URL = re.compile(r"https?://\S+|www\.\S+")
+_CODE_BLOCK = re.compile(r"```[\s\S]*?```")
+_INLINE_CODE = re.compile(r"`[^`]*`")
+_HTML_TAG = re.compile(r"<[^>]+>")
+# Words, keeping inner hyphens and digits ("scikit-learn", "python3")
+_TOKEN = re.compile(r"[a-z][a-z0-9]*(?:-[a-z0-9]+)*")
+
+
+def normalize_text(text: str) -> str:
+    """Lower-cased text without URLs, code blocks, inline code and HTML tags."""
+    text = text.lower()
+    text = _URL.sub(" ", text)
+    text = _CODE_BLOCK.sub(" ", text)
+    text = _INLINE_CODE.sub(" ", text)
+    return _HTML_TAG.sub(" ", text)
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Terms of a text, in order.
+
+    Args:
+        text: Raw text (Markdown, plain text)
+
+    Returns:
+        Normalized tokens without stop words and tokens shorter than
+        MIN_TOKEN_LENGTH
+    """
+    if not text:
+        return []
+    return [
+        token
+        for token in _TOKEN.findall(normalize_text(text))
+        if len(token) >= MIN_TOKEN_LENGTH and token not in STOP_WORDS
+    ]
+
+
+def notebook_text(content: str) -> str:
+    """Markdown and code of a Jupyter notebook (other formats are returned unchanged)."""
+    try:
+        notebook = json.loads(content)
+    except (TypeError, ValueError):
+        return content
+    if not isinstance(notebook, dict) or not isinstance(notebook.get("cells"), list):
+        return content
+    parts = []
+    for cell in notebook["cells"]:
+        source = cell.get("source", "") if isinstance(cell, dict) else ""
+        parts.append("".join(source) if isinstance(source, list) else str(source))
+    return "\n".join(parts)
+
+
+def tfidf(counts: sparse.csr_matrix) -> sparse.csr_matrix:
+    """
+    TF-IDF weights of a count matrix (rows are documents).
+
+    Uses smoothed inverse document frequencies and L2-normalized rows, as
+    scikit-learn's TfidfTransformer does by default.
+    """
+    counts = sparse.csr_matrix(counts, dtype=np.float64)
+    n_documents = counts.shape[0]
+    document_frequency = np.bincount(counts.indices, minlength=counts.shape[1])
+    idf = np.log((1 + n_documents) / (1 + document_frequency)) + 1
+    weights = counts.multiply(idf).tocsr()
+    norms = np.sqrt(np.asarray(weights.multiply(weights).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    weights = sparse.csr_matrix(sparse.diags(1 / norms) @ weights)
+    # Same sparsity structure as the counts, so both can share indices on disk
+    weights.sort_indices()
+    return weights
+
+
+class CorpusDocument(NamedTuple):
+    """A tokenized document of the corpus."""
+
+    repo: str
+    kind: str
+    title: str
+    digest: str
+    tokens: np.ndarray
+
+
+class _Source(NamedTuple):
+    """A document before tokenization; text is only read when needed."""
+
+    doc_id: str
+    kind: str
+    title: str
+    digest: str
+    text: Callable[[], str]
+
+
+def _text_digest(value: Any) -> str:
+    """Digest of inline text, or the digest a blob reference already carries."""
+    return value[BLOB_KEY] if is_blob_ref(value) else BlobStore.digest(value)
+
+
+def _sources(repository: Repository) -> Iterator[_Source]:
+    """Documents of a repository, keeping blob references unresolved."""
+    name = repository.name
+    metadata = repository.metadata or {}
+    store = metadata.store if isinstance(metadata, LazyBlobDict) else None
+    raw = metadata.raw() if isinstance(metadata, LazyBlobDict) else metadata
+
+    def text_of(value: Any) -> str:
+        value = store.resolve(value) if store is not None else value
+        return value if isinstance(value, str) else ""
+
+    def notebook_text_of(value: Any) -> str:
+        return notebook_text(text_of(value))
+
+    if repository.description:
+        yield _Source(
+            f"{name}/description",
+            "description",
+            name,
+            BlobStore.digest(repository.description),
+            partial(str, repository.description),
+        )
+
+    readme = raw.get("readme")
+    if readme and readme != _NO_README and (is_blob_ref(readme) or isinstance(readme, str)):
+        yield _Source(
+            f"{name}/readme",
+            "readme",
+            repository.description or name,
+            _text_digest(readme),
+            partial(text_of, readme),
+        )
+
+    research_metadata = repository.research_metadata or {}
+    research = research_metadata.get("research") or {}
+    if isinstance(research, dict) and research.get("abstract"):
+        yield _Source(
+            f"{name}/abstract",
+            "abstract",
+            research.get("title") or name,
+            BlobStore.digest(research["abstract"]),
+            partial(str, research["abstract"]),
+        )
+
+    for i, pub in enumerate(research_metadata.get("publications") or []):
+        if isinstance(pub, dict) and (pub.get("title") or pub.get("abstract")):
+            content = f"{pub.get('title', '')} {pub.get('abstract', '')}"
+            yield _Source(
+                f"{name}/publication/{i}",
+                "publication",
+                pub.get("title") or "Untitled",
+                BlobStore.digest(content),
+                partial(str, content),
+            )
+
+    notebooks = raw.get("notebooks")
+    if isinstance(notebooks, dict) and not is_blob_ref(notebooks):
+        for path, content in sorted(notebooks.items()):
+            if content and (is_blob_ref(content) or isinstance(content, str)):
+                yield _Source(
+                    f"{name}/notebook/{path}",
+                    "notebook",
+                    path,
+                    _text_digest(content),
+                    partial(notebook_text_of, content),
+                )
+
+
+class Corpus:
+    """Tokenized repository documents with their vocabulary and sparse matrices."""
+
+    def __init__(self, path: Path | str = DEFAULT_CORPUS_PATH):
+        self.path = Path(path)
+        self._terms: list[str] = []
+        self._index: dict[str, int] = {}
+        self._documents: dict[str, CorpusDocument] = {}
+        self._counts: sparse.csr_matrix | None = None
+        self._tfidf: sparse.csr_matrix | None = None
+        self._by_repo: dict[str, list[str]] | None = None
+        if self.path.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._documents
+
+    @property
+    def terms(self) -> list[str]:
+        """Vocabulary, indexed by term id (column of the matrices)."""
+        return self._terms
+
+    def update(self, repositories: Iterable[Repository]) -> int:
+        """
+        Bring the corpus up to date with the repositories.
+
+        Only new or changed documents are tokenized; documents of
+        repositories that are gone are dropped.
+
+        Args:
+            repositories: Repository models
+
+        Returns:
+            Number of documents tokenized
+        """
+        documents: dict[str, CorpusDocument] = {}
+        tokenized = 0
+        for repository in repositories:
+            for source in _sources(repository):
+                known = self._documents.get(source.doc_id)
+                if known is not None and known.digest == source.digest:
+                    documents[source.doc_id] = known._replace(title=source.title)
+                    continue
+                tokens = self._term_ids(tokenize(source.text()))
+                documents[source.doc_id] = CorpusDocument(
+                    repository.name, source.kind, source.title, source.digest, tokens
+                )
+                tokenized += 1
+
+        self._documents = documents
+        self._counts = self._tfidf = self._by_repo = None
+        self._compact()
+        return tokenized
+
+    def documents(
+        self, repo: str | None = None, kinds: Iterable[str] | None = None
+    ) -> list[dict[str, str]]:
+        """Documents (``id``, ``repo``, ``kind``, ``title``) in matrix row order."""
+        kinds = set(kinds) if kinds is not None else None
+        if repo is None:
+            doc_ids: Iterable[str] = self._documents
+        else:
+            if self._by_repo is None:
+                self._by_repo = {}
+                for doc_id, doc in self._documents.items():
+                    self._by_repo.setdefault(doc.repo, []).append(doc_id)
+            doc_ids = self._by_repo.get(repo, [])
+        documents = []
+        for doc_id in doc_ids:
+            doc = self._documents[doc_id]
+            if kinds is None or doc.kind in kinds:
+                documents.append(
+                    {"id": doc_id, "repo": doc.repo, "kind": doc.kind, "title": doc.title}
+                )
+        return documents
+
+    def tokens(self, doc_id: str) -> list[str]:
+        """Token stream of a document."""
+        terms = self._terms
+        return [terms[i] for i in self._documents[doc_id].tokens]
+
+    def repository_tokens(self, repo: str, kinds: Iterable[str] | None = None) -> list[str]:
+        """Token streams of a repository's documents, concatenated."""
+        return [token for doc in self.documents(repo, kinds) for token in self.tokens(doc["id"])]
+
+    def fingerprint(self, repo: str, kinds: Iterable[str] | None = None) -> str:
+        """Digest of a repository's documents (changes whenever one of their texts does)."""
+        return BlobStore.digest(
+            "\n".join(
+                f"{doc['id']}\0{self._documents[doc['id']].digest}"
+                for doc in self.documents(repo, kinds)
+            )
+        )
+
+    def counts(self) -> sparse.csr_matrix:
+        """Document-term count matrix (rows in ``documents()`` order)."""
+        if self._counts is None:
+            streams = [doc.tokens for doc in self._documents.values()]
+            lengths = np.fromiter((len(s) for s in streams), dtype=np.int64, count=len(streams))
+            rows = np.repeat(np.arange(len(streams)), lengths)
+            columns = np.concatenate(streams) if streams else np.zeros(0, dtype=np.int32)
+            counts = sparse.csr_matrix(
+                (np.ones(len(columns), dtype=np.int32), (rows, columns)),
+                shape=(len(streams), len(self._terms)),
+            )
+            counts.sum_duplicates()
+            self._counts = counts
+        return self._counts
+
+    def tfidf(self) -> sparse.csr_matrix:
+        """Document-term TF-IDF matrix (rows in ``documents()`` order)."""
+        if self._tfidf is None:
+            self._tfidf = tfidf(self.counts())
+        return self._tfidf
+
+    def repository_counts(
+        self, kinds: Iterable[str] | None = None
+    ) -> tuple[list[str], sparse.csr_matrix]:
+        """
+        Term counts summed over each repository's documents.
+
+        Args:
+            kinds: Document kinds to include (all when None)
+
+        Returns:
+            Repository names and the repository-term count matrix
+        """
+        kinds = set(kinds) if kinds is not None else None
+        names: list[str] = []
+        repo_rows: dict[str, int] = {}
+        rows, columns = [], []
+        for column, doc in enumerate(self._documents.values()):
+            if kinds is None or doc.kind in kinds:
+                rows.append(repo_rows.setdefault(doc.repo, len(repo_rows)))
+                columns.append(column)
+                if len(names) < len(repo_rows):
+                    names.append(doc.repo)
+        membership = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, columns)), shape=(len(names), len(self._documents))
+        )
+        return names, sparse.csr_matrix(membership @ self.counts())
+
+    def save(self) -> None:
+        """Write the corpus atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        documents = list(self._documents.items())
+        streams = [doc.tokens for _, doc in documents]
+        counts, weights = self.counts(), self.tfidf()
+        arrays = {
+            "terms": np.array(self._terms, dtype=str),
+            "doc_ids": np.array([doc_id for doc_id, _ in documents], dtype=str),
+            "repos": np.array([doc.repo for _, doc in documents], dtype=str),
+            "kinds": np.array([doc.kind for _, doc in documents], dtype=str),
+            "titles": np.array([doc.title for _, doc in documents], dtype=str),
+            "digests": np.array([doc.digest for _, doc in documents], dtype=str),
+            "tokens": np.concatenate(streams) if streams else np.zeros(0, dtype=np.int32),
+            "token_offsets": np.cumsum([0] + [len(s) for s in streams], dtype=np.int64),
+            "counts_data": counts.data,
+            "counts_indices": counts.indices,
+            "counts_indptr": counts.indptr,
+            "tfidf_data": weights.data,
+        }
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp-", suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _term_ids(self, tokens: list[str]) -> np.ndarray:
+        """Term ids of tokens, adding new terms to the vocabulary."""
+        index = self._index
+        for token in tokens:
+            if token not in index:
+                index[token] = len(self._terms)
+                self._terms.append(token)
+        return np.fromiter((index[t] for t in tokens), dtype=np.int32, count=len(tokens))
+
+    def _compact(self) -> None:
+        """Drop terms no document uses once they make up COMPACT_UNUSED of the vocabulary."""
+        if not self._terms:
+            return
+        used = np.zeros(len(self._terms), dtype=bool)
+        for doc in self._documents.values():
+            used[doc.tokens] = True
+        if used.sum() > (1 - COMPACT_UNUSED) * len(self._terms):
+            return
+        remap = np.cumsum(used, dtype=np.int32) - 1
+        self._terms = [term for term, keep in zip(self._terms, used, strict=True) if keep]
+        self._index = {term: i for i, term in enumerate(self._terms)}
+        self._documents = {
+            doc_id: doc._replace(tokens=remap[doc.tokens])
+            for doc_id, doc in self._documents.items()
+        }
+
+    def _load(self) -> None:
+        """Restore the persisted corpus."""
+        with np.load(self.path, allow_pickle=False) as data:
+            self._terms = data["terms"].tolist()
+            tokens, offsets = data["tokens"], data["token_offsets"]
+            self._documents = {
+                doc_id: CorpusDocument(
+                    repo, kind, title, digest, tokens[offsets[i] : offsets[i + 1]]
+                )
+                for i, (doc_id, repo, kind, title, digest) in enumerate(
+                    zip(
+                        data["doc_ids"].tolist(),
+                        data["repos"].tolist(),
+                        data["kinds"].tolist(),
+                        data["titles"].tolist(),
+                        data["digests"].tolist(),
+                        strict=True,
+                    )
+                )
+            }
+            shape = (len(self._documents), len(self._terms))
+            matrix = (data["counts_indices"], data["counts_indptr"])
+            self._counts = sparse.csr_matrix((data["counts_data"], *matrix), shape=shape)
+            self._tfidf = sparse.csr_matrix((data["tfidf_data"], *matrix), shape=shape)
+        self._index = {term: i for i, term in enumerate(self._terms)}
+
+
+def build_corpus(
+    repositories: Iterable[Repository],
+    path: Path | str = DEFAULT_CORPUS_PATH,
+    logger: logging.Logger | None = None,
+) -> Corpus:
+    """
+    Update the persisted corpus with the repositories and save it.
+
+    Args:
+        repositories: Repository models
+        path: Location of the corpus
+        logger: Optional logger instance
+
+    Returns:
+        The up-to-date corpus
+    """
+    logger = logger or logging.getLogger(__name__)
+    corpus = Corpus(path)
+    tokenized = corpus.update(repositories)
+    corpus.save()
+    logger.info(
+        f"Corpus: {len(corpus)} documents ({tokenized} tokenized), {len(corpus.terms)} terms"
+    )
+    return corpus
@@ -2,26 +2,161 @@
 
 Analyzes package dependencies across repositories to identify
 shared dependencies, dependency clusters, and ecosystem patterns.
+
+Repository overlaps are computed from a sparse repository x package
+incidence matrix: one sparse product per block of rows gives the shared
+package counts, from which Jaccard similarity follows, and only the
+strongest overlaps of each repository are kept. Clusters are communities of
+the resulting similarity graph.
 """
 
 import json
 import logging
-import re
 from collections import Counter
+from collections.abc import Iterable
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Any
 
 import networkx as nx
+import numpy as np
+from scipy import sparse
 
 from ..models.repository import Repository
+from ..storage.datastore import get_datastore
+from ..storage.dependency_index import LOCK_MANIFESTS, DependencyIndex
+from ..storage.package_index import PackageIndex, normalize_name
+from .manifests import (
+    MANIFEST_KINDS,
+    Dependency,
+    ManifestExtractor,
+    manifest_fingerprint,
+    open_manifest_cache,
+)
+from .resolver import MANIFEST_ECOSYSTEMS, DependencyResolver
+from .similarity import NEAR_DUPLICATE_SIMILARITY, SIMILAR_STACK_SIMILARITY, SimilarityIndex
+
+# Overlaps reported per repository (strongest Jaccard similarity first)
+TOP_OVERLAPS = 10
+
+# Minimum Jaccard similarity for two repositories to be linked in a cluster
+CLUSTER_SIMILARITY = 0.3
+
+# Incidence rows multiplied at once (bounds memory to block x repositories)
+OVERLAP_BLOCK_ROWS = 1024
+
+
+def incidence_matrix(
+    dependency_sets: Iterable[set[str]],
+) -> tuple[sparse.csr_matrix, list[str]]:
+    """
+    Binary repository x package incidence matrix.
+
+    Args:
+        dependency_sets: Package names used by each repository
+
+    Returns:
+        Sparse matrix (one row per repository) and the package of each column
+    """
+    packages: dict[str, int] = {}
+    indptr = [0]
+    indices: list[int] = []
+    for deps in dependency_sets:
+        indices.extend(packages.setdefault(dep, len(packages)) for dep in sorted(deps))
+        indptr.append(len(indices))
+    matrix = sparse.csr_matrix(
+        (np.ones(len(indices), dtype=np.int32), indices, indptr),
+        shape=(len(indptr) - 1, len(packages)),
+    )
+    return matrix, list(packages)
+
+
+def top_overlaps(
+    incidence: sparse.csr_matrix,
+    top_k: int = TOP_OVERLAPS,
+    block_rows: int = OVERLAP_BLOCK_ROWS,
+) -> dict[tuple[int, int], tuple[int, float]]:
+    """
+    Strongest package overlaps of every repository.
+
+    Args:
+        incidence: Binary repository x package matrix
+        top_k: Overlaps kept per repository (by Jaccard similarity, then
+            shared count, then row order)
+        block_rows: Rows multiplied at once
+
+    Returns:
+        (row, other row) with row < other -> (shared package count, Jaccard
+        similarity); a pair is kept when it is in the top k of either row
+    """
+    sizes = np.asarray(incidence.sum(axis=1)).ravel()
+    transposed = incidence.T.tocsr()
+    pairs: dict[tuple[int, int], tuple[int, float]] = {}
+
+    for start in range(0, incidence.shape[0], block_rows):
+        cooccurrence = (incidence[start : start + block_rows] @ transposed).tocsr()
+        for offset in range(cooccurrence.shape[0]):
+            row = start + offset
+            begin, end = cooccurrence.indptr[offset], cooccurrence.indptr[offset + 1]
+            others = cooccurrence.indices[begin:end]
+            counts = cooccurrence.data[begin:end]
+            keep = others != row
+            others, counts = others[keep], counts[keep]
+            if not len(others):
+                continue
+
+            jaccard = counts / (sizes[row] + sizes[others] - counts)
+            best = np.lexsort((others, -counts, -jaccard))[:top_k]
+            for other, count, similarity in zip(others[best], counts[best], jaccard[best]):
+                key = (row, int(other)) if row < other else (int(other), row)
+                pairs[key] = (int(count), float(similarity))
+    return pairs
+
+
+def similarity_clusters(
+    names: list[str],
+    overlaps: dict[tuple[int, int], tuple[int, float]],
+    threshold: float = CLUSTER_SIMILARITY,
+) -> list[list[str]]:
+    """
+    Communities of repositories with similar dependencies.
+
+    Args:
+        names: Repository name of each row
+        overlaps: Pair overlaps as returned by top_overlaps
+        threshold: Jaccard similarity above which two repositories are linked
+
+    Returns:
+        Clusters of two or more repositories (largest first, members in input order)
+    """
+    graph = nx.Graph()
+    graph.add_weighted_edges_from(
+        (i, j, similarity) for (i, j), (_, similarity) in overlaps.items() if similarity > threshold
+    )
+    if not graph.number_of_edges():
+        return []
+
+    communities = nx.community.louvain_communities(graph, weight="weight", seed=0)
+    clusters = [sorted(c) for c in communities if len(c) > 1]
+    clusters.sort(key=lambda c: (-len(c), c[0]))
+    return [[names[i] for i in cluster] for cluster in clusters]
 
 
 class DependencyAnalyzer:
     """Analyze dependency networks across repositories."""
 
-    def __init__(self, logger: logging.Logger | None = None):
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        manifests: ManifestExtractor | None = None,
+        resolver: DependencyResolver | None = None,
+    ):
         self.logger = logger or logging.getLogger(__name__)
         self.graph = nx.DiGraph()
+        # Parsed manifests are memoized per content hash
+        self.manifests = manifests or ManifestExtractor(self.logger)
+        # Transitive dependencies are only expanded when a package index snapshot is given
+        self.resolver = resolver
 
     def parse_requirements_txt(self, content: str) -> list[str]:
         """
@@ -33,27 +168,7 @@ class DependencyAnalyzer:
         Returns:
             List of package names
         """
-        dependencies = []
-        for line in content.splitlines():
-            line = line.strip()
-            # Skip comments and empty lines
-            if not line or line.startswith("#"):
-                continue
-            # Skip -e editable installs
-            if line.startswith("-e"):
-                continue
-            # Skip other pip options
-            if line.startswith("-"):
-                continue
-
-            # Extract package name (before version specifier)
-            # Handle formats: package==1.0, package>=1.0, package[extra]>=1.0
-            match = re.match(r"^([a-zA-Z0-9_\-\.]+)", line)
-            if match:
-                package = match.group(1).lower()
-                dependencies.append(package)
-
-        return dependencies
+        return [dep.name for dep in self.manifests.parse("requirements_txt", content)]
 
     def parse_pyproject_toml(self, content: str) -> list[str]:
         """
@@ -65,31 +180,7 @@ class DependencyAnalyzer:
         Returns:
             List of package names
         """
-        dependencies = []
-        try:
-            import tomli
-
-            data = tomli.loads(content)
-
-            # Check poetry dependencies
-            if "tool" in data and "poetry" in data["tool"]:
-                poetry_deps = data["tool"]["poetry"].get("dependencies", {})
-                for dep in poetry_deps:
-                    if dep != "python":  # Skip python version
-                        dependencies.append(dep.lower())
-
-            # Check project dependencies (PEP 621)
-            if "project" in data:
-                project_deps = data["project"].get("dependencies", [])
-                for dep in project_deps:
-                    match = re.match(r"^([a-zA-Z0-9_\-\.]+)", dep)
-                    if match:
-                        dependencies.append(match.group(1).lower())
-
-        except Exception as e:
-            self.logger.warning(f"Failed to parse pyproject.toml: {e}")
-
-        return dependencies
+        return [dep.name for dep in self.manifests.parse("pyproject_toml", content)]
 
     def parse_package_json(self, content: str) -> list[str]:
         """
@@ -101,22 +192,19 @@ class DependencyAnalyzer:
         Returns:
             List of package names
         """
-        dependencies = []
-        try:
-            data = json.loads(content)
-
-            # Regular dependencies
-            if "dependencies" in data:
-                dependencies.extend(data["dependencies"].keys())
+        return [dep.name for dep in self.manifests.parse("package_json", content)]
 
-            # Dev dependencies
-            if "devDependencies" in data:
-                dependencies.extend(data["devDependencies"].keys())
+    def extract_repository_manifests(self, repository: Repository) -> dict[str, list[Dependency]]:
+        """
+        Extract dependencies with version specifiers and extras from every manifest.
 
-        except Exception as e:
-            self.logger.warning(f"Failed to parse package.json: {e}")
+        Args:
+            repository: Repository model with metadata
 
-        return dependencies
+        Returns:
+            Dictionary mapping manifest kinds to dependency entries
+        """
+        return self.manifests.extract(repository)
 
     def extract_repository_dependencies(self, repository: Repository) -> dict[str, list[str]]:
         """
@@ -126,42 +214,35 @@ class DependencyAnalyzer:
             repository: Repository model with metadata
 
         Returns:
-            Dictionary mapping file types to dependency lists
+            Dictionary mapping manifest kinds (requirements, pyproject, package,
+            environment, setup_cfg, pipfile, poetry_lock, description) to
+            dependency lists
         """
-        dependencies = {"requirements": [], "pyproject": [], "package": []}
-
-        metadata = repository.metadata or {}
-
-        # Parse requirements.txt if available
-        if "requirements_txt" in metadata:
-            dependencies["requirements"] = self.parse_requirements_txt(metadata["requirements_txt"])
-
-        # Parse pyproject.toml if available
-        if "pyproject_toml" in metadata:
-            dependencies["pyproject"] = self.parse_pyproject_toml(metadata["pyproject_toml"])
-
-        # Parse package.json if available
-        if "package_json" in metadata:
-            dependencies["package"] = self.parse_package_json(metadata["package_json"])
-
-        return dependencies
+        return {
+            kind: [dep.name for dep in deps]
+            for kind, deps in self.extract_repository_manifests(repository).items()
+        }
 
-    def build_dependency_graph(self, repositories: list[Repository]) -> nx.DiGraph:
+    def build_dependency_graph(
+        self,
+        repositories: list[Repository],
+        dependencies: list[list[str]] | None = None,
+    ) -> nx.DiGraph:
         """
         Build a dependency network graph across all repositories.
 
         Args:
             repositories: List of repository models
+            dependencies: Already extracted dependencies of each repository
 
         Returns:
             NetworkX directed graph of dependencies
         """
         self.graph.clear()
+        if dependencies is None:
+            dependencies = [self._all_dependencies(repo) for repo in repositories]
 
-        for repo in repositories:
-            deps = self.extract_repository_dependencies(repo)
-            all_deps = deps["requirements"] + deps["pyproject"] + deps["package"]
-
+        for repo, all_deps in zip(repositories, dependencies):
             # Add repo node
             self.graph.add_node(
                 repo.name,
@@ -183,71 +264,100 @@ class DependencyAnalyzer:
 
         return self.graph
 
-    def analyze_dependency_patterns(self, repositories: list[Repository]) -> dict[str, Any]:
+    def add_transitive_dependencies(self, repositories: list[Repository]) -> dict[str, Any]:
+        """
+        Add the packages pulled in by direct dependencies to the graph.
+
+        Package -> requirement edges are added for everything reachable from
+        the repositories' direct dependencies, as listed by the resolver's
+        package index snapshot.
+
+        Args:
+            repositories: List of repository models (already in the graph)
+
+        Returns:
+            Dictionary mapping repo names to direct and total dependency counts
+        """
+        resolver = self.resolver
+        if resolver is None:
+            return {}
+
+        counts = {}
+        expanded: set[tuple[str, str]] = set()
+        for repo in repositories:
+            direct: set[str] = set()
+            total: set[str] = set()
+            for kind, names in self.extract_repository_dependencies(repo).items():
+                if kind in LOCK_MANIFESTS:
+                    continue
+                ecosystem = MANIFEST_ECOSYSTEMS[kind]
+                for name in names:
+                    name = normalize_name(ecosystem, name)
+                    direct.add(name)
+                    total |= resolver.closure(ecosystem, name)
+                    self._add_requirement_edges(resolver, ecosystem, name, expanded)
+            counts[repo.name] = {"direct": len(direct), "total": len(direct | total)}
+        return counts
+
+    def _add_requirement_edges(
+        self,
+        resolver: DependencyResolver,
+        ecosystem: str,
+        name: str,
+        expanded: set[tuple[str, str]],
+    ) -> None:
+        """Add requirement edges below a (normalized) package node, expanding each once."""
+        stack = [name]
+        while stack:
+            package = stack.pop()
+            key = (ecosystem, package)
+            if key in expanded:
+                continue
+            expanded.add(key)
+            for requirement in resolver.requirements(ecosystem, package):
+                if not self.graph.has_node(requirement):
+                    self.graph.add_node(requirement, node_type="package", transitive=True)
+                self.graph.add_edge(package, requirement, weight=1, relation="requires")
+                stack.append(requirement)
+
+    def analyze_dependency_patterns(
+        self, repositories: list[Repository], top_k: int = TOP_OVERLAPS
+    ) -> dict[str, Any]:
         """
         Analyze dependency patterns across repositories.
 
         Args:
             repositories: List of repository models
+            top_k: Overlaps reported per repository
 
         Returns:
             Dictionary with dependency analysis metrics
         """
-        self.build_dependency_graph(repositories)
+        dependencies = [self._all_dependencies(repo) for repo in repositories]
+        self.build_dependency_graph(repositories, dependencies)
+        transitive = self.add_transitive_dependencies(repositories)
 
         # Count package usage across repos
-        package_usage = Counter()
-        repo_dependencies = {}
-
-        for repo in repositories:
-            deps = self.extract_repository_dependencies(repo)
-            all_deps = set(deps["requirements"] + deps["pyproject"] + deps["package"])
-            repo_dependencies[repo.name] = all_deps
-
-            for dep in all_deps:
-                package_usage[dep] += 1
+        dependency_sets = [set(deps) for deps in dependencies]
+        package_usage = Counter(dep for deps in dependency_sets for dep in deps)
 
         # Find shared dependencies
         shared_dependencies = {pkg: count for pkg, count in package_usage.items() if count > 1}
 
-        # Calculate dependency overlap between repos
+        # Strongest dependency overlaps of each repo, from the sparse incidence matrix
+        incidence, _ = incidence_matrix(dependency_sets)
+        overlaps = top_overlaps(incidence, top_k)
+        repo_names = [repo.name for repo in repositories]
         overlap_matrix = {}
-        repo_names = list(repo_dependencies.keys())
-        for i, repo1 in enumerate(repo_names):
-            for repo2 in repo_names[i + 1 :]:
-                deps1 = repo_dependencies[repo1]
-                deps2 = repo_dependencies[repo2]
-                if deps1 or deps2:
-                    overlap = len(deps1 & deps2)
-                    if overlap > 0:
-                        overlap_matrix[f"{repo1}-{repo2}"] = {
-                            "overlap_count": overlap,
-                            "shared_packages": list(deps1 & deps2),
-                        }
-
-        # Find dependency clusters (repos with similar dependencies)
-        clusters = []
-        if len(repo_names) >= 2:
-            # Simple clustering: group repos that share many dependencies
-            for repo in repo_names:
-                cluster_members = [repo]
-                repo_deps = repo_dependencies[repo]
-                for other_repo in repo_names:
-                    if other_repo != repo:
-                        other_deps = repo_dependencies[other_repo]
-                        if repo_deps and other_deps:
-                            similarity = len(repo_deps & other_deps) / len(repo_deps | other_deps)
-                            if similarity > 0.3:  # 30% similarity threshold
-                                cluster_members.append(other_repo)
-                if len(cluster_members) > 1:
-                    clusters.append(cluster_members)
-
-        # Remove duplicate clusters
-        unique_clusters = []
-        for cluster in clusters:
-            cluster_set = set(cluster)
-            if not any(cluster_set == set(c) for c in unique_clusters):
-                unique_clusters.append(cluster)
+        for (i, j), (count, similarity) in sorted(overlaps.items()):
+            overlap_matrix[f"{repo_names[i]}-{repo_names[j]}"] = {
+                "overlap_count": count,
+                "jaccard": round(similarity, 4),
+                "shared_packages": sorted(dependency_sets[i] & dependency_sets[j]),
+            }
+
+        # Find dependency clusters (communities of repos with similar dependencies)
+        clusters = similarity_clusters(repo_names, overlaps)
 
         return {
             "total_repositories": len(repositories),
@@ -256,7 +366,8 @@ class DependencyAnalyzer:
             "most_common_packages": package_usage.most_common(20),
             "shared_dependencies": shared_dependencies,
             "dependency_overlap": overlap_matrix,
-            "dependency_clusters": unique_clusters,
+            "dependency_clusters": clusters,
+            "transitive_dependencies": transitive,
             "network_stats": {
                 "nodes": self.graph.number_of_nodes(),
                 "edges": self.graph.number_of_edges(),
@@ -274,12 +385,141 @@ class DependencyAnalyzer:
         Returns:
             Dictionary mapping repo names to dependency counts
         """
-        counts = {}
+        return {repo.name: len(set(self._all_dependencies(repo))) for repo in repositories}
+
+    def find_similar_repositories(
+        self,
+        repositories: list[Repository],
+        index: SimilarityIndex,
+        limit: int = 5,
+    ) -> dict[str, Any]:
+        """
+        Find repositories with similar stacks and near-duplicate repositories.
+
+        Signatures in the index are refreshed only for repositories whose
+        dependencies or content changed.
+
+        Args:
+            repositories: List of repository models
+            index: MinHash/LSH index of repository signatures
+            limit: Similar repositories reported per repository
+
+        Returns:
+            Dictionary with similar stacks per repository and near-duplicate pairs
+        """
+        updated = index.update_repositories(repositories, self._all_dependencies)
+        self.logger.info(f"Recomputed {updated} MinHash signatures")
+
+        similar_stacks = {}
         for repo in repositories:
-            deps = self.extract_repository_dependencies(repo)
-            all_deps = set(deps["requirements"] + deps["pyproject"] + deps["package"])
-            counts[repo.name] = len(all_deps)
-        return counts
+            matches = index.similar(
+                "dependencies", repo.name, threshold=SIMILAR_STACK_SIMILARITY, limit=limit
+            )
+            if matches:
+                similar_stacks[repo.name] = [
+                    {"repository": name, "similarity": round(similarity, 3)}
+                    for name, similarity in matches
+                ]
+
+        near_duplicates = [
+            {"repositories": [first, second], "similarity": round(similarity, 3)}
+            for first, second, similarity in index.similar_pairs(
+                "content", threshold=NEAR_DUPLICATE_SIMILARITY
+            )
+        ]
+        return {"similar_stacks": similar_stacks, "near_duplicates": near_duplicates}
+
+    def update_dependency_index(
+        self, repositories: list[Repository], index: DependencyIndex
+    ) -> int:
+        """
+        Bring the reverse-dependency index up to date.
+
+        Only repositories whose manifests changed are re-parsed and
+        re-indexed; repositories that no longer exist are dropped. Package
+        names are normalized per ecosystem (PEP 503 on PyPI), so spellings
+        such as ``scikit_learn`` and ``Scikit-Learn`` are one package.
+
+        Args:
+            repositories: List of repository models
+            index: Reverse-dependency index
+
+        Returns:
+            Number of repositories re-indexed
+        """
+        updated = 0
+        for repo in repositories:
+            fingerprint = manifest_fingerprint(repo)
+            if index.fingerprint(repo.name) == fingerprint:
+                continue
+            entries = [
+                (normalize_name(MANIFEST_ECOSYSTEMS[kind], dep.name), kind, dep.specifier)
+                for kind, deps in self.extract_repository_manifests(repo).items()
+                for dep in deps
+            ]
+            updated += index.update(repo.name, fingerprint, entries)
+
+        names = {repo.name for repo in repositories}
+        for name in index.repos():
+            if name not in names:
+                index.remove(name)
+        return updated
+
+    def summarize_dependency_index(
+        self, repositories: list[Repository], index: DependencyIndex
+    ) -> dict[str, Any]:
+        """
+        Package usage statistics and dependency graph read from the index.
+
+        Args:
+            repositories: List of repository models (already indexed)
+            index: Reverse-dependency index
+
+        Returns:
+            Dictionary with the usage metrics of analyze_dependency_patterns,
+            network statistics and org-wide version drift
+        """
+        self.build_dependency_graph(
+            repositories,
+            [
+                [
+                    d["package"]
+                    for d in index.dependencies(repo.name)
+                    if d["manifest"] not in LOCK_MANIFESTS
+                ]
+                for repo in repositories
+            ],
+        )
+        totals = index.totals()
+        usage = index.package_usage()
+        return {
+            "total_repositories": len(repositories),
+            "total_unique_packages": totals["packages"],
+            "total_dependencies": totals["dependencies"],
+            "most_common_packages": usage[:20],
+            "shared_dependencies": {pkg: count for pkg, count in usage if count > 1},
+            "version_drift": index.version_drift(),
+            "network_stats": {
+                "nodes": self.graph.number_of_nodes(),
+                "edges": self.graph.number_of_edges(),
+                "density": (nx.density(self.graph) if self.graph.number_of_nodes() > 0 else 0),
+            },
+        }
+
+    def _all_dependencies(self, repository: Repository) -> list[str]:
+        """
+        Normalized dependencies declared in a repository's manifests (duplicates kept).
+
+        Lock files are left out: they pin the whole resolved tree, not what
+        the repository depends on directly.
+        """
+        deps = self.extract_repository_dependencies(repository)
+        return [
+            normalize_name(MANIFEST_ECOSYSTEMS[kind], name)
+            for kind in MANIFEST_KINDS
+            if kind not in LOCK_MANIFESTS
+            for name in deps[kind]
+        ]
 
     def save_dependency_report(self, analysis: dict[str, Any], output_path: Path) -> None:
         """
@@ -307,29 +547,44 @@ def analyze_all_dependencies(repos_data: list[dict[str, Any]]) -> dict[str, Any]
     Returns:
         Dependency analysis dictionary
     """
-    repositories = [Repository.from_dict(repo_data) for repo_data in repos_data]
+    repositories = Repository.from_dicts(repos_data)
 
     analyzer = DependencyAnalyzer()
     return analyzer.analyze_dependency_patterns(repositories)
 
 
-def generate_dependency_report(output_path: str | Path = "data/dependencies.json") -> None:
+def generate_dependency_report(
+    output_path: str | Path = "data/dependencies.json", data_dir: str | Path = "data"
+) -> None:
     """
     Generate dependency analysis report from existing repository data.
 
     Args:
         output_path: Path to save the report
+        data_dir: Repository data directory (also holds the MinHash signatures
+            and, when available, the package_index.db snapshot used to expand
+            transitive dependencies)
     """
-    repos_file = Path("data/repos.json")
-    if not repos_file.exists():
-        raise FileNotFoundError(f"Repository data not found: {repos_file}")
-
-    with open(repos_file, encoding="utf-8") as f:
-        repos_data = json.load(f)
+    repositories = list(get_datastore(data_dir).repositories())
+    index_path = Path(data_dir) / "package_index.db"
+
+    with ExitStack() as stack:
+        cache = stack.enter_context(open_manifest_cache())
+        resolver = None
+        if index_path.exists():
+            resolver = DependencyResolver(stack.enter_context(PackageIndex(index_path)))
+        analyzer = DependencyAnalyzer(manifests=ManifestExtractor(cache=cache), resolver=resolver)
+        if resolver is None:
+            analyzer.logger.warning(
+                f"No package index at {index_path}; reporting direct dependencies only. "
+                "Build it with scripts/build_package_index.py"
+            )
+        analysis = analyzer.analyze_dependency_patterns(repositories)
 
-    analysis = analyze_all_dependencies(repos_data)
+        index = SimilarityIndex(Path(data_dir) / "minhash_signatures.npz")
+        analysis.update(analyzer.find_similar_repositories(repositories, index))
+        index.save()
 
-    analyzer = DependencyAnalyzer()
     analyzer.save_dependency_report(analysis, Path(output_path))
 
     print("\nDependency Analysis Summary:")
@@ -337,6 +592,9 @@ def generate_dependency_report(output_path: str | Path = "data/dependencies.json
     print(f"  - Unique packages: {analysis['total_unique_packages']}")
     print(f"  - Total dependencies: {analysis['total_dependencies']}")
     print(f"  - Top 5 packages: {analysis['most_common_packages'][:5]}")
+    print(f"  - Near-duplicate pairs: {len(analysis['near_duplicates'])}")
+    if resolver is None:
+        print(f"  - Transitive dependencies: not resolved (no {index_path})")
 
 
 if __name__ == "__main__":
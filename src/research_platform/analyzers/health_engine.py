@@ -0,0 +1,454 @@
+"""Vectorized repository health scoring.
+
+One engine computes every health score used by the platform for a whole
+organization at once:
+
+- ``summary_scores``: the 0-1 score of ``Repository.get_health_score``
+- ``category_scores``: the 0-100 activity/community/documentation/code quality
+  breakdown of ``Repository.calculate_health_score`` (used by ``HealthScorer``
+  and ``CodeQualityAnalyzer``)
+- ``dimension_scores``: the six weighted dimensions of the build report
+  (scripts/repository_health_scorer.py)
+
+All repositories are scored against a single reference timestamp. Naive
+timestamps are taken as UTC. Logarithms go through ``math.log10`` on the
+distinct values only, so results match the scalar formulas bit for bit.
+"""
+
+import math
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import numpy as np
+
+from ..models.repository import Repository
+
+# Weights of Repository.get_health_score
+SUMMARY_WEIGHTS = {
+    "stars": 0.2,
+    "forks": 0.15,
+    "contributors": 0.2,
+    "recent_update": 0.2,
+    "documentation": 0.15,
+    "issues_ratio": 0.1,
+}
+
+# Weights of the build report dimensions
+DIMENSION_WEIGHTS = {
+    "activity": 0.25,
+    "community": 0.20,
+    "documentation": 0.20,
+    "code_quality": 0.15,
+    "popularity": 0.10,
+    "maintenance": 0.10,
+}
+
+# Dimensions whose scalar formulas produce integers
+INTEGER_DIMENSIONS = ("activity", "documentation", "code_quality", "maintenance")
+
+# Languages assumed to imply some project structure
+STRUCTURED_LANGUAGES = ("Python", "JavaScript", "TypeScript", "Java")
+
+# Letter grades of calculate_health_score (score >= threshold)
+CATEGORY_GRADES = ((90, "A"), (80, "B"), (70, "C"), (60, "D"))
+
+# Letter grades and status labels of the build report
+DIMENSION_GRADES = (
+    (80, "A", "Excellent"),
+    (70, "B", "Good"),
+    (60, "C", "Fair"),
+    (50, "D", "Poor"),
+)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_DAY_US = 86_400_000_000
+
+
+@dataclass
+class HealthInputs:
+    """Per-repository scoring inputs as parallel arrays."""
+
+    names: list[str]
+    stars: np.ndarray
+    forks: np.ndarray
+    open_issues: np.ndarray
+    contributors: np.ndarray
+    updated_us: np.ndarray
+    has_updated: np.ndarray
+    pushed_us: np.ndarray
+    has_pushed: np.ndarray
+    description_length: np.ndarray
+    has_homepage: np.ndarray
+    has_wiki: np.ndarray
+    has_issues: np.ndarray
+    archived: np.ndarray
+    disabled: np.ndarray
+    topic_count: np.ndarray
+    has_license: np.ndarray
+    has_default_branch: np.ndarray
+    structured_language: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_repositories(
+        cls,
+        repositories: Sequence[Repository],
+        on_error: Callable[[Any, Exception], None] | None = None,
+    ) -> "HealthInputs":
+        """
+        Extract inputs from Repository objects.
+
+        Args:
+            repositories: Repositories to score
+            on_error: Called with (repository, error) for repositories whose
+                fields cannot be read; they are left out. Errors propagate
+                when not given.
+        """
+        return cls._build(
+            repositories,
+            lambda r: (
+                r.name,
+                int(r.stars),
+                int(r.forks),
+                int(r.open_issues),
+                int(r.contributors_count),
+                _microseconds(r.updated_at),
+                _microseconds(r.pushed_at),
+                len(r.description) if r.description else 0,
+                bool(r.homepage),
+                bool(r.has_wiki),
+                bool(r.has_issues),
+                bool(r.archived),
+                bool(r.disabled),
+                len(r.topics),
+                r.metadata.get("license") != "No License",
+                bool(r.default_branch),
+                r.language in STRUCTURED_LANGUAGES,
+            ),
+            on_error,
+        )
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Sequence[dict[str, Any]],
+        on_error: Callable[[Any, Exception], None] | None = None,
+    ) -> "HealthInputs":
+        """Extract inputs from repository records (as in data/repos.json)."""
+        return cls._build(
+            records,
+            lambda r: (
+                r["name"],
+                int(r.get("stars", 0)),
+                int(r.get("forks", 0)),
+                int(r.get("open_issues", 0)),
+                int(r.get("contributors_count", 0)),
+                _microseconds(r.get("updated_at")),
+                _microseconds(r.get("pushed_at")),
+                len(r["description"]) if r.get("description") else 0,
+                bool(r.get("homepage")),
+                bool(r.get("has_wiki", True)),
+                bool(r.get("has_issues", True)),
+                bool(r.get("archived", False)),
+                bool(r.get("disabled", False)),
+                len(r.get("topics", [])),
+                r.get("license") != "No License",
+                bool(r.get("default_branch")),
+                r.get("language") in STRUCTURED_LANGUAGES,
+            ),
+            on_error,
+        )
+
+    @classmethod
+    def _build(
+        cls,
+        rows: Sequence[Any],
+        extract: Callable[[Any], tuple[Any, ...]],
+        on_error: Callable[[Any, Exception], None] | None,
+    ) -> "HealthInputs":
+        values = []
+        for row in rows:
+            try:
+                values.append(extract(row))
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(row, e)
+
+        columns = list(zip(*values)) if values else [()] * 17
+        updated = [v if v is not None else 0 for v in columns[5]]
+        pushed = [v if v is not None else 0 for v in columns[6]]
+        return cls(
+            names=list(columns[0]),
+            stars=np.array(columns[1], dtype=np.int64),
+            forks=np.array(columns[2], dtype=np.int64),
+            open_issues=np.array(columns[3], dtype=np.int64),
+            contributors=np.array(columns[4], dtype=np.int64),
+            updated_us=np.array(updated, dtype=np.int64),
+            has_updated=np.array([v is not None for v in columns[5]], dtype=bool),
+            pushed_us=np.array(pushed, dtype=np.int64),
+            has_pushed=np.array([v is not None for v in columns[6]], dtype=bool),
+            description_length=np.array(columns[7], dtype=np.int64),
+            has_homepage=np.array(columns[8], dtype=bool),
+            has_wiki=np.array(columns[9], dtype=bool),
+            has_issues=np.array(columns[10], dtype=bool),
+            archived=np.array(columns[11], dtype=bool),
+            disabled=np.array(columns[12], dtype=bool),
+            topic_count=np.array(columns[13], dtype=np.int64),
+            has_license=np.array(columns[14], dtype=bool),
+            has_default_branch=np.array(columns[15], dtype=bool),
+            structured_language=np.array(columns[16], dtype=bool),
+        )
+
+
+class HealthScoringEngine:
+    """Score many repositories at once against a single reference time."""
+
+    def __init__(
+        self,
+        summary_weights: dict[str, float] | None = None,
+        dimension_weights: dict[str, float] | None = None,
+        now: datetime | None = None,
+    ):
+        self.summary_weights = summary_weights or dict(SUMMARY_WEIGHTS)
+        self.dimension_weights = dimension_weights or dict(DIMENSION_WEIGHTS)
+        self.now = now or datetime.now(timezone.utc)
+        self._now_us = _microseconds(self.now)
+
+    def days_since(self, timestamps_us: np.ndarray, present: np.ndarray) -> np.ndarray:
+        """Whole days between each timestamp and the reference time (0 when missing)."""
+        return np.where(present, (self._now_us - timestamps_us) // _DAY_US, 0)
+
+    def summary_scores(self, inputs: HealthInputs) -> np.ndarray:
+        """Compute ``Repository.get_health_score`` (0.0-1.0) for every repository."""
+        w = self.summary_weights
+        stars = inputs.stars
+        days = self.days_since(inputs.updated_us, inputs.has_updated)
+
+        score = np.zeros(len(inputs))
+        score = score + np.where(stars > 0, w["stars"] * np.minimum(_log10p1(stars) / 4, 1.0), 0.0)
+        score = score + np.where(
+            inputs.forks > 0, w["forks"] * np.minimum(_log10p1(inputs.forks) / 3, 1.0), 0.0
+        )
+        score = score + np.where(
+            inputs.contributors > 0,
+            w["contributors"] * np.minimum(inputs.contributors / 20, 1.0),
+            0.0,
+        )
+        score = score + np.where(days < 90, w["recent_update"] * (1 - days / 365), 0.0)
+        score = score + np.where(inputs.description_length > 0, w["documentation"] * 0.5, 0.0)
+        score = score + np.where(inputs.has_homepage, w["documentation"] * 0.5, 0.0)
+        score = score + np.where(
+            stars > 0,
+            w["issues_ratio"] * np.maximum(0, 1 - inputs.open_issues / (stars + 1)),
+            0.0,
+        )
+        return np.minimum(score, 1.0)
+
+    def category_scores(self, inputs: HealthInputs) -> dict[str, np.ndarray]:
+        """
+        Compute the ``Repository.calculate_health_score`` breakdown.
+
+        Returns:
+            Arrays for "activity", "community", "documentation",
+            "code_quality" (each 0-25) and "overall" (0-100)
+        """
+        stars, forks = inputs.stars, inputs.forks
+        days = self.days_since(inputs.updated_us, inputs.has_updated)
+
+        activity = np.select(
+            [days < 30, days < 90, days < 180, days < 365], [25.0, 20.0, 15.0, 10.0], 5.0
+        )
+
+        community = np.zeros(len(inputs))
+        community = community + np.where(stars > 0, np.minimum(_log10p1(stars) * 5, 10), 0.0)
+        community = community + np.where(forks > 0, np.minimum(_log10p1(forks) * 3, 7), 0.0)
+        community = community + np.where(
+            inputs.contributors > 0, np.minimum(inputs.contributors, 8), 0.0
+        )
+        community = np.minimum(community, 25.0)
+
+        documentation = np.zeros(len(inputs))
+        documentation = documentation + np.where(inputs.description_length > 20, 10.0, 0.0)
+        documentation = documentation + np.where(inputs.has_homepage, 5.0, 0.0)
+        documentation = documentation + np.where(inputs.has_wiki, 5.0, 0.0)
+        documentation = documentation + np.where(
+            inputs.topic_count > 0, np.minimum(inputs.topic_count * 1.5, 5.0), 0.0
+        )
+        documentation = np.minimum(documentation, 25.0)
+
+        quality = np.zeros(len(inputs))
+        quality = quality + np.where(inputs.has_issues, 5.0, 0.0)
+        quality = quality + np.where(~inputs.archived, 5.0, 0.0)
+        quality = quality + np.where(~inputs.disabled, 5.0, 0.0)
+        quality = quality + np.where(
+            stars > 0, np.maximum(0, 10 - inputs.open_issues / (stars + 1) * 20), 0.0
+        )
+        quality = np.minimum(quality, 25.0)
+
+        return {
+            "activity": activity,
+            "community": community,
+            "documentation": documentation,
+            "code_quality": quality,
+            "overall": 0 + activity + community + documentation + quality,
+        }
+
+    def category_report(self, inputs: HealthInputs) -> list[dict[str, Any]]:
+        """Per-repository results in the ``calculate_health_score`` format."""
+        scores = self.category_scores(inputs)
+        columns = {name: values.tolist() for name, values in scores.items()}
+        grades = _grades(scores["overall"], CATEGORY_GRADES, "F")
+
+        return [
+            {
+                "overall": columns["overall"][i],
+                "scores": {
+                    "activity": columns["activity"][i],
+                    "community": columns["community"][i],
+                    "documentation": columns["documentation"][i],
+                    "code_quality": columns["code_quality"][i],
+                },
+                "max_score": 100.0,
+                "grade": grades[i],
+            }
+            for i in range(len(inputs))
+        ]
+
+    def score_repositories(
+        self,
+        repositories: Sequence[Repository],
+        on_error: Callable[[Any, Exception], None] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Score repositories in the ``calculate_health_score`` format, keyed by name."""
+        inputs = HealthInputs.from_repositories(repositories, on_error)
+        return dict(zip(inputs.names, self.category_report(inputs)))
+
+    def dimension_scores(
+        self, inputs: HealthInputs, structure_scores: np.ndarray | None = None
+    ) -> dict[str, np.ndarray]:
+        """
+        Compute the six weighted dimensions of the build health report.
+
+        Args:
+            inputs: Scoring inputs
+            structure_scores: Optional per-repository code quality scores from
+                a quality report (NaN where unavailable)
+
+        Returns:
+            Arrays for each dimension, "overall" (unrounded), and the
+            intermediate values shown in report details ("days_since_push",
+            "activity_base", "contributor_score", "star_score", "fork_score")
+        """
+        days = (self._now_us - inputs.pushed_us) // _DAY_US
+        activity_base = np.select(
+            [days < 30, days < 90, days < 180, days < 365], [100, 75, 50, 25], 10
+        )
+        activity = np.where(inputs.has_pushed, activity_base, 50)
+        activity = np.where(inputs.archived, np.maximum(10, activity * 0.1), activity)
+        activity = np.minimum(100, activity)
+
+        contributors = inputs.contributors
+        contributor_score = np.select(
+            [contributors >= 10, contributors >= 5, contributors >= 3, contributors >= 2],
+            [100, 75, 50, 25],
+            10,
+        )
+        community = 0 + contributor_score * 0.5
+        community = community + np.where(inputs.open_issues > 0, 25, 0)
+        community = community + np.where(inputs.stars + inputs.forks > 0, 25, 0)
+        community = np.minimum(100, community)
+
+        documentation = np.where(inputs.description_length > 0, 30, 0)
+        documentation = documentation + np.where(inputs.description_length > 20, 20, 0)
+        documentation = documentation + np.select(
+            [inputs.topic_count >= 3, inputs.topic_count >= 1], [25, 15], 0
+        )
+        documentation = documentation + np.where(inputs.has_license, 25, 0)
+        documentation = np.minimum(100, documentation)
+
+        code_quality = 50 + np.where(inputs.structured_language, 20, 0)
+        if structure_scores is not None:
+            code_quality = np.where(np.isnan(structure_scores), code_quality, structure_scores)
+
+        stars, forks = inputs.stars, inputs.forks
+        star_score = np.select(
+            [stars >= 100, stars >= 50, stars >= 20, stars >= 10, stars >= 5, stars >= 1],
+            [100, 80, 60, 40, 20, 10],
+            0,
+        )
+        fork_score = np.select(
+            [forks >= 20, forks >= 10, forks >= 5, forks >= 1], [100, 75, 50, 25], 0
+        )
+        popularity = star_score * 0.7 + fork_score * 0.3
+
+        maintenance = np.where(~inputs.archived, 50, 0)
+        maintenance = maintenance + np.where(inputs.has_issues, 25, 0)
+        maintenance = maintenance + np.where(inputs.has_default_branch, 25, 0)
+
+        dimensions = {
+            "activity": activity,
+            "community": community,
+            "documentation": documentation,
+            "code_quality": code_quality,
+            "popularity": popularity,
+            "maintenance": maintenance,
+        }
+
+        overall = 0
+        for dimension, weight in self.dimension_weights.items():
+            overall = overall + dimensions[dimension] * weight
+
+        return {
+            **dimensions,
+            "overall": np.asarray(overall, dtype=np.float64),
+            "days_since_push": np.where(inputs.has_pushed, days, -1),
+            "activity_base": activity_base,
+            "contributor_score": contributor_score,
+            "star_score": star_score,
+            "fork_score": fork_score,
+        }
+
+    @staticmethod
+    def dimension_grades(overall: np.ndarray) -> tuple[list[str], list[str]]:
+        """Letter grades and status labels for build report scores."""
+        grades = _grades(overall, [(t, g) for t, g, _ in DIMENSION_GRADES], "F")
+        labels = {g: s for _, g, s in DIMENSION_GRADES}
+        return grades, [labels.get(g, "Critical") for g in grades]
+
+
+def _grades(scores: np.ndarray, thresholds: Sequence[tuple[float, str]], lowest: str) -> list[str]:
+    """Map scores to grades via descending thresholds."""
+    labels = np.select([scores >= t for t, _ in thresholds], [g for _, g in thresholds], lowest)
+    grades: list[str] = labels.tolist()
+    return grades
+
+
+def _log10p1(values: np.ndarray) -> np.ndarray:
+    """``log10(x + 1)`` computed with math.log10 on the distinct values."""
+    if not len(values):
+        return np.zeros(0)
+    unique, inverse = np.unique(values, return_inverse=True)
+    logs = np.array([math.log10(v + 1) if v >= 0 else math.nan for v in unique.tolist()])
+    return logs[inverse]
+
+
+def _microseconds(value: Any) -> int | None:
+    """Microseconds since the epoch for a datetime or ISO string; None when unavailable."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        raise TypeError(f"Expected a datetime, got {type(value).__name__}")
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int((value - _EPOCH) // _MICROSECOND)
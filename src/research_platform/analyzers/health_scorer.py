@@ -6,6 +6,7 @@ from typing import Any
 
 from ..models.repository import Repository
 from .base import BaseAnalyzer
+from .health_engine import HealthScoringEngine
 
 
 class HealthScorer(BaseAnalyzer):
@@ -24,14 +25,11 @@ class HealthScorer(BaseAnalyzer):
         Returns:
             Health report with scores
         """
-        health_scores = {}
-
-        for repo in repositories:
-            try:
-                health_scores[repo.name] = repo.calculate_health_score()
-            except Exception as e:
-                self.logger.warning(f"Failed to score {repo.name}: {e}")
-                continue
+        engine = HealthScoringEngine()
+        health_scores = engine.score_repositories(
+            repositories,
+            on_error=lambda repo, e: self.logger.warning(f"Failed to score {repo.name}: {e}"),
+        )
 
         return {
             "timestamp": datetime.now().isoformat(),
@@ -2,14 +2,33 @@
 
 Calculates academic impact metrics including h-index, total citations,
 and other scholarly metrics for repositories with publications.
+
+Publications are read once per repository into citation and year arrays;
+every indicator is derived from one ranking per repository (and one merged
+ranking for the organization).
 """
 
+import heapq
 import json
 import logging
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from ..models.repository import Repository
+from ..storage.dataset import load_repository_records
+from .bibliometrics import (
+    citation_metrics,
+    h_index,
+    percentiles,
+    publication_year,
+    rank_citations,
+    yearly_metrics,
+)
+
+# Repositories listed in each top ranking
+TOP_REPOSITORIES = 10
 
 
 class ImpactMetricsAnalyzer:
@@ -31,20 +50,8 @@ class ImpactMetricsAnalyzer:
         Returns:
             The h-index value
         """
-        if not citation_counts:
-            return 0
-
-        # Sort in descending order
-        sorted_citations = sorted(citation_counts, reverse=True)
-
-        h_index = 0
-        for i, citations in enumerate(sorted_citations, start=1):
-            if citations >= i:
-                h_index = i
-            else:
-                break
-
-        return h_index
+        ranked, _ = rank_citations(citation_counts)
+        return h_index(ranked)
 
     def calculate_repository_impact(self, repository: Repository) -> dict[str, Any]:
         """
@@ -56,42 +63,8 @@ class ImpactMetricsAnalyzer:
         Returns:
             Dictionary containing impact metrics
         """
-        research_metadata = repository.research_metadata
-        publications = research_metadata.get("publications", []) if research_metadata else []
-
-        if not publications:
-            return {
-                "repository": repository.name,
-                "has_publications": False,
-                "total_publications": 0,
-                "total_citations": 0,
-                "h_index": 0,
-                "average_citations": 0.0,
-                "max_citations": 0,
-            }
-
-        # Extract citation counts
-        citation_counts = []
-        for pub in publications:
-            citations = pub.get("citations", 0) or pub.get("citation_count", 0)
-            citation_counts.append(citations)
-
-        total_citations = sum(citation_counts)
-        h_index = self.calculate_h_index(citation_counts)
-
-        return {
-            "repository": repository.name,
-            "has_publications": True,
-            "total_publications": len(publications),
-            "total_citations": total_citations,
-            "h_index": h_index,
-            "average_citations": total_citations / len(publications) if publications else 0.0,
-            "max_citations": max(citation_counts) if citation_counts else 0,
-            "citation_distribution": {
-                "median": self._calculate_median(citation_counts),
-                "top_cited": citation_counts[0] if citation_counts else 0,
-            },
-        }
+        ranked, ranked_years = rank_citations(*self._publication_arrays(repository))
+        return self._repository_impact(repository.name, ranked, ranked_years)
 
     def analyze_organization_impact(self, repositories: list[Repository]) -> dict[str, Any]:
         """
@@ -104,53 +77,45 @@ class ImpactMetricsAnalyzer:
             Dictionary with organization-wide impact metrics
         """
         repo_impacts = []
-        total_publications = 0
-        total_citations = 0
-        all_citation_counts = []
+        ranked_runs = []
+        year_runs = []
 
         for repo in repositories:
-            impact = self.calculate_repository_impact(repo)
-            repo_impacts.append(impact)
-
-            if impact["has_publications"]:
-                total_publications += impact["total_publications"]
-                total_citations += impact["total_citations"]
-
-                # Collect all citation counts for org-wide h-index
-                research_metadata = repo.research_metadata
-                if research_metadata:
-                    publications = research_metadata.get("publications", [])
-                    for pub in publications:
-                        citations = pub.get("citations", 0) or pub.get("citation_count", 0)
-                        all_citation_counts.append(citations)
-
-        # Calculate organization-wide h-index
-        org_h_index = self.calculate_h_index(all_citation_counts)
+            citations, years = self._publication_arrays(repo)
+            ranked, ranked_years = rank_citations(citations, years)
+            repo_impacts.append(self._repository_impact(repo.name, ranked, ranked_years))
+            ranked_runs.append(ranked)
+            year_runs.append(ranked_years)
+
+        # Merging the per-repository rankings is a stable sort over sorted runs
+        org_ranked, org_years = rank_citations(
+            np.concatenate(ranked_runs or [np.zeros(0, dtype=np.int64)]),
+            np.concatenate(year_runs or [np.zeros(0, dtype=np.int64)]),
+        )
+        metrics = citation_metrics(org_ranked)
+        with_publications = [r for r in repo_impacts if r["has_publications"]]
 
         return {
             "organization_metrics": {
                 "total_repositories": len(repositories),
-                "repositories_with_publications": sum(
-                    1 for r in repo_impacts if r["has_publications"]
-                ),
-                "total_publications": total_publications,
-                "total_citations": total_citations,
-                "organization_h_index": org_h_index,
-                "average_citations_per_publication": (
-                    total_citations / total_publications if total_publications > 0 else 0.0
-                ),
+                "repositories_with_publications": len(with_publications),
+                "total_publications": metrics["publications"],
+                "total_citations": metrics["total_citations"],
+                "organization_h_index": metrics["h_index"],
+                "organization_g_index": metrics["g_index"],
+                "organization_i10_index": metrics["i10_index"],
+                "average_citations_per_publication": metrics["average_citations"],
+                "median_citations": metrics["median_citations"],
+                "citation_percentiles": percentiles(org_ranked),
+                "by_year": yearly_metrics(org_ranked, org_years),
             },
             "repository_impacts": repo_impacts,
-            "top_repositories_by_h_index": sorted(
-                [r for r in repo_impacts if r["has_publications"]],
-                key=lambda x: x["h_index"],
-                reverse=True,
-            )[:10],
-            "top_repositories_by_citations": sorted(
-                [r for r in repo_impacts if r["has_publications"]],
-                key=lambda x: x["total_citations"],
-                reverse=True,
-            )[:10],
+            "top_repositories_by_h_index": heapq.nlargest(
+                TOP_REPOSITORIES, with_publications, key=lambda x: x["h_index"]
+            ),
+            "top_repositories_by_citations": heapq.nlargest(
+                TOP_REPOSITORIES, with_publications, key=lambda x: x["total_citations"]
+            ),
         }
 
     def save_impact_report(self, impact_data: dict[str, Any], output_path: Path) -> None:
@@ -170,16 +135,58 @@ class ImpactMetricsAnalyzer:
 
     def _calculate_median(self, numbers: list[int | float]) -> float:
         """Calculate median of a list of numbers."""
-        if not numbers:
-            return 0.0
+        return float(np.median(numbers)) if len(numbers) else 0.0
+
+    def _publication_arrays(self, repository: Repository) -> tuple[np.ndarray, np.ndarray]:
+        """Citation counts and publication years of a repository's publications."""
+        research_metadata = repository.research_metadata
+        publications = research_metadata.get("publications", []) if research_metadata else []
+        citations = np.fromiter(
+            (pub.get("citations", 0) or pub.get("citation_count", 0) or 0 for pub in publications),
+            dtype=np.int64,
+            count=len(publications),
+        )
+        years = np.fromiter(
+            (publication_year(pub.get("year")) for pub in publications),
+            dtype=np.int64,
+            count=len(publications),
+        )
+        return citations, years
+
+    def _repository_impact(
+        self, name: str, ranked: np.ndarray, ranked_years: np.ndarray
+    ) -> dict[str, Any]:
+        """Impact metrics of one repository from its ranked publication arrays."""
+        if len(ranked) == 0:
+            return {
+                "repository": name,
+                "has_publications": False,
+                "total_publications": 0,
+                "total_citations": 0,
+                "h_index": 0,
+                "average_citations": 0.0,
+                "max_citations": 0,
+            }
 
-        sorted_numbers = sorted(numbers)
-        n = len(sorted_numbers)
+        metrics = citation_metrics(ranked)
 
-        if n % 2 == 0:
-            return (sorted_numbers[n // 2 - 1] + sorted_numbers[n // 2]) / 2
-        else:
-            return float(sorted_numbers[n // 2])
+        return {
+            "repository": name,
+            "has_publications": True,
+            "total_publications": metrics["publications"],
+            "total_citations": metrics["total_citations"],
+            "h_index": metrics["h_index"],
+            "g_index": metrics["g_index"],
+            "i10_index": metrics["i10_index"],
+            "average_citations": metrics["average_citations"],
+            "max_citations": metrics["max_citations"],
+            "citation_distribution": {
+                "median": metrics["median_citations"],
+                "top_cited": metrics["max_citations"],
+                "percentiles": percentiles(ranked),
+            },
+            "by_year": yearly_metrics(ranked, ranked_years),
+        }
 
 
 def analyze_all_repositories(repos_data: list[dict[str, Any]]) -> dict[str, Any]:
@@ -193,7 +200,7 @@ def analyze_all_repositories(repos_data: list[dict[str, Any]]) -> dict[str, Any]
         Impact metrics dictionary
     """
     # Convert to Repository models
-    repositories = [Repository.from_dict(repo_data) for repo_data in repos_data]
+    repositories = Repository.from_dicts(repos_data)
 
     analyzer = ImpactMetricsAnalyzer()
     return analyzer.analyze_organization_impact(repositories)
@@ -206,13 +213,8 @@ def generate_impact_report(output_path: str | Path = "data/impact_metrics.json")
     Args:
         output_path: Path to save the report
     """
-    # Load repository data
-    repos_file = Path("data/repos.json")
-    if not repos_file.exists():
-        raise FileNotFoundError(f"Repository data not found: {repos_file}")
-
-    with open(repos_file, encoding="utf-8") as f:
-        repos_data = json.load(f)
+    # Load repository data (core fields and research metadata only)
+    repos_data = load_repository_records(columns=["*", "research_metadata"])
 
     # Analyze impact
     impact_data = analyze_all_repositories(repos_data)
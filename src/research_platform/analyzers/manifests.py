@@ -0,0 +1,363 @@
+"""Dependency manifest parsing.
+
+Parses the dependency manifests found in repository metadata into
+normalized dependency entries (name, version specifier, extras). Supported
+formats are requirements.txt, pyproject.toml (PEP 621 and Poetry),
+package.json, environment.yml, setup.cfg, Pipfile, poetry.lock and R
+DESCRIPTION files.
+
+Each manifest is parsed once per content hash: results are memoized in
+memory and, optionally, in a persistent ResultCache, so repeated analyses
+and manifests shared between repositories cost a lookup.
+"""
+
+import configparser
+import json
+import logging
+import re
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from ..models.repository import Repository
+from ..storage.blobs import BLOB_KEY, BlobStore, LazyBlobDict, is_blob_ref
+from ..storage.results import ResultCache
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+# Bump whenever parser output changes so cached results are recomputed
+PARSER_VERSION = 1
+
+# Default location of the persistent cache of parsed manifests
+DEFAULT_CACHE_PATH = Path("cache/manifests.sqlite")
+
+# PEP 508 requirement: name, optional [extras], then the version specifier
+_REQUIREMENT = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[([^\]]*)\])?\s*(.*)$")
+
+# Conda match spec: optional channel::, name, then version (and build)
+_CONDA_SPEC = re.compile(r"^\s*(?:[\w.-]+::)?([A-Za-z0-9][A-Za-z0-9._-]*)\s*(.*)$")
+
+# R package reference in DESCRIPTION: name with an optional (version constraint)
+_R_PACKAGE = re.compile(r"^\s*([A-Za-z][A-Za-z0-9.]*)\s*(?:\(([^)]*)\))?\s*$")
+
+# DESCRIPTION fields listing package dependencies
+_R_DEPENDENCY_FIELDS = ("Depends", "Imports", "LinkingTo")
+
+# Entries naming the interpreter rather than a package
+_INTERPRETERS = {"python", "r"}
+
+
+@dataclass(frozen=True)
+class Dependency:
+    """A dependency declared in a manifest."""
+
+    name: str
+    specifier: str = ""
+    extras: tuple[str, ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {"name": self.name, "specifier": self.specifier, "extras": list(self.extras)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Dependency":
+        """Create instance from dictionary."""
+        return cls(data["name"], data.get("specifier", ""), tuple(data.get("extras", ())))
+
+
+def parse_requirement(line: str) -> Dependency | None:
+    """
+    Parse one PEP 508 requirement string.
+
+    Args:
+        line: Requirement such as ``pandas[excel]>=2.0; python_version >= "3.9"``
+
+    Returns:
+        Dependency, or None when the line names no package
+    """
+    match = _REQUIREMENT.match(line)
+    if not match:
+        return None
+    name, extras, rest = match.groups()
+    specifier = rest.split(";", 1)[0].strip()
+    return Dependency(
+        name=name.lower(),
+        specifier=specifier,
+        extras=tuple(e.strip().lower() for e in extras.split(",") if e.strip()) if extras else (),
+    )
+
+
+def parse_requirements_txt(content: str) -> list[Dependency]:
+    """Parse requirements.txt content (options, editables and comments are skipped)."""
+    dependencies = []
+    for line in content.splitlines():
+        line = line.split(" #", 1)[0].strip()
+        # Skip comments, empty lines, editable installs and other pip options
+        if not line or line.startswith(("#", "-")):
+            continue
+        dependency = parse_requirement(line)
+        if dependency:
+            dependencies.append(dependency)
+    return dependencies
+
+
+def _poetry_dependencies(table: dict[str, Any]) -> list[Dependency]:
+    """Dependencies of a Poetry (or Pipfile) name -> constraint table."""
+    dependencies = []
+    for name, constraint in table.items():
+        if name.lower() in _INTERPRETERS:
+            continue
+        if isinstance(constraint, dict):
+            specifier = constraint.get("version", "")
+            extras = tuple(constraint.get("extras", ()))
+        else:
+            specifier, extras = str(constraint), ()
+        dependencies.append(Dependency(name.lower(), "" if specifier == "*" else specifier, extras))
+    return dependencies
+
+
+def parse_pyproject_toml(content: str) -> list[Dependency]:
+    """Parse Poetry and PEP 621 dependencies of pyproject.toml content."""
+    data = tomllib.loads(content)
+    dependencies = []
+
+    poetry = data.get("tool", {}).get("poetry", {})
+    if poetry:
+        dependencies.extend(_poetry_dependencies(poetry.get("dependencies", {})))
+
+    for requirement in data.get("project", {}).get("dependencies", []):
+        dependency = parse_requirement(requirement)
+        if dependency:
+            dependencies.append(dependency)
+    return dependencies
+
+
+def parse_package_json(content: str) -> list[Dependency]:
+    """Parse regular and dev dependencies of package.json content."""
+    data = json.loads(content)
+    return [
+        Dependency(name, str(version))
+        for section in ("dependencies", "devDependencies")
+        for name, version in data.get(section, {}).items()
+    ]
+
+
+def parse_environment_yml(content: str) -> list[Dependency]:
+    """Parse conda and pip dependencies of a conda environment.yml."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(content, Loader=loader) or {}
+    dependencies = []
+    for entry in data.get("dependencies") or []:
+        if isinstance(entry, dict):
+            for requirement in entry.get("pip") or []:
+                dependency = parse_requirement(str(requirement))
+                if dependency:
+                    dependencies.append(dependency)
+            continue
+        match = _CONDA_SPEC.match(str(entry))
+        if match and match.group(1).lower() not in _INTERPRETERS:
+            specifier = match.group(2).strip()
+            # Conda's "=1.2" means "1.2.*"; keep the constraint as written
+            dependencies.append(Dependency(match.group(1).lower(), specifier))
+    return dependencies
+
+
+def parse_setup_cfg(content: str) -> list[Dependency]:
+    """Parse ``[options] install_requires`` of setup.cfg content."""
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read_string(content)
+    requires = parser.get("options", "install_requires", fallback="")
+    dependencies = []
+    for line in requires.splitlines():
+        line = line.split("#", 1)[0].strip()
+        dependency = parse_requirement(line) if line else None
+        if dependency:
+            dependencies.append(dependency)
+    return dependencies
+
+
+def parse_pipfile(content: str) -> list[Dependency]:
+    """Parse ``[packages]`` and ``[dev-packages]`` of a Pipfile."""
+    data = tomllib.loads(content)
+    return _poetry_dependencies(data.get("packages", {})) + _poetry_dependencies(
+        data.get("dev-packages", {})
+    )
+
+
+def parse_poetry_lock(content: str) -> list[Dependency]:
+    """Parse the pinned packages of poetry.lock content."""
+    data = tomllib.loads(content)
+    return [
+        Dependency(package["name"].lower(), f"=={package['version']}")
+        for package in data.get("package", [])
+        if "name" in package and "version" in package
+    ]
+
+
+def parse_description(content: str) -> list[Dependency]:
+    """Parse Depends, Imports and LinkingTo of an R package DESCRIPTION file."""
+    fields: dict[str, str] = {}
+    current = None
+    for line in content.splitlines():
+        if line[:1].isspace() and current:
+            # Continuation line of a multi-line field
+            fields[current] += " " + line.strip()
+        elif ":" in line:
+            current, value = line.split(":", 1)
+            fields[current] = value.strip()
+
+    dependencies = []
+    for field in _R_DEPENDENCY_FIELDS:
+        for entry in fields.get(field, "").split(","):
+            match = _R_PACKAGE.match(entry)
+            if match and match.group(1) != "R":
+                specifier = re.sub(r"\s+", "", match.group(2) or "")
+                dependencies.append(Dependency(match.group(1), specifier))
+    return dependencies
+
+
+# Metadata field -> (manifest kind, parser)
+MANIFEST_PARSERS: dict[str, tuple[str, Callable[[str], list[Dependency]]]] = {
+    "requirements_txt": ("requirements", parse_requirements_txt),
+    "pyproject_toml": ("pyproject", parse_pyproject_toml),
+    "package_json": ("package", parse_package_json),
+    "environment_yml": ("environment", parse_environment_yml),
+    "setup_cfg": ("setup_cfg", parse_setup_cfg),
+    "pipfile": ("pipfile", parse_pipfile),
+    "poetry_lock": ("poetry_lock", parse_poetry_lock),
+    "description_file": ("description", parse_description),
+}
+
+# Manifest kinds in a fixed order
+MANIFEST_KINDS = tuple(kind for kind, _ in MANIFEST_PARSERS.values())
+
+
+def manifest_fingerprint(repository: Repository) -> str:
+    """Digest of every manifest of a repository (blob digests are used as-is)."""
+    metadata = repository.metadata or {}
+    if isinstance(metadata, LazyBlobDict):
+        metadata = metadata.raw()
+    parts = [f"v{PARSER_VERSION}"]
+    for field in MANIFEST_PARSERS:
+        value = metadata.get(field)
+        if is_blob_ref(value):
+            parts.append(f"{field}:{value[BLOB_KEY]}")
+        elif isinstance(value, str) and value:
+            parts.append(f"{field}:{BlobStore.digest(value)}")
+    return BlobStore.digest("\n".join(parts))
+
+
+def open_manifest_cache(path: Path | str = DEFAULT_CACHE_PATH) -> ResultCache:
+    """Open the persistent cache of parsed manifests for the current parser version."""
+    return ResultCache(path, namespace="manifests", version=str(PARSER_VERSION))
+
+
+class ManifestExtractor:
+    """Parse repository manifests once per content hash."""
+
+    def __init__(self, logger: logging.Logger | None = None, cache: ResultCache | None = None):
+        """
+        Initialize the extractor.
+
+        Args:
+            logger: Logger instance
+            cache: Persistent cache of parsed manifests (in-memory only when None)
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.cache = cache
+        self._parsed: dict[tuple[str, str], tuple[Dependency, ...]] = {}
+
+    def parse(self, field: str, content: str, digest: str | None = None) -> tuple[Dependency, ...]:
+        """
+        Parse one manifest, reusing the result for content parsed before.
+
+        Args:
+            field: Metadata field of the manifest (a MANIFEST_PARSERS key)
+            content: Manifest text
+            digest: Content hash when already known
+
+        Returns:
+            Dependencies in declaration order (empty when the manifest is invalid)
+        """
+        return self._parse_once(field, digest or BlobStore.digest(content), lambda: content)
+
+    def extract(self, repository: Repository) -> dict[str, list[Dependency]]:
+        """
+        Parse every manifest of a repository.
+
+        Args:
+            repository: Repository model with metadata
+
+        Returns:
+            Manifest kind -> dependencies (empty list for absent manifests)
+        """
+        metadata = repository.metadata or {}
+        store = None
+        if isinstance(metadata, LazyBlobDict):
+            # Use blob digests directly; manifest text is only read on a cache miss
+            store = metadata.store
+            metadata = metadata.raw()
+
+        result: dict[str, list[Dependency]] = {kind: [] for kind in MANIFEST_KINDS}
+        for field, (kind, _) in MANIFEST_PARSERS.items():
+            value = metadata.get(field)
+            if is_blob_ref(value) and store is not None:
+                digest = value[BLOB_KEY]
+                result[kind] = list(
+                    self._parse_once(field, digest, partial(store.get_text, digest))
+                )
+            elif isinstance(value, str) and value:
+                result[kind] = list(self.parse(field, value))
+        return result
+
+    def _parse_once(
+        self, field: str, digest: str, read: Callable[[], str]
+    ) -> tuple[Dependency, ...]:
+        """
+        Memoized parse of a manifest; ``read`` is only called on a cache miss.
+
+        A manifest whose text cannot be read (a missing blob) yields no
+        dependencies and is not memoized, so it is parsed once it is restored.
+        """
+        key = (field, digest)
+        if key not in self._parsed:
+            dependencies = self._load(field, digest, read)
+            if dependencies is None:
+                return ()
+            self._parsed[key] = dependencies
+        return self._parsed[key]
+
+    def _load(
+        self, field: str, digest: str, read: Callable[[], str]
+    ) -> tuple[Dependency, ...] | None:
+        """Parsed manifest from the persistent cache, or parse and store it (None if unreadable)."""
+        cache_key = f"{field}:{digest}"
+        if self.cache is not None:
+            cached = self.cache.get_many([cache_key])
+            if cache_key in cached:
+                return tuple(Dependency.from_dict(d) for d in cached[cache_key])
+
+        kind, parser = MANIFEST_PARSERS[field]
+        try:
+            content = read()
+        except KeyError:
+            self.logger.warning(f"Missing blob {digest} of {kind} manifest")
+            return None
+
+        try:
+            dependencies = tuple(parser(content))
+        except Exception as e:
+            self.logger.warning(f"Failed to parse {kind} manifest: {e}")
+            dependencies = ()
+
+        if self.cache is not None:
+            self.cache.put_many({cache_key: [d.to_dict() for d in dependencies]})
+        return dependencies
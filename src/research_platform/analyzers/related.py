@@ -0,0 +1,349 @@
+"""Related repositories by sparse cosine similarity.
+
+Every repository is a sparse feature vector of three L2-normalized blocks:
+TF-IDF of its corpus documents (see corpus), its GitHub topics and its
+declared dependencies. Each block is scaled by the square root of its
+weight, so the dot product of two vectors is the weighted sum of the three
+block cosines. The top-k neighbors of every repository come from blocked
+sparse products (``features[rows] @ features.T``), so memory grows with
+BLOCK_ELEMENTS and never with an n × n similarity matrix.
+
+Neighbor lists are persisted with a fingerprint of each repository's
+features. An update recomputes the neighbors of changed repositories and of
+those whose list contained a changed or removed one; every other list only
+merges in its similarity to the changed repositories. IDF weights are frozen
+at the last full fit, so unchanged vectors stay identical between updates,
+and are refitted once the share of changed repositories passes
+DRIFT_THRESHOLD.
+"""
+
+import os
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from scipy import sparse
+
+from ..models.repository import Repository
+from ..storage.blobs import BlobStore
+from .corpus import Corpus
+
+# Default location of the persisted neighbor lists
+DEFAULT_RELATED_PATH = Path("data/related_index.npz")
+
+# Neighbors kept per repository
+DEFAULT_NEIGHBORS = 10
+
+# Feature blocks and their share of the similarity
+BLOCKS = ("text", "topics", "dependencies")
+WEIGHTS = {"text": 0.6, "topics": 0.2, "dependencies": 0.2}
+
+# Share of repositories (changed, added or removed) that triggers a full refit
+DRIFT_THRESHOLD = 0.2
+
+# Similarities computed at once (rows of a block × repositories)
+BLOCK_ELEMENTS = 1 << 22
+
+
+def normalize_rows(matrix: sparse.spmatrix) -> sparse.csr_matrix:
+    """Rows scaled to unit L2 norm (empty rows stay empty)."""
+    matrix = sparse.csr_matrix(matrix, dtype=np.float64)
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.csr_matrix(sparse.diags(1 / norms) @ matrix)
+
+
+def similarity_blocks(
+    features: sparse.csr_matrix,
+    rows: Iterable[int] | None = None,
+    block_elements: int = BLOCK_ELEMENTS,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Similarities of rows to every row, a block of rows at a time.
+
+    Args:
+        features: Row-normalized feature matrix
+        rows: Rows to compute (all when None)
+        block_elements: Dense similarities held at once
+
+    Yields:
+        Row indices of the block and their similarities (block × rows of
+        ``features``), with self-similarity set to 0
+    """
+    n = features.shape[0]
+    rows = np.arange(n) if rows is None else np.fromiter(rows, dtype=np.int64)
+    transposed = features.T.tocsr()
+    size = max(1, block_elements // max(n, 1))
+    for start in range(0, len(rows), size):
+        block = rows[start : start + size]
+        similarities = (features[block] @ transposed).toarray()
+        similarities[np.arange(len(block)), block] = 0
+        yield block, similarities
+
+
+def top_k(similarities: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Largest k similarities of every row, most similar first.
+
+    Returns:
+        Column indices and similarities (rows × min(k, columns))
+    """
+    k = min(k, similarities.shape[1])
+    if k == 0:
+        empty = np.zeros((len(similarities), 0))
+        return empty.astype(np.int64), empty
+    if k < similarities.shape[1]:
+        indices = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+    else:
+        indices = np.tile(np.arange(k), (len(similarities), 1))
+    scores = np.take_along_axis(similarities, indices, axis=1)
+    order = np.argsort(-scores, axis=1, kind="stable")
+    return np.take_along_axis(indices, order, axis=1), np.take_along_axis(scores, order, axis=1)
+
+
+def _binary_features(values: list[list[str]]) -> sparse.csr_matrix:
+    """Indicator matrix of string sets (columns numbered in order of appearance)."""
+    columns: dict[str, int] = {}
+    indices = [columns.setdefault(value, len(columns)) for row in values for value in row]
+    indptr = np.cumsum([0] + [len(row) for row in values])
+    return sparse.csr_matrix(
+        (np.ones(len(indices)), indices, indptr), shape=(len(values), len(columns))
+    )
+
+
+class RelatedIndex:
+    """Persisted top-k related repositories, updated incrementally."""
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_RELATED_PATH,
+        k: int = DEFAULT_NEIGHBORS,
+        weights: dict[str, float] | None = None,
+        drift_threshold: float = DRIFT_THRESHOLD,
+        block_elements: int = BLOCK_ELEMENTS,
+    ):
+        self.path = Path(path)
+        self.k = k
+        self.weights = {**WEIGHTS, **(weights or {})}
+        self.drift_threshold = drift_threshold
+        self.block_elements = block_elements
+        self.fingerprints: dict[str, str] = {}
+        self.neighbors: dict[str, list[tuple[str, float]]] = {}
+        # Inverse document frequencies of the last full fit
+        self._idf: dict[str, float] = {}
+        self._idf_documents = 0
+        if self.path.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self.neighbors)
+
+    def __contains__(self, repo: object) -> bool:
+        return repo in self.neighbors
+
+    def related(self, repo: str, limit: int | None = None) -> list[dict[str, Any]]:
+        """
+        Repositories most similar to one.
+
+        Returns:
+            ``repo`` and ``score`` (0-1) of each neighbor, most similar first
+        """
+        neighbors = self.neighbors.get(repo, [])[:limit]
+        return [{"repo": other, "score": score} for other, score in neighbors]
+
+    def update(
+        self,
+        repositories: Iterable[Repository],
+        corpus: Corpus,
+        dependencies: Callable[[Repository], Iterable[str]] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Bring the neighbor lists up to date with the repositories.
+
+        Args:
+            repositories: Repository models
+            corpus: Tokenized corpus of the repositories
+            dependencies: Callable returning the packages a repository declares
+
+        Returns:
+            Whether IDF weights were refitted, how many neighbor lists were
+            recomputed, merged with changed repositories, and removed
+        """
+        repositories = list(repositories)
+        names = [repo.name for repo in repositories]
+        topics = [sorted(set(repo.topics)) for repo in repositories]
+        packages = [
+            sorted(set(dependencies(repo))) if dependencies is not None else []
+            for repo in repositories
+        ]
+        fingerprints = {
+            name: BlobStore.digest(
+                "\n".join([corpus.fingerprint(name), "\0".join(tags), "\0".join(deps)])
+            )
+            for name, tags, deps in zip(names, topics, packages, strict=True)
+        }
+        changed = {name for name in names if self.fingerprints.get(name) != fingerprints[name]}
+        removed = set(self.neighbors) - set(names)
+        drift = (len(changed) + len(removed)) / max(len(names), 1)
+        refit = not self.neighbors or drift > self.drift_threshold
+
+        corpus_names, counts = corpus.repository_counts()
+        if refit:
+            self._fit_idf(corpus.terms, counts)
+        features = self._features(names, corpus, corpus_names, counts, topics, packages)
+
+        if refit:
+            dirty = set(names)
+        else:
+            touched = changed | removed
+            dirty = changed | {
+                name
+                for name in names
+                if any(other in touched for other, _ in self.neighbors.get(name, []))
+            }
+        neighbors = {name: self.neighbors[name] for name in names if name not in dirty}
+        candidates = self._recompute(features, names, dirty, changed, neighbors)
+        for name, found in candidates.items():
+            neighbors[name] = sorted(neighbors[name] + found, key=lambda n: (-n[1], n[0]))[: self.k]
+
+        self.neighbors = neighbors
+        self.fingerprints = fingerprints
+        return {
+            "refit": refit,
+            "recomputed": len(dirty),
+            "merged": len(candidates),
+            "removed": len(removed),
+        }
+
+    def save(self) -> None:
+        """Write neighbor lists, fingerprints and IDF weights atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        names = sorted(self.neighbors)
+        neighbor_names = np.full((len(names), self.k), "", dtype=object)
+        neighbor_scores = np.zeros((len(names), self.k))
+        for row, name in enumerate(names):
+            for column, (other, score) in enumerate(self.neighbors[name]):
+                neighbor_names[row, column] = other
+                neighbor_scores[row, column] = score
+        terms = sorted(self._idf)
+        arrays: dict[str, Any] = {
+            "names": np.array(names, dtype=str),
+            "fingerprints": np.array([self.fingerprints[name] for name in names], dtype=str),
+            "neighbor_names": neighbor_names.astype(str),
+            "neighbor_scores": neighbor_scores,
+            "idf_terms": np.array(terms, dtype=str),
+            "idf": np.array([self._idf[term] for term in terms]),
+            "idf_documents": np.array(self._idf_documents),
+            "k": np.array(self.k),
+            "weights": np.array([self.weights[block] for block in BLOCKS]),
+        }
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp-", suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _fit_idf(self, terms: list[str], counts: sparse.csr_matrix) -> None:
+        """Smoothed inverse document frequencies over repositories."""
+        document_frequency = np.bincount(counts.indices, minlength=len(terms))
+        idf = np.log((1 + counts.shape[0]) / (1 + document_frequency)) + 1
+        self._idf = dict(zip(terms, idf.tolist(), strict=True))
+        self._idf_documents = counts.shape[0]
+
+    def _features(
+        self,
+        names: list[str],
+        corpus: Corpus,
+        corpus_names: list[str],
+        counts: sparse.csr_matrix,
+        topics: list[list[str]],
+        packages: list[list[str]],
+    ) -> sparse.csr_matrix:
+        """Weighted, normalized feature blocks of the repositories in ``names`` order."""
+        # Terms unseen at the last fit weigh as if in no repository
+        unseen = np.log(1 + self._idf_documents) + 1
+        idf = np.array([self._idf.get(term, unseen) for term in corpus.terms])
+        rows = {name: row for row, name in enumerate(corpus_names)}
+        # Repositories without documents select the appended empty row
+        padded = sparse.vstack([counts, sparse.csr_matrix((1, counts.shape[1]))]).tocsr()
+        text = padded[[rows.get(name, len(corpus_names)) for name in names]]
+
+        blocks = {
+            "text": text.multiply(idf),
+            "topics": _binary_features(topics),
+            "dependencies": _binary_features(packages),
+        }
+        return sparse.hstack(
+            [np.sqrt(self.weights[block]) * normalize_rows(blocks[block]) for block in BLOCKS],
+            format="csr",
+        )
+
+    def _recompute(
+        self,
+        features: sparse.csr_matrix,
+        names: list[str],
+        dirty: set[str],
+        changed: set[str],
+        neighbors: dict[str, list[tuple[str, float]]],
+    ) -> dict[str, list[tuple[str, float]]]:
+        """
+        Recompute the neighbor lists of dirty repositories in place.
+
+        Returns:
+            Similarities of every other repository to changed ones, to merge
+            into their existing lists
+        """
+        dirty_rows = [row for row, name in enumerate(names) if name in dirty]
+        # Lowest similarity that still enters each clean list (inf for dirty rows)
+        floor = np.full(len(names), np.inf)
+        for row, name in enumerate(names):
+            if name not in dirty:
+                kept = neighbors[name]
+                floor[row] = kept[-1][1] if len(kept) >= self.k else 0.0
+        candidates: dict[str, list[tuple[str, float]]] = {}
+
+        for block, similarities in similarity_blocks(features, dirty_rows, self.block_elements):
+            indices, scores = top_k(similarities, self.k)
+            for local, row in enumerate(block):
+                name = names[row]
+                neighbors[name] = sorted(
+                    (
+                        (names[other], float(score))
+                        for other, score in zip(indices[local], scores[local], strict=True)
+                        if score > 0
+                    ),
+                    key=lambda n: (-n[1], n[0]),
+                )
+                if name not in changed:
+                    continue
+                # Similarity is symmetric: this row is also a candidate of every clean one
+                for other in np.flatnonzero(similarities[local] > floor):
+                    candidates.setdefault(names[other], []).append(
+                        (name, float(similarities[local, other]))
+                    )
+        return candidates
+
+    def _load(self) -> None:
+        """Restore the persisted index unless it was built with other settings."""
+        with np.load(self.path, allow_pickle=False) as data:
+            weights = [self.weights[block] for block in BLOCKS]
+            if int(data["k"]) != self.k or not np.allclose(data["weights"], weights):
+                return
+            names = data["names"].tolist()
+            self.fingerprints = dict(zip(names, data["fingerprints"].tolist(), strict=True))
+            self.neighbors = {
+                name: [(other, score) for other, score in zip(others, scores, strict=True) if other]
+                for name, others, scores in zip(
+                    names,
+                    data["neighbor_names"].tolist(),
+                    data["neighbor_scores"].tolist(),
+                    strict=True,
+                )
+            }
+            self._idf = dict(zip(data["idf_terms"].tolist(), data["idf"].tolist(), strict=True))
+            self._idf_documents = int(data["idf_documents"])
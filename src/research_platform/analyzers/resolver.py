@@ -0,0 +1,109 @@
+"""Offline transitive dependency resolution.
+
+Expands the direct dependencies declared in repository manifests into
+everything they pull in, using a local PackageIndex snapshot instead of the
+package registries. Requirement lookups and per-package closures are
+memoized, so packages shared by many repositories are expanded once.
+"""
+
+import logging
+from collections.abc import Iterable
+
+import networkx as nx
+
+from ..storage.package_index import PackageIndex, normalize_name
+
+# Registry ecosystem of each manifest kind (conda packages are looked up on PyPI)
+MANIFEST_ECOSYSTEMS = {
+    "requirements": "pypi",
+    "pyproject": "pypi",
+    "environment": "pypi",
+    "setup_cfg": "pypi",
+    "pipfile": "pypi",
+    "poetry_lock": "pypi",
+    "package": "npm",
+    "description": "cran",
+}
+
+
+class DependencyResolver:
+    """Resolve transitive dependencies against a local package index."""
+
+    def __init__(self, index: PackageIndex, logger: logging.Logger | None = None):
+        self.index = index
+        self.logger = logger or logging.getLogger(__name__)
+        self._requires: dict[tuple[str, str], tuple[str, ...]] = {}
+        self._closures: dict[tuple[str, str], frozenset[str]] = {}
+
+    def requirements(self, ecosystem: str, name: str) -> tuple[str, ...]:
+        """Direct requirements of a package (empty when it is not in the snapshot)."""
+        name = normalize_name(ecosystem, name)
+        self._fetch(ecosystem, [name])
+        return self._requires[(ecosystem, name)]
+
+    def closure(self, ecosystem: str, name: str) -> frozenset[str]:
+        """
+        Every package a package depends on, directly or transitively.
+
+        Args:
+            ecosystem: Package ecosystem
+            name: Package name
+
+        Returns:
+            Normalized package names (the package itself only when it is part
+            of a dependency cycle)
+        """
+        name = normalize_name(ecosystem, name)
+        key = (ecosystem, name)
+        if key not in self._closures:
+            self._expand(ecosystem, name)
+        return self._closures[key]
+
+    def resolve(self, ecosystem: str, names: Iterable[str]) -> set[str]:
+        """Union of the closures of several packages."""
+        resolved: set[str] = set()
+        for name in names:
+            resolved |= self.closure(ecosystem, name)
+        return resolved
+
+    def _fetch(self, ecosystem: str, names: list[str]) -> None:
+        """Load requirements of packages not looked up yet (one batched query)."""
+        missing = [name for name in names if (ecosystem, name) not in self._requires]
+        if not missing:
+            return
+        found = self.index.requirements(ecosystem, missing)
+        for name in missing:
+            self._requires[(ecosystem, name)] = found.get(name, ())
+
+    def _expand(self, ecosystem: str, root: str) -> None:
+        """Compute the closures of every package reachable from ``root``."""
+        # Discover the part of the graph whose closures are not known yet, level by level
+        graph = nx.DiGraph()
+        graph.add_node(root)
+        frontier = [root]
+        while frontier:
+            self._fetch(ecosystem, frontier)
+            next_frontier = []
+            for name in frontier:
+                for requirement in self._requires[(ecosystem, name)]:
+                    known = (ecosystem, requirement) in self._closures
+                    if not known and requirement not in graph:
+                        next_frontier.append(requirement)
+                    graph.add_edge(name, requirement)
+            frontier = list(dict.fromkeys(next_frontier))
+
+        # Closures bottom-up over strongly connected components (cycles share one closure)
+        condensed = nx.condensation(graph)
+        for component in reversed(list(nx.topological_sort(condensed))):
+            members = condensed.nodes[component]["members"]
+            if len(members) == 1 and (ecosystem, next(iter(members))) in self._closures:
+                continue
+            reach: set[str] = set()
+            for member in members:
+                for requirement in self._requires[(ecosystem, member)]:
+                    reach.add(requirement)
+                    if requirement not in members:
+                        reach |= self._closures[(ecosystem, requirement)]
+            closure = frozenset(reach)
+            for member in members:
+                self._closures[(ecosystem, member)] = closure
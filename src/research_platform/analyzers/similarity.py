@@ -0,0 +1,385 @@
+"""MinHash signatures and LSH lookups for similar repositories.
+
+Every repository gets a MinHash signature of its dependency set (similar
+stacks) and of word shingles of its README and source code (near-duplicate
+repositories and forks). Signatures are banded into a locality-sensitive
+hash index, so finding the repositories similar to one only compares it
+with the few that share a band bucket instead of with every repository.
+
+Signatures are persisted together with a fingerprint of their input, so a
+rebuild only rehashes repositories whose dependencies or content changed.
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+from collections import defaultdict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from ..models.repository import Repository
+from ..storage.blobs import BLOB_KEY, LazyBlobDict, is_blob_ref
+
+# Hash functions per signature
+NUM_PERM = 128
+
+# LSH bands (NUM_PERM / BANDS rows each); pairs above a Jaccard similarity of
+# about (1 / BANDS) ** (BANDS / NUM_PERM) are likely to collide
+BANDS = 32
+
+# Words per content shingle
+SHINGLE_SIZE = 5
+
+# Tokens hashed at once (bounds memory to HASH_CHUNK x NUM_PERM values)
+HASH_CHUNK = 4096
+
+# Estimated Jaccard similarity of dependency sets reported as a similar stack
+SIMILAR_STACK_SIMILARITY = 0.5
+
+# Estimated Jaccard similarity of content shingles reported as a near-duplicate
+NEAR_DUPLICATE_SIMILARITY = 0.8
+
+# Signature kinds kept for every repository
+KINDS = ("dependencies", "content")
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_WORD = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[str]:
+    """Lower-cased word ``size``-grams of a text (the whole text when shorter)."""
+    words = _WORD.findall(text.lower())
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+class MinHasher:
+    """Compute MinHash signatures with a fixed family of hash functions."""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        self.num_perm = num_perm
+        rng = np.random.default_rng(seed)
+        # a, b < 2**32 keep a * x + b (x < 2**32) within 64 bits
+        self._a = rng.integers(1, int(_MAX_HASH), num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_MAX_HASH), num_perm, dtype=np.uint64)
+
+    def signature(self, tokens: Iterable[str]) -> np.ndarray:
+        """
+        MinHash signature of a set of tokens.
+
+        Args:
+            tokens: Set elements (duplicates are ignored)
+
+        Returns:
+            ``num_perm`` uint32 minimum hash values (all maximal for an empty set)
+        """
+        hashes = np.fromiter((_token_hash(token) for token in set(tokens)), dtype=np.uint64)
+        signature = np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        # Universal hashing (a * x + b) mod p, truncated to 32 bits
+        for start in range(0, len(hashes), HASH_CHUNK):
+            chunk = hashes[start : start + HASH_CHUNK]
+            permuted = (np.outer(chunk, self._a) + self._b) % _MERSENNE_PRIME
+            np.minimum(signature, (permuted & _MAX_HASH).min(axis=0), out=signature)
+        return signature.astype(np.uint32)
+
+
+def estimate_jaccard(first: np.ndarray, second: np.ndarray) -> float:
+    """Estimated Jaccard similarity of the sets behind two signatures."""
+    return float(np.mean(first == second))
+
+
+class LSHIndex:
+    """Banded locality-sensitive hash index over MinHash signatures."""
+
+    def __init__(self, num_perm: int = NUM_PERM, bands: int = BANDS):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: list[defaultdict[bytes, set[str]]] = [defaultdict(set) for _ in range(bands)]
+        self._keys: dict[str, list[bytes]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+
+    def insert(self, key: str, signature: np.ndarray) -> None:
+        """Add (or replace) the signature of a key."""
+        self.remove(key)
+        band_keys = self._band_keys(signature)
+        for buckets, band_key in zip(self._buckets, band_keys):
+            buckets[band_key].add(key)
+        self._keys[key] = band_keys
+
+    def remove(self, key: str) -> None:
+        """Drop a key from the index (no-op when absent)."""
+        for buckets, band_key in zip(self._buckets, self._keys.pop(key, [])):
+            bucket = buckets[band_key]
+            bucket.discard(key)
+            if not bucket:
+                del buckets[band_key]
+
+    def candidates(self, signature: np.ndarray) -> set[str]:
+        """Keys sharing at least one band bucket with a signature."""
+        found: set[str] = set()
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            found.update(buckets.get(band_key, ()))
+        return found
+
+    def _band_keys(self, signature: np.ndarray) -> list[bytes]:
+        return [
+            signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+
+class SimilarityIndex:
+    """Persisted MinHash signatures of repositories with one LSH index per kind."""
+
+    def __init__(
+        self,
+        path: Path | str = Path("data/minhash_signatures.npz"),
+        num_perm: int = NUM_PERM,
+        bands: int = BANDS,
+    ):
+        self.path = Path(path)
+        self.hasher = MinHasher(num_perm)
+        self.bands = bands
+        self.signatures: dict[str, dict[str, np.ndarray]] = {kind: {} for kind in KINDS}
+        self.fingerprints: dict[str, dict[str, str]] = {kind: {} for kind in KINDS}
+        self.lsh = {kind: LSHIndex(num_perm, bands) for kind in KINDS}
+        if self.path.exists():
+            self._load()
+
+    def update(self, kind: str, key: str, fingerprint: str, tokens: Any) -> bool:
+        """
+        Set the signature of a repository unless its input is unchanged.
+
+        Args:
+            kind: Signature kind ("dependencies" or "content")
+            key: Repository name
+            fingerprint: Stable digest of the input
+            tokens: Set of tokens, or a callable returning them (only called
+                when the fingerprint changed)
+
+        Returns:
+            Whether the signature was (re)computed (or dropped for an empty
+            token set, which is similar to nothing)
+        """
+        if self.fingerprints[kind].get(key) == fingerprint:
+            return False
+        tokens = set(tokens() if callable(tokens) else tokens)
+        if not tokens:
+            # Every empty set has the same signature; indexing it would match them all
+            self.remove(kind, key)
+            self.fingerprints[kind][key] = fingerprint
+            return True
+        signature = self.hasher.signature(tokens)
+        self.signatures[kind][key] = signature
+        self.fingerprints[kind][key] = fingerprint
+        self.lsh[kind].insert(key, signature)
+        return True
+
+    def update_repositories(self, repositories: Iterable[Repository], dependencies: Any) -> int:
+        """
+        Refresh both signature kinds of repositories and drop vanished ones.
+
+        Args:
+            repositories: Repository models
+            dependencies: Callable returning the dependency set of a repository
+
+        Returns:
+            Number of signatures recomputed
+        """
+        repositories = list(repositories)
+        updated = 0
+        for repo in repositories:
+            deps = set(dependencies(repo))
+            updated += self.update("dependencies", repo.name, _digest(sorted(deps)), deps)
+            updated += self.update(
+                "content",
+                repo.name,
+                content_fingerprint(repo),
+                lambda repo=repo: shingles(repository_text(repo)),
+            )
+
+        names = {repo.name for repo in repositories}
+        for kind in KINDS:
+            for key in [k for k in self.fingerprints[kind] if k not in names]:
+                self.remove(kind, key)
+        return updated
+
+    def remove(self, kind: str, key: str) -> None:
+        """Forget the signature of a repository."""
+        self.signatures[kind].pop(key, None)
+        self.fingerprints[kind].pop(key, None)
+        self.lsh[kind].remove(key)
+
+    def similar(
+        self, kind: str, key: str, threshold: float = 0.5, limit: int = 10
+    ) -> list[tuple[str, float]]:
+        """
+        Repositories whose estimated Jaccard similarity to one exceeds a threshold.
+
+        Args:
+            kind: Signature kind
+            key: Repository name
+            threshold: Minimum estimated Jaccard similarity
+            limit: Maximum number of results
+
+        Returns:
+            (repository, similarity) pairs, most similar first
+        """
+        signature = self.signatures[kind].get(key)
+        if signature is None:
+            return []
+        return self._matches(kind, signature, threshold, exclude=key)[:limit]
+
+    def query(
+        self, kind: str, tokens: Iterable[str], threshold: float = 0.5, limit: int = 10
+    ) -> list[tuple[str, float]]:
+        """Repositories similar to an external token set (e.g. another corpus)."""
+        tokens = set(tokens)
+        if not tokens:
+            return []
+        return self._matches(kind, self.hasher.signature(tokens), threshold)[:limit]
+
+    def similar_pairs(self, kind: str, threshold: float = 0.8) -> list[tuple[str, str, float]]:
+        """
+        Every pair of repositories above a similarity threshold.
+
+        Args:
+            kind: Signature kind ("content" finds near-duplicates and forks)
+            threshold: Minimum estimated Jaccard similarity
+
+        Returns:
+            (repository, other repository, similarity) with names in sorted
+            order, most similar first
+        """
+        pairs = {}
+        for key, signature in self.signatures[kind].items():
+            for other, similarity in self._matches(kind, signature, threshold, exclude=key):
+                pairs[tuple(sorted((key, other)))] = similarity
+        return sorted(((a, b, s) for (a, b), s in pairs.items()), key=lambda p: (-p[2], p[0], p[1]))
+
+    def save(self) -> None:
+        """Write every signature and fingerprint atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        arrays: dict[str, Any] = {}
+        for kind in KINDS:
+            keys = sorted(self.signatures[kind])
+            arrays[f"{kind}_keys"] = np.array(keys, dtype=str)
+            arrays[f"{kind}_fingerprints"] = np.array(
+                [self.fingerprints[kind][k] for k in keys], dtype=str
+            )
+            arrays[f"{kind}_signatures"] = np.array(
+                [self.signatures[kind][k] for k in keys], dtype=np.uint32
+            ).reshape(len(keys), self.hasher.num_perm)
+            # Repositories with empty token sets: fingerprint only, not indexed
+            empty = sorted(set(self.fingerprints[kind]) - set(keys))
+            arrays[f"{kind}_empty_keys"] = np.array(empty, dtype=str)
+            arrays[f"{kind}_empty_fingerprints"] = np.array(
+                [self.fingerprints[kind][k] for k in empty], dtype=str
+            )
+
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp-", suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _matches(
+        self, kind: str, signature: np.ndarray, threshold: float, exclude: str | None = None
+    ) -> list[tuple[str, float]]:
+        matches = []
+        for other in self.lsh[kind].candidates(signature):
+            if other == exclude:
+                continue
+            similarity = estimate_jaccard(signature, self.signatures[kind][other])
+            if similarity >= threshold:
+                matches.append((other, similarity))
+        return sorted(matches, key=lambda m: (-m[1], m[0]))
+
+    def _load(self) -> None:
+        with np.load(self.path) as data:
+            arrays: dict[str, Any] = {key: data[key] for key in data.files}
+
+        for kind in KINDS:
+            if f"{kind}_keys" not in arrays:
+                continue
+            signatures = arrays[f"{kind}_signatures"]
+            if signatures.shape[1:] != (self.hasher.num_perm,):
+                # Signatures of another size cannot be compared; rebuild them
+                continue
+            for key, fingerprint, signature in zip(
+                arrays[f"{kind}_keys"], arrays[f"{kind}_fingerprints"], signatures
+            ):
+                if (signature == _MAX_HASH).all():
+                    # Signature of an empty set (saved by older versions); recomputed on update
+                    continue
+                key = str(key)
+                self.signatures[kind][key] = signature
+                self.fingerprints[kind][key] = str(fingerprint)
+                self.lsh[kind].insert(key, signature)
+            for key, fingerprint in zip(
+                arrays.get(f"{kind}_empty_keys", []), arrays.get(f"{kind}_empty_fingerprints", [])
+            ):
+                self.fingerprints[kind][str(key)] = str(fingerprint)
+
+
+def _token_hash(token: str) -> int:
+    """Stable 32-bit hash of a token (independent of PYTHONHASHSEED)."""
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+def _digest(parts: Iterable[str]) -> str:
+    """Digest of a sequence of strings."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _text_fields(repository: Repository) -> list[tuple[str, Any]]:
+    """README and code files of a repository, keeping blob references unresolved."""
+    metadata = repository.metadata or {}
+    if isinstance(metadata, LazyBlobDict):
+        metadata = metadata.raw()
+    fields = [("readme", metadata.get("readme"))]
+    code_files = metadata.get("code_files")
+    if isinstance(code_files, dict) and not is_blob_ref(code_files):
+        fields.extend(sorted(code_files.items()))
+    return [(name, value) for name, value in fields if value]
+
+
+def content_fingerprint(repository: Repository) -> str:
+    """Digest of a repository's README and code (blob digests are used as-is)."""
+    return _digest(
+        f"{name}:{value[BLOB_KEY] if is_blob_ref(value) else value}"
+        for name, value in _text_fields(repository)
+    )
+
+
+def repository_text(repository: Repository) -> str:
+    """README and code of a repository as one text."""
+    metadata = repository.metadata or {}
+    store = metadata.store if isinstance(metadata, LazyBlobDict) else None
+    texts = []
+    for _, value in _text_fields(repository):
+        if store is not None:
+            value = store.resolve(value)
+        if isinstance(value, str):
+            texts.append(value)
+    return "\n".join(texts)
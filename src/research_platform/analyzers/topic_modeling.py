@@ -1,6 +1,18 @@
-"""ML-based topic modeling for repositories."""
+"""ML-based topic modeling for repositories.
 
+Fitted models are optionally persisted (see topic_models), so later runs
+only assign topics to new or changed repositories. NMF and LDA (and every
+candidate topic count of a sweep) are fitted concurrently in worker
+processes, off the event loop.
+"""
+
+import asyncio
 import logging
+import os
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
 from typing import Any
 
 from ..models.repository import Repository
@@ -14,9 +26,26 @@ class TopicModelingAnalyzer(BaseAnalyzer):
         self,
         n_topics: int = 5,
         logger: logging.Logger | None = None,
+        model_dir: Path | str | None = None,
+        n_topics_range: Sequence[int] | None = None,
+        max_workers: int | None = None,
     ):
+        """
+        Initialize topic modeling analyzer.
+
+        Args:
+            n_topics: Number of topics
+            logger: Optional logger instance
+            model_dir: Directory of persisted models (refitted every run when None)
+            n_topics_range: Candidate topic counts; the most coherent model of
+                each method is reported instead of ``n_topics``
+            max_workers: Worker processes for fitting (CPU count by default)
+        """
         self.n_topics = n_topics
         self.logger = logger or logging.getLogger(__name__)
+        self.model_dir = Path(model_dir) if model_dir is not None else None
+        self.n_topics_range = list(n_topics_range) if n_topics_range else None
+        self.max_workers = max_workers or os.cpu_count() or 1
 
     async def analyze(self, repositories: list[Repository]) -> dict[str, Any]:
         """
@@ -29,83 +58,107 @@ class TopicModelingAnalyzer(BaseAnalyzer):
             Topic analysis results
         """
         # Import ML libraries here (lazy import)
+        from .corpus import tokenize
 
-        # Prepare documents
-        documents = [
-            f"{repo.name} {repo.description} {' '.join(repo.topics)}" for repo in repositories
-        ]
-
-        # NMF topic extraction
-        nmf_results = await self._extract_nmf_topics(documents)
-
-        # LDA topic extraction
-        lda_results = await self._extract_lda_topics(documents)
+        # Prepare documents (token streams of the shared corpus rules)
+        documents = {
+            repo.name: " ".join(
+                tokenize(f"{repo.name} {repo.description or ''} {' '.join(repo.topics)}")
+            )
+            for repo in repositories
+        }
+
+        # NMF and LDA (every candidate topic count of each) are fitted concurrently
+        jobs = 2 * len(self._candidates)
+        workers = min(self.max_workers, jobs)
+        # Share the cores between the concurrent fits instead of oversubscribing them
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            nmf_results, lda_results = await asyncio.gather(
+                self._extract_nmf_topics(documents, executor, threads),
+                self._extract_lda_topics(documents, executor, threads),
+            )
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
         return {"methods": {"nmf": nmf_results, "lda": lda_results}}
 
-    async def _extract_nmf_topics(self, documents: list[str]) -> dict[str, Any]:
-        """Extract topics using NMF."""
-        from sklearn.decomposition import NMF
-        from sklearn.feature_extraction.text import TfidfVectorizer
-
-        vectorizer = TfidfVectorizer(max_features=1000, min_df=1, max_df=0.8, ngram_range=(1, 2))
-
-        tfidf = vectorizer.fit_transform(documents)
-        model = NMF(n_components=min(self.n_topics, len(documents)), random_state=42)
-        model.fit(tfidf)
-
-        # Extract topic keywords
-        feature_names = vectorizer.get_feature_names_out()
-        topics = []
-
-        for topic_idx, topic in enumerate(model.components_):
-            top_indices = topic.argsort()[-10:][::-1]
-            keywords = [feature_names[i] for i in top_indices]
-            weights = [float(topic[i]) for i in top_indices]
-
-            topics.append(
-                {
-                    "topic_id": topic_idx,
-                    "words": keywords,
-                    "weights": weights,
-                    "label": " & ".join(keywords[:3]),
-                }
-            )
+    @property
+    def _candidates(self) -> list[int]:
+        """Topic counts to fit."""
+        return self.n_topics_range or [self.n_topics]
 
-        return {"method": "NMF", "n_topics": self.n_topics, "topics": topics}
+    async def _extract_nmf_topics(
+        self,
+        documents: dict[str, str],
+        executor: Executor | None = None,
+        threads: int = 1,
+    ) -> dict[str, Any]:
+        """Extract topics using NMF."""
+        return {"method": "NMF", **await self._fit_models("nmf", documents, executor, threads)}
 
-    async def _extract_lda_topics(self, documents: list[str]) -> dict[str, Any]:
+    async def _extract_lda_topics(
+        self,
+        documents: dict[str, str],
+        executor: Executor | None = None,
+        threads: int = 1,
+    ) -> dict[str, Any]:
         """Extract topics using LDA."""
-        from sklearn.decomposition import LatentDirichletAllocation
-        from sklearn.feature_extraction.text import CountVectorizer
-
-        vectorizer = CountVectorizer(max_features=1000, min_df=1, max_df=0.8)
-
-        counts = vectorizer.fit_transform(documents)
-        model = LatentDirichletAllocation(
-            n_components=min(self.n_topics, len(documents)), random_state=42
-        )
-        model.fit(counts)
-
-        # Extract topic keywords
-        feature_names = vectorizer.get_feature_names_out()
-        topics = []
-
-        for topic_idx, topic in enumerate(model.components_):
-            top_indices = topic.argsort()[-10:][::-1]
-            keywords = [feature_names[i] for i in top_indices]
-            weights = [float(topic[i]) for i in top_indices]
-
-            topics.append(
-                {
-                    "topic_id": topic_idx,
-                    "words": keywords,
-                    "weights": weights,
-                    "label": " & ".join(keywords[:3]),
-                }
-            )
+        return {"method": "LDA", **await self._fit_models("lda", documents, executor, threads)}
+
+    async def _fit_models(
+        self,
+        method: str,
+        documents: dict[str, str],
+        executor: Executor | None,
+        threads: int,
+    ) -> dict[str, Any]:
+        """
+        Update (or fit) the models of a method off the event loop.
+
+        With a topic count sweep, every candidate is fitted in parallel and the
+        one with the highest UMass coherence is reported.
 
-        return {"method": "LDA", "n_topics": self.n_topics, "topics": topics}
+        Args:
+            method: "nmf" or "lda"
+            documents: Repository name -> document text
+            executor: Worker processes (the loop's default thread pool when None)
+            threads: Native threads each fit may use
+
+        Returns:
+            Topics of the selected model
+        """
+        # Import ML libraries here (lazy import)
+        from .topic_models import update_topic_model
+
+        sweep = len(self._candidates) > 1
+        loop = asyncio.get_running_loop()
+        fits = []
+        for n_topics in self._candidates:
+            path = None
+            if self.model_dir is not None:
+                name = f"{method}-{n_topics}" if sweep else method
+                path = self.model_dir / f"{name}.joblib"
+            fit = partial(
+                update_topic_model,
+                method,
+                n_topics,
+                documents,
+                path=path,
+                threads=threads,
+                score=sweep,
+            )
+            fits.append(loop.run_in_executor(executor, fit))
+        results = await asyncio.gather(*fits)
+
+        best = max(results, key=lambda r: r["coherence"]) if sweep else results[0]
+        report = {"n_topics": best["n_topics"], "topics": best["topics"], "refit": best["refit"]}
+        if sweep:
+            report["coherence"] = best["coherence"]
+            report["sweep"] = {r["n_topics"]: r["coherence"] for r in results}
+        return report
 
     async def validate_results(self, results: dict[str, Any]) -> bool:
         """Validate topic modeling results."""
@@ -0,0 +1,379 @@
+"""Persisted topic models with incremental assignment.
+
+A TopicModel keeps a fitted vectorizer and NMF or LDA model together with
+the fingerprint of the corpus it was fitted on and the digest of every
+document it has assigned topics to. Updating it with the current corpus
+only projects new or changed documents onto the existing topics
+(``transform``); the model is refitted from scratch once the share of the
+corpus that changed since the last fit passes DRIFT_THRESHOLD, or when its
+configuration changes.
+
+LDA models can learn from changed documents online (``partial_fit``), and
+large corpora are fitted in mini-batches. ``update_topic_model`` is the
+entry point for worker processes: it caps native threads so concurrent fits
+do not oversubscribe the CPU, and scores the topics by UMass coherence so a
+sweep over topic counts can pick the best model.
+
+Documents are token streams from the shared corpus (``corpus.tokenize``)
+joined by spaces; the vectorizers only split them, so every consumer of
+repository text agrees on the terms.
+"""
+
+import logging
+import os
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import joblib
+import numpy as np
+from sklearn.decomposition import NMF, LatentDirichletAllocation
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+from threadpoolctl import threadpool_limits
+
+from ..storage.blobs import BlobStore
+
+# Bump whenever the persisted state changes so stale models are refitted
+MODEL_VERSION = 2
+
+# Default location of fitted models (one file per method)
+DEFAULT_MODEL_DIR = Path("cache/topic_models")
+
+# Share of the corpus (changed, added or removed documents) that triggers a refit
+DRIFT_THRESHOLD = 0.2
+
+# Corpora from this size on fit LDA with mini-batch (online) variational Bayes
+ONLINE_MIN_DOCUMENTS = 5000
+
+# Documents per LDA mini-batch
+ONLINE_BATCH_SIZE = 256
+
+METHODS = ("nmf", "lda")
+
+# Documents are already tokenized (space-joined corpus token streams)
+_PRETOKENIZED: dict[str, Any] = {"tokenizer": str.split, "token_pattern": None, "lowercase": False}
+
+_VECTORIZER_DEFAULTS: dict[str, dict[str, Any]] = {
+    "nmf": {"max_features": 1000, "min_df": 1, "max_df": 0.8, "ngram_range": (1, 2)},
+    "lda": {"max_features": 1000, "min_df": 1, "max_df": 0.8},
+}
+
+
+def corpus_fingerprint(digests: dict[str, str]) -> str:
+    """Digest of a corpus from the digests of its documents (order-independent)."""
+    return BlobStore.digest("\n".join(f"{name}\0{digests[name]}" for name in sorted(digests)))
+
+
+class TopicModel:
+    """NMF or LDA topic model that persists and assigns new documents incrementally."""
+
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        method: str = "nmf",
+        n_topics: int = 5,
+        vectorizer_params: dict[str, Any] | None = None,
+        model_params: dict[str, Any] | None = None,
+        online: bool = False,
+        drift_threshold: float = DRIFT_THRESHOLD,
+        n_jobs: int | None = None,
+        logger: logging.Logger | None = None,
+    ):
+        if method not in METHODS:
+            raise ValueError(f"Unknown topic model method: {method}")
+        self.path = Path(path) if path is not None else None
+        self.method = method
+        self.n_topics = n_topics
+        self.vectorizer_params = {
+            **_PRETOKENIZED,
+            **_VECTORIZER_DEFAULTS[method],
+            **(vectorizer_params or {}),
+        }
+        self.model_params = {"random_state": 42, **(model_params or {})}
+        self.online = online
+        self.drift_threshold = drift_threshold
+        # Parallel jobs of LDA (does not change results, so not part of config)
+        self.n_jobs = n_jobs
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.vectorizer: TfidfVectorizer | CountVectorizer | None = None
+        self.model: NMF | LatentDirichletAllocation | None = None
+        self.fingerprint: str | None = None
+        self.fitted_documents = 0
+        self.perplexity: float | None = None
+        self.digests: dict[str, str] = {}
+        self.distributions: dict[str, np.ndarray] = {}
+        self._drifted: set[str] = set()
+
+        if self.path is not None and self.path.exists():
+            self._load()
+
+    @property
+    def config(self) -> dict[str, Any]:
+        """Settings a persisted model must match to be reused."""
+        return {
+            "version": MODEL_VERSION,
+            "method": self.method,
+            "n_topics": self.n_topics,
+            "vectorizer_params": self.vectorizer_params,
+            "model_params": self.model_params,
+            "online": self.online,
+        }
+
+    @property
+    def drift(self) -> float:
+        """Share of the fitted corpus changed, added or removed since the last fit."""
+        return len(self._drifted) / max(self.fitted_documents, 1)
+
+    def update(self, documents: dict[str, str]) -> dict[str, Any]:
+        """
+        Bring topic assignments up to date with the current corpus.
+
+        Args:
+            documents: Repository name -> space-joined tokens
+
+        Returns:
+            Whether the model was refitted and how many documents were
+            (re)assigned and dropped
+        """
+        digests = {name: BlobStore.digest(text) for name, text in documents.items()}
+        changed = [name for name, digest in digests.items() if self.digests.get(name) != digest]
+        removed = [name for name in self.digests if name not in digests]
+
+        drifted = self._drifted.union(changed, removed)
+        if (
+            self.model is None
+            or len(drifted) / max(self.fitted_documents, 1) > self.drift_threshold
+        ):
+            self.fit(documents)
+            return {"refit": True, "assigned": len(documents), "removed": len(removed)}
+
+        for name in removed:
+            del self.digests[name]
+            del self.distributions[name]
+        self._drifted.update(removed)
+        if changed:
+            self.assign({name: documents[name] for name in changed})
+        # Keep assignments in corpus order
+        self.distributions = {name: self.distributions[name] for name in documents}
+        return {"refit": False, "assigned": len(changed), "removed": len(removed)}
+
+    def fit(self, documents: dict[str, str]) -> None:
+        """
+        Fit the vectorizer and topic model from scratch.
+
+        Args:
+            documents: Repository name -> space-joined tokens
+
+        Raises:
+            ValueError: If the documents yield no vocabulary
+        """
+        names = list(documents)
+        self.vectorizer = (
+            TfidfVectorizer(**self.vectorizer_params)
+            if self.method == "nmf"
+            else CountVectorizer(**self.vectorizer_params)
+        )
+        matrix = self.vectorizer.fit_transform(documents.values())
+
+        n_components = min(self.n_topics, len(names))
+        if self.method == "nmf":
+            self.model = NMF(n_components=n_components, **self.model_params)
+        else:
+            params = dict(self.model_params)
+            params.setdefault("n_jobs", self.n_jobs)
+            if self.online or len(names) >= ONLINE_MIN_DOCUMENTS:
+                params.setdefault("learning_method", "online")
+                params.setdefault("batch_size", ONLINE_BATCH_SIZE)
+            self.model = LatentDirichletAllocation(n_components=n_components, **params)
+        distributions = self.model.fit_transform(matrix)
+        self.perplexity = float(self.model.perplexity(matrix)) if self.method == "lda" else None
+
+        self.digests = {name: BlobStore.digest(documents[name]) for name in names}
+        self.distributions = dict(zip(names, distributions, strict=True))
+        self.fingerprint = corpus_fingerprint(self.digests)
+        self.fitted_documents = len(names)
+        self._drifted = set()
+        self.logger.info(f"Fitted {self.method.upper()} topic model on {len(names)} documents")
+
+    def assign(self, documents: dict[str, str]) -> dict[str, np.ndarray]:
+        """
+        Project documents onto the existing topics.
+
+        Online LDA models also learn from the documents (``partial_fit``)
+        before they are projected.
+
+        Args:
+            documents: Repository name -> space-joined tokens
+
+        Returns:
+            Repository name -> topic distribution
+        """
+        if self.model is None or self.vectorizer is None:
+            raise ValueError("Topic model has not been fitted")
+        matrix = self.vectorizer.transform(documents.values())
+        if self.online and self.method == "lda":
+            self.model.partial_fit(matrix)
+        assigned = dict(zip(documents, self.model.transform(matrix), strict=True))
+
+        for name, text in documents.items():
+            self.digests[name] = BlobStore.digest(text)
+        self.distributions.update(assigned)
+        self._drifted.update(documents)
+        return assigned
+
+    def topics(self, n_top_words: int = 10) -> list[dict[str, Any]]:
+        """Top words of every topic, with their weights and a short label."""
+        if self.model is None or self.vectorizer is None:
+            return []
+        feature_names = self.vectorizer.get_feature_names_out()
+        topics = []
+        for topic_idx, topic in enumerate(self.model.components_):
+            top_indices = topic.argsort()[-n_top_words:][::-1]
+            words = [str(feature_names[i]) for i in top_indices]
+            topics.append(
+                {
+                    "topic_id": topic_idx,
+                    "words": words,
+                    "weights": [float(topic[i]) for i in top_indices],
+                    "label": " & ".join(words[:3]),
+                }
+            )
+        return topics
+
+    def repository_topics(self) -> list[dict[str, Any]]:
+        """Dominant topic and topic distribution of every assigned repository."""
+        repo_topics = []
+        for name, distribution in self.distributions.items():
+            dominant_topic = int(distribution.argmax())
+            repo_topics.append(
+                {
+                    "repository": name,
+                    "dominant_topic": dominant_topic,
+                    "topic_strength": float(distribution[dominant_topic]),
+                    "topic_distribution": [float(x) for x in distribution],
+                }
+            )
+        return repo_topics
+
+    def coherence(self, documents: Iterable[str], n_top_words: int = 10) -> float:
+        """
+        Mean UMass coherence of the topics over a corpus.
+
+        Scores how often the top words of each topic occur in the same
+        documents: log((D(w_m, w_l) + 1) / D(w_l)) averaged over pairs of top
+        words, w_l ranked above w_m, and over topics. Higher (closer to zero)
+        is more coherent.
+
+        Args:
+            documents: Space-joined token streams
+            n_top_words: Top words per topic
+
+        Returns:
+            Coherence score
+        """
+        if self.model is None or self.vectorizer is None:
+            raise ValueError("Topic model has not been fitted")
+        top = np.argsort(self.model.components_, axis=1)[:, ::-1][:, :n_top_words]
+        terms, index = np.unique(top, return_inverse=True)
+        index = index.reshape(top.shape)
+
+        # Document co-occurrence counts of the top words only
+        occurs = (self.vectorizer.transform(documents)[:, terms] > 0).astype(np.float64)
+        together = (occurs.T @ occurs).toarray()
+
+        higher, lower = np.triu_indices(top.shape[1], k=1)
+        ranked, other = index[:, higher], index[:, lower]
+        scores = np.log((together[other, ranked] + 1) / np.maximum(together[ranked, ranked], 1))
+        return float(scores.mean())
+
+    @property
+    def vocabulary_size(self) -> int:
+        """Number of terms known to the fitted vectorizer."""
+        return len(self.vectorizer.vocabulary_) if self.vectorizer is not None else 0
+
+    def save(self) -> None:
+        """Write the fitted model and assignments atomically."""
+        if self.path is None:
+            raise ValueError("TopicModel has no path to save to")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            "config": self.config,
+            "vectorizer": self.vectorizer,
+            "model": self.model,
+            "fingerprint": self.fingerprint,
+            "fitted_documents": self.fitted_documents,
+            "perplexity": self.perplexity,
+            "digests": self.digests,
+            "distributions": self.distributions,
+            "drifted": self._drifted,
+        }
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp-", suffix=".joblib")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                joblib.dump(state, f)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _load(self) -> None:
+        """Restore a persisted model unless it was fitted with other settings."""
+        try:
+            state = joblib.load(self.path)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable topic model {self.path}: {e}")
+            return
+        if state.get("config") != self.config:
+            self.logger.info(f"Topic model settings changed, {self.path} will be refitted")
+            return
+        self.vectorizer = state["vectorizer"]
+        self.model = state["model"]
+        if self.method == "lda":
+            self.model.set_params(n_jobs=self.n_jobs)
+        self.fingerprint = state["fingerprint"]
+        self.fitted_documents = state["fitted_documents"]
+        self.perplexity = state["perplexity"]
+        self.digests = state["digests"]
+        self.distributions = state["distributions"]
+        self._drifted = state["drifted"]
+
+
+def update_topic_model(
+    method: str,
+    n_topics: int,
+    documents: dict[str, str],
+    path: Path | str | None = None,
+    threads: int = 1,
+    n_top_words: int = 10,
+    score: bool = False,
+) -> dict[str, Any]:
+    """
+    Update (or fit) one persisted topic model, limited to ``threads`` threads.
+
+    Module-level so it can run in a worker process.
+
+    Args:
+        method: "nmf" or "lda"
+        n_topics: Number of topics
+        documents: Repository name -> space-joined tokens
+        path: File of the persisted model (not persisted when None)
+        threads: Native (BLAS/OpenMP) threads and LDA jobs the fit may use
+        n_top_words: Top words reported per topic
+        score: Whether to compute the UMass coherence of the topics
+
+    Returns:
+        Topics, whether the model was refitted, and the coherence when scored
+    """
+    with threadpool_limits(limits=threads):
+        model = TopicModel(path, method=method, n_topics=n_topics, n_jobs=threads)
+        update = model.update(documents)
+        if path is not None:
+            model.save()
+        return {
+            "n_topics": n_topics,
+            "topics": model.topics(n_top_words),
+            "refit": update["refit"],
+            "coherence": model.coherence(documents.values(), n_top_words) if score else None,
+        }
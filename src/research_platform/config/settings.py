@@ -121,6 +121,17 @@ class Settings:
         }
     )
 
+    # Performance tuning
+    performance: dict[str, Any] = field(
+        default_factory=lambda: {
+            "max_concurrent_requests": 5,
+            "async_batch_size": 10,
+            "cache_warming": False,
+            "warming_budget": 1000,
+            "parallel_analysis": True,
+        }
+    )
+
     @classmethod
     def from_yaml(cls, config_path: Path) -> "Settings":
         """Load settings from YAML file."""
@@ -191,6 +202,7 @@ class Settings:
             "ENVIRONMENT": ("environment",),
             "CACHE_ENABLED": ("cache", "enabled"),
             "CACHE_TTL": ("cache", "ttl"),
+            "CACHE_REDIS_URL": ("cache", "redis_url"),
         }
 
         for env_var, path in env_mapping.items():
@@ -267,6 +279,10 @@ class Settings:
         """Check if a feature is enabled."""
         return self.features.get(feature, False)
 
+    def get_performance_setting(self, name: str, default: Any = None) -> Any:
+        """Get a performance tuning value."""
+        return self.performance.get(name, default)
+
     def __str__(self) -> str:
         """String representation."""
         return f"Settings(app='{self.app_name}', env='{self.environment}', org='{self.github.organization}')"
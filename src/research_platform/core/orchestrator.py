@@ -22,6 +22,7 @@ class PipelineResult:
     data: dict[str, Any]
     duration: float
     timestamp: datetime = field(default_factory=datetime.now)
+    cache_stats: dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -38,6 +39,7 @@ class PipelineResult:
                 "successful": len(self.phases_completed),
                 "failed": len(self.phases_failed),
             },
+            "cache_stats": self.cache_stats,
         }
 
 
@@ -50,6 +52,7 @@ class PipelineOrchestrator:
         self.phases: list[Phase] = []
         self.context: dict[str, Any] = {}
         self._phase_results: dict[str, PhaseResult] = {}
+        self._caches: dict[str, Any] = {}
 
     def register_phase(self, phase: Phase) -> None:
         """Register a phase in the pipeline."""
@@ -61,6 +64,19 @@ class PipelineOrchestrator:
         for phase in phases:
             self.register_phase(phase)
 
+    def register_cache(self, name: str, cache: Any) -> None:
+        """Register a cache whose statistics are reported with the pipeline result."""
+        self._caches[name] = cache
+
+    def _collect_cache_stats(self) -> dict[str, Any]:
+        """Log and collect statistics from registered caches."""
+        cache_stats = {}
+        for name, cache in self._caches.items():
+            self.logger.info(f"Cache statistics ({name}):")
+            cache.stats.log_summary(self.logger)
+            cache_stats[name] = cache.stats.to_dict()
+        return cache_stats
+
     @asynccontextmanager
     async def _phase_context(self, phase_name: str):
         """Context manager for phase execution."""
@@ -139,6 +155,7 @@ class PipelineOrchestrator:
             warnings=warnings,
             data=self.context,
             duration=duration,
+            cache_stats=self._collect_cache_stats(),
         )
 
     async def _execute_phase_with_retry(self, phase: Phase) -> PhaseResult:
@@ -1,6 +1,15 @@
 """Data fetchers for GitHub and academic sources."""
 
-from .cache import CacheManager
+from .cache import CacheManager, RedisCacheManager, create_cache_manager
+from .cache_stats import CacheStats
+from .cache_warmer import CacheWarmer
 from .github_fetcher import GitHubFetcher
 
-__all__ = ["GitHubFetcher", "CacheManager"]
+__all__ = [
+    "GitHubFetcher",
+    "CacheManager",
+    "CacheStats",
+    "CacheWarmer",
+    "RedisCacheManager",
+    "create_cache_manager",
+]
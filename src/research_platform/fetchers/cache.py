@@ -2,7 +2,11 @@
 
 import asyncio
 import json
+import logging
 import os
+import time
+import zlib
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -10,15 +14,21 @@ from typing import Any
 import aiofiles
 
 from ..config.settings import Settings
+from ..core.exceptions import CacheException
+from .cache_stats import CacheStats
 
 
 class CacheManager:
     """Manage file-based caching for fetched data."""
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, logger: logging.Logger | None = None):
         self.settings = settings
+        self.logger = logger or logging.getLogger(__name__)
         self.cache_dir = Path(settings.cache.directory)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # One producer task per key currently being computed (single-flight)
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.stats = CacheStats()
 
     async def get(self, key: str) -> dict[str, Any] | None:
         """
@@ -30,29 +40,102 @@ class CacheManager:
         Returns:
             Cached data or None if expired/not found
         """
-        cache_file = self.cache_dir / f"{key}.json"
+        entry = await self._lookup(key)
 
-        if not cache_file.exists():
+        if entry is None:
             return None
 
-        try:
-            async with aiofiles.open(cache_file, encoding="utf-8") as f:
-                content = await f.read()
-                cached_data = json.loads(content)
+        data, expires_in = entry
+        if expires_in > 0:
+            return data
 
-            # Check expiration
-            cached_at = datetime.fromisoformat(cached_data.get("cached_at", ""))
-            ttl = timedelta(seconds=cached_data.get("ttl", self.settings.cache.ttl))
+        # Expired - remove entry
+        await self._delete_entry(key)
+        self.stats.for_key(key).evictions += 1
+        return None
 
-            if datetime.now() - cached_at < ttl:
-                return cached_data.get("data")
+    async def get_many(self, keys: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Get several cached entries at once.
 
-            # Expired - remove file
-            await self._remove_cache_file(cache_file)
-            return None
+        Args:
+            keys: Cache keys
 
-        except Exception:
-            return None
+        Returns:
+            Mapping of key to data for every fresh hit
+        """
+        values = await asyncio.gather(*[self.get(key) for key in keys])
+        return {key: value for key, value in zip(keys, values) if value is not None}
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[dict[str, Any]]],
+        ttl: int | None = None,
+        stale_while_revalidate: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Get cached data, computing and caching it on a miss.
+
+        Concurrent misses for the same key are coalesced: only one call to
+        ``compute`` runs and every other caller awaits its result.
+
+        Args:
+            key: Cache key
+            compute: Zero-argument callable returning an awaitable that produces the data
+            ttl: Time to live in seconds for the computed value
+            stale_while_revalidate: Serve an expired value immediately and
+                refresh it in the background instead of waiting for ``compute``
+
+        Returns:
+            Cached or freshly computed data
+        """
+        entry = await self._lookup(key)
+
+        if entry is not None:
+            data, expires_in = entry
+            if expires_in > 0:
+                return data
+            if stale_while_revalidate:
+                self._start_compute(key, compute, ttl)
+                return data
+
+        # Shield so a cancelled waiter does not cancel the shared producer
+        return await asyncio.shield(self._start_compute(key, compute, ttl))
+
+    async def refresh(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[dict[str, Any]]],
+        ttl: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Recompute and re-cache a key regardless of its current freshness.
+
+        Joins an in-flight computation for the key if one is running.
+
+        Args:
+            key: Cache key
+            compute: Zero-argument callable returning an awaitable that produces the data
+            ttl: Time to live in seconds for the computed value
+
+        Returns:
+            Freshly computed data
+        """
+        return await asyncio.shield(self._start_compute(key, compute, ttl))
+
+    async def time_to_expiry(self, key: str) -> float | None:
+        """
+        Get the number of seconds until a cached entry expires.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Seconds until expiry (negative if already expired) or None if not cached
+        """
+        entry = await self._read_entry(key)
+        return entry[1] if entry is not None else None
 
     async def set(self, key: str, data: dict[str, Any], ttl: int | None = None) -> None:
         """
@@ -63,20 +146,64 @@ class CacheManager:
             data: Data to cache
             ttl: Time to live in seconds
         """
-        cache_file = self.cache_dir / f"{key}.json"
-
-        cached_data = {
-            "cached_at": datetime.now().isoformat(),
-            "ttl": ttl or self.settings.cache.ttl,
-            "data": data,
-        }
+        cached_data = self._make_entry(data, ttl)
+        stats = self.stats.for_key(key)
+        start = time.perf_counter()
 
         try:
-            async with aiofiles.open(cache_file, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(cached_data, indent=2, ensure_ascii=False))
+            await self._write_entry(key, cached_data)
         except Exception as e:
             # Log but don't fail if caching fails
-            print(f"Warning: Failed to cache {key}: {e}")
+            stats.errors += 1
+            self.logger.warning(f"Failed to cache {key}: {e}")
+        finally:
+            stats.set_latency.observe(time.perf_counter() - start)
+
+    async def set_many(self, items: dict[str, dict[str, Any]], ttl: int | None = None) -> None:
+        """
+        Cache several entries at once.
+
+        Args:
+            items: Mapping of cache key to data
+            ttl: Time to live in seconds
+        """
+        await asyncio.gather(*[self.set(key, data, ttl=ttl) for key, data in items.items()])
+
+    async def close(self) -> None:
+        """Release backend resources."""
+        pass
+
+    def _start_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[dict[str, Any]]],
+        ttl: int | None,
+    ) -> asyncio.Task:
+        """Return the in-flight producer for a key, starting one if needed."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._compute_and_set(key, compute, ttl))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish_compute(key, t))
+        return task
+
+    async def _compute_and_set(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[dict[str, Any]]],
+        ttl: int | None,
+    ) -> dict[str, Any]:
+        """Run the producer and cache its result."""
+        data = await compute()
+        await self.set(key, data, ttl=ttl)
+        return data
+
+    def _finish_compute(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished producer and log failures nobody awaited."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.warning(f"Failed to compute cache entry {key}: {task.exception()}")
 
     async def clear(self, key: str | None = None) -> None:
         """
@@ -86,12 +213,92 @@ class CacheManager:
             key: Specific key to clear, or None to clear all
         """
         if key:
-            cache_file = self.cache_dir / f"{key}.json"
-            await self._remove_cache_file(cache_file)
+            await self._delete_entry(key)
+            self.stats.for_key(key).evictions += 1
         else:
             # Clear all cache files
             for cache_file in self.cache_dir.glob("*.json"):
                 await self._remove_cache_file(cache_file)
+                self.stats.for_key(cache_file.stem).evictions += 1
+
+    async def _lookup(self, key: str) -> tuple[dict[str, Any], float] | None:
+        """Read an entry and record hit/miss/expiration statistics."""
+        stats = self.stats.for_key(key)
+        start = time.perf_counter()
+
+        entry = await self._read_entry(key)
+
+        stats.get_latency.observe(time.perf_counter() - start)
+        if entry is None:
+            stats.misses += 1
+        elif entry[1] > 0:
+            stats.hits += 1
+        else:
+            stats.misses += 1
+            stats.expirations += 1
+        return entry
+
+    def _make_entry(self, data: dict[str, Any], ttl: int | None) -> dict[str, Any]:
+        """Wrap data with the metadata stored alongside it."""
+        return {
+            "cached_at": datetime.now().isoformat(),
+            "ttl": ttl or self.settings.cache.ttl,
+            "data": data,
+        }
+
+    def _unwrap_entry(self, cached_data: dict[str, Any]) -> tuple[Any, float]:
+        """Split a stored entry into (data, seconds until expiry)."""
+        cached_at = datetime.fromisoformat(cached_data.get("cached_at", ""))
+        ttl = timedelta(seconds=cached_data.get("ttl", self.settings.cache.ttl))
+
+        return cached_data.get("data"), (cached_at + ttl - datetime.now()).total_seconds()
+
+    async def _read_entry(self, key: str) -> tuple[dict[str, Any], float] | None:
+        """
+        Read a cache entry without evicting it.
+
+        Returns:
+            Tuple of (data, seconds until expiry) or None if missing/unreadable
+        """
+        cache_file = self.cache_dir / f"{key}.json"
+
+        if not cache_file.exists():
+            return None
+
+        stats = self.stats.for_key(key)
+
+        try:
+            async with aiofiles.open(cache_file, encoding="utf-8") as f:
+                content = await f.read()
+
+            start = time.perf_counter()
+            cached_data = json.loads(content)
+            stats.serialization_seconds += time.perf_counter() - start
+            stats.bytes_read += len(content.encode("utf-8"))
+
+            return self._unwrap_entry(cached_data)
+
+        except Exception as e:
+            stats.errors += 1
+            self.logger.debug(f"Unreadable cache entry {key}: {e}")
+            return None
+
+    async def _write_entry(self, key: str, cached_data: dict[str, Any]) -> None:
+        """Persist a wrapped cache entry."""
+        cache_file = self.cache_dir / f"{key}.json"
+        stats = self.stats.for_key(key)
+
+        start = time.perf_counter()
+        content = json.dumps(cached_data, indent=2, ensure_ascii=False)
+        stats.serialization_seconds += time.perf_counter() - start
+
+        async with aiofiles.open(cache_file, "w", encoding="utf-8") as f:
+            await f.write(content)
+        stats.bytes_written += len(content.encode("utf-8"))
+
+    async def _delete_entry(self, key: str) -> None:
+        """Remove a single cache entry."""
+        await self._remove_cache_file(self.cache_dir / f"{key}.json")
 
     async def _remove_cache_file(self, cache_file: Path) -> None:
         """Remove a cache file safely."""
@@ -100,3 +307,170 @@ class CacheManager:
                 await asyncio.to_thread(os.remove, cache_file)
         except Exception:
             pass  # Ignore errors when removing cache files
+
+
+class RedisCacheManager(CacheManager):
+    """
+    Cache backed by a Redis-protocol server shared between build runners.
+
+    Entries are stored as zlib-compressed JSON. The server expires keys after
+    twice their TTL so stale-while-revalidate can still serve them for one
+    extra TTL period; freshness itself is checked against ``cached_at``.
+    """
+
+    KEY_PREFIX = "research_platform:cache:"
+
+    def __init__(
+        self,
+        settings: Settings,
+        client: Any | None = None,
+        logger: logging.Logger | None = None,
+    ):
+        super().__init__(settings, logger)
+
+        if client is None:
+            try:
+                import redis.asyncio as aioredis
+            except ImportError as e:
+                raise CacheException(
+                    "cache.redis_url is set but the 'redis' package is not installed",
+                    details={"redis_url": settings.cache.redis_url},
+                ) from e
+            client = aioredis.from_url(settings.cache.redis_url)
+
+        self.client = client
+
+    async def get_many(self, keys: list[str]) -> dict[str, dict[str, Any]]:
+        """Get several cached entries in one pipelined round trip."""
+        if not keys:
+            return {}
+
+        start = time.perf_counter()
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key in keys:
+                pipe.get(self._redis_key(key))
+            payloads = await pipe.execute()
+        except Exception as e:
+            # An unreachable server degrades to misses, as in get()
+            for key in keys:
+                stats = self.stats.for_key(key)
+                stats.errors += 1
+                stats.misses += 1
+            self.logger.debug(f"Failed to read {len(keys)} cache entries: {e}")
+            return {}
+        elapsed = time.perf_counter() - start
+
+        results = {}
+        for key, payload in zip(keys, payloads):
+            stats = self.stats.for_key(key)
+            stats.get_latency.observe(elapsed / len(keys))
+            entry = self._decode(key, payload)
+            if entry is not None and entry[1] > 0:
+                stats.hits += 1
+                results[key] = entry[0]
+            else:
+                stats.misses += 1
+                if entry is not None:
+                    stats.expirations += 1
+        return results
+
+    async def set_many(self, items: dict[str, dict[str, Any]], ttl: int | None = None) -> None:
+        """Cache several entries in one pipelined round trip."""
+        if not items:
+            return
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, data in items.items():
+                cached_data = self._make_entry(data, ttl)
+                pipe.set(
+                    self._redis_key(key),
+                    self._encode(key, cached_data),
+                    ex=cached_data["ttl"] * 2,
+                )
+            await pipe.execute()
+        except Exception as e:
+            for key in items:
+                self.stats.for_key(key).errors += 1
+            self.logger.warning(f"Failed to cache {len(items)} entries: {e}")
+
+    async def clear(self, key: str | None = None) -> None:
+        """Clear a specific key or every key under this cache's prefix."""
+        if key:
+            await self._delete_entry(key)
+            self.stats.for_key(key).evictions += 1
+            return
+
+        keys = [k async for k in self.client.scan_iter(match=f"{self.KEY_PREFIX}*")]
+        if keys:
+            await self.client.delete(*keys)
+        for redis_key in keys:
+            if isinstance(redis_key, bytes):
+                redis_key = redis_key.decode("utf-8")
+            self.stats.for_key(redis_key[len(self.KEY_PREFIX) :]).evictions += 1
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self.client.aclose()
+
+    async def _read_entry(self, key: str) -> tuple[dict[str, Any], float] | None:
+        try:
+            payload = await self.client.get(self._redis_key(key))
+        except Exception as e:
+            self.stats.for_key(key).errors += 1
+            self.logger.debug(f"Failed to read cache entry {key}: {e}")
+            return None
+        return self._decode(key, payload)
+
+    async def _write_entry(self, key: str, cached_data: dict[str, Any]) -> None:
+        await self.client.set(
+            self._redis_key(key), self._encode(key, cached_data), ex=cached_data["ttl"] * 2
+        )
+
+    async def _delete_entry(self, key: str) -> None:
+        try:
+            await self.client.delete(self._redis_key(key))
+        except Exception:
+            pass  # Ignore errors when removing cache entries
+
+    def _redis_key(self, key: str) -> str:
+        """Namespace a cache key on the shared server."""
+        return f"{self.KEY_PREFIX}{key}"
+
+    def _encode(self, key: str, cached_data: dict[str, Any]) -> bytes:
+        """Serialize and compress a wrapped entry."""
+        stats = self.stats.for_key(key)
+        start = time.perf_counter()
+        payload = zlib.compress(json.dumps(cached_data, ensure_ascii=False).encode("utf-8"))
+        stats.serialization_seconds += time.perf_counter() - start
+        stats.bytes_written += len(payload)
+        return payload
+
+    def _decode(self, key: str, payload: bytes | None) -> tuple[dict[str, Any], float] | None:
+        """Decompress a stored payload into (data, seconds until expiry)."""
+        if payload is None:
+            return None
+        stats = self.stats.for_key(key)
+        try:
+            start = time.perf_counter()
+            cached_data = json.loads(zlib.decompress(payload))
+            stats.serialization_seconds += time.perf_counter() - start
+            stats.bytes_read += len(payload)
+            return self._unwrap_entry(cached_data)
+        except Exception as e:
+            stats.errors += 1
+            self.logger.debug(f"Undecodable cache entry {key}: {e}")
+            return None
+
+
+def create_cache_manager(settings: Settings, logger: logging.Logger | None = None) -> CacheManager:
+    """
+    Create the cache backend selected by the settings.
+
+    Returns a RedisCacheManager when ``cache.redis_url`` is configured,
+    otherwise the file-based CacheManager.
+    """
+    if settings.cache.redis_url:
+        return RedisCacheManager(settings, logger=logger)
+    return CacheManager(settings, logger=logger)
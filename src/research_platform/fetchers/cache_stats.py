@@ -0,0 +1,174 @@
+"""Hit/miss and latency instrumentation for cache backends."""
+
+import json
+import logging
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Upper bounds (milliseconds) of the latency histogram buckets; the last
+# bucket collects everything slower.
+LATENCY_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000)
+
+# Key prefixes mapped to the namespace they are reported under. Keys of the
+# form "namespace:rest" use the part before the colon directly.
+NAMESPACE_PREFIXES = {
+    "org_data": "org_data",
+    "readme": "readme",
+    "tree": "tree",
+    "releases": "releases",
+    "doi": "doi",
+    "crossref": "doi",
+    "arxiv": "arxiv",
+    "analysis": "analysis",
+}
+
+
+def key_namespace(key: str) -> str:
+    """Return the reporting namespace for a cache key."""
+    if ":" in key:
+        return key.split(":", 1)[0]
+
+    lowered = key.lower()
+    for prefix, namespace in NAMESPACE_PREFIXES.items():
+        if lowered.startswith(prefix):
+            return namespace
+    return "other"
+
+
+@dataclass
+class LatencyHistogram:
+    """Fixed-bucket latency histogram."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one observation."""
+        ms = seconds * 1000
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return sum(self.counts)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation."""
+        labels = [f"<={b}ms" for b in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+@dataclass
+class NamespaceStats:
+    """Counters for one cache key namespace."""
+
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    errors: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    serialization_seconds: float = 0.0
+    get_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    set_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "hit_rate": round(self.hit_rate, 4),
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "serialization_ms": round(self.serialization_seconds * 1000, 3),
+            "get_latency": self.get_latency.to_dict(),
+            "set_latency": self.set_latency.to_dict(),
+        }
+
+
+class CacheStats:
+    """Collect cache statistics per key namespace."""
+
+    def __init__(self) -> None:
+        self.namespaces: dict[str, NamespaceStats] = {}
+
+    def for_key(self, key: str) -> NamespaceStats:
+        """Get (creating if needed) the counters for a key's namespace."""
+        namespace = key_namespace(key)
+        stats = self.namespaces.get(namespace)
+        if stats is None:
+            stats = self.namespaces[namespace] = NamespaceStats()
+        return stats
+
+    def totals(self) -> dict[str, Any]:
+        """Aggregate counters across all namespaces."""
+        hits = sum(s.hits for s in self.namespaces.values())
+        misses = sum(s.misses for s in self.namespaces.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "expirations": sum(s.expirations for s in self.namespaces.values()),
+            "evictions": sum(s.evictions for s in self.namespaces.values()),
+            "errors": sum(s.errors for s in self.namespaces.values()),
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            "bytes_read": sum(s.bytes_read for s in self.namespaces.values()),
+            "bytes_written": sum(s.bytes_written for s in self.namespaces.values()),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "totals": self.totals(),
+            "namespaces": {
+                name: stats.to_dict() for name, stats in sorted(self.namespaces.items())
+            },
+        }
+
+    def summary_lines(self) -> list[str]:
+        """Human-readable one-line-per-namespace summary."""
+        lines = []
+        for name, stats in sorted(self.namespaces.items()):
+            lines.append(
+                f"cache[{name}]: {stats.hits} hits, {stats.misses} misses "
+                f"({stats.hit_rate:.0%}), {stats.expirations} expired, "
+                f"{stats.bytes_read / 1024:.1f} KB read, "
+                f"{stats.bytes_written / 1024:.1f} KB written, "
+                f"avg get {stats.get_latency.to_dict()['avg_ms']}ms"
+            )
+        return lines
+
+    def log_summary(self, logger: logging.Logger) -> None:
+        """Write the summary to a logger."""
+        for line in self.summary_lines():
+            logger.info(line)
+
+    def export(self, output_path: Path) -> None:
+        """Save statistics to a JSON file."""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def reset(self) -> None:
+        """Drop all collected statistics."""
+        self.namespaces.clear()
@@ -0,0 +1,265 @@
+"""Predictive cache warming ahead of scheduled builds.
+
+Entries that will expire before (or during) the next build are refreshed
+ahead of time, most-likely-to-change first, within a request budget, so the
+build window starts with a hot cache.
+"""
+
+import asyncio
+import json
+import logging
+import math
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from ..config.settings import Settings
+from ..models.repository import Repository
+from .cache import CacheManager
+
+# Push timestamps kept per repository for frequency estimation
+MAX_PUSH_HISTORY = 50
+
+
+@dataclass
+class WarmupTarget:
+    """A cache entry that may be prefetched."""
+
+    key: str
+    compute: Callable[[], Awaitable[dict[str, Any]]]
+    ttl: int | None = None
+    change_probability: float = 0.5
+    # Upstream API requests one refresh spends
+    cost: int = 1
+
+
+def repository_cache_key(kind: str, full_name: str) -> str:
+    """Build the cache key for a per-repository record such as a README."""
+    return f"{kind}_{full_name.replace('/', '__')}"
+
+
+class PushHistory:
+    """Per-repository push timestamps persisted next to the cache."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.pushes: dict[str, list[str]] = {}
+        if path.exists():
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.pushes = json.load(f)
+            except Exception:
+                self.pushes = {}
+
+    def record(self, repository: Repository) -> None:
+        """Record the repository's latest push if it has not been seen."""
+        if not repository.pushed_at:
+            return
+        pushed = _as_utc(repository.pushed_at).isoformat()
+        history = self.pushes.setdefault(repository.full_name, [])
+        if pushed not in history:
+            history.append(pushed)
+            history.sort()
+            del history[:-MAX_PUSH_HISTORY]
+
+    def pushes_per_day(self, repository: Repository, now: datetime | None = None) -> float:
+        """
+        Estimate how often a repository is pushed to.
+
+        Uses the recorded push history when at least two pushes are known;
+        otherwise falls back to the time since the last push.
+        """
+        now = now or datetime.now(timezone.utc)
+        history = [datetime.fromisoformat(p) for p in self.pushes.get(repository.full_name, [])]
+
+        if len(history) >= 2:
+            span_days = max((now - history[0]).total_seconds() / 86400, 1.0)
+            return (len(history) - 1) / span_days
+
+        if repository.pushed_at:
+            days_since_push = (now - _as_utc(repository.pushed_at)).total_seconds() / 86400
+            return 1.0 / max(days_since_push, 1.0)
+
+        return 0.0
+
+    def save(self) -> None:
+        """Persist the history."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.pushes, f, indent=2)
+
+
+def change_probability(pushes_per_day: float, horizon_days: float) -> float:
+    """Probability of at least one push within the horizon (Poisson model)."""
+    return 1.0 - math.exp(-pushes_per_day * horizon_days)
+
+
+class CacheWarmer:
+    """Prefetch cache entries that are about to expire."""
+
+    def __init__(
+        self,
+        cache: CacheManager,
+        settings: Settings,
+        logger: logging.Logger | None = None,
+    ):
+        self.cache = cache
+        self.settings = settings
+        self.logger = logger or logging.getLogger(__name__)
+        self.push_history = PushHistory(Path(settings.cache.directory) / "push_history.json")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether ``performance.cache_warming`` is switched on."""
+        return bool(self.settings.get_performance_setting("cache_warming", False))
+
+    def repository_targets(
+        self,
+        repositories: list[Repository],
+        producers: dict[str, Callable[[Repository], Awaitable[dict[str, Any]]]],
+        horizon_days: float = 1.0,
+        ttls: dict[str, int] | None = None,
+        costs: dict[str, int] | None = None,
+    ) -> list[WarmupTarget]:
+        """
+        Build warm-up targets for per-repository records.
+
+        Args:
+            repositories: Repositories to consider
+            producers: Mapping of record kind (e.g. "readme", "tree", "releases",
+                "doi") to a coroutine function fetching that record for a repository
+            horizon_days: Window over which the change probability is estimated
+            ttls: Optional per-kind TTL overrides
+            costs: Optional per-kind API request counts (one request by default)
+
+        Returns:
+            One target per (repository, kind)
+        """
+        ttls = ttls or {}
+        costs = costs or {}
+        now = datetime.now(timezone.utc)
+        targets = []
+
+        for repo in repositories:
+            self.push_history.record(repo)
+            probability = change_probability(
+                self.push_history.pushes_per_day(repo, now), horizon_days
+            )
+            for kind, producer in producers.items():
+                targets.append(
+                    WarmupTarget(
+                        key=repository_cache_key(kind, repo.full_name),
+                        compute=_bind(producer, repo),
+                        ttl=ttls.get(kind),
+                        change_probability=probability,
+                        cost=costs.get(kind, 1),
+                    )
+                )
+
+        self.push_history.save()
+        return targets
+
+    async def plan(self, targets: list[WarmupTarget], horizon: int | None = None) -> list[dict]:
+        """
+        Select the targets that are missing or expire within the horizon.
+
+        Args:
+            targets: Candidate entries
+            horizon: Seconds ahead to look (defaults to the cache TTL)
+
+        Returns:
+            Selected targets with their expiry, most urgent first
+        """
+        horizon = horizon if horizon is not None else self.settings.cache.ttl
+        expiries = await asyncio.gather(*[self.cache.time_to_expiry(t.key) for t in targets])
+
+        planned: list[dict[str, Any]] = []
+        for target, expires_in in zip(targets, expiries):
+            if expires_in is None or expires_in < horizon:
+                planned.append({"target": target, "expires_in": expires_in})
+
+        # Likely-to-change entries first; among equals, the soonest to expire
+        planned.sort(
+            key=lambda p: (
+                -p["target"].change_probability,
+                p["expires_in"] if p["expires_in"] is not None else -math.inf,
+            )
+        )
+        return planned
+
+    async def warm(
+        self,
+        targets: list[WarmupTarget],
+        budget: int,
+        horizon: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Refresh entries that are about to expire, within a request budget.
+
+        Targets are taken in plan order until the next one's cost would exceed
+        the budget.
+
+        Args:
+            targets: Candidate entries
+            budget: Maximum number of upstream requests to spend
+            horizon: Seconds ahead to look (defaults to the cache TTL)
+
+        Returns:
+            Summary of the warm-up run
+        """
+        planned = await self.plan(targets, horizon)
+        selected = []
+        spent = 0
+        for entry in planned:
+            if spent + entry["target"].cost > budget:
+                break
+            selected.append(entry)
+            spent += entry["target"].cost
+
+        semaphore = asyncio.Semaphore(
+            self.settings.get_performance_setting("max_concurrent_requests", 5)
+        )
+
+        async def refresh(target: WarmupTarget) -> None:
+            async with semaphore:
+                await self.cache.refresh(target.key, target.compute, ttl=target.ttl)
+
+        results = await asyncio.gather(
+            *[refresh(p["target"]) for p in selected], return_exceptions=True
+        )
+
+        # The cache logs each failed producer; only collect the keys here
+        failed = [
+            entry["target"].key
+            for entry, result in zip(selected, results)
+            if isinstance(result, Exception)
+        ]
+
+        summary = {
+            "timestamp": datetime.now().isoformat(),
+            "candidates": len(targets),
+            "expiring": len(planned),
+            "warmed": len(selected) - len(failed),
+            "failed": failed,
+            "requests": spent,
+            "skipped_over_budget": len(planned) - len(selected),
+        }
+        self.logger.info(
+            f"Cache warm-up: {summary['warmed']} refreshed, {len(failed)} failed, "
+            f"{summary['skipped_over_budget']} skipped over budget ({spent} API requests)"
+        )
+        return summary
+
+
+def _bind(
+    producer: Callable[[Repository], Awaitable[dict[str, Any]]], repo: Repository
+) -> Callable[[], Awaitable[dict[str, Any]]]:
+    """Bind a repository to a per-repository producer."""
+    return lambda: producer(repo)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
@@ -2,14 +2,23 @@
 
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from github import Github, GithubException
 
 from ..config.settings import Settings
 from ..models.repository import Repository
+from ..models.table import RepositoryTable
 from .base import BaseFetcher
-from .cache import CacheManager
+from .cache import CacheManager, create_cache_manager
+from .cache_warmer import CacheWarmer, repository_cache_key
+
+# Requests kept in reserve when spending the rate limit on cache warming
+RATE_LIMIT_RESERVE = 500
+
+# Per-repository records read through the cache and prefetched by warm_cache
+RECORD_KINDS = ("readme", "tree", "releases")
 
 
 class GitHubFetcher(BaseFetcher):
@@ -22,7 +31,7 @@ class GitHubFetcher(BaseFetcher):
         logger: logging.Logger | None = None,
     ):
         self.settings = settings
-        self.cache = cache_manager or CacheManager(settings)
+        self.cache = cache_manager or create_cache_manager(settings)
         self.logger = logger or logging.getLogger(__name__)
         self.github = Github(settings.github.token) if settings.github.token else Github()
 
@@ -41,7 +50,7 @@ class GitHubFetcher(BaseFetcher):
         cached = await self.cache.get(cache_key)
         if cached:
             self.logger.info(f"Using cached data for {org_name}")
-            return cached
+            return {**cached, "repos": Repository.from_dicts(cached["repos"])}
 
         self.logger.info(f"Fetching data for organization: {org_name}")
 
@@ -59,8 +68,12 @@ class GitHubFetcher(BaseFetcher):
 
         result = {"repos": repos, "stats": stats, "organization": org_name}
 
-        # Cache result
-        await self.cache.set(cache_key, result, ttl=self.settings.cache.ttl)
+        # Cache result (repositories as plain records so the entry is JSON-serializable)
+        await self.cache.set(
+            cache_key,
+            {**result, "repos": Repository.to_dicts(repos)},
+            ttl=self.settings.cache.ttl,
+        )
 
         return result
 
@@ -85,17 +98,33 @@ class GitHubFetcher(BaseFetcher):
 
         Runs in executor to avoid blocking on API calls.
         """
+        try:
+            record = await self.repository_record(
+                "readme", Repository(id=repo.id, name=repo.name, full_name=repo.full_name)
+            )
+            readme = record["content"] or "No README available"
+        except Exception:
+            readme = "No README available"
+
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._sync_convert, repo)
+        return await loop.run_in_executor(None, self._sync_convert, repo, readme)
 
-    def _sync_convert(self, repo: Any) -> Repository:
-        """Synchronous conversion (called in executor)."""
+    def _sync_convert(self, repo: Any, readme: str | None = None) -> Repository:
+        """
+        Synchronous conversion (called in executor).
+
+        Args:
+            repo: PyGithub repository
+            readme: README text already read through the cache; fetched from
+                the repository when omitted
+        """
         # Get README content
-        try:
-            readme = repo.get_readme()
-            readme_content = readme.decoded_content.decode("utf-8")[:1000]  # Truncate
-        except Exception:
-            readme_content = "No README available"
+        if readme is None:
+            try:
+                readme = repo.get_readme().decoded_content.decode("utf-8")
+            except Exception:
+                readme = "No README available"
+        readme_content = readme[:1000]  # Truncate
 
         # Get contributors count
         try:
@@ -137,17 +166,132 @@ class GitHubFetcher(BaseFetcher):
 
     def _calculate_stats(self, repos: list[Repository]) -> dict[str, Any]:
         """Calculate organization statistics."""
+        return RepositoryTable.from_repositories(repos).summary()
+
+    async def warm_cache(self, repositories: list[Repository]) -> dict[str, Any] | None:
+        """
+        Prefetch per-repository records that are about to expire.
+
+        Runs only when ``performance.cache_warming`` is enabled. READMEs, file
+        trees and releases are refreshed for the repositories most likely to
+        have changed, within the remaining API rate budget.
+
+        Args:
+            repositories: Repositories from the previous build
+
+        Returns:
+            Warm-up summary, or None when warming is disabled
+        """
+        warmer = CacheWarmer(self.cache, self.settings, self.logger)
+        if not warmer.enabled:
+            return None
+
+        targets = warmer.repository_targets(repositories, self._record_producers())
+        budget = await asyncio.to_thread(self._warming_budget)
+        return await warmer.warm(targets, budget)
+
+    async def repository_record(self, kind: str, repository: Repository) -> dict[str, Any]:
+        """
+        Read a per-repository record through the cache, fetching it on a miss.
+
+        These are the entries warm_cache prefetches, so reads after a warm-up
+        spend no API requests.
+
+        Args:
+            kind: One of RECORD_KINDS ("readme", "tree" or "releases")
+            repository: Repository the record belongs to
+
+        Returns:
+            ``{"content": str | None}`` for a README, ``{"entries": [...]}``
+            (path, type and size) for a file tree or ``{"releases": [...]}``
+            (newest first) for releases
+        """
+        producer = self._record_producers()[kind]
+        return await self.cache.get_or_compute(
+            repository_cache_key(kind, repository.full_name), lambda: producer(repository)
+        )
+
+    def _record_producers(
+        self,
+    ) -> dict[str, Callable[[Repository], Awaitable[dict[str, Any]]]]:
+        """Fetch functions for each record kind; each spends one API request."""
         return {
-            "total_repos": len(repos),
-            "active_repos": sum(1 for r in repos if not r.archived),
-            "archived_repos": sum(1 for r in repos if r.archived),
-            "total_stars": sum(r.stars for r in repos),
-            "total_forks": sum(r.forks for r in repos),
-            "total_contributors": sum(r.contributors_count for r in repos),
-            "avg_stars": sum(r.stars for r in repos) / len(repos) if repos else 0,
-            "avg_forks": sum(r.forks for r in repos) / len(repos) if repos else 0,
+            "readme": self._fetch_readme_record,
+            "tree": self._fetch_tree_record,
+            "releases": self._fetch_releases_record,
         }
 
+    def _lazy_repo(self, repository: Repository) -> Any:
+        """Repository handle that spends no request until a resource is read."""
+        return self.github.withLazy(True).get_repo(repository.full_name)
+
+    def _warming_budget(self) -> int:
+        """Number of API requests cache warming may spend."""
+        limit = int(self.settings.get_performance_setting("warming_budget", 1000))
+        try:
+            rate_limit: Any = self.github.get_rate_limit()
+            # Newer PyGithub releases group the per-resource limits under .resources
+            remaining = int(getattr(rate_limit, "resources", rate_limit).core.remaining)
+        except Exception:
+            return limit
+        return max(0, min(limit, remaining - RATE_LIMIT_RESERVE))
+
+    async def _fetch_readme_record(self, repository: Repository) -> dict[str, Any]:
+        """Fetch a repository README for caching."""
+
+        def fetch() -> dict[str, Any]:
+            try:
+                readme = self._lazy_repo(repository).get_readme()
+            except GithubException as e:
+                if e.status != 404:
+                    raise
+                return {"content": None}
+            return {"content": readme.decoded_content.decode("utf-8")}
+
+        return await asyncio.to_thread(fetch)
+
+    async def _fetch_tree_record(self, repository: Repository) -> dict[str, Any]:
+        """Fetch a repository's file tree for caching."""
+
+        def fetch() -> dict[str, Any]:
+            try:
+                tree = self._lazy_repo(repository).get_git_tree(
+                    repository.default_branch, recursive=True
+                )
+            except GithubException as e:
+                # 409: the repository is empty
+                if e.status not in (404, 409):
+                    raise
+                return {"entries": []}
+            return {
+                "entries": [
+                    {"path": entry.path, "type": entry.type, "size": entry.size}
+                    for entry in tree.tree
+                ]
+            }
+
+        return await asyncio.to_thread(fetch)
+
+    async def _fetch_releases_record(self, repository: Repository) -> dict[str, Any]:
+        """Fetch a repository's most recent releases (one page) for caching."""
+
+        def fetch() -> dict[str, Any]:
+            releases = self._lazy_repo(repository).get_releases().get_page(0)
+            return {
+                "releases": [
+                    {
+                        "tag": release.tag_name,
+                        "name": release.title,
+                        "published_at": (
+                            release.published_at.isoformat() if release.published_at else None
+                        ),
+                    }
+                    for release in releases
+                ]
+            }
+
+        return await asyncio.to_thread(fetch)
+
     async def validate(self, data: dict[str, Any]) -> bool:
         """Validate fetched data."""
         required_keys = ["repos", "stats", "organization"]
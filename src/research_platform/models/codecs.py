@@ -0,0 +1,183 @@
+"""Schema-specialized serializers for domain models.
+
+The encoder and decoder for a dataclass are generated once from its fields,
+so converting records does no per-call field introspection and no deep
+copies: only top-level containers are copied (lists and dicts owned by the
+record), datetimes are converted once, and the input is never mutated.
+"""
+
+import dataclasses
+import hashlib
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from types import UnionType
+from typing import TYPE_CHECKING, Any, TypeVar, Union, get_args, get_origin
+
+if TYPE_CHECKING:
+    from _typeshed import DataclassInstance
+
+T = TypeVar("T", bound="DataclassInstance")
+
+# Modulus of content-derived ids (keeps them in the range of GitHub ids)
+STABLE_ID_MODULUS = 10**9
+
+
+def stable_id(value: str) -> int:
+    """
+    Derive a stable integer id from a string.
+
+    Unlike ``hash()``, the result is identical across processes and Python
+    runs, so it can be used in cache keys and persisted data.
+    """
+    digest = hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % STABLE_ID_MODULUS
+
+
+def parse_datetime(value: Any) -> Any:
+    """Parse an ISO 8601 string (including a trailing "Z"); pass other values through."""
+    if isinstance(value, str) and value:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return value
+
+
+def format_datetime(value: Any) -> Any:
+    """Format a datetime as ISO 8601; pass other values through."""
+    return value.isoformat() if value else value
+
+
+def _copy_dict(value: Any) -> Any:
+    return dict(value) if isinstance(value, dict) else value
+
+
+def _copy_list(value: Any) -> Any:
+    return list(value) if isinstance(value, list) else value
+
+
+def _copy_dict_list(value: Any) -> Any:
+    if isinstance(value, list):
+        return [dict(item) if isinstance(item, dict) else item for item in value]
+    return value
+
+
+def _field_kind(tp: Any) -> str | None:
+    """Classify a field annotation as datetime, list, list of dicts or dict."""
+    if tp is datetime:
+        return "datetime"
+    origin = get_origin(tp)
+    if origin in (Union, UnionType):
+        for arg in get_args(tp):
+            kind = _field_kind(arg)
+            if kind:
+                return kind
+        return None
+    if tp is list or origin is list:
+        args = get_args(tp)
+        if args and (args[0] is dict or get_origin(args[0]) is dict):
+            return "dict_list"
+        return "list"
+    if tp is dict or origin is dict:
+        return "dict"
+    return None
+
+
+# Field kind -> (encode, decode) converter names
+_CONVERTERS = {
+    "datetime": ("format_datetime", "parse_datetime"),
+    "dict_list": ("copy_dict_list", "copy_dict_list"),
+    "list": ("copy_list", "copy_list"),
+    "dict": ("copy_dict", "copy_dict"),
+}
+
+
+def _field_converters(cls: type) -> dict[str, tuple[str, str]]:
+    """Map each field that needs conversion to its (encode, decode) converters."""
+    converters = {}
+    for f in dataclasses.fields(cls):
+        kind = _field_kind(f.type)
+        if kind:
+            converters[f.name] = _CONVERTERS[kind]
+    return converters
+
+
+_NAMESPACE: dict[str, Any] = {
+    "format_datetime": format_datetime,
+    "parse_datetime": parse_datetime,
+    "copy_dict": _copy_dict,
+    "copy_list": _copy_list,
+    "copy_dict_list": _copy_dict_list,
+}
+
+
+def build_encoder(cls: type[T]) -> Callable[[T], dict[str, Any]]:
+    """
+    Generate a function converting an instance of a dataclass to a dict.
+
+    Args:
+        cls: Dataclass type
+
+    Returns:
+        Encoder specialized to the fields of ``cls``
+    """
+    converters = _field_converters(cls)
+    items = []
+    for f in dataclasses.fields(cls):
+        access = f"obj.{f.name}"
+        if f.name in converters:
+            access = f"{converters[f.name][0]}({access})"
+        items.append(f"        {f.name!r}: {access},")
+
+    source = "def encode(obj):\n    return {\n" + "\n".join(items) + "\n    }\n"
+    namespace = dict(_NAMESPACE)
+    exec(compile(source, f"<encoder {cls.__name__}>", "exec"), namespace)
+    encode: Callable[[T], dict[str, Any]] = namespace["encode"]
+    return encode
+
+
+def build_decoder(
+    cls: type[T], extras_field: str | None = None
+) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """
+    Generate a function converting a record to constructor keyword arguments.
+
+    Keys that are not fields of ``cls`` are merged into ``extras_field`` (a
+    dict field) when given, and dropped otherwise. The record is not mutated.
+
+    Args:
+        cls: Dataclass type
+        extras_field: Name of the dict field collecting unknown keys
+
+    Returns:
+        Decoder specialized to the fields of ``cls``
+    """
+    converters = _field_converters(cls)
+    names = [f.name for f in dataclasses.fields(cls)]
+
+    lines = ["def decode(data):", "    kwargs = {}"]
+    for name in names:
+        value = f"data[{name!r}]"
+        if name in converters and name != extras_field:
+            value = f"{converters[name][1]}({value})"
+        lines.append(f"    if {name!r} in data:")
+        lines.append(f"        kwargs[{name!r}] = {value}")
+
+    if extras_field is not None:
+        lines += [
+            "    if len(kwargs) < len(data):",
+            "        extras = {k: v for k, v in data.items() if k not in FIELDS}",
+            f"        merged = dict(kwargs.get({extras_field!r}) or {{}})",
+            "        merged.update(extras)",
+            f"        kwargs[{extras_field!r}] = merged",
+            f"    elif {extras_field!r} in kwargs:",
+            f"        kwargs[{extras_field!r}] = copy_dict(kwargs[{extras_field!r}])",
+        ]
+    lines.append("    return kwargs")
+
+    namespace = dict(_NAMESPACE, FIELDS=frozenset(names))
+    exec(compile("\n".join(lines) + "\n", f"<decoder {cls.__name__}>", "exec"), namespace)
+    decode: Callable[[dict[str, Any]], dict[str, Any]] = namespace["decode"]
+    return decode
+
+
+def encode_many(encode: Callable[[T], dict[str, Any]], items: Iterable[T]) -> list[dict[str, Any]]:
+    """Encode a batch of instances with a generated encoder."""
+    return [encode(item) for item in items]
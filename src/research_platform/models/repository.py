@@ -1,13 +1,26 @@
 """Repository domain model."""
 
-from dataclasses import asdict, dataclass, field
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from .codecs import build_decoder, build_encoder, encode_many, stable_id
 
-@dataclass
+if TYPE_CHECKING:
+    from ..storage.blobs import BlobStore
+
+
+@dataclass(slots=True)
 class Repository:
-    """Domain model for a GitHub repository."""
+    """
+    Domain model for a GitHub repository.
+
+    Uses ``__slots__`` and interns the low-cardinality strings (language,
+    topics) shared by many repositories, so large organizations stay cheap
+    to hold in memory.
+    """
 
     # Required fields
     id: int
@@ -54,48 +67,59 @@ class Repository:
     # Additional metadata
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        """Intern strings repeated across many repositories."""
+        if self.language:
+            self.language = sys.intern(self.language)
+        if self.topics:
+            self.topics = [sys.intern(topic) for topic in self.topics]
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
-        data = asdict(self)
+        return _encode(self)
 
-        # Convert datetime objects to ISO format strings
-        for field_name in ["created_at", "updated_at", "pushed_at"]:
-            if field_name in data and data[field_name]:
-                data[field_name] = data[field_name].isoformat()
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], blobs: "BlobStore | None" = None) -> "Repository":
+        """
+        Create instance from dictionary.
 
-        return data
+        The input is not modified. Keys that are not fields are kept in
+        ``metadata``; a missing id is derived from ``full_name`` so it is
+        stable across processes.
 
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "Repository":
-        """Create instance from dictionary."""
-        # Convert ISO strings back to datetime objects
-        for field_name in ["created_at", "updated_at", "pushed_at"]:
-            if field_name in data and data[field_name]:
-                if isinstance(data[field_name], str):
-                    data[field_name] = datetime.fromisoformat(
-                        data[field_name].replace("Z", "+00:00")
-                    )
+        Args:
+            data: Repository record
+            blobs: Blob store for records whose heavy fields (README, code,
+                manifests) were externalized; they are then resolved lazily
+                on first access instead of at load time
+        """
+        kwargs = _decode(data)
 
-        # Get valid field names from the dataclass
-        import dataclasses
+        # Generate ID from full_name if missing (for backward compatibility)
+        if "id" not in kwargs and "full_name" in kwargs:
+            kwargs["id"] = stable_id(kwargs["full_name"])
 
-        valid_fields = {f.name for f in dataclasses.fields(cls)}
+        if blobs is not None:
+            from ..storage.blobs import LazyBlobDict
 
-        # Filter data to only include valid fields
-        filtered_data = {k: v for k, v in data.items() if k in valid_fields}
+            for field_name in ("metadata", "research_metadata"):
+                if isinstance(kwargs.get(field_name), dict):
+                    kwargs[field_name] = LazyBlobDict(kwargs[field_name], store=blobs)
 
-        # Generate ID from full_name hash if missing (for backward compatibility)
-        if "id" not in filtered_data and "full_name" in filtered_data:
-            filtered_data["id"] = abs(hash(filtered_data["full_name"])) % (10**9)
+        return cls(**kwargs)
 
-        # Store extra fields in metadata if they exist
-        extra_fields = {k: v for k, v in data.items() if k not in valid_fields}
-        if extra_fields and "metadata" not in filtered_data:
-            filtered_data["metadata"] = {}
-        if extra_fields:
-            filtered_data["metadata"].update(extra_fields)
+    @staticmethod
+    def to_dicts(repositories: "Iterable[Repository]") -> list[dict[str, Any]]:
+        """Convert a batch of repositories to dictionaries."""
+        return encode_many(_encode, repositories)
 
-        return cls(**filtered_data)
+    @classmethod
+    def from_dicts(
+        cls, records: Iterable[dict[str, Any]], blobs: "BlobStore | None" = None
+    ) -> list["Repository"]:
+        """Create instances from a batch of dictionaries."""
+        from_dict = cls.from_dict
+        return [from_dict(record, blobs) for record in records]
 
     @classmethod
     def from_github(cls, github_repo) -> "Repository":
@@ -177,122 +201,26 @@ class Repository:
         """
         Calculate a simple health score based on various metrics.
 
-        Returns value between 0.0 and 1.0
+        Returns value between 0.0 and 1.0 (see HealthScoringEngine.summary_scores)
         """
-        score = 0.0
-        weights = {
-            "stars": 0.2,
-            "forks": 0.15,
-            "contributors": 0.2,
-            "recent_update": 0.2,
-            "documentation": 0.15,
-            "issues_ratio": 0.1,
-        }
-
-        # Stars score (logarithmic)
-        if self.stars > 0:
-            import math
+        from ..analyzers.health_engine import HealthInputs, HealthScoringEngine
 
-            score += weights["stars"] * min(math.log10(self.stars + 1) / 4, 1.0)
-
-        # Forks score (logarithmic)
-        if self.forks > 0:
-            import math
-
-            score += weights["forks"] * min(math.log10(self.forks + 1) / 3, 1.0)
-
-        # Contributors score
-        if self.contributors_count > 0:
-            score += weights["contributors"] * min(self.contributors_count / 20, 1.0)
-
-        # Recent update score
-        if self.days_since_update < 90:
-            score += weights["recent_update"] * (1 - self.days_since_update / 365)
-
-        # Documentation score
-        if self.description:
-            score += weights["documentation"] * 0.5
-        if self.homepage:
-            score += weights["documentation"] * 0.5
-
-        # Issues ratio (fewer open issues is better)
-        if self.stars > 0:
-            issues_ratio = self.open_issues / (self.stars + 1)
-            score += weights["issues_ratio"] * max(0, 1 - issues_ratio)
-
-        return min(score, 1.0)
+        inputs = HealthInputs.from_repositories([self])
+        return float(HealthScoringEngine().summary_scores(inputs)[0])
 
     def calculate_health_score(self) -> dict[str, Any]:
         """
         Calculate detailed health scores for the repository.
 
-        Returns a dictionary with overall score and breakdown by category.
+        Returns a dictionary with overall score and breakdown by category
+        (see HealthScoringEngine.category_scores). Score many repositories
+        with HealthScoringEngine.score_repositories instead of calling this
+        in a loop.
         """
-        import math
-
-        scores = {
-            "activity": 0.0,
-            "community": 0.0,
-            "documentation": 0.0,
-            "code_quality": 0.0,
-        }
-
-        # Activity score (based on recency and frequency)
-        if self.days_since_update < 30:
-            scores["activity"] = 25.0
-        elif self.days_since_update < 90:
-            scores["activity"] = 20.0
-        elif self.days_since_update < 180:
-            scores["activity"] = 15.0
-        elif self.days_since_update < 365:
-            scores["activity"] = 10.0
-        else:
-            scores["activity"] = 5.0
-
-        # Community score (based on stars, forks, contributors)
-        community_score = 0.0
-        if self.stars > 0:
-            community_score += min(math.log10(self.stars + 1) * 5, 10)
-        if self.forks > 0:
-            community_score += min(math.log10(self.forks + 1) * 3, 7)
-        if self.contributors_count > 0:
-            community_score += min(self.contributors_count, 8)
-        scores["community"] = min(community_score, 25.0)
-
-        # Documentation score
-        doc_score = 0.0
-        if self.description and len(self.description) > 20:
-            doc_score += 10.0
-        if self.homepage:
-            doc_score += 5.0
-        if self.has_wiki:
-            doc_score += 5.0
-        if len(self.topics) > 0:
-            doc_score += min(len(self.topics) * 1.5, 5.0)
-        scores["documentation"] = min(doc_score, 25.0)
-
-        # Code quality score (proxy based on available metrics)
-        quality_score = 0.0
-        if self.has_issues:
-            quality_score += 5.0
-        if not self.archived:
-            quality_score += 5.0
-        if not self.disabled:
-            quality_score += 5.0
-        # Lower open issues ratio is better
-        if self.stars > 0:
-            issues_ratio = self.open_issues / (self.stars + 1)
-            quality_score += max(0, 10 - issues_ratio * 20)
-        scores["code_quality"] = min(quality_score, 25.0)
-
-        overall = sum(scores.values())
-
-        return {
-            "overall": overall,
-            "scores": scores,
-            "max_score": 100.0,
-            "grade": self._score_to_grade(overall),
-        }
+        from ..analyzers.health_engine import HealthInputs, HealthScoringEngine
+
+        inputs = HealthInputs.from_repositories([self])
+        return HealthScoringEngine().category_report(inputs)[0]
 
     @staticmethod
     def _score_to_grade(score: float) -> str:
@@ -315,3 +243,8 @@ class Repository:
     def __repr__(self) -> str:
         """Developer representation."""
         return f"Repository(id={self.id}, name='{self.name}', full_name='{self.full_name}')"
+
+
+# Serializers generated from the Repository fields (see codecs.py)
+_encode = build_encoder(Repository)
+_decode = build_decoder(Repository, extras_field="metadata")
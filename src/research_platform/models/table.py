@@ -0,0 +1,329 @@
+"""Columnar view of a repository collection.
+
+Numeric and boolean fields are stored as contiguous NumPy arrays and
+low-cardinality strings (language, license, topics) are dictionary-encoded,
+so organization-wide statistics are a handful of vectorized passes instead of
+repeated loops over repository objects.
+"""
+
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+import numpy as np
+
+from .repository import Repository
+
+# Integer columns
+NUMERIC_COLUMNS = (
+    "stars",
+    "forks",
+    "watchers",
+    "open_issues",
+    "size",
+    "contributors_count",
+    "commits_count",
+)
+
+# Boolean columns
+FLAG_COLUMNS = ("archived", "disabled", "has_wiki", "has_pages", "has_issues", "is_template")
+
+# Timestamp columns, stored as POSIX seconds (NaN when missing)
+TIME_COLUMNS = ("created_at", "updated_at", "pushed_at")
+
+
+@dataclass
+class CategoricalColumn:
+    """Dictionary-encoded string column (one value per row)."""
+
+    codes: np.ndarray
+    categories: list[str | None]
+
+    @classmethod
+    def from_values(cls, values: Iterable[str | None]) -> "CategoricalColumn":
+        """Encode values; categories keep first-seen order."""
+        lookup: dict[str | None, int] = {}
+        codes = np.fromiter((lookup.setdefault(v, len(lookup)) for v in values), dtype=np.int32)
+        return cls(codes, list(lookup))
+
+    def code(self, value: str | None) -> int:
+        """Code of a category, or -1 if absent."""
+        try:
+            return self.categories.index(value)
+        except ValueError:
+            return -1
+
+    def mask(self, value: str | None) -> np.ndarray:
+        """Boolean mask of rows equal to value."""
+        return np.asarray(self.codes == self.code(value))
+
+    def take(self, rows: np.ndarray) -> "CategoricalColumn":
+        """Select rows (by index or mask)."""
+        return CategoricalColumn(self.codes[rows], self.categories)
+
+    def counts(self, rows: np.ndarray | None = None) -> dict[str | None, int]:
+        """Occurrences per category (categories with no rows are omitted)."""
+        codes = self.codes if rows is None else self.codes[rows]
+        totals = np.bincount(codes, minlength=len(self.categories))
+        return {c: int(n) for c, n in zip(self.categories, totals) if n}
+
+    def most_common(self, n: int | None = None, exclude: Sequence[str | None] = ()) -> dict:
+        """Most frequent categories, ties in first-seen order (like Counter)."""
+        return _most_common(
+            self.categories, np.bincount(self.codes, minlength=len(self.categories)), n, exclude
+        )
+
+    def __getitem__(self, row: int) -> str | None:
+        return self.categories[int(self.codes[row])]
+
+
+@dataclass
+class MultiCategoricalColumn:
+    """Dictionary-encoded list column (e.g. topics), stored as flat codes plus row offsets."""
+
+    codes: np.ndarray
+    offsets: np.ndarray
+    categories: list[str]
+
+    @classmethod
+    def from_values(cls, values: Iterable[Iterable[str]]) -> "MultiCategoricalColumn":
+        """Encode per-row lists; categories keep first-seen order."""
+        lookup: dict[str, int] = {}
+        flat: list[int] = []
+        offsets = [0]
+        for row in values:
+            flat.extend(lookup.setdefault(v, len(lookup)) for v in row)
+            offsets.append(len(flat))
+        return cls(np.array(flat, dtype=np.int32), np.array(offsets, dtype=np.int64), list(lookup))
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Number of values per row."""
+        return np.diff(self.offsets)
+
+    @property
+    def row_ids(self) -> np.ndarray:
+        """Row index of every flat value."""
+        return np.repeat(np.arange(len(self.offsets) - 1), self.lengths)
+
+    def mask(self, value: str) -> np.ndarray:
+        """Boolean mask of rows containing value."""
+        result = np.zeros(len(self.offsets) - 1, dtype=bool)
+        if value in self.categories:
+            result[self.row_ids[self.codes == self.categories.index(value)]] = True
+        return result
+
+    def take(self, rows: np.ndarray) -> "MultiCategoricalColumn":
+        """Select rows (by index or mask)."""
+        rows = np.flatnonzero(rows) if rows.dtype == bool else rows
+        starts, ends = self.offsets[rows], self.offsets[rows + 1]
+        lengths = ends - starts
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        flat = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+        return MultiCategoricalColumn(self.codes[flat], offsets, self.categories)
+
+    def most_common(self, n: int | None = None, exclude: Sequence[str] = ()) -> dict:
+        """Most frequent values across all rows, ties in first-seen order."""
+        return _most_common(
+            self.categories, np.bincount(self.codes, minlength=len(self.categories)), n, exclude
+        )
+
+    def __getitem__(self, row: int) -> list[str]:
+        return [self.categories[c] for c in self.codes[self.offsets[row] : self.offsets[row + 1]]]
+
+
+class RepositoryTable:
+    """
+    Columnar table of repositories.
+
+    Build it once from ``Repository`` objects or raw records (as stored in
+    data/repos.json), then aggregate, filter and rank with NumPy.
+    """
+
+    def __init__(
+        self,
+        names: np.ndarray,
+        numeric: dict[str, np.ndarray],
+        flags: dict[str, np.ndarray],
+        times: dict[str, np.ndarray],
+        language: CategoricalColumn,
+        license: CategoricalColumn,
+        topics: MultiCategoricalColumn,
+    ):
+        self.names = names
+        self.numeric = numeric
+        self.flags = flags
+        self.times = times
+        self.language = language
+        self.license = license
+        self.topics = topics
+
+    @classmethod
+    def from_repositories(cls, repositories: Sequence[Repository]) -> "RepositoryTable":
+        """Build a table from Repository objects."""
+        return cls._build(
+            repositories,
+            lambda r, name: getattr(r, name),
+            lambda r: r.metadata.get("license"),
+        )
+
+    @classmethod
+    def from_records(cls, records: Sequence[dict[str, Any]]) -> "RepositoryTable":
+        """Build a table from repository records (dicts with ISO timestamps)."""
+        return cls._build(
+            records,
+            lambda r, name: r.get(name),
+            lambda r: r.get("license", (r.get("metadata") or {}).get("license")),
+        )
+
+    @classmethod
+    def _build(
+        cls,
+        rows: Sequence[Any],
+        get: Callable[[Any, str], Any],
+        get_license: Callable[[Any], Any],
+    ) -> "RepositoryTable":
+        n = len(rows)
+        names = np.array([get(r, "name") for r in rows], dtype=object)
+        numeric = {
+            name: np.fromiter((get(r, name) or 0 for r in rows), dtype=np.int64, count=n)
+            for name in NUMERIC_COLUMNS
+        }
+        flags = {
+            name: np.fromiter((bool(get(r, name)) for r in rows), dtype=bool, count=n)
+            for name in FLAG_COLUMNS
+        }
+        times = {
+            name: np.fromiter((_timestamp(get(r, name)) for r in rows), dtype=np.float64, count=n)
+            for name in TIME_COLUMNS
+        }
+        return cls(
+            names,
+            numeric,
+            flags,
+            times,
+            CategoricalColumn.from_values(get(r, "language") for r in rows),
+            CategoricalColumn.from_values(get_license(r) for r in rows),
+            MultiCategoricalColumn.from_values(get(r, "topics") or () for r in rows),
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def column(self, name: str) -> np.ndarray:
+        """Get a numeric, boolean or timestamp column by name."""
+        for columns in (self.numeric, self.flags, self.times):
+            if name in columns:
+                return columns[name]
+        raise KeyError(name)
+
+    def filter(self, mask: np.ndarray) -> "RepositoryTable":
+        """Rows selected by a boolean mask (or index array)."""
+        return RepositoryTable(
+            self.names[mask],
+            {k: v[mask] for k, v in self.numeric.items()},
+            {k: v[mask] for k, v in self.flags.items()},
+            {k: v[mask] for k, v in self.times.items()},
+            self.language.take(mask),
+            self.license.take(mask),
+            self.topics.take(np.asarray(mask)),
+        )
+
+    def top_k(self, column: str, k: int, mask: np.ndarray | None = None) -> np.ndarray:
+        """
+        Row indices of the k largest values of a column, largest first.
+
+        Ties keep table order and missing timestamps are skipped, matching a
+        stable ``sorted(..., reverse=True)`` over the original rows.
+
+        Args:
+            column: Column name
+            k: Number of rows
+            mask: Optional boolean mask restricting the candidates
+
+        Returns:
+            Row indices into this table
+        """
+        values = self.column(column).astype(np.float64)
+        candidates = np.flatnonzero(~np.isnan(values) if mask is None else mask & ~np.isnan(values))
+        if k <= 0 or not len(candidates):
+            return np.array([], dtype=np.int64)
+
+        if k < len(candidates):
+            # Keep everything at or above the k-th largest value, then order exactly
+            kth = np.partition(values[candidates], len(candidates) - k)[len(candidates) - k]
+            candidates = candidates[values[candidates] >= kth]
+
+        order = np.argsort(-values[candidates], kind="stable")
+        return candidates[order[:k]]
+
+    def group_by(self, key: str, column: str, agg: str = "sum") -> dict[str | None, float]:
+        """
+        Aggregate a column per category of ``language`` or ``license``.
+
+        Args:
+            key: "language" or "license"
+            column: Column to aggregate
+            agg: "sum", "mean" or "count"
+
+        Returns:
+            Category -> aggregate, in first-seen category order
+        """
+        categorical: CategoricalColumn = getattr(self, key)
+        size = len(categorical.categories)
+        counts = np.bincount(categorical.codes, minlength=size)
+        if agg == "count":
+            values = counts
+        else:
+            values = np.bincount(categorical.codes, weights=self.column(column), minlength=size)
+            if agg == "mean":
+                values = np.divide(values, counts, out=np.zeros(size), where=counts > 0)
+            elif agg != "sum":
+                raise ValueError(f"Unknown aggregation: {agg}")
+        return {c: v.item() for c, v, n in zip(categorical.categories, values, counts) if n}
+
+    def summary(self) -> dict[str, Any]:
+        """Organization totals (the statistics reported by GitHubFetcher)."""
+        total = len(self)
+        archived = int(self.flags["archived"].sum())
+        total_stars = int(self.numeric["stars"].sum())
+        total_forks = int(self.numeric["forks"].sum())
+        return {
+            "total_repos": total,
+            "active_repos": total - archived,
+            "archived_repos": archived,
+            "total_stars": total_stars,
+            "total_forks": total_forks,
+            "total_contributors": int(self.numeric["contributors_count"].sum()),
+            "avg_stars": total_stars / total if total else 0,
+            "avg_forks": total_forks / total if total else 0,
+        }
+
+
+def _most_common(
+    categories: list, totals: np.ndarray, n: int | None, exclude: Sequence
+) -> dict[Any, int]:
+    """Categories by descending count, ties in first-seen order."""
+    order = np.argsort(-totals, kind="stable")
+    result = {}
+    for index in order:
+        if not totals[index]:
+            break
+        if categories[index] in exclude:
+            continue
+        result[categories[index]] = int(totals[index])
+        if n is not None and len(result) >= n:
+            break
+    return result
+
+
+def _timestamp(value: Any) -> float:
+    """POSIX seconds for a datetime or ISO string (naive values are UTC); NaN when missing."""
+    if not value:
+        return np.nan
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return float(value.timestamp())
@@ -0,0 +1,25 @@
+"""Persistent storage for repository data and large artifacts."""
+
+from .blobs import BlobStore, LazyBlobDict, is_blob_ref
+from .dataset import RepositoryDataset, load_repository_records
+from .datastore import DataStore, get_datastore
+from .dependency_index import DependencyIndex
+from .history import CitationHistoryLog
+from .package_index import PackageIndex
+from .results import ResultCache
+from .timeseries import MetricsStore
+
+__all__ = [
+    "BlobStore",
+    "CitationHistoryLog",
+    "DataStore",
+    "DependencyIndex",
+    "LazyBlobDict",
+    "MetricsStore",
+    "PackageIndex",
+    "RepositoryDataset",
+    "ResultCache",
+    "get_datastore",
+    "is_blob_ref",
+    "load_repository_records",
+]
@@ -0,0 +1,294 @@
+"""Content-addressed blob store for large repository text.
+
+READMEs, dependency manifests, notebooks and source files are stored once
+under the SHA-256 of their content (zlib-compressed), and repository records
+keep only a ``{"$blob": "<sha256>"}`` reference in their place. Identical
+content is stored once no matter how many records or artifacts refer to it.
+"""
+
+import hashlib
+import os
+import tempfile
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, TypeGuard
+
+# Marker key used in place of externalized text
+BLOB_KEY = "$blob"
+
+# Top-level record fields holding large text
+RECORD_BLOB_FIELDS = ("readme",)
+
+# Fields inside ``metadata`` holding large text; dict values (e.g. code_files)
+# have each of their string values externalized
+METADATA_BLOB_FIELDS = (
+    "readme",
+    "requirements_txt",
+    "pyproject_toml",
+    "package_json",
+    "environment_yml",
+    "setup_cfg",
+    "pipfile",
+    "poetry_lock",
+    "description_file",
+    "code_files",
+    "notebooks",
+)
+
+# Text shorter than this stays inline (sentinels such as "No README available")
+MIN_BLOB_SIZE = 256
+
+
+def is_blob_ref(value: Any) -> TypeGuard[dict[str, str]]:
+    """Check whether a value is a blob reference."""
+    return isinstance(value, dict) and len(value) == 1 and BLOB_KEY in value
+
+
+class BlobStore:
+    """Store and retrieve text by content hash."""
+
+    def __init__(self, root: Path | str = Path("data/blobs"), cache_size: int = 256):
+        self.root = Path(root)
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, str] = OrderedDict()
+
+    @staticmethod
+    def digest(content: str | bytes) -> str:
+        """Compute the content hash used as blob id."""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        return hashlib.sha256(content).hexdigest()
+
+    def path_for(self, digest: str) -> Path:
+        """Location of a blob on disk (fanned out by hash prefix)."""
+        return self.root / digest[:2] / digest[2:]
+
+    def __contains__(self, digest: str) -> bool:
+        return self.path_for(digest).exists()
+
+    def put(self, content: str | bytes) -> str:
+        """
+        Store content, deduplicating by hash.
+
+        Args:
+            content: Text or bytes to store
+
+        Returns:
+            SHA-256 hex digest identifying the blob
+        """
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        digest = self.digest(data)
+        path = self.path_for(digest)
+
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file first so readers never see partial blobs
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(zlib.compress(data))
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+
+        return digest
+
+    def get_bytes(self, digest: str) -> bytes:
+        """
+        Read a blob.
+
+        Raises:
+            KeyError: If the blob does not exist
+        """
+        try:
+            with open(self.path_for(digest), "rb") as f:
+                return zlib.decompress(f.read())
+        except FileNotFoundError:
+            raise KeyError(digest) from None
+
+    def get_text(self, digest: str) -> str:
+        """Read a blob as UTF-8 text, using a small LRU cache."""
+        text = self._cache.get(digest)
+        if text is not None:
+            self._cache.move_to_end(digest)
+            return text
+
+        text = self.get_bytes(digest).decode("utf-8")
+        self._cache[digest] = text
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return text
+
+    def resolve(self, value: Any) -> Any:
+        """Return the text behind a blob reference, or the value unchanged."""
+        if is_blob_ref(value):
+            return self.get_text(value[BLOB_KEY])
+        if isinstance(value, dict) and any(is_blob_ref(v) for v in value.values()):
+            return {k: self.resolve(v) for k, v in value.items()}
+        return value
+
+    def ref(self, content: str) -> dict[str, str]:
+        """Store text and return a reference to it."""
+        return {BLOB_KEY: self.put(content)}
+
+    def externalize(self, record: dict[str, Any]) -> dict[str, Any]:
+        """
+        Replace large text fields of a repository record with blob references.
+
+        The input record is not modified; nested containers are copied only
+        where a field is replaced.
+
+        Args:
+            record: Repository record (as in data/repos.json)
+
+        Returns:
+            Record with heavy fields replaced by references
+        """
+        result = dict(record)
+
+        for field_name in RECORD_BLOB_FIELDS:
+            if field_name in result:
+                result[field_name] = self._externalize_value(result[field_name])
+
+        metadata = result.get("metadata")
+        if isinstance(metadata, dict):
+            metadata = dict(metadata)
+            for field_name in METADATA_BLOB_FIELDS:
+                if field_name in metadata:
+                    metadata[field_name] = self._externalize_value(metadata[field_name])
+            result["metadata"] = metadata
+
+        return result
+
+    def hydrate(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Inverse of externalize: resolve every blob reference in a record."""
+        result = dict(record)
+
+        for field_name in RECORD_BLOB_FIELDS:
+            if field_name in result:
+                result[field_name] = self.resolve(result[field_name])
+
+        metadata = result.get("metadata")
+        if isinstance(metadata, dict):
+            result["metadata"] = {
+                k: self.resolve(v) if k in METADATA_BLOB_FIELDS else v for k, v in metadata.items()
+            }
+
+        return result
+
+    def referenced(self, records: list[dict[str, Any]]) -> set[str]:
+        """Collect every blob digest referenced by the given records."""
+        digests = set()
+
+        def collect(value: Any) -> None:
+            if is_blob_ref(value):
+                digests.add(value[BLOB_KEY])
+            elif isinstance(value, dict):
+                for item in value.values():
+                    collect(item)
+            elif isinstance(value, list):
+                for item in value:
+                    collect(item)
+
+        for record in records:
+            collect(record)
+        return digests
+
+    def garbage_collect(self, live: set[str]) -> int:
+        """
+        Delete blobs that are no longer referenced.
+
+        Args:
+            live: Digests still in use
+
+        Returns:
+            Number of blobs removed
+        """
+        removed = 0
+        if not self.root.exists():
+            return removed
+
+        for path in self.root.glob("??/*"):
+            if path.name.startswith(".tmp-"):
+                continue
+            if path.parent.name + path.name not in live:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def _externalize_value(self, value: Any) -> Any:
+        """Externalize a string, or each string value of a dict."""
+        if isinstance(value, str):
+            if len(value) >= MIN_BLOB_SIZE:
+                return self.ref(value)
+            return value
+        if isinstance(value, dict) and not is_blob_ref(value):
+            return {k: self._externalize_value(v) for k, v in value.items()}
+        return value
+
+
+class LazyBlobDict(dict):
+    """
+    Dict whose blob-reference values are resolved on first access.
+
+    Used for heavy record fields (metadata, research metadata) so README and
+    code text is only read from the blob store when something asks for it.
+    Resolved values replace the reference in place. Copies (``copy()``,
+    ``dict(d)``, ``{**d}``) and ``json.dumps`` see resolved values; use
+    ``raw()`` for the stored references.
+    """
+
+    def __init__(self, *args: Any, store: BlobStore | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.store = store
+
+    def _load(self, key: Any, value: Any) -> Any:
+        """Resolve a value and cache the result in place."""
+        if self.store is None:
+            return value
+        resolved = self.store.resolve(value)
+        if resolved is not value:
+            super().__setitem__(key, resolved)
+        return resolved
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._load(key, super().__getitem__(key))
+
+    def __iter__(self) -> Iterator[Any]:
+        # Defining __iter__ takes dict(d) and {**d} off the C fast path, which
+        # would copy references; the slow path reads values via __getitem__
+        return super().__iter__()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            return default
+        return self[key]
+
+    def items(self) -> list[tuple[Any, Any]]:  # type: ignore[override]
+        return [(key, self[key]) for key in self.keys()]
+
+    def values(self) -> list[Any]:  # type: ignore[override]
+        return [self[key] for key in self.keys()]
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return super().setdefault(key, default)
+
+    def copy(self) -> "LazyBlobDict":
+        """Shallow copy that keeps unread references lazy."""
+        return LazyBlobDict(self.raw(), store=self.store)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key in self:
+            value = self[key]
+            super().pop(key)
+            return value
+        return super().pop(key, *default)
+
+    def raw(self) -> dict[str, Any]:
+        """Plain dict of the stored values without resolving references."""
+        return dict(super().items())
@@ -0,0 +1,415 @@
+"""Partitioned on-disk repository dataset.
+
+Replaces the monolithic data/repos.json with one JSON line per repository,
+hash-partitioned into shards and split by column group::
+
+    data/repos/
+        _manifest.json          shard row counts and min/max statistics
+        core/part-00.jsonl      scalar fields (name, stars, dates, ...)
+        readme/part-00.jsonl    one group per heavy field, line-aligned
+        metadata/part-00.jsonl
+        ...
+
+Readers only open the column groups they ask for, skip whole shards whose
+statistics rule out the filters, and decode heavy fields only for rows that
+pass them. Updating a repository rewrites its shard, not the dataset.
+"""
+
+import hashlib
+import heapq
+import json
+import mmap
+import operator
+import os
+import tempfile
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+# Fields stored in their own column group; everything else lives in "core"
+GROUPED_FIELDS = ("readme", "metadata", "research_metadata", "citations")
+
+CORE_GROUP = "core"
+
+# Column name selecting every core field in a projection
+ALL_CORE = "*"
+MANIFEST_NAME = "_manifest.json"
+FORMAT_VERSION = 1
+
+# Row ordinal kept in core lines so reads return records in write order
+ROW_KEY = "_row"
+
+# Filter operators usable in (field, op, value) predicates
+OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda a, b: a in b,
+}
+
+Filter = tuple[str, str, Any]
+
+
+def record_key(record: dict[str, Any]) -> str:
+    """Identity of a repository record."""
+    return str(record.get("full_name") or record["name"])
+
+
+class RepositoryDataset:
+    """Sharded, column-grouped JSONL store of repository records."""
+
+    def __init__(self, root: Path | str = Path("data/repos"), num_shards: int = 16):
+        self.root = Path(root)
+        self._manifest: dict[str, Any] | None = None
+        self._num_shards = num_shards
+
+    @property
+    def manifest(self) -> dict[str, Any]:
+        """Dataset manifest (shard statistics), loaded on first use."""
+        if self._manifest is None:
+            path = self.root / MANIFEST_NAME
+            if not path.exists():
+                raise FileNotFoundError(f"Repository dataset not found: {self.root}")
+            with open(path, encoding="utf-8") as f:
+                self._manifest = json.load(f)
+        return self._manifest
+
+    @property
+    def num_shards(self) -> int:
+        """Number of shards (fixed when the dataset is written)."""
+        if self.exists():
+            return int(self.manifest["num_shards"])
+        return self._num_shards
+
+    def exists(self) -> bool:
+        """Whether the dataset has been written."""
+        return (self.root / MANIFEST_NAME).exists()
+
+    def __len__(self) -> int:
+        return sum(shard["rows"] for shard in self.manifest["shards"].values())
+
+    def shard_of(self, key: str) -> str:
+        """Shard id of a repository key."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=4).digest()
+        return f"{int.from_bytes(digest, 'big') % self.num_shards:02d}"
+
+    def write(self, records: Iterable[dict[str, Any]]) -> None:
+        """
+        Replace the dataset with the given records.
+
+        Args:
+            records: Repository records (as in data/repos.json); input order is
+                preserved on read
+        """
+        shards: dict[str, list[dict[str, Any]]] = {}
+        row = -1
+        for row, record in enumerate(records):
+            shards.setdefault(self.shard_of(record_key(record)), []).append(
+                {ROW_KEY: row, **record}
+            )
+
+        manifest: dict[str, Any] = {
+            "format": FORMAT_VERSION,
+            "num_shards": self.num_shards,
+            "next_row": row + 1,
+            "shards": {},
+        }
+        for shard in sorted(set(shards) | set(self._existing_shards())):
+            manifest["shards"][shard] = self._write_shard(shard, shards.get(shard, []))
+
+        self._save_manifest(manifest)
+
+    def read(
+        self,
+        columns: Sequence[str] | None = None,
+        filters: Sequence[Filter] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream records in write order.
+
+        Args:
+            columns: Fields to return (all fields when None); "*" selects
+                every core field, e.g. ``["*", "research_metadata"]``
+            filters: ANDed (field, op, value) predicates on core fields, e.g.
+                ``[("archived", "==", False), ("stars", ">=", 10)]``; ops are
+                ==, !=, <, <=, >, >= and in
+
+        Yields:
+            Records restricted to the requested columns
+        """
+        filters = list(filters or [])
+        groups = self._groups_for(columns)
+        shards = [
+            self._read_shard(shard, groups, columns, filters)
+            for shard, info in sorted(self.manifest["shards"].items())
+            if info["rows"] and _shard_may_match(info.get("stats", {}), filters)
+        ]
+        for _, record in heapq.merge(*shards, key=lambda item: item[0]):
+            yield record
+
+    def load(
+        self,
+        columns: Sequence[str] | None = None,
+        filters: Sequence[Filter] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Read matching records into a list (see ``read``)."""
+        return list(self.read(columns, filters))
+
+    def get(self, key: str, columns: Sequence[str] | None = None) -> dict[str, Any] | None:
+        """Read one repository by full name (or name)."""
+        shard = self.shard_of(key)
+        groups = self._groups_for(columns)
+        for _, record in self._read_shard(shard, groups, None, []):
+            if record_key(record) == key:
+                return _project(record, columns)
+        return None
+
+    def upsert(self, record: dict[str, Any]) -> None:
+        """Insert or replace one repository, rewriting only its shard."""
+        if not self.exists():
+            self.write([record])
+            return
+
+        manifest = self.manifest
+        key = record_key(record)
+        shard = self.shard_of(key)
+        rows = self._load_shard(shard)
+
+        for i, existing in enumerate(rows):
+            if record_key(existing) == key:
+                rows[i] = {ROW_KEY: existing[ROW_KEY], **record}
+                break
+        else:
+            rows.append({ROW_KEY: manifest["next_row"], **record})
+            manifest["next_row"] += 1
+
+        manifest["shards"][shard] = self._write_shard(shard, rows)
+        self._save_manifest(manifest)
+
+    def delete(self, key: str) -> bool:
+        """Remove one repository; returns whether it existed."""
+        manifest = self.manifest
+        shard = self.shard_of(key)
+        rows = self._load_shard(shard)
+        remaining = [row for row in rows if record_key(row) != key]
+        if len(remaining) == len(rows):
+            return False
+
+        manifest["shards"][shard] = self._write_shard(shard, remaining)
+        self._save_manifest(manifest)
+        return True
+
+    @classmethod
+    def import_json(
+        cls, json_path: Path | str, root: Path | str = Path("data/repos"), num_shards: int = 16
+    ) -> "RepositoryDataset":
+        """Create a dataset from a monolithic repos.json file."""
+        with open(json_path, encoding="utf-8") as f:
+            records = json.load(f)
+        dataset = cls(root, num_shards)
+        dataset.write(records)
+        return dataset
+
+    def _groups_for(self, columns: Sequence[str] | None) -> list[str]:
+        """Column groups needed to serve a projection."""
+        if columns is None:
+            return [CORE_GROUP, *GROUPED_FIELDS]
+        return [CORE_GROUP, *(g for g in GROUPED_FIELDS if g in columns)]
+
+    def _path(self, group: str, shard: str) -> Path:
+        return self.root / group / f"part-{shard}.jsonl"
+
+    def _existing_shards(self) -> list[str]:
+        if not self.exists():
+            return []
+        return list(self.manifest["shards"])
+
+    def _read_shard(
+        self,
+        shard: str,
+        groups: list[str],
+        columns: Sequence[str] | None,
+        filters: list[Filter],
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Yield (row, record) for matching rows of one shard."""
+        readers = [_MappedLines(self._path(group, shard)) for group in groups]
+        try:
+            for lines in zip(*readers):
+                core = json.loads(lines[0])
+                if not _matches(core, filters):
+                    continue
+                record = core
+                for line in lines[1:]:
+                    record.update(json.loads(line))
+                row = record.pop(ROW_KEY)
+                yield row, _project(record, columns)
+        finally:
+            for reader in readers:
+                reader.close()
+
+    def _load_shard(self, shard: str) -> list[dict[str, Any]]:
+        """All rows of a shard, including row ordinals."""
+        groups = [CORE_GROUP, *GROUPED_FIELDS]
+        readers = [_MappedLines(self._path(group, shard)) for group in groups]
+        rows = []
+        try:
+            for lines in zip(*readers):
+                record = json.loads(lines[0])
+                for line in lines[1:]:
+                    record.update(json.loads(line))
+                rows.append(record)
+        finally:
+            for reader in readers:
+                reader.close()
+        return rows
+
+    def _write_shard(self, shard: str, rows: list[dict[str, Any]]) -> dict[str, Any]:
+        """Write all column groups of a shard; returns its manifest entry."""
+        parts: dict[str, list[str]] = {group: [] for group in (CORE_GROUP, *GROUPED_FIELDS)}
+        for row in rows:
+            core = {k: v for k, v in row.items() if k not in GROUPED_FIELDS}
+            parts[CORE_GROUP].append(json.dumps(core, ensure_ascii=False))
+            for group in GROUPED_FIELDS:
+                value = {group: row[group]} if group in row else {}
+                parts[group].append(json.dumps(value, ensure_ascii=False))
+
+        for group, lines in parts.items():
+            _atomic_write(self._path(group, shard), "".join(line + "\n" for line in lines))
+
+        return {"rows": len(rows), "stats": _statistics(rows)}
+
+    def _save_manifest(self, manifest: dict[str, Any]) -> None:
+        _atomic_write(self.root / MANIFEST_NAME, json.dumps(manifest, indent=2))
+        self._manifest = manifest
+
+
+def load_repository_records(
+    data_dir: Path | str = Path("data"),
+    columns: Sequence[str] | None = None,
+    filters: Sequence[Filter] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Load repository records, preferring the partitioned dataset.
+
+    Falls back to data/repos.json (applying the same projection and filters)
+    when the dataset has not been written yet.
+
+    Raises:
+        FileNotFoundError: If neither the dataset nor repos.json exists
+    """
+    data_dir = Path(data_dir)
+    dataset = RepositoryDataset(data_dir / "repos")
+    if dataset.exists():
+        return dataset.load(columns, filters)
+
+    repos_file = data_dir / "repos.json"
+    if not repos_file.exists():
+        raise FileNotFoundError(f"Repository data not found: {repos_file}")
+    with open(repos_file, encoding="utf-8") as f:
+        records = json.load(f)
+    return [_project(r, columns) for r in records if _matches(r, list(filters or []))]
+
+
+class _MappedLines:
+    """Iterate the lines of a file through a read-only memory map."""
+
+    def __init__(self, path: Path):
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._map is None:
+            return iter(())
+        return iter(self._map.readline, b"")
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+
+def _project(record: dict[str, Any], columns: Sequence[str] | None) -> dict[str, Any]:
+    """Restrict a record to the requested columns ("*" selects every core field)."""
+    if columns is None:
+        return record
+    if ALL_CORE in columns:
+        return {k: v for k, v in record.items() if k not in GROUPED_FIELDS or k in columns}
+    return {k: record[k] for k in columns if k in record}
+
+
+def _matches(record: dict[str, Any], filters: list[Filter]) -> bool:
+    """Evaluate ANDed predicates; comparisons that cannot be made are false."""
+    for field_name, op, value in filters:
+        try:
+            if not OPERATORS[op](record.get(field_name), value):
+                return False
+        except TypeError:
+            return False
+    return True
+
+
+def _statistics(rows: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    """Min/max of every core field holding numbers, booleans or strings."""
+    bounds: dict[str, list[Any]] = {}
+    skipped: set[str] = set()
+    for row in rows:
+        for field_name, value in row.items():
+            if field_name in skipped or field_name == ROW_KEY:
+                continue
+            if not isinstance(value, int | float | str):
+                if value is not None:
+                    skipped.add(field_name)
+                    bounds.pop(field_name, None)
+                continue
+            current = bounds.get(field_name)
+            if current is None:
+                bounds[field_name] = [value, value]
+                continue
+            try:
+                current[0] = min(current[0], value)
+                current[1] = max(current[1], value)
+            except TypeError:
+                skipped.add(field_name)
+                bounds.pop(field_name)
+    return bounds
+
+
+def _shard_may_match(stats: dict[str, list[Any]], filters: Sequence[Filter]) -> bool:
+    """Whether a shard can contain rows matching the filters, judging by min/max."""
+    for field_name, op, value in filters:
+        if field_name not in stats:
+            continue
+        low, high = stats[field_name]
+        try:
+            if op == "==" and not low <= value <= high:
+                return False
+            if op == "in" and not any(low <= v <= high for v in value):
+                return False
+            if op == "<" and not low < value:
+                return False
+            if op == "<=" and not low <= value:
+                return False
+            if op == ">" and not high > value:
+                return False
+            if op == ">=" and not high >= value:
+                return False
+        except TypeError:
+            continue
+    return True
+
+
+def _atomic_write(path: Path, content: str) -> None:
+    """Write a file via a temporary file so readers never see partial data."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,156 @@
+"""Memoized, shared access to repository data for a build.
+
+A build runs many phases in one process, and each of them used to re-read
+and re-parse the repository data. ``DataStore`` loads it once and hands out
+shared views (raw records, ``Repository`` models and a ``RepositoryTable``)
+that stay cached until the underlying files change.
+
+Views are shared between callers and must be treated as read-only; copy a
+record before modifying it.
+"""
+
+import json
+import os
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+from ..models.repository import Repository
+from ..models.table import RepositoryTable
+from .blobs import BlobStore
+from .dataset import MANIFEST_NAME, RepositoryDataset, _project, load_repository_records
+
+# File modification signature: (mtime in ns, size), or None when missing
+Signature = tuple[int, int] | None
+
+
+class DataStore:
+    """
+    Load repository data once per build and share it between phases.
+
+    Cached views are dropped when the dataset manifest or repos.json changes
+    on disk (every dataset write rewrites the manifest), or when data is
+    written through the store.
+    """
+
+    def __init__(self, data_dir: Path | str = Path("data"), blobs: BlobStore | None = None):
+        self.data_dir = Path(data_dir)
+        self.dataset = RepositoryDataset(self.data_dir / "repos")
+        self.blobs = blobs or BlobStore(self.data_dir / "blobs")
+        self._records: dict[tuple[str, ...] | None, tuple[dict[str, Any], ...]] = {}
+        self._repositories: tuple[Repository, ...] | None = None
+        self._table: RepositoryTable | None = None
+        self._signature: tuple[Signature, Signature] | None = None
+
+    def records(self, columns: Sequence[str] | None = None) -> tuple[dict[str, Any], ...]:
+        """
+        Repository records (as in data/repos.json), loaded once.
+
+        Args:
+            columns: Projection as accepted by ``RepositoryDataset.read``;
+                served from the full records when those are already loaded
+
+        Returns:
+            Shared tuple of records; do not mutate them
+
+        Raises:
+            FileNotFoundError: If no repository data has been written
+        """
+        self._check_fresh()
+        key = tuple(columns) if columns is not None else None
+        cached = self._records.get(key)
+        if cached is not None:
+            return cached
+
+        if key is not None and None in self._records:
+            records = tuple(_project(r, columns) for r in self._records[None])
+        else:
+            records = tuple(load_repository_records(self.data_dir, columns))
+        self._records[key] = records
+        return records
+
+    def repositories(self) -> tuple[Repository, ...]:
+        """Repository models for every record; heavy fields resolve lazily from blobs."""
+        self._check_fresh()
+        if self._repositories is None:
+            self._repositories = tuple(Repository.from_dicts(self.records(), self.blobs))
+        return self._repositories
+
+    def table(self) -> RepositoryTable:
+        """Columnar table over every record."""
+        self._check_fresh()
+        if self._table is None:
+            self._table = RepositoryTable.from_records(self.records(["*"]))
+        return self._table
+
+    def write(self, records: Iterable[dict[str, Any]]) -> None:
+        """
+        Replace the repository data and drop cached views.
+
+        Writes the partitioned dataset and the repos.json export. The export
+        is read outside this repository, so its blob references are resolved
+        to the text they stand for.
+
+        Args:
+            records: Repository records (heavy fields already externalized)
+        """
+        records = list(records)
+        self.dataset.write(records)
+        with open(self.data_dir / "repos.json", "w", encoding="utf-8") as f:
+            json.dump(
+                [self.blobs.hydrate(record) for record in records],
+                f,
+                indent=2,
+                ensure_ascii=False,
+            )
+        self.invalidate()
+
+    def upsert(self, record: dict[str, Any]) -> None:
+        """
+        Insert or replace one repository in the dataset and drop cached views.
+
+        Only the dataset is updated; the repos.json export is rewritten by
+        ``write``. Readers go through ``load_repository_records`` (or this
+        store), which prefer the dataset.
+        """
+        self.dataset.upsert(record)
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop every cached view; the next access reloads from disk."""
+        self._records.clear()
+        self._repositories = None
+        self._table = None
+        self._signature = None
+        # Fresh handle so a manifest rewritten elsewhere is re-read
+        self.dataset = RepositoryDataset(self.data_dir / "repos")
+
+    def _check_fresh(self) -> None:
+        """Invalidate cached views if the files on disk changed since they were loaded."""
+        signature = (
+            _file_signature(self.data_dir / "repos" / MANIFEST_NAME),
+            _file_signature(self.data_dir / "repos.json"),
+        )
+        if signature != self._signature:
+            self.invalidate()
+            self._signature = signature
+
+
+# Stores shared by every caller in the process, keyed by data directory
+_shared: dict[Path, DataStore] = {}
+
+
+def get_datastore(data_dir: Path | str = Path("data")) -> DataStore:
+    """Process-wide store for a data directory, so phases share one load."""
+    path = Path(data_dir).resolve()
+    if path not in _shared:
+        _shared[path] = DataStore(data_dir)
+    return _shared[path]
+
+
+def _file_signature(path: Path) -> Signature:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,224 @@
+"""Persistent reverse-dependency index.
+
+Maps every package to the repositories that declare it, with the version
+specifier and manifest it was declared in. The ``uses`` table is clustered
+on the package, so "which repositories use pandas, and at which versions?"
+reads only the matching rows, and per-package counters (repositories and
+distinct specifiers) are kept up to date on every change, so usage rankings
+and org-wide version drift are answered from the counters alone.
+
+Repositories are re-indexed only when the fingerprint of their manifests
+changes. An index written with another INDEX_VERSION is emptied on open, so
+every repository is re-indexed once.
+"""
+
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+# Bumped when the indexed entries change (2: normalized package names,
+# 3: lock file pins left out of the counters)
+INDEX_VERSION = 3
+
+# Lock files pin every version they resolved rather than declaring
+# requirements, so their entries count neither as usage nor as version drift
+LOCK_MANIFESTS = ("poetry_lock",)
+_LOCK_PARAMS = ", ".join("?" * len(LOCK_MANIFESTS))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS uses (
+    package TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    manifest TEXT NOT NULL,
+    specifier TEXT NOT NULL,
+    PRIMARY KEY (package, repo, manifest)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS uses_repo ON uses (repo);
+CREATE TABLE IF NOT EXISTS repos (
+    repo TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS packages (
+    package TEXT PRIMARY KEY,
+    repos INTEGER NOT NULL,
+    specifiers INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS packages_repos ON packages (repos);
+CREATE INDEX IF NOT EXISTS packages_specifiers ON packages (specifiers);
+"""
+
+
+class DependencyIndex:
+    """SQLite-backed inverted index from package to declaring repositories."""
+
+    def __init__(self, path: Path | str = Path("data/dependency_index.db")):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+            with self._conn:
+                for table in ("uses", "repos", "packages"):
+                    self._conn.execute(f"DELETE FROM {table}")
+                self._conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "DependencyIndex":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def fingerprint(self, repo: str) -> str | None:
+        """Manifest fingerprint a repository was last indexed with."""
+        row = self._conn.execute("SELECT fingerprint FROM repos WHERE repo = ?", (repo,)).fetchone()
+        return row[0] if row else None
+
+    def repos(self) -> list[str]:
+        """Names of every indexed repository."""
+        return [row[0] for row in self._conn.execute("SELECT repo FROM repos ORDER BY repo")]
+
+    def update(self, repo: str, fingerprint: str, entries: Iterable[tuple[str, str, str]]) -> bool:
+        """
+        Replace the dependencies of a repository unless its manifests are unchanged.
+
+        Args:
+            repo: Repository name
+            fingerprint: Digest of the repository's manifests
+            entries: (package, manifest, version specifier) declarations
+
+        Returns:
+            Whether the repository was re-indexed
+        """
+        if self.fingerprint(repo) == fingerprint:
+            return False
+        rows = {(package, repo, manifest): specifier for package, manifest, specifier in entries}
+        with self._conn:
+            touched = self._delete(repo)
+            self._conn.executemany(
+                "INSERT INTO uses (package, repo, manifest, specifier) VALUES (?, ?, ?, ?)",
+                [(*key, specifier) for key, specifier in rows.items()],
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO repos (repo, fingerprint) VALUES (?, ?)",
+                (repo, fingerprint),
+            )
+            self._refresh_counts(touched | {package for package, _, _ in rows})
+        return True
+
+    def remove(self, repo: str) -> None:
+        """Drop a repository from the index."""
+        with self._conn:
+            self._refresh_counts(self._delete(repo))
+            self._conn.execute("DELETE FROM repos WHERE repo = ?", (repo,))
+
+    def dependents(self, package: str) -> list[dict[str, str]]:
+        """
+        Repositories declaring a package.
+
+        Returns:
+            Declarations with ``repo``, ``manifest`` and ``specifier``
+        """
+        cursor = self._conn.execute(
+            "SELECT repo, manifest, specifier FROM uses WHERE package = ? ORDER BY repo, manifest",
+            (package,),
+        )
+        return [{"repo": r, "manifest": m, "specifier": s} for r, m, s in cursor]
+
+    def dependencies(self, repo: str) -> list[dict[str, Any]]:
+        """
+        Packages declared by a repository.
+
+        Returns:
+            Declarations with ``package``, ``manifest``, ``specifier`` and the
+            number of repositories using the package (``used_by``)
+        """
+        cursor = self._conn.execute(
+            """
+            SELECT uses.package, uses.manifest, uses.specifier, packages.repos
+            FROM uses JOIN packages ON packages.package = uses.package
+            WHERE uses.repo = ? ORDER BY uses.package, uses.manifest
+            """,
+            (repo,),
+        )
+        return [
+            {"package": p, "manifest": m, "specifier": s, "used_by": n} for p, m, s, n in cursor
+        ]
+
+    def package_usage(self, limit: int | None = None) -> list[tuple[str, int]]:
+        """Packages with the number of repositories declaring them, most used first."""
+        cursor = self._conn.execute(
+            "SELECT package, repos FROM packages WHERE repos > 0 "
+            "ORDER BY repos DESC, package LIMIT ?",
+            (-1 if limit is None else limit,),
+        )
+        return [(package, count) for package, count in cursor]
+
+    def totals(self) -> dict[str, int]:
+        """Indexed repositories, distinct declared packages and repository-package pairs."""
+        packages, pairs = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(repos), 0) FROM packages WHERE repos > 0"
+        ).fetchone()
+        repos = self._conn.execute("SELECT COUNT(*) FROM repos").fetchone()[0]
+        return {"repositories": repos, "packages": packages, "dependencies": pairs}
+
+    def version_drift(self, min_specifiers: int = 2) -> dict[str, dict[str, list[str]]]:
+        """
+        Packages declared with different version specifiers across the organization.
+
+        Args:
+            min_specifiers: Minimum number of distinct specifiers (an unpinned
+                declaration counts as the specifier "", lock file pins do not count)
+
+        Returns:
+            Package -> specifier -> repositories using it
+        """
+        drift: dict[str, dict[str, list[str]]] = {}
+        cursor = self._conn.execute(
+            f"""
+            SELECT uses.package, uses.specifier, uses.repo
+            FROM packages JOIN uses ON uses.package = packages.package
+            WHERE packages.specifiers >= ? AND uses.manifest NOT IN ({_LOCK_PARAMS})
+            ORDER BY uses.package, uses.specifier, uses.repo
+            """,
+            (min_specifiers, *LOCK_MANIFESTS),
+        )
+        for package, specifier, repo in cursor:
+            repos = drift.setdefault(package, {}).setdefault(specifier, [])
+            if repo not in repos:
+                repos.append(repo)
+        return drift
+
+    def _delete(self, repo: str) -> set[str]:
+        """Delete a repository's declarations and return the affected packages."""
+        packages = {
+            row[0] for row in self._conn.execute("SELECT package FROM uses WHERE repo = ?", (repo,))
+        }
+        self._conn.execute("DELETE FROM uses WHERE repo = ?", (repo,))
+        return packages
+
+    def _refresh_counts(self, packages: set[str]) -> None:
+        """Recompute the counters of packages (each a range scan of the clustered key)."""
+        for package in packages:
+            uses, repos, specifiers = self._conn.execute(
+                f"""
+                SELECT COUNT(*),
+                       COUNT(DISTINCT CASE WHEN manifest NOT IN ({_LOCK_PARAMS})
+                                      THEN repo END),
+                       COUNT(DISTINCT CASE WHEN manifest NOT IN ({_LOCK_PARAMS})
+                                      THEN specifier END)
+                FROM uses WHERE package = ?
+                """,
+                (*LOCK_MANIFESTS, *LOCK_MANIFESTS, package),
+            ).fetchone()
+            if uses:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO packages (package, repos, specifiers) VALUES (?, ?, ?)",
+                    (package, repos, specifiers),
+                )
+            else:
+                self._conn.execute("DELETE FROM packages WHERE package = ?", (package,))
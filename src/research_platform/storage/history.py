@@ -0,0 +1,273 @@
+"""Append-only, time-indexed log of per-repository citation snapshots.
+
+Each build appends one row per repository to a SQLite table clustered on
+(repo, timestamp), so recording a run never rewrites earlier history and
+growth over any time window is two index lookups. Old points are
+periodically downsampled: snapshots older than ``raw_days`` keep the last
+point of each week, and those older than ``weekly_days`` the last point of
+each month, which bounds the size of the log.
+"""
+
+import json
+import sqlite3
+import time
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+# Counters recorded for every repository
+METRICS = ("external_citations", "publications_count", "stars", "forks")
+
+# Snapshots younger than this are kept at full resolution
+RAW_DAYS = 90
+
+# Snapshots older than this are kept monthly (weekly in between)
+WEEKLY_DAYS = 365
+
+# Minimum time between automatic compactions
+COMPACT_INTERVAL_DAYS = 7
+
+DAY_SECONDS = 86400
+WEEK_SECONDS = 7 * DAY_SECONDS
+
+# Average month length used to express growth rates per month
+MONTH_SECONDS = 30.4375 * DAY_SECONDS
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS snapshots (
+    repo TEXT NOT NULL,
+    ts INTEGER NOT NULL,
+    {", ".join(f"{m} INTEGER NOT NULL DEFAULT 0" for m in METRICS)},
+    PRIMARY KEY (repo, ts)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Bucket expressions used when downsampling (last snapshot per bucket is kept)
+_WEEK_BUCKET = f"{{t}}.ts / {WEEK_SECONDS}"
+_MONTH_BUCKET = "strftime('%Y-%m', {t}.ts, 'unixepoch')"
+
+
+class CitationHistoryLog:
+    """SQLite-backed snapshot log of citation and popularity counters."""
+
+    def __init__(
+        self,
+        path: Path | str = Path("data/citation_history.db"),
+        raw_days: int = RAW_DAYS,
+        weekly_days: int = WEEKLY_DAYS,
+    ):
+        self.path = Path(path)
+        self.raw_days = raw_days
+        self.weekly_days = weekly_days
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "CitationHistoryLog":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def append(self, snapshots: dict[str, dict[str, int]], timestamp: float | None = None) -> None:
+        """
+        Record one snapshot per repository.
+
+        Args:
+            snapshots: Repository name -> metric values (missing metrics are 0)
+            timestamp: POSIX time of the snapshot (now when omitted)
+        """
+        ts = int(time.time() if timestamp is None else timestamp)
+        rows = [
+            (repo, ts, *(int(values.get(m, 0)) for m in METRICS))
+            for repo, values in snapshots.items()
+        ]
+        placeholders = ", ".join("?" * (len(METRICS) + 2))
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO snapshots (repo, ts, {', '.join(METRICS)}) "
+                f"VALUES ({placeholders})",
+                rows,
+            )
+
+    def series(
+        self, repo: str, start: float | None = None, end: float | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Snapshots of a repository in a time window, oldest first.
+
+        Args:
+            repo: Repository name
+            start: Inclusive POSIX start time (unbounded when None)
+            end: Inclusive POSIX end time (unbounded when None)
+
+        Returns:
+            Snapshots with ``timestamp`` (ISO 8601) and metric values
+        """
+        where, params = _window(repo, start, end)
+        cursor = self._conn.execute(f"SELECT * FROM snapshots WHERE {where} ORDER BY ts", params)
+        return [_snapshot(row) for row in cursor]
+
+    def growth(
+        self, repo: str, start: float | None = None, end: float | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Change of every metric between the first and last snapshot in a window.
+
+        Args:
+            repo: Repository name
+            start: Inclusive POSIX start time (unbounded when None)
+            end: Inclusive POSIX end time (unbounded when None)
+
+        Returns:
+            First and last snapshots, per-metric deltas, elapsed seconds and
+            snapshot count, or None with fewer than two snapshots
+        """
+        where, params = _window(repo, start, end)
+        count = self._conn.execute(
+            f"SELECT COUNT(*) FROM snapshots WHERE {where}", params
+        ).fetchone()[0]
+        if count < 2:
+            return None
+
+        first = self._conn.execute(
+            f"SELECT * FROM snapshots WHERE {where} ORDER BY ts LIMIT 1", params
+        ).fetchone()
+        last = self._conn.execute(
+            f"SELECT * FROM snapshots WHERE {where} ORDER BY ts DESC LIMIT 1", params
+        ).fetchone()
+        return {
+            "first": _snapshot(first),
+            "last": _snapshot(last),
+            "delta": {m: last[m] - first[m] for m in METRICS},
+            "seconds": last["ts"] - first["ts"],
+            "snapshots": count,
+        }
+
+    def repos(self) -> list[str]:
+        """Names of every repository in the log."""
+        return [row[0] for row in self._conn.execute("SELECT DISTINCT repo FROM snapshots")]
+
+    def __len__(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0])
+
+    def compact(self, now: float | None = None) -> int:
+        """
+        Downsample old snapshots to weekly, then monthly, resolution.
+
+        Within each bucket the latest snapshot is kept, so the counters keep
+        their end-of-period values.
+
+        Args:
+            now: Reference POSIX time (now when omitted)
+
+        Returns:
+            Number of snapshots removed
+        """
+        now = time.time() if now is None else now
+        removed = 0
+        with self._conn:
+            for cutoff_days, bucket in (
+                (self.raw_days, _WEEK_BUCKET),
+                (self.weekly_days, _MONTH_BUCKET),
+            ):
+                cutoff = int(now - cutoff_days * DAY_SECONDS)
+                removed += self._conn.execute(
+                    f"""
+                    DELETE FROM snapshots WHERE ts < :cutoff AND EXISTS (
+                        SELECT 1 FROM snapshots AS t
+                        WHERE t.repo = snapshots.repo AND t.ts < :cutoff
+                          AND t.ts > snapshots.ts
+                          AND {bucket.format(t="t")} = {bucket.format(t="snapshots")}
+                    )
+                    """,
+                    {"cutoff": cutoff},
+                ).rowcount
+            self._set_meta("compacted_at", str(int(now)))
+        return removed
+
+    def compact_if_due(
+        self, now: float | None = None, interval_days: float = COMPACT_INTERVAL_DAYS
+    ) -> int:
+        """Compact when the last compaction is older than ``interval_days``."""
+        now = time.time() if now is None else now
+        last = self._get_meta("compacted_at")
+        if last is not None and now - int(last) < interval_days * DAY_SECONDS:
+            return 0
+        return self.compact(now)
+
+    def import_json(self, json_path: Path | str) -> int:
+        """
+        Import snapshots from the legacy citation_history.json format.
+
+        Args:
+            json_path: File mapping repository name -> list of snapshots with
+                ISO ``timestamp`` keys
+
+        Returns:
+            Number of snapshots imported
+        """
+        with open(json_path, encoding="utf-8") as f:
+            history = json.load(f)
+
+        by_time: dict[float, dict[str, dict[str, int]]] = {}
+        for repo, snapshots in history.items():
+            for snapshot in snapshots:
+                ts = datetime.fromisoformat(snapshot["timestamp"]).timestamp()
+                by_time.setdefault(ts, {})[repo] = snapshot
+
+        for ts, snapshots in by_time.items():
+            self.append(snapshots, ts)
+        return sum(len(s) for s in by_time.values())
+
+    def _get_meta(self, key: str) -> str | None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+
+def _window(repo: str, start: float | None, end: float | None) -> tuple[str, list[Any]]:
+    """WHERE clause and parameters selecting one repository's time window."""
+    clauses = ["repo = ?"]
+    params: list[Any] = [repo]
+    if start is not None:
+        clauses.append("ts >= ?")
+        params.append(int(start))
+    if end is not None:
+        clauses.append("ts <= ?")
+        params.append(int(end))
+    return " AND ".join(clauses), params
+
+
+def _snapshot(row: sqlite3.Row) -> dict[str, Any]:
+    """Snapshot dict (ISO timestamp plus metrics) from a database row."""
+    return {
+        "timestamp": datetime.fromtimestamp(row["ts"]).isoformat(),
+        **{m: row[m] for m in METRICS},
+    }
+
+
+def snapshot_metrics(records: Iterable[dict[str, Any]]) -> dict[str, dict[str, int]]:
+    """Current citation counters of repository records, keyed by name."""
+    snapshots = {}
+    for repo in records:
+        publications = (repo.get("research_metadata") or {}).get("publications", [])
+        snapshots[repo["name"]] = {
+            "external_citations": sum(pub.get("citation_count", 0) for pub in publications),
+            "publications_count": len(publications),
+            "stars": repo.get("stars", 0),
+            "forks": repo.get("forks", 0),
+        }
+    return snapshots
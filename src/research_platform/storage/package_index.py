@@ -0,0 +1,149 @@
+"""Local snapshot of package registry dependency metadata.
+
+Maps (ecosystem, package) to the package's direct requirements, as listed
+by its registry (PyPI ``requires_dist``, npm ``dependencies``, CRAN
+``Imports``). The snapshot lives in one SQLite table clustered on the
+package key, so dependency resolution runs offline with indexed lookups.
+"""
+
+import json
+import re
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+# Keys per SQL statement (well below SQLite's bound-parameter limit)
+BATCH_SIZE = 500
+
+# Requirements that only apply to an optional extra (PEP 508 marker)
+_EXTRA_MARKER = re.compile(r"""\bextra\s*==""")
+
+# Package name at the start of a requirement string
+_NAME = re.compile(r"^\s*([A-Za-z0-9@][A-Za-z0-9._/@-]*)")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS packages (
+    ecosystem TEXT NOT NULL,
+    name TEXT NOT NULL,
+    requires TEXT NOT NULL,
+    PRIMARY KEY (ecosystem, name)
+) WITHOUT ROWID;
+"""
+
+
+def normalize_name(ecosystem: str, name: str) -> str:
+    """Canonical package name (PEP 503 for PyPI, unchanged elsewhere)."""
+    if ecosystem == "pypi":
+        return re.sub(r"[-_.]+", "-", name).lower()
+    return name
+
+
+def requirement_names(ecosystem: str, requirements: Any) -> list[str]:
+    """
+    Package names of registry requirements.
+
+    Args:
+        ecosystem: Package ecosystem
+        requirements: List of requirement strings, or a name -> version mapping
+
+    Returns:
+        Normalized names, without requirements of optional extras
+    """
+    if isinstance(requirements, dict):
+        requirements = list(requirements)
+    names = []
+    for requirement in requirements or []:
+        if _EXTRA_MARKER.search(requirement):
+            continue
+        match = _NAME.match(requirement)
+        if match:
+            name = normalize_name(ecosystem, match.group(1))
+            if name not in names:
+                names.append(name)
+    return names
+
+
+class PackageIndex:
+    """SQLite-backed snapshot of package requirements."""
+
+    def __init__(self, path: Path | str = Path("data/package_index.db")):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "PackageIndex":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM packages").fetchone()[0])
+
+    def add(self, ecosystem: str, packages: dict[str, Any]) -> None:
+        """
+        Store (or replace) the requirements of packages.
+
+        Args:
+            ecosystem: Package ecosystem ("pypi", "npm", "cran")
+            packages: Package name -> requirement strings or name -> version mapping
+        """
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO packages (ecosystem, name, requires) VALUES (?, ?, ?)",
+                [
+                    (
+                        ecosystem,
+                        normalize_name(ecosystem, name),
+                        "\n".join(requirement_names(ecosystem, requirements)),
+                    )
+                    for name, requirements in packages.items()
+                ],
+            )
+
+    def requirements(self, ecosystem: str, names: Iterable[str]) -> dict[str, tuple[str, ...]]:
+        """
+        Direct requirements of packages.
+
+        Args:
+            ecosystem: Package ecosystem
+            names: Normalized package names
+
+        Returns:
+            Name -> requirements for every package in the snapshot
+        """
+        names = list(dict.fromkeys(names))
+        found: dict[str, tuple[str, ...]] = {}
+        for start in range(0, len(names), BATCH_SIZE):
+            batch = names[start : start + BATCH_SIZE]
+            rows = self._conn.execute(
+                f"SELECT name, requires FROM packages WHERE ecosystem = ? "
+                f"AND name IN ({', '.join('?' * len(batch))})",
+                [ecosystem, *batch],
+            )
+            found.update(
+                (name, tuple(filter(None, requires.split("\n")))) for name, requires in rows
+            )
+        return found
+
+    def import_json(self, json_path: Path | str) -> int:
+        """
+        Import a snapshot exported as JSON.
+
+        Args:
+            json_path: File mapping ecosystem -> package name -> requirements
+
+        Returns:
+            Number of packages imported
+        """
+        with open(json_path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+        for ecosystem, packages in snapshot.items():
+            self.add(ecosystem, packages)
+        return sum(len(packages) for packages in snapshot.values())
@@ -0,0 +1,129 @@
+"""Persistent cache of per-content analysis results.
+
+Results are keyed by the SHA-256 of the analyzed content (the same digest
+the blob store uses) and tagged with the version of the analyzer that
+produced them, so unchanged content is never re-analyzed and a new analyzer
+version silently invalidates old entries.
+"""
+
+import json
+import sqlite3
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+# Keys per SQL statement (well below SQLite's bound-parameter limit)
+BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    version TEXT NOT NULL,
+    value TEXT NOT NULL,
+    used_at INTEGER NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+"""
+
+
+class ResultCache:
+    """
+    SQLite-backed map from content digest to a JSON-serializable result.
+
+    Several kinds of result can share one database under different
+    ``namespace`` values; entries written by another ``version`` are misses.
+    """
+
+    def __init__(
+        self,
+        path: Path | str = Path("cache/results.sqlite"),
+        namespace: str = "default",
+        version: str = "1",
+    ):
+        self.path = Path(path)
+        self.namespace = namespace
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """
+        Look up results by content digest.
+
+        Args:
+            keys: Content digests
+
+        Returns:
+            Digest -> result for every entry written by the current version
+        """
+        keys = list(dict.fromkeys(keys))
+        found: dict[str, Any] = {}
+        for start in range(0, len(keys), BATCH_SIZE):
+            batch = keys[start : start + BATCH_SIZE]
+            rows = self._conn.execute(
+                f"SELECT key, value FROM results WHERE namespace = ? AND version = ? "
+                f"AND key IN ({', '.join('?' * len(batch))})",
+                [self.namespace, self.version, *batch],
+            )
+            found.update((key, json.loads(value)) for key, value in rows)
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        if found:
+            # Remember use so prune() keeps entries that are still read
+            now = int(time.time())
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE results SET used_at = ? WHERE namespace = ? AND key = ?",
+                    [(now, self.namespace, key) for key in found],
+                )
+        return found
+
+    def put_many(self, items: dict[str, Any]) -> None:
+        """Store results by content digest, replacing older versions."""
+        now = int(time.time())
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO results (namespace, key, version, value, used_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (self.namespace, key, self.version, json.dumps(value), now)
+                    for key, value in items.items()
+                ],
+            )
+
+    def prune(self, max_age_days: float = 90) -> int:
+        """
+        Remove entries of other versions and entries unused for ``max_age_days``.
+
+        Returns:
+            Number of entries removed
+        """
+        cutoff = int(time.time() - max_age_days * 86400)
+        with self._conn:
+            return self._conn.execute(
+                "DELETE FROM results WHERE namespace = ? AND (version != ? OR used_at < ?)",
+                (self.namespace, self.version, cutoff),
+            ).rowcount
+
+    def __len__(self) -> int:
+        row = self._conn.execute(
+            "SELECT COUNT(*) FROM results WHERE namespace = ? AND version = ?",
+            (self.namespace, self.version),
+        ).fetchone()
+        return int(row[0])
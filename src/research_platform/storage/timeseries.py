@@ -0,0 +1,283 @@
+"""Daily per-repository metrics history.
+
+Each build records one snapshot of integer counters (stars, forks, open
+issues, contributors) per repository and day. In memory every metric is a
+(days x repositories) NumPy matrix; on disk the matrices are delta-encoded
+along the time axis, so the slowly changing counters become runs of zeros
+that compress to almost nothing.
+"""
+
+import os
+import tempfile
+from collections.abc import Iterable, Sequence
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+# Counters recorded for every repository
+METRICS = ("stars", "forks", "open_issues", "contributors")
+
+# Rollup periods and the aggregations they support
+PERIODS = ("day", "week", "month")
+AGGREGATIONS = ("last", "max", "mean", "sum")
+
+DayLike = date | str | int
+
+
+class MetricsStore:
+    """Delta-encoded store of daily per-repository metric snapshots."""
+
+    def __init__(
+        self,
+        path: Path | str = Path("data/metrics_timeseries.npz"),
+        metrics: Sequence[str] = METRICS,
+    ):
+        self.path = Path(path)
+        self.metrics = tuple(metrics)
+        self.days = np.array([], dtype=np.int32)
+        self.repos: list[str] = []
+        self.values = {m: np.zeros((0, 0), dtype=np.int64) for m in self.metrics}
+        self.observed = np.zeros((0, 0), dtype=bool)
+        self._repo_index: dict[str, int] = {}
+        if self.path.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        """Number of recorded days."""
+        return len(self.days)
+
+    def record(self, snapshots: dict[str, dict[str, int]], day: DayLike | None = None) -> None:
+        """
+        Record one day's counters; recording a day again overwrites it.
+
+        Args:
+            snapshots: Repository name -> metric values (missing metrics are 0)
+            day: Snapshot date (today when omitted)
+        """
+        day_number = _day_number(date.today() if day is None else day)
+        self._add_repos(snapshots)
+        row = self._row_for(day_number)
+
+        columns = np.fromiter((self._repo_index[r] for r in snapshots), dtype=np.int64)
+        for metric in self.metrics:
+            self.values[metric][row, columns] = [
+                int(values.get(metric, 0)) for values in snapshots.values()
+            ]
+        self.observed[row, columns] = True
+
+    def save(self) -> None:
+        """Write the store (delta-encoded, compressed) atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        arrays: dict[str, Any] = {
+            "days": np.diff(self.days, prepend=0),
+            "repos": np.array(self.repos, dtype=str),
+            "observed": np.packbits(self.observed, axis=0),
+            "num_days": np.array(len(self.days)),
+        }
+        for metric, matrix in self.values.items():
+            arrays[f"metric_{metric}"] = np.diff(matrix, axis=0, prepend=0)
+
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp-", suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def series(
+        self,
+        metric: str,
+        repo: str | None = None,
+        start: DayLike | None = None,
+        end: DayLike | None = None,
+    ) -> tuple[list[str], np.ndarray]:
+        """
+        Daily values of a metric in a date range.
+
+        Args:
+            metric: Metric name
+            repo: Repository name, or None for the organization total (each
+                repository contributes its latest value as of the day)
+            start: Inclusive first day (unbounded when None)
+            end: Inclusive last day (unbounded when None)
+
+        Returns:
+            ISO dates and the matching values; a repository's series only
+            includes the days it was observed
+        """
+        rows = self._rows_between(start, end)
+        if repo is None:
+            values = self._filled(metric)[rows].sum(axis=1)
+            return self._dates(rows), values
+
+        if repo not in self._repo_index:
+            return [], np.array([], dtype=np.int64)
+        column = self._repo_index[repo]
+        rows = rows[self.observed[rows, column]]
+        return self._dates(rows), self.values[metric][rows, column]
+
+    def rollup(
+        self,
+        metric: str,
+        period: str = "week",
+        agg: str = "last",
+        repo: str | None = None,
+        start: DayLike | None = None,
+        end: DayLike | None = None,
+    ) -> tuple[list[str], np.ndarray]:
+        """
+        Aggregate a daily series per week (Monday-based) or calendar month.
+
+        Args:
+            metric: Metric name
+            period: "day", "week" or "month"
+            agg: "last", "max", "mean" or "sum" of the daily values
+            repo: Repository name, or None for the organization total
+            start: Inclusive first day (unbounded when None)
+            end: Inclusive last day (unbounded when None)
+
+        Returns:
+            ISO start date of each period and the aggregated values
+        """
+        if period not in PERIODS:
+            raise ValueError(f"Unknown period: {period}")
+        if agg not in AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation: {agg}")
+
+        dates, values = self.series(metric, repo, start, end)
+        if not dates:
+            return [], values
+
+        days = np.array(dates, dtype="datetime64[D]")
+        if period == "week":
+            # 1970-01-01 was a Thursday
+            buckets = days - ((days.astype(np.int64) + 3) % 7).astype("timedelta64[D]")
+        elif period == "month":
+            buckets = days.astype("datetime64[M]").astype("datetime64[D]")
+        else:
+            buckets = days
+
+        labels, first, counts = np.unique(buckets, return_index=True, return_counts=True)
+        if agg == "last":
+            result = values[first + counts - 1]
+        elif agg == "max":
+            result = np.maximum.reduceat(values, first)
+        elif agg == "sum":
+            result = np.add.reduceat(values, first)
+        else:
+            result = np.add.reduceat(values, first) / counts
+        return [str(label) for label in labels], result
+
+    def rate(
+        self,
+        metric: str,
+        repo: str | None = None,
+        start: DayLike | None = None,
+        end: DayLike | None = None,
+        per_days: float = 1.0,
+    ) -> float | None:
+        """
+        Average change of a metric per ``per_days`` between the first and
+        last recorded day in a range (None with fewer than two days).
+        """
+        dates, values = self.series(metric, repo, start, end)
+        if len(dates) < 2:
+            return None
+        elapsed = _day_number(dates[-1]) - _day_number(dates[0])
+        return float(values[-1] - values[0]) / elapsed * per_days
+
+    def latest(self, metric: str) -> dict[str, int]:
+        """Most recent observed value of a metric per repository."""
+        if not len(self.days):
+            return {}
+        filled = self._filled(metric)[-1]
+        seen = np.asarray(self.observed.any(axis=0))
+        return {r: int(v) for r, v, s in zip(self.repos, filled, seen) if s}
+
+    def _add_repos(self, names: Iterable[str]) -> None:
+        """Append columns for repositories not seen before."""
+        new = [name for name in names if name not in self._repo_index]
+        if not new:
+            return
+        for name in new:
+            self._repo_index[name] = len(self.repos)
+            self.repos.append(name)
+        pad = ((0, 0), (0, len(new)))
+        for metric in self.metrics:
+            self.values[metric] = np.pad(self.values[metric], pad)
+        self.observed = np.pad(self.observed, pad)
+
+    def _row_for(self, day_number: int) -> int:
+        """Row of a day, inserting an empty row (in date order) if needed."""
+        row = int(np.searchsorted(self.days, day_number))
+        if row < len(self.days) and self.days[row] == day_number:
+            return row
+
+        self.days = np.insert(self.days, row, day_number)
+        for metric in self.metrics:
+            self.values[metric] = np.insert(self.values[metric], row, 0, axis=0)
+        self.observed = np.insert(self.observed, row, False, axis=0)
+        return row
+
+    def _rows_between(self, start: DayLike | None, end: DayLike | None) -> np.ndarray:
+        low = 0 if start is None else np.searchsorted(self.days, _day_number(start), "left")
+        high = (
+            len(self.days) if end is None else np.searchsorted(self.days, _day_number(end), "right")
+        )
+        return np.arange(low, high)
+
+    def _filled(self, metric: str) -> np.ndarray:
+        """Metric matrix with each repository's last observed value carried forward."""
+        rows = np.arange(len(self.days))[:, None]
+        last_seen = np.maximum.accumulate(np.where(self.observed, rows, -1), axis=0)
+        columns = np.broadcast_to(np.arange(len(self.repos)), last_seen.shape)
+        filled = self.values[metric][np.maximum(last_seen, 0), columns]
+        return np.where(last_seen >= 0, filled, 0)
+
+    def _dates(self, rows: np.ndarray) -> list[str]:
+        return [str(d) for d in self.days[rows].astype("datetime64[D]")]
+
+    def _load(self) -> None:
+        with np.load(self.path) as data:
+            arrays: dict[str, Any] = {key: data[key] for key in data.files}
+
+        num_days = int(arrays["num_days"])
+        self.days = np.cumsum(arrays["days"]).astype(np.int32)
+        self.repos = [str(name) for name in arrays["repos"]]
+        self._repo_index = {name: i for i, name in enumerate(self.repos)}
+        self.observed = np.unpackbits(arrays["observed"], axis=0, count=num_days).astype(bool)
+        shape = (num_days, len(self.repos))
+        for metric in self.metrics:
+            key = f"metric_{metric}"
+            if key in arrays:
+                self.values[metric] = np.cumsum(arrays[key], axis=0)
+            else:
+                self.values[metric] = np.zeros(shape, dtype=np.int64)
+
+
+def _day_number(day: DayLike) -> int:
+    """Days since 1970-01-01 of a date, ISO date string or day number."""
+    if isinstance(day, int | np.integer):
+        return int(day)
+    if isinstance(day, datetime):
+        day = day.date()
+    if isinstance(day, str):
+        day = date.fromisoformat(day[:10])
+    return (day - date(1970, 1, 1)).days
+
+
+def repository_metrics(repositories: Iterable[Any]) -> dict[str, dict[str, int]]:
+    """Current counters of Repository models, keyed by name."""
+    return {
+        repo.name: {
+            "stars": repo.stars,
+            "forks": repo.forks,
+            "open_issues": repo.open_issues,
+            "contributors": repo.contributors_count,
+        }
+        for repo in repositories
+    }
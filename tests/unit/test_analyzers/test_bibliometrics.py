@@ -0,0 +1,101 @@
+"""Tests for vectorized bibliometric indicators."""
+
+import numpy as np
+import pytest
+
+from research_platform.analyzers.bibliometrics import (
+    UNKNOWN_YEAR,
+    citation_metrics,
+    g_index,
+    h_index,
+    i_index,
+    percentiles,
+    publication_year,
+    rank_citations,
+    yearly_metrics,
+)
+
+
+def _brute_h(counts):
+    return max((h for h in range(len(counts) + 1) if sum(c >= h for c in counts) >= h), default=0)
+
+
+def _brute_g(counts):
+    ranked = sorted(counts, reverse=True)
+    return max((g for g in range(len(ranked) + 1) if sum(ranked[:g]) >= g * g), default=0)
+
+
+class TestIndicators:
+    """Tests for the indicators computed from one ranking."""
+
+    def test_indices_match_definitions(self):
+        """Test h-, g- and i10-index against brute-force definitions."""
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            counts = rng.integers(0, 60, size=rng.integers(0, 40)).tolist()
+            ranked, _ = rank_citations(counts)
+
+            assert h_index(ranked) == _brute_h(counts)
+            assert g_index(ranked) == _brute_g(counts)
+            assert i_index(ranked) == sum(c >= 10 for c in counts)
+
+    def test_percentiles_match_numpy(self):
+        """Test percentiles read off the ranking equal numpy's default method."""
+        counts = [3, 40, 0, 7, 7, 12, 1, 95, 22]
+        ranked, _ = rank_citations(counts)
+
+        result = percentiles(ranked)
+
+        for q in (25, 50, 75, 90):
+            assert result[f"p{q}"] == pytest.approx(np.percentile(counts, q))
+
+    def test_citation_metrics(self):
+        """Test every indicator of one entity."""
+        ranked, _ = rank_citations([10, 8, 5, 4, 3])
+
+        assert citation_metrics(ranked) == {
+            "publications": 5,
+            "total_citations": 30,
+            "average_citations": 6.0,
+            "max_citations": 10,
+            "median_citations": 5.0,
+            "h_index": 4,
+            "g_index": 5,
+            "i10_index": 1,
+        }
+
+    def test_empty(self):
+        """Test an entity without publications."""
+        ranked, _ = rank_citations([])
+
+        assert citation_metrics(ranked)["h_index"] == 0
+        assert percentiles(ranked) == {"p25": 0.0, "p50": 0.0, "p75": 0.0, "p90": 0.0}
+
+
+class TestYearlyMetrics:
+    """Tests for per-year windows."""
+
+    def test_windows_match_per_year_rankings(self):
+        """Test each year's indicators equal those of the year's publications alone."""
+        rng = np.random.default_rng(1)
+        citations = rng.integers(0, 30, size=300)
+        years = rng.integers(2015, 2024, size=300)
+
+        windows = yearly_metrics(*rank_citations(citations, years))
+
+        assert list(windows) == sorted(set(years.tolist()))
+        for year, window in windows.items():
+            counts = citations[years == year].tolist()
+            assert window == {
+                "publications": len(counts),
+                "total_citations": sum(counts),
+                "h_index": _brute_h(counts),
+                "i10_index": sum(c >= 10 for c in counts),
+            }
+
+    def test_unknown_years_are_skipped(self):
+        """Test publications without a year are left out of the windows."""
+        years = [publication_year(value) for value in (2021, "2021-05-01", None, "n/a")]
+
+        assert years == [2021, 2021, UNKNOWN_YEAR, UNKNOWN_YEAR]
+        assert list(yearly_metrics(*rank_citations([5, 1, 9, 9], years))) == [2021]
@@ -1,11 +1,17 @@
 """Tests for ComplexityAnalyzer."""
 
 import json
+from unittest.mock import patch
 
 import pytest
 
-from research_platform.analyzers.complexity_analyzer import ComplexityAnalyzer
+from research_platform.analyzers.complexity_analyzer import (
+    ComplexityAnalyzer,
+    analyze_all_complexity,
+    open_result_cache,
+)
 from research_platform.models.repository import Repository
+from research_platform.storage.blobs import BlobStore
 
 
 @pytest.fixture
@@ -467,3 +473,178 @@ def complex():
         # Should be limited to 10
         assert len(analysis["most_complex_repositories"]) <= 10
         assert len(analysis["most_maintainable_repositories"]) <= 10
+
+    def test_block_types_and_ranks(self, complexity_analyzer):
+        """Test blocks are typed as function, class or method and ranked A-F."""
+        pytest.importorskip("radon")
+        code = """
+class Greeter:
+    def greet(self, name):
+        return name or "world"
+
+def main():
+    return Greeter().greet("x")
+"""
+        results = complexity_analyzer.calculate_cyclomatic_complexity(code, "greeter.py")
+
+        assert {(r["name"], r["type"]) for r in results} == {
+            ("main", "function"),
+            ("Greeter", "class"),
+            ("greet", "method"),
+        }
+        assert all(r["rank"] == "A" for r in results)
+
+    def test_maintainability_index_counts_asserts(self, complexity_analyzer):
+        """Test the single-pass maintainability index matches radon's mi_visit."""
+        radon_metrics = pytest.importorskip("radon.metrics")
+        code = "def check(x):\n    assert x > 0\n    assert x < 10\n    return x\n"
+
+        expected = round(radon_metrics.mi_visit(code, multi=True), 2)
+
+        assert complexity_analyzer.calculate_maintainability_index(code) == expected
+
+    def test_code_without_asserts_is_visited_once(self, complexity_analyzer, simple_python_code):
+        """Test the maintainability index reuses the complexity block visit."""
+        radon_visitors = pytest.importorskip("radon.visitors")
+        from_ast = radon_visitors.ComplexityVisitor.from_ast
+
+        with patch.object(
+            radon_visitors.ComplexityVisitor, "from_ast", side_effect=from_ast
+        ) as visit:
+            result = complexity_analyzer.analyze_code_file(simple_python_code, "simple.py")
+
+        assert result["maintainability_index"] is not None
+        assert visit.call_count == 1
+
+
+class TestAnalyzeFiles:
+    """Tests for batch (parallel) file analysis."""
+
+    def test_parallel_matches_serial(self):
+        """Test pooled analysis returns the serial results in input order."""
+        pytest.importorskip("radon")
+        files = [
+            (
+                f"mod{i}.py",
+                "def f(x):\n" + "    if x:\n        x += 1\n" * (i % 7) + "    return x\n",
+            )
+            for i in range(80)
+        ]
+
+        serial = ComplexityAnalyzer(max_workers=1).analyze_files(files)
+        parallel = ComplexityAnalyzer(max_workers=2).analyze_files(files)
+
+        assert parallel == serial
+        assert [r["filename"] for r in parallel] == [name for name, _ in files]
+
+    def test_organization_results_split_per_repository(self):
+        """Test files analyzed in one batch are attributed to their repositories."""
+        pytest.importorskip("radon")
+        repos = [
+            Repository(
+                id=i,
+                name=f"repo{i}",
+                full_name=f"org/repo{i}",
+                metadata={"code_files": {f"r{i}_{j}.py": "x = 1\n" for j in range(i)}},
+            )
+            for i in range(4)
+        ]
+
+        analysis = ComplexityAnalyzer(max_workers=1).analyze_organization_complexity(repos)
+
+        files = {
+            r["repository"]: [f["filename"] for f in r["file_analyses"]]
+            for r in analysis["repository_analyses"]
+        }
+        assert files == {
+            "repo1": ["r1_0.py"],
+            "repo2": ["r2_0.py", "r2_1.py"],
+            "repo3": ["r3_0.py", "r3_1.py", "r3_2.py"],
+        }
+
+
+class TestResultCache:
+    """Tests for reusing cached per-file results."""
+
+    def test_only_changed_files_are_reanalyzed(self, temp_dir, monkeypatch):
+        """Test a second run analyzes only new content and returns identical results."""
+        pytest.importorskip("radon")
+        files = [(f"mod{i}.py", f"def f{i}(x):\n    return x + {i}\n") for i in range(5)]
+        with open_result_cache(temp_dir / "complexity.sqlite") as cache:
+            first = ComplexityAnalyzer(max_workers=1, cache=cache).analyze_files(files)
+
+            analyzed = []
+            analyzer = ComplexityAnalyzer(max_workers=1, cache=cache)
+            original = analyzer._analyze_texts
+            monkeypatch.setattr(
+                analyzer,
+                "_analyze_texts",
+                lambda texts: analyzed.extend(texts) or original(texts),
+            )
+            changed = files[:4] + [("mod4.py", "def g(x):\n    return -x\n")]
+            second = analyzer.analyze_files(changed)
+
+        assert [name for name, _ in analyzed] == ["mod4.py"]
+        assert second[:4] == first[:4]
+        assert second[4] == ComplexityAnalyzer().analyze_code_file(*reversed(changed[4]))
+
+    def test_identical_content_keeps_each_filename(self, temp_dir):
+        """Test files sharing content share one cache entry but keep their names."""
+        pytest.importorskip("radon")
+        code = "def f(x):\n    return x\n"
+        with open_result_cache(temp_dir / "complexity.sqlite") as cache:
+            results = ComplexityAnalyzer(max_workers=1, cache=cache).analyze_files(
+                [("a.py", code), ("b.py", code)]
+            )
+            assert len(cache) == 1
+
+        assert [r["filename"] for r in results] == ["a.py", "b.py"]
+
+    def test_cached_blobs_are_not_read(self, temp_dir):
+        """Test externalized source files are resolved only on a cache miss."""
+        pytest.importorskip("radon")
+        blobs = BlobStore(temp_dir / "blobs")
+        code = "def f(x):\n    return x\n" + "# padding\n" * 40
+        record = {
+            "name": "repo",
+            "full_name": "org/repo",
+            "metadata": {"code_files": {"main.py": blobs.ref(code)}},
+        }
+        with open_result_cache(temp_dir / "complexity.sqlite") as cache:
+            analyzer = ComplexityAnalyzer(max_workers=1, cache=cache)
+            first = analyzer.analyze_repository_complexity(Repository.from_dict(record, blobs))
+
+            for path in (temp_dir / "blobs").glob("??/*"):
+                path.unlink()
+            second = analyzer.analyze_repository_complexity(Repository.from_dict(record, blobs))
+
+        assert second["file_analyses"] == first["file_analyses"]
+        assert second["total_loc"] == first["total_loc"] > 40
+
+    def test_failed_analyses_are_not_cached(self, temp_dir):
+        """Test unresolved blobs and unparsable files are analyzed again next time."""
+        pytest.importorskip("radon")
+        files = [("missing.py", {"$blob": "0" * 64}, None), ("broken.py", "def f(:\n")]
+        with open_result_cache(temp_dir / "complexity.sqlite") as cache:
+            results = ComplexityAnalyzer(max_workers=1, cache=cache).analyze_files(files)
+
+            assert len(cache) == 0
+        assert [r["error"] for r in results] == ["unresolved blob reference", results[1]["error"]]
+        assert results[1]["error"]
+
+
+def test_analyze_all_complexity_resolves_blobs(temp_dir):
+    """Test externalized code files of repository records are read from the blob store."""
+    pytest.importorskip("radon")
+    blobs = BlobStore(temp_dir / "blobs")
+    code = "def f(x):\n    if x:\n        return 1\n    return 2\n" + "# padding\n" * 40
+    record = blobs.externalize(
+        {"name": "repo", "full_name": "org/repo", "metadata": {"code_files": {"main.py": code}}}
+    )
+
+    analysis = analyze_all_complexity(
+        [record], cache_path=temp_dir / "complexity.sqlite", blobs_dir=temp_dir / "blobs"
+    )
+
+    assert analysis["organization_metrics"]["total_loc"] > 40
+    assert analysis["organization_metrics"]["total_functions"] == 1
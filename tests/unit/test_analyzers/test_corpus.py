@@ -0,0 +1,173 @@
+"""Tests for the shared tokenized corpus."""
+
+import json
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfTransformer
+
+from research_platform.analyzers.corpus import (
+    Corpus,
+    build_corpus,
+    notebook_text,
+    tfidf,
+    tokenize,
+)
+from research_platform.models.repository import Repository
+from research_platform.storage.blobs import BlobStore
+
+README = "# Portfolio risk\n\nVolatility models for asset pricing. " * 20
+
+
+def make_repo(name, description, readme=README, **fields):
+    """Repository with a description and README."""
+    return Repository(
+        id=len(name),
+        name=name,
+        full_name=f"org/{name}",
+        description=description,
+        metadata={"readme": readme, **fields.pop("metadata", {})},
+        **fields,
+    )
+
+
+class TestTokenize:
+    """Tests for the shared tokenization rules."""
+
+    def test_normalizes_markdown(self):
+        """Test URLs, code, HTML and stop words are dropped and words lower-cased."""
+        text = "Using <b>Scikit-Learn</b> and `pip install` with Python3 https://x.org\n```\nx = 1\n```"
+
+        assert tokenize(text) == ["using", "scikit-learn", "python3"]
+
+    def test_short_and_empty(self):
+        """Test short tokens and empty text yield no terms."""
+        assert tokenize("an ML of AI") == []
+        assert tokenize("") == []
+
+    def test_notebook_text(self):
+        """Test notebook cells are extracted and other text is returned unchanged."""
+        notebook = json.dumps({"cells": [{"source": ["import torch\n", "x"]}, {"source": "plot"}]})
+
+        assert notebook_text(notebook) == "import torch\nx\nplot"
+        assert notebook_text("print('hi')") == "print('hi')"
+
+
+class TestCorpus:
+    """Tests for Corpus."""
+
+    def test_documents_of_a_repository(self, temp_dir):
+        """Test descriptions, READMEs, abstracts, publications and notebooks are documents."""
+        repo = make_repo(
+            "alpha",
+            "Portfolio optimization",
+            research_metadata={
+                "research": {"abstract": "Stochastic volatility"},
+                "publications": [{"title": "Deep hedging"}, {"doi": "10.1/x"}],
+            },
+            metadata={"notebooks": {"demo.ipynb": json.dumps({"cells": [{"source": "lstm"}]})}},
+        )
+        corpus = Corpus(temp_dir / "corpus.npz")
+
+        assert corpus.update([repo, make_repo("beta", None, readme="No README available")]) == 5
+
+        assert [doc["kind"] for doc in corpus.documents("alpha")] == [
+            "description",
+            "readme",
+            "abstract",
+            "publication",
+            "notebook",
+        ]
+        assert corpus.documents("beta") == []
+        assert corpus.tokens("alpha/notebook/demo.ipynb") == ["lstm"]
+        assert corpus.repository_tokens("alpha", ["description"]) == ["portfolio", "optimization"]
+
+    def test_only_changed_documents_are_tokenized(self, temp_dir):
+        """Test a saved corpus re-tokenizes only new or changed documents."""
+        repos = [make_repo("alpha", "Portfolio optimization"), make_repo("beta", "Neural nets")]
+        build_corpus(repos, temp_dir / "corpus.npz")
+
+        corpus = Corpus(temp_dir / "corpus.npz")
+        assert len(corpus) == 4
+        assert corpus.update(repos) == 0
+
+        repos[1] = make_repo("beta", "Neural networks")
+        assert corpus.update(repos + [make_repo("gamma", "Blockchain")]) == 3
+
+    def test_build_logs_summary(self, temp_dir, caplog):
+        """Test building reports its summary through logging, not stdout."""
+        with caplog.at_level("INFO", logger="research_platform.analyzers.corpus"):
+            build_corpus([make_repo("alpha", "Portfolio optimization")], temp_dir / "corpus.npz")
+
+        assert "Corpus: 2 documents (2 tokenized)" in caplog.text
+
+    def test_fingerprint_follows_document_text(self, temp_dir):
+        """Test a repository's fingerprint changes only with its documents."""
+        corpus = Corpus(temp_dir / "corpus.npz")
+        corpus.update([make_repo("alpha", "Portfolio optimization")])
+        before = corpus.fingerprint("alpha")
+
+        corpus.update([make_repo("alpha", "Portfolio optimization")])
+        assert corpus.fingerprint("alpha") == before
+
+        corpus.update([make_repo("alpha", "Portfolio construction")])
+        assert corpus.fingerprint("alpha") != before
+
+    def test_blob_readmes_are_not_read_when_unchanged(self, temp_dir):
+        """Test externalized READMEs are recognized by their digest."""
+        store = BlobStore(temp_dir / "blobs")
+        record = store.externalize({"name": "alpha", "full_name": "org/alpha", "readme": README})
+        corpus = Corpus(temp_dir / "corpus.npz")
+        corpus.update(Repository.from_dicts([record], store))
+        corpus.save()
+
+        for path in (temp_dir / "blobs").rglob("*"):
+            if path.is_file():
+                path.unlink()
+
+        assert Corpus(temp_dir / "corpus.npz").update(Repository.from_dicts([record], store)) == 0
+
+    def test_save_and_load(self, temp_dir):
+        """Test vocabulary, token streams and matrices survive a round trip."""
+        repos = [make_repo("alpha", "Portfolio optimization"), make_repo("beta", "Neural nets")]
+        corpus = build_corpus(repos, temp_dir / "corpus.npz")
+
+        loaded = Corpus(temp_dir / "corpus.npz")
+
+        assert loaded.terms == corpus.terms
+        assert loaded.documents() == corpus.documents()
+        assert loaded.tokens("beta/description") == ["neural", "nets"]
+        assert (loaded.counts() != corpus.counts()).nnz == 0
+        assert np.allclose(loaded.tfidf().toarray(), corpus.tfidf().toarray())
+
+    def test_counts_and_repository_counts(self, temp_dir):
+        """Test count matrices follow the token streams."""
+        corpus = Corpus(temp_dir / "corpus.npz")
+        corpus.update([make_repo("alpha", "risk risk model"), make_repo("beta", "risk")])
+        risk = corpus.terms.index("risk")
+
+        assert corpus.counts()[:, risk].toarray().ravel().tolist() == [2, 20, 1, 20]
+        names, counts = corpus.repository_counts(["description"])
+        assert names == ["alpha", "beta"]
+        assert counts[:, risk].toarray().ravel().tolist() == [2, 1]
+
+    def test_unused_terms_are_compacted(self, temp_dir):
+        """Test terms of removed documents are dropped once most terms are unused."""
+        corpus = Corpus(temp_dir / "corpus.npz")
+        corpus.update([make_repo("alpha", "portfolio optimization")])
+
+        corpus.update([make_repo("beta", "neural", readme="")])
+
+        assert corpus.terms == ["neural"]
+        assert corpus.tokens("beta/description") == ["neural"]
+
+
+def test_tfidf_matches_scikit_learn(temp_dir):
+    """Test TF-IDF weights equal scikit-learn's defaults."""
+    corpus = Corpus(temp_dir / "corpus.npz")
+    corpus.update([make_repo("alpha", "risk model"), make_repo("beta", "neural risk")])
+    counts = corpus.counts()
+
+    expected = TfidfTransformer().fit_transform(counts).toarray()
+
+    assert tfidf(counts).toarray() == pytest.approx(expected)
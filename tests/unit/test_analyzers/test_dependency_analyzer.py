@@ -4,8 +4,14 @@ import json
 
 import pytest
 
-from research_platform.analyzers.dependency_analyzer import DependencyAnalyzer
+from research_platform.analyzers.dependency_analyzer import (
+    DependencyAnalyzer,
+    incidence_matrix,
+    similarity_clusters,
+    top_overlaps,
+)
 from research_platform.models.repository import Repository
+from research_platform.storage.dependency_index import DependencyIndex
 
 
 @pytest.fixture
@@ -524,3 +530,156 @@ dependencies = [
         assert graph2.number_of_nodes() < node_count1
         assert "python-repo" not in graph2.nodes()
         assert "repo2" in graph2.nodes()
+
+
+class TestSparseOverlaps:
+    """Tests for the sparse overlap and clustering helpers."""
+
+    def test_overlaps_match_set_jaccard(self):
+        """Test shared counts and Jaccard similarity match set arithmetic."""
+        sets = [{"a", "b", "c"}, {"b", "c", "d"}, {"e"}, set(), {"a", "e"}]
+        incidence, packages = incidence_matrix(sets)
+
+        overlaps = top_overlaps(incidence, top_k=10, block_rows=2)
+
+        assert sorted(packages) == ["a", "b", "c", "d", "e"]
+        expected = {}
+        for i, first in enumerate(sets):
+            for j in range(i + 1, len(sets)):
+                shared = len(first & sets[j])
+                if shared:
+                    expected[(i, j)] = (shared, shared / len(first | sets[j]))
+        assert overlaps == pytest.approx(expected)
+
+    def test_top_k_per_repository(self):
+        """Test only the strongest overlaps of each repository are kept."""
+        hub = {f"p{i}" for i in range(10)}
+        sets = [hub] + [{f"p{j}" for j in range(i + 1)} for i in range(10)]
+        incidence, _ = incidence_matrix(sets)
+
+        overlaps = top_overlaps(incidence, top_k=2)
+
+        # The hub keeps its two most similar repositories; each other repo keeps
+        # the hub and its nearest neighbour
+        assert {(0, 10), (0, 9)} <= overlaps.keys()
+        assert all(sum(i in pair for pair in overlaps) <= 4 for i in range(11))
+        assert len(overlaps) < 11 * 10 // 2
+
+    def test_clusters_are_similarity_communities(self):
+        """Test repositories split into clusters of similar stacks."""
+        sets = [
+            {"numpy", "pandas", "scipy"},
+            {"numpy", "pandas", "scikit-learn"},
+            {"numpy", "pandas", "scipy", "statsmodels"},
+            {"react", "axios"},
+            {"react", "axios", "redux"},
+            {"flask"},
+        ]
+        names = ["ml1", "ml2", "ml3", "web1", "web2", "api"]
+        incidence, _ = incidence_matrix(sets)
+
+        clusters = similarity_clusters(names, top_overlaps(incidence))
+
+        assert clusters == [["ml1", "ml2", "ml3"], ["web1", "web2"]]
+
+    def test_overlap_report_includes_jaccard(self, dependency_analyzer):
+        """Test reported overlaps carry the Jaccard similarity."""
+        repos = [
+            Repository(
+                id=i,
+                name=f"repo{i}",
+                full_name=f"org/repo{i}",
+                metadata={"requirements_txt": deps},
+            )
+            for i, deps in enumerate(["numpy\npandas\n", "numpy\nscipy\n"])
+        ]
+
+        analysis = dependency_analyzer.analyze_dependency_patterns(repos)
+
+        assert analysis["dependency_overlap"]["repo0-repo1"]["jaccard"] == pytest.approx(
+            1 / 3, 1e-3
+        )
+
+
+class TestDependencyIndexing:
+    """Tests for maintaining the reverse-dependency index."""
+
+    def _repo(self, name, requirements):
+        return Repository(
+            id=hash(name) % 1000,
+            name=name,
+            full_name=f"org/{name}",
+            metadata={"requirements_txt": requirements},
+        )
+
+    def test_update_is_incremental(self, dependency_analyzer, temp_dir):
+        """Test only repositories with changed manifests are re-indexed."""
+        repos = [self._repo("a", "numpy>=1.24\n"), self._repo("b", "numpy==1.26\npandas\n")]
+        with DependencyIndex(temp_dir / "deps.db") as index:
+            assert dependency_analyzer.update_dependency_index(repos, index) == 2
+            assert dependency_analyzer.update_dependency_index(repos, index) == 0
+
+            repos[0] = self._repo("a", "numpy>=1.24\nscipy\n")
+            assert dependency_analyzer.update_dependency_index(repos, index) == 1
+            assert [d["repo"] for d in index.dependents("scipy")] == ["a"]
+            assert set(index.version_drift()["numpy"]) == {">=1.24", "==1.26"}
+
+            assert dependency_analyzer.update_dependency_index(repos[:1], index) == 0
+            assert index.repos() == ["a"]
+
+    def test_package_names_are_normalized(self, dependency_analyzer, temp_dir):
+        """Test spellings of one PyPI package are indexed as the same package."""
+        repos = [self._repo("a", "scikit_learn>=1.3\n"), self._repo("b", "Scikit-Learn\n")]
+        with DependencyIndex(temp_dir / "deps.db") as index:
+            dependency_analyzer.update_dependency_index(repos, index)
+
+            assert index.package_usage() == [("scikit-learn", 2)]
+
+    def test_summary_matches_full_analysis(self, dependency_analyzer, temp_dir):
+        """Test usage statistics read from the index match a full recomputation."""
+        repos = [
+            self._repo("a", "numpy\npandas\n"),
+            self._repo("b", "numpy\nscipy\n"),
+            self._repo("c", "flask\n"),
+        ]
+        expected = DependencyAnalyzer().analyze_dependency_patterns(repos)
+        with DependencyIndex(temp_dir / "deps.db") as index:
+            dependency_analyzer.update_dependency_index(repos, index)
+            summary = dependency_analyzer.summarize_dependency_index(repos, index)
+
+        for key in ("total_unique_packages", "total_dependencies", "shared_dependencies"):
+            assert summary[key] == expected[key]
+        assert dict(summary["most_common_packages"]) == dict(expected["most_common_packages"])
+        assert summary["network_stats"] == expected["network_stats"]
+
+    def test_lock_file_pins_are_not_dependencies(self, dependency_analyzer, temp_dir):
+        """Test packages pinned only by poetry.lock count neither as usage nor as overlap."""
+        lock = '[[package]]\nname = "numpy"\nversion = "1.26.0"\n\n'
+        lock += '[[package]]\nname = "six"\nversion = "1.16.0"\n'
+        repos = [
+            Repository(
+                id=1,
+                name="a",
+                full_name="org/a",
+                metadata={"requirements_txt": "numpy\n", "poetry_lock": lock},
+            ),
+            Repository(
+                id=2,
+                name="b",
+                full_name="org/b",
+                metadata={"requirements_txt": "flask\n", "poetry_lock": lock},
+            ),
+        ]
+        expected = DependencyAnalyzer().analyze_dependency_patterns(repos)
+        with DependencyIndex(temp_dir / "deps.db") as index:
+            dependency_analyzer.update_dependency_index(repos, index)
+            summary = dependency_analyzer.summarize_dependency_index(repos, index)
+
+            assert [d["repo"] for d in index.dependents("six")] == ["a", "b"]
+
+        assert expected["total_dependencies"] == 2
+        assert expected["shared_dependencies"] == {}
+        assert expected["dependency_overlap"] == {}
+        for key in ("total_unique_packages", "total_dependencies", "shared_dependencies"):
+            assert summary[key] == expected[key]
+        assert summary["network_stats"] == expected["network_stats"]
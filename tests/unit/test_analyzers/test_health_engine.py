@@ -0,0 +1,149 @@
+"""Tests for the vectorized health scoring engine."""
+
+import math
+from datetime import datetime, timezone
+
+import pytest
+
+from research_platform.analyzers.health_engine import HealthInputs, HealthScoringEngine
+from research_platform.models.repository import Repository
+
+NOW = datetime(2024, 6, 1, 12, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def engine():
+    """Create an engine with a fixed reference time."""
+    return HealthScoringEngine(now=NOW)
+
+
+@pytest.fixture
+def repositories():
+    """Repositories covering the score branches."""
+    return [
+        Repository(
+            id=1,
+            name="active",
+            full_name="org/active",
+            description="A well documented research repository",
+            homepage="https://example.org",
+            stars=120,
+            forks=25,
+            open_issues=4,
+            contributors_count=12,
+            updated_at=datetime(2024, 5, 20),
+            topics=["finance", "ml", "stats"],
+        ),
+        Repository(id=2, name="stale", full_name="org/stale", archived=True, has_wiki=False),
+    ]
+
+
+class TestHealthScoringEngine:
+    """Tests for HealthScoringEngine."""
+
+    def test_summary_scores_follow_formula(self, engine, repositories):
+        """Test the 0-1 summary score of an active repository."""
+        scores = engine.summary_scores(HealthInputs.from_repositories(repositories))
+
+        expected = (
+            0.2 * min(math.log10(121) / 4, 1.0)
+            + 0.15 * min(math.log10(26) / 3, 1.0)
+            + 0.2 * min(12 / 20, 1.0)
+            + 0.2 * (1 - 12 / 365)
+            + 0.15 * 0.5
+            + 0.15 * 0.5
+            + 0.1 * max(0, 1 - 4 / 121)
+        )
+        assert scores[0] == pytest.approx(expected)
+        # Missing update time counts as updated today
+        assert scores[1] == pytest.approx(0.2)
+
+    def test_category_report(self, engine, repositories):
+        """Test the category breakdown and grades."""
+        report = engine.category_report(HealthInputs.from_repositories(repositories))
+
+        assert report[0]["scores"]["activity"] == 25.0
+        assert report[0]["scores"]["documentation"] == 24.5
+        assert report[0]["grade"] == "A"
+        assert report[1]["scores"] == {
+            "activity": 25.0,
+            "community": 0.0,
+            "documentation": 0.0,
+            "code_quality": 10.0,
+        }
+        assert report[1]["overall"] == 35.0
+        assert report[1]["grade"] == "F"
+
+    def test_single_reference_time(self, repositories):
+        """Test activity depends on the engine's reference time."""
+        later = HealthScoringEngine(now=datetime(2025, 1, 1, tzinfo=timezone.utc))
+        inputs = HealthInputs.from_repositories(repositories[:1])
+
+        assert later.category_scores(inputs)["activity"][0] == 10.0
+
+    def test_matches_repository_methods(self, repositories):
+        """Test Repository methods delegate to the engine."""
+        engine = HealthScoringEngine()
+        inputs = HealthInputs.from_repositories(repositories)
+
+        assert repositories[0].get_health_score() == engine.summary_scores(inputs)[0]
+        assert repositories[0].calculate_health_score() == engine.category_report(inputs)[0]
+
+    def test_custom_weights(self, repositories):
+        """Test summary weights are configurable."""
+        weights = dict.fromkeys(
+            ["stars", "forks", "contributors", "recent_update", "documentation", "issues_ratio"],
+            0.0,
+        )
+        weights["contributors"] = 1.0
+        engine = HealthScoringEngine(summary_weights=weights, now=NOW)
+
+        scores = engine.summary_scores(HealthInputs.from_repositories(repositories))
+
+        assert scores.tolist() == [0.6, 0.0]
+
+    def test_dimension_scores(self, engine):
+        """Test the build report dimensions for raw records."""
+        record = {
+            "name": "repo",
+            "description": "Short",
+            "pushed_at": "2024-05-30T00:00:00Z",
+            "stars": 10,
+            "forks": 0,
+            "contributors_count": 3,
+            "topics": ["a"],
+            "license": "No License",
+            "language": "Python",
+            "default_branch": "main",
+        }
+        scores = engine.dimension_scores(HealthInputs.from_records([record]))
+
+        assert scores["days_since_push"][0] == 2
+        assert scores["activity"][0] == 100
+        assert scores["community"][0] == 50.0
+        assert scores["documentation"][0] == 45
+        assert scores["code_quality"][0] == 70
+        assert scores["popularity"][0] == pytest.approx(28.0)
+        assert scores["maintenance"][0] == 100
+        assert scores["overall"][0] == pytest.approx(67.3)
+        assert engine.dimension_grades(scores["overall"]) == (["C"], ["Fair"])
+
+    def test_unreadable_repositories_are_reported(self, engine):
+        """Test rows that cannot be read are passed to on_error and skipped."""
+        bad = Repository(id=1, name="bad", full_name="org/bad", stars="many")
+        good = Repository(id=2, name="good", full_name="org/good")
+        errors = []
+
+        scores = engine.score_repositories(
+            [bad, good], on_error=lambda repo, e: errors.append(repo.name)
+        )
+
+        assert list(scores) == ["good"]
+        assert errors == ["bad"]
+
+    def test_empty_input(self, engine):
+        """Test scoring no repositories."""
+        inputs = HealthInputs.from_records([])
+
+        assert len(engine.summary_scores(inputs)) == 0
+        assert engine.category_report(inputs) == []
@@ -287,3 +287,43 @@ class TestImpactMetricsAnalyzer:
         assert org_metrics["total_citations"] == 0
         assert org_metrics["organization_h_index"] == 0
         assert org_metrics["average_citations_per_publication"] == 0.0
+
+    def test_yearly_windows_and_extra_indices(self, impact_analyzer):
+        """Test per-year windows and g/i10 indices at repository and organization level."""
+        repos = [
+            Repository(
+                id=1,
+                name="a",
+                full_name="org/a",
+                research_metadata={
+                    "publications": [
+                        {"citations": 30, "year": 2020},
+                        {"citations": 12, "year": 2021},
+                        {"citations": 2, "year": 2021},
+                    ]
+                },
+            ),
+            Repository(
+                id=2,
+                name="b",
+                full_name="org/b",
+                research_metadata={"publications": [{"citations": 4, "year": "2021"}]},
+            ),
+        ]
+
+        result = impact_analyzer.analyze_organization_impact(repos)
+
+        impact = result["repository_impacts"][0]
+        assert impact["g_index"] == 3
+        assert impact["i10_index"] == 2
+        assert impact["by_year"][2021] == {
+            "publications": 2,
+            "total_citations": 14,
+            "h_index": 2,
+            "i10_index": 1,
+        }
+        org = result["organization_metrics"]
+        assert org["organization_g_index"] == 4
+        assert org["median_citations"] == 8.0
+        assert org["by_year"][2021]["publications"] == 3
+        assert org["by_year"][2021]["h_index"] == 2
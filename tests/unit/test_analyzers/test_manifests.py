@@ -0,0 +1,206 @@
+"""Tests for dependency manifest parsing."""
+
+from research_platform.analyzers.manifests import (
+    Dependency,
+    ManifestExtractor,
+    open_manifest_cache,
+    parse_description,
+    parse_environment_yml,
+    parse_pipfile,
+    parse_poetry_lock,
+    parse_requirement,
+    parse_requirements_txt,
+    parse_setup_cfg,
+)
+from research_platform.models.repository import Repository
+from research_platform.storage.blobs import BlobStore
+
+
+class TestParsers:
+    """Tests for the manifest parsers."""
+
+    def test_parse_requirement(self):
+        """Test names are lower-cased and extras, specifiers and markers split off."""
+        dep = parse_requirement('Pandas[Excel, performance] >=2.0,<3 ; python_version >= "3.9"')
+
+        assert dep == Dependency("pandas", ">=2.0,<3", ("excel", "performance"))
+        assert parse_requirement("numpy") == Dependency("numpy")
+
+    def test_parse_requirements_txt(self):
+        """Test options, editables and comments are skipped."""
+        content = "-r base.txt\n-e .\n# comment\nscipy==1.11  # pinned\nrequests\n"
+
+        assert parse_requirements_txt(content) == [
+            Dependency("scipy", "==1.11"),
+            Dependency("requests"),
+        ]
+
+    def test_parse_environment_yml(self):
+        """Test conda specs (with channels) and nested pip requirements."""
+        content = """
+name: research
+channels: [conda-forge]
+dependencies:
+  - python=3.11
+  - conda-forge::numpy>=1.24
+  - pandas=2.0
+  - pip
+  - pip:
+      - torch==2.1
+"""
+        assert parse_environment_yml(content) == [
+            Dependency("numpy", ">=1.24"),
+            Dependency("pandas", "=2.0"),
+            Dependency("pip"),
+            Dependency("torch", "==2.1"),
+        ]
+
+    def test_parse_setup_cfg(self):
+        """Test install_requires of the options section."""
+        content = """
+[metadata]
+name = example
+
+[options]
+install_requires =
+    numpy>=1.24
+    requests[socks]
+"""
+        assert parse_setup_cfg(content) == [
+            Dependency("numpy", ">=1.24"),
+            Dependency("requests", "", ("socks",)),
+        ]
+
+    def test_parse_pipfile(self):
+        """Test regular and dev packages with string and table constraints."""
+        content = """
+[packages]
+requests = "*"
+django = {version = ">=4.0", extras = ["bcrypt"]}
+
+[dev-packages]
+pytest = "==7.4"
+
+[requires]
+python_version = "3.11"
+"""
+        assert parse_pipfile(content) == [
+            Dependency("requests"),
+            Dependency("django", ">=4.0", ("bcrypt",)),
+            Dependency("pytest", "==7.4"),
+        ]
+
+    def test_parse_poetry_lock(self):
+        """Test locked packages become exact pins."""
+        content = """
+[[package]]
+name = "NumPy"
+version = "1.26.0"
+
+[[package]]
+name = "pandas"
+version = "2.1.1"
+"""
+        assert parse_poetry_lock(content) == [
+            Dependency("numpy", "==1.26.0"),
+            Dependency("pandas", "==2.1.1"),
+        ]
+
+    def test_parse_description(self):
+        """Test R dependencies across continuation lines, skipping R itself."""
+        content = """Package: example
+Depends: R (>= 4.0), stats
+Imports:
+    dplyr (>= 1.0.0),
+    ggplot2
+LinkingTo: Rcpp
+"""
+        assert parse_description(content) == [
+            Dependency("stats"),
+            Dependency("dplyr", ">=1.0.0"),
+            Dependency("ggplot2"),
+            Dependency("Rcpp"),
+        ]
+
+
+class TestManifestExtractor:
+    """Tests for ManifestExtractor."""
+
+    def test_parses_each_content_once(self, monkeypatch):
+        """Test identical manifests are parsed a single time."""
+        calls = []
+        extractor = ManifestExtractor()
+        original = extractor._load
+        monkeypatch.setattr(
+            extractor, "_load", lambda *args: calls.append(args[0]) or original(*args)
+        )
+
+        for _ in range(3):
+            extractor.parse("requirements_txt", "numpy\n")
+        extractor.parse("setup_cfg", "numpy\n")
+
+        assert calls == ["requirements_txt", "setup_cfg"]
+
+    def test_invalid_manifest_is_empty(self):
+        """Test a manifest that fails to parse yields no dependencies."""
+        assert ManifestExtractor().parse("pipfile", "not [valid toml") == ()
+
+    def test_extract_all_kinds(self):
+        """Test every manifest of a repository is parsed into its kind."""
+        repo = Repository(
+            id=1,
+            name="repo",
+            full_name="org/repo",
+            metadata={
+                "requirements_txt": "numpy\n",
+                "description_file": "Package: x\nImports: dplyr\n",
+            },
+        )
+
+        manifests = ManifestExtractor().extract(repo)
+
+        assert manifests["requirements"] == [Dependency("numpy")]
+        assert manifests["description"] == [Dependency("dplyr")]
+        assert manifests["pipfile"] == []
+
+    def test_persistent_cache_skips_blob_reads(self, temp_dir):
+        """Test a manifest cached on disk is not read from the blob store again."""
+        blobs = BlobStore(temp_dir / "blobs")
+        requirements = "".join(f"package-{i}>=1.{i}\n" for i in range(40))
+        record = {
+            "name": "repo",
+            "full_name": "org/repo",
+            "metadata": {"requirements_txt": blobs.ref(requirements)},
+        }
+        with open_manifest_cache(temp_dir / "manifests.sqlite") as cache:
+            first = ManifestExtractor(cache=cache).extract(Repository.from_dict(record, blobs))
+
+            for path in (temp_dir / "blobs").glob("??/*"):
+                path.unlink()
+            second = ManifestExtractor(cache=cache).extract(Repository.from_dict(record, blobs))
+
+        assert second == first
+        assert second["requirements"][5] == Dependency("package-5", ">=1.5")
+
+    def test_missing_blob_is_not_cached(self, temp_dir):
+        """Test a manifest whose blob is missing is parsed once the blob is restored."""
+        requirements = "numpy>=1.24\n"
+        record = {
+            "name": "repo",
+            "full_name": "org/repo",
+            "metadata": {"requirements_txt": BlobStore(temp_dir / "blobs").ref(requirements)},
+        }
+        for path in (temp_dir / "blobs").glob("??/*"):
+            path.unlink()
+        blobs = BlobStore(temp_dir / "blobs")
+
+        with open_manifest_cache(temp_dir / "manifests.sqlite") as cache:
+            extractor = ManifestExtractor(cache=cache)
+            assert extractor.extract(Repository.from_dict(record, blobs))["requirements"] == []
+
+            BlobStore(temp_dir / "blobs").ref(requirements)
+            restored = extractor.extract(Repository.from_dict(record, blobs))
+            reopened = ManifestExtractor(cache=cache).extract(Repository.from_dict(record, blobs))
+
+        assert restored["requirements"] == [Dependency("numpy", ">=1.24")]
+        assert reopened == restored
@@ -0,0 +1,147 @@
+"""Tests for the related-repositories kNN index."""
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+from research_platform.analyzers.corpus import Corpus
+from research_platform.analyzers.related import (
+    RelatedIndex,
+    normalize_rows,
+    similarity_blocks,
+    top_k,
+)
+from research_platform.models.repository import Repository
+
+# Weights that leave IDF out, so incremental and full results must agree exactly
+NO_TEXT = {"text": 0.0, "topics": 0.5, "dependencies": 0.5}
+
+
+def make_repo(name, description="", topics=(), packages=()):
+    """Repository with a description, topics and declared packages."""
+    return Repository(
+        id=len(name),
+        name=name,
+        full_name=f"org/{name}",
+        description=description,
+        topics=list(topics),
+        metadata={"packages": list(packages)},
+    )
+
+
+def packages(repo):
+    """Packages a test repository declares."""
+    return repo.metadata["packages"]
+
+
+def random_repos(count, seed=0):
+    """Repositories with random topics and packages."""
+    rng = np.random.default_rng(seed)
+    return [
+        make_repo(
+            f"repo{i}",
+            topics=[f"topic{t}" for t in rng.choice(20, size=3, replace=False)],
+            packages=[f"pkg{p}" for p in rng.choice(40, size=4, replace=False)],
+        )
+        for i in range(count)
+    ]
+
+
+def build(repos, path, **kwargs):
+    """Update an index at path with repositories and save it."""
+    corpus = Corpus(path.parent / "corpus.npz")
+    corpus.update(repos)
+    index = RelatedIndex(path, **kwargs)
+    stats = index.update(repos, corpus, packages)
+    index.save()
+    return index, stats
+
+
+class TestBlockedSimilarity:
+    """Tests for the blocked sparse products and top-k selection."""
+
+    def test_blocks_match_the_full_product(self):
+        """Test small blocks give the full similarity matrix without the diagonal."""
+        features = normalize_rows(sparse.random(30, 12, density=0.3, random_state=0))
+        expected = (features @ features.T).toarray()
+        np.fill_diagonal(expected, 0)
+
+        rows = np.vstack([block for _, block in similarity_blocks(features, block_elements=60)])
+
+        assert rows == pytest.approx(expected)
+
+    def test_top_k(self):
+        """Test the largest similarities come first and k is capped at the row length."""
+        similarities = np.array([[0.1, 0.9, 0.5, 0.0], [0.3, 0.2, 0.8, 0.4]])
+
+        indices, scores = top_k(similarities, 2)
+
+        assert indices.tolist() == [[1, 2], [2, 3]]
+        assert scores.tolist() == [[0.9, 0.5], [0.8, 0.4]]
+        assert top_k(similarities, 10)[0].shape == (2, 4)
+
+
+class TestRelatedIndex:
+    """Tests for RelatedIndex."""
+
+    def test_similar_repositories_are_neighbors(self, temp_dir):
+        """Test shared text, topics and packages make repositories related."""
+        repos = [
+            make_repo("pricing", "Option pricing with Monte Carlo", ["finance"], ["numpy"]),
+            make_repo("options", "Monte Carlo option pricing models", ["finance"], ["numpy"]),
+            make_repo("vision", "Image segmentation networks", ["cv"], ["torch"]),
+        ]
+
+        index, stats = build(repos, temp_dir / "related.npz")
+
+        assert stats["refit"]
+        assert [n["repo"] for n in index.related("pricing")] == ["options"]
+        assert index.related("pricing")[0]["score"] > 0.5
+        assert index.related("vision") == []
+
+    def test_unchanged_repositories_are_not_recomputed(self, temp_dir):
+        """Test a persisted index leaves neighbor lists of unchanged repositories alone."""
+        repos = random_repos(50)
+        first, _ = build(repos, temp_dir / "related.npz")
+
+        index, stats = build(repos, temp_dir / "related.npz")
+
+        assert stats == {"refit": False, "recomputed": 0, "merged": 0, "removed": 0}
+        assert index.neighbors == first.neighbors
+
+    def test_incremental_update_matches_full_build(self, temp_dir):
+        """Test changed, added and removed repositories give the neighbors of a rebuild."""
+        repos = random_repos(60)
+        build(repos, temp_dir / "related.npz", weights=NO_TEXT)
+
+        changed = random_repos(60, seed=1)
+        repos = [changed[i] if i % 10 == 0 else repo for i, repo in enumerate(repos)]
+        repos = repos[:-2] + [changed[58], changed[59]]
+        repos[-2].name, repos[-1].name = "new0", "new1"
+        index, stats = build(repos, temp_dir / "related.npz", weights=NO_TEXT)
+        full, _ = build(repos, temp_dir / "full.npz", weights=NO_TEXT)
+
+        assert not stats["refit"]
+        assert stats["removed"] == 2
+        assert stats["recomputed"] < len(repos)
+        for name in full.neighbors:
+            assert [s for _, s in index.neighbors[name]] == pytest.approx(
+                [s for _, s in full.neighbors[name]]
+            )
+        assert "repo59" not in {other for n in index.neighbors.values() for other, _ in n}
+
+    def test_large_changes_refit(self, temp_dir):
+        """Test IDF weights are refitted once most repositories changed."""
+        build(random_repos(20), temp_dir / "related.npz")
+
+        _, stats = build(random_repos(20, seed=1), temp_dir / "related.npz")
+
+        assert stats["refit"]
+
+    def test_other_settings_start_over(self, temp_dir):
+        """Test an index saved with another k is not reused."""
+        build(random_repos(20), temp_dir / "related.npz")
+
+        index = RelatedIndex(temp_dir / "related.npz", k=3)
+
+        assert len(index) == 0
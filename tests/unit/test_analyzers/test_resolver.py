@@ -0,0 +1,111 @@
+"""Tests for offline transitive dependency resolution."""
+
+import pytest
+
+from research_platform.analyzers.dependency_analyzer import DependencyAnalyzer
+from research_platform.analyzers.resolver import DependencyResolver
+from research_platform.models.repository import Repository
+from research_platform.storage.package_index import PackageIndex
+
+
+@pytest.fixture
+def index(temp_dir):
+    """Package index with a small PyPI dependency tree and a cycle."""
+    with PackageIndex(temp_dir / "index.db") as index:
+        index.add(
+            "pypi",
+            {
+                "pandas": ["numpy", "python-dateutil", "pytz"],
+                "python-dateutil": ["six"],
+                "numpy": [],
+                "six": [],
+                "pytz": [],
+                "cycle-a": ["cycle-b"],
+                "cycle-b": ["cycle-a", "six"],
+            },
+        )
+        yield index
+
+
+class TestDependencyResolver:
+    """Tests for DependencyResolver."""
+
+    def test_closure(self, index):
+        """Test transitive requirements are collected through every level."""
+        resolver = DependencyResolver(index)
+
+        assert resolver.closure("pypi", "pandas") == {"numpy", "python-dateutil", "pytz", "six"}
+        assert resolver.closure("pypi", "Python_Dateutil") == {"six"}
+        assert resolver.closure("pypi", "unknown") == frozenset()
+
+    def test_cycles_share_a_closure(self, index):
+        """Test packages in a dependency cycle reach each other and themselves."""
+        resolver = DependencyResolver(index)
+
+        assert resolver.closure("pypi", "cycle-a") == {"cycle-a", "cycle-b", "six"}
+        assert resolver.closure("pypi", "cycle-b") == resolver.closure("pypi", "cycle-a")
+
+    def test_lookups_are_memoized(self, index, monkeypatch):
+        """Test each package is looked up in the index at most once."""
+        resolver = DependencyResolver(index)
+        looked_up = []
+        original = index.requirements
+        monkeypatch.setattr(
+            index,
+            "requirements",
+            lambda eco, names: looked_up.extend(names) or original(eco, names),
+        )
+
+        resolver.resolve("pypi", ["pandas", "python-dateutil"])
+        resolver.resolve("pypi", ["pandas", "six"])
+
+        assert sorted(looked_up) == ["numpy", "pandas", "python-dateutil", "pytz", "six"]
+
+    def test_graph_enrichment(self, index):
+        """Test the dependency graph gains package -> requirement edges."""
+        repo = Repository(
+            id=1, name="repo", full_name="org/repo", metadata={"requirements_txt": "pandas\n"}
+        )
+        analyzer = DependencyAnalyzer(resolver=DependencyResolver(index))
+
+        analysis = analyzer.analyze_dependency_patterns([repo])
+
+        assert analyzer.graph.has_edge("repo", "pandas")
+        assert analyzer.graph.has_edge("pandas", "python-dateutil")
+        assert analyzer.graph.has_edge("python-dateutil", "six")
+        assert analyzer.graph.nodes["six"]["transitive"] is True
+        assert analysis["transitive_dependencies"] == {"repo": {"direct": 1, "total": 5}}
+
+    def test_mixed_spellings_are_one_node(self, temp_dir):
+        """Test manifest spellings and registry names of a package share one graph node."""
+        with PackageIndex(temp_dir / "spellings.db") as index:
+            index.add(
+                "pypi",
+                {"scikit-learn": ["numpy", "scipy"], "seaborn": ["scikit_learn"]},
+            )
+            repos = [
+                Repository(
+                    id=1,
+                    name="a",
+                    full_name="org/a",
+                    metadata={"requirements_txt": "Scikit_Learn\n"},
+                ),
+                Repository(
+                    id=2,
+                    name="b",
+                    full_name="org/b",
+                    metadata={"requirements_txt": "scikit-learn\nseaborn\n"},
+                ),
+            ]
+            analyzer = DependencyAnalyzer(resolver=DependencyResolver(index))
+
+            analysis = analyzer.analyze_dependency_patterns(repos)
+
+        packages = {
+            n for n, data in analyzer.graph.nodes(data=True) if data["node_type"] == "package"
+        }
+        assert packages == {"scikit-learn", "seaborn", "numpy", "scipy"}
+        assert analyzer.graph.has_edge("a", "scikit-learn")
+        assert analyzer.graph.has_edge("scikit-learn", "numpy")
+        assert analysis["shared_dependencies"] == {"scikit-learn": 2}
+        assert analysis["dependency_overlap"]["a-b"]["shared_packages"] == ["scikit-learn"]
@@ -0,0 +1,166 @@
+"""Tests for MinHash signatures and the LSH similarity index."""
+
+import pytest
+
+from research_platform.analyzers.dependency_analyzer import DependencyAnalyzer
+from research_platform.analyzers.similarity import (
+    LSHIndex,
+    MinHasher,
+    SimilarityIndex,
+    estimate_jaccard,
+    shingles,
+)
+from research_platform.models.repository import Repository
+from research_platform.storage.blobs import BlobStore
+
+README = " ".join(f"word{i}" for i in range(200))
+
+
+def make_repo(name, requirements, readme=README):
+    """Repository with a requirements file and README."""
+    return Repository(
+        id=len(name),
+        name=name,
+        full_name=f"org/{name}",
+        metadata={"requirements_txt": requirements, "readme": readme},
+    )
+
+
+class TestMinHasher:
+    """Tests for MinHasher."""
+
+    def test_estimates_jaccard(self):
+        """Test signature agreement approximates the Jaccard similarity."""
+        hasher = MinHasher(num_perm=256)
+        first = {f"token{i}" for i in range(1000)}
+        second = {f"token{i}" for i in range(500, 1500)}
+
+        similarity = estimate_jaccard(hasher.signature(first), hasher.signature(second))
+
+        assert similarity == pytest.approx(1 / 3, abs=0.1)
+        assert estimate_jaccard(hasher.signature(first), hasher.signature(first)) == 1.0
+
+    def test_signatures_are_stable(self):
+        """Test the same seed gives the same signature in a new hasher."""
+        tokens = {"numpy", "pandas"}
+
+        assert (MinHasher().signature(tokens) == MinHasher().signature(tokens)).all()
+
+    def test_shingles(self):
+        """Test word shingles are lower-cased and overlapping."""
+        assert shingles("A b C d", size=2) == {"a b", "b c", "c d"}
+        assert shingles("short", size=5) == {"short"}
+        assert shingles("", size=5) == set()
+
+
+class TestLSHIndex:
+    """Tests for LSHIndex."""
+
+    def test_candidates_and_removal(self):
+        """Test similar signatures collide and removed keys disappear."""
+        hasher = MinHasher()
+        index = LSHIndex()
+        base = {f"t{i}" for i in range(100)}
+        index.insert("same", hasher.signature(base))
+        index.insert("other", hasher.signature({f"u{i}" for i in range(100)}))
+
+        assert index.candidates(hasher.signature(base | {"extra"})) == {"same"}
+        index.remove("same")
+        assert "same" not in index
+        assert index.candidates(hasher.signature(base)) == set()
+
+    def test_bands_must_divide_permutations(self):
+        """Test an uneven band split is rejected."""
+        with pytest.raises(ValueError):
+            LSHIndex(num_perm=100, bands=32)
+
+
+class TestSimilarityIndex:
+    """Tests for SimilarityIndex."""
+
+    def test_similar_stacks_and_near_duplicates(self, temp_dir):
+        """Test similar dependency sets and copied content are found."""
+        ml = "numpy\npandas\nscipy\nscikit-learn\nmatplotlib\n"
+        repos = [
+            make_repo("ml", ml),
+            make_repo("ml-fork", ml + "seaborn\n", README + " one more line"),
+            make_repo("web", "flask\njinja2\n", "a web application"),
+        ]
+        index = SimilarityIndex(temp_dir / "signatures.npz")
+
+        result = DependencyAnalyzer().find_similar_repositories(repos, index)
+
+        assert [m["repository"] for m in result["similar_stacks"]["ml"]] == ["ml-fork"]
+        assert "web" not in result["similar_stacks"]
+        assert [d["repositories"] for d in result["near_duplicates"]] == [["ml", "ml-fork"]]
+
+    def test_empty_sets_match_nothing(self, temp_dir):
+        """Test repositories without dependencies or content are similar to nothing."""
+        repos = [make_repo(name, "", "") for name in ("a", "b", "c")]
+        index = SimilarityIndex(temp_dir / "signatures.npz")
+
+        result = DependencyAnalyzer().find_similar_repositories(repos, index)
+
+        assert result["similar_stacks"] == {}
+        assert result["near_duplicates"] == []
+        assert index.similar("dependencies", "a") == []
+        assert index.similar_pairs("content", threshold=0.0) == []
+        assert index.query("dependencies", []) == []
+
+        index.save()
+        reloaded = SimilarityIndex(temp_dir / "signatures.npz")
+        assert reloaded.update_repositories(repos, DependencyAnalyzer()._all_dependencies) == 0
+
+    def test_only_changed_repositories_are_rehashed(self, temp_dir):
+        """Test saved signatures are reused until a repository changes."""
+        repos = [make_repo("a", "numpy\n"), make_repo("b", "flask\n")]
+        analyzer = DependencyAnalyzer()
+        index = SimilarityIndex(temp_dir / "signatures.npz")
+        assert index.update_repositories(repos, analyzer._all_dependencies) == 4
+        index.save()
+
+        reloaded = SimilarityIndex(temp_dir / "signatures.npz")
+        repos[1] = make_repo("b", "flask\nrequests\n")
+
+        assert reloaded.update_repositories(repos, analyzer._all_dependencies) == 1
+        assert (reloaded.signatures["content"]["a"] == index.signatures["content"]["a"]).all()
+
+    def test_vanished_repositories_are_dropped(self, temp_dir):
+        """Test repositories no longer present leave the index."""
+        analyzer = DependencyAnalyzer()
+        index = SimilarityIndex(temp_dir / "signatures.npz")
+        index.update_repositories([make_repo("a", "numpy\n")], analyzer._all_dependencies)
+
+        index.update_repositories([make_repo("b", "numpy\n")], analyzer._all_dependencies)
+
+        assert list(index.signatures["dependencies"]) == ["b"]
+        assert "a" not in index.lsh["content"]
+
+    def test_blob_content_is_read_only_when_changed(self, temp_dir):
+        """Test externalized README text is not loaded for unchanged repositories."""
+        blobs = BlobStore(temp_dir / "blobs")
+        record = {
+            "name": "repo",
+            "full_name": "org/repo",
+            "metadata": {"readme": blobs.ref(README)},
+        }
+        analyzer = DependencyAnalyzer()
+        index = SimilarityIndex(temp_dir / "signatures.npz")
+        index.update_repositories([Repository.from_dict(record, blobs)], analyzer._all_dependencies)
+
+        for path in (temp_dir / "blobs").glob("??/*"):
+            path.unlink()
+
+        assert (
+            index.update_repositories(
+                [Repository.from_dict(record, blobs)], analyzer._all_dependencies
+            )
+            == 0
+        )
+
+    def test_query_external_tokens(self, temp_dir):
+        """Test an external dependency set is matched against the index."""
+        index = SimilarityIndex(temp_dir / "signatures.npz")
+        index.update("dependencies", "ml", "x", {"numpy", "pandas", "scipy"})
+
+        assert index.query("dependencies", {"numpy", "pandas", "scipy"})[0] == ("ml", 1.0)
@@ -0,0 +1,180 @@
+"""Tests for persisted, incrementally updated topic models."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from research_platform.analyzers.topic_modeling import TopicModelingAnalyzer
+from research_platform.analyzers.topic_models import TopicModel, update_topic_model
+from research_platform.models.repository import Repository
+
+THEMES = [
+    "portfolio risk volatility returns asset pricing",
+    "neural network deep learning training gradient",
+    "blockchain ledger token smart contract crypto",
+]
+
+
+@pytest.fixture
+def corpus():
+    """Forty small documents drawn from three themes."""
+    rng = np.random.default_rng(0)
+    documents = {}
+    for i in range(40):
+        words = THEMES[i % 3].split()
+        documents[f"repo{i}"] = " ".join(rng.choice(words, size=12))
+    return documents
+
+
+class TestTopicModel:
+    """Tests for TopicModel."""
+
+    def test_unchanged_corpus_is_not_refitted(self, corpus, temp_dir):
+        """Test a persisted model is reused as-is for an unchanged corpus."""
+        model = TopicModel(temp_dir / "nmf.joblib", n_topics=3)
+        assert model.update(corpus)["refit"] is True
+        model.save()
+
+        reloaded = TopicModel(temp_dir / "nmf.joblib", n_topics=3)
+        update = reloaded.update(corpus)
+
+        assert update == {"refit": False, "assigned": 0, "removed": 0}
+        assert reloaded.fingerprint == model.fingerprint
+        assert reloaded.topics() == model.topics()
+
+    def test_changed_document_is_projected(self, corpus, temp_dir):
+        """Test a changed document is assigned to existing topics without a refit."""
+        model = TopicModel(temp_dir / "nmf.joblib", n_topics=3)
+        model.update(corpus)
+        components = model.model.components_.copy()
+        crypto_topic = model.repository_topics()[2]["dominant_topic"]
+
+        corpus["repo0"] = "blockchain token smart contract ledger crypto token"
+        update = model.update(corpus)
+
+        assert update == {"refit": False, "assigned": 1, "removed": 0}
+        np.testing.assert_array_equal(model.model.components_, components)
+        assert model.repository_topics()[0]["dominant_topic"] == crypto_topic
+
+    def test_drift_triggers_refit(self, corpus):
+        """Test the model is refitted once enough of the corpus has changed."""
+        model = TopicModel(n_topics=3, drift_threshold=0.2)
+        model.update(corpus)
+
+        for i in range(8):
+            corpus[f"new{i}"] = THEMES[0]
+            assert model.update(corpus)["refit"] is False
+        corpus["new8"] = THEMES[1]
+
+        assert model.update(corpus)["refit"] is True
+        assert model.drift == 0.0
+        assert model.fitted_documents == 49
+
+    def test_removed_documents_are_dropped(self, corpus):
+        """Test repositories missing from the corpus lose their assignment."""
+        model = TopicModel(n_topics=3)
+        model.update(corpus)
+        del corpus["repo5"]
+
+        assert model.update(corpus)["removed"] == 1
+        assert "repo5" not in {r["repository"] for r in model.repository_topics()}
+
+    def test_settings_change_refits(self, corpus, temp_dir):
+        """Test a persisted model fitted with other settings is not reused."""
+        model = TopicModel(temp_dir / "lda.joblib", method="lda", n_topics=3)
+        model.update(corpus)
+        model.save()
+
+        assert TopicModel(temp_dir / "lda.joblib", method="lda", n_topics=4).model is None
+
+    def test_online_lda_learns_from_changes(self, corpus):
+        """Test online LDA updates its topics from changed documents."""
+        model = TopicModel(method="lda", n_topics=3, online=True)
+        model.update(corpus)
+        components = model.model.components_.copy()
+
+        corpus["repo1"] = THEMES[2]
+        assert model.update(corpus)["refit"] is False
+
+        assert not np.array_equal(model.model.components_, components)
+        assert model.perplexity is not None
+
+    def test_coherence_prefers_true_topic_count(self):
+        """Test a model with one topic per corpus theme is the most coherent."""
+        themes = [
+            "portfolio risk volatility returns asset pricing hedge equity bond yield option market",
+            "neural network deep learning training gradient layer tensor model dropout epoch adam",
+            "blockchain ledger token smart contract crypto wallet mining consensus chain block hash",
+        ]
+        rng = np.random.default_rng(0)
+        corpus = {
+            f"repo{i}": " ".join(rng.choice(themes[i % 3].split(), size=8, replace=False))
+            for i in range(60)
+        }
+
+        scores = {
+            k: update_topic_model("lda", k, corpus, score=True)["coherence"] for k in (2, 3, 4)
+        }
+
+        assert max(scores, key=scores.get) == 3
+
+
+def _repositories(corpus):
+    return [
+        Repository(id=i, name=name, full_name=f"org/{name}", description=text)
+        for i, (name, text) in enumerate(corpus.items())
+    ]
+
+
+class TestTopicModelingAnalyzer:
+    """Tests for TopicModelingAnalyzer with persisted models."""
+
+    @pytest.mark.asyncio
+    async def test_models_are_persisted(self, corpus, temp_dir):
+        """Test a second analysis of the same repositories reuses the fitted models."""
+        repos = _repositories(corpus)
+        analyzer = TopicModelingAnalyzer(n_topics=3, model_dir=temp_dir, max_workers=1)
+
+        first = await analyzer.analyze(repos)
+        second = await analyzer.analyze(repos)
+
+        assert first["methods"]["nmf"]["refit"] is True
+        assert second["methods"]["nmf"]["refit"] is False
+        assert second["methods"]["lda"]["topics"] == first["methods"]["lda"]["topics"]
+        assert (temp_dir / "nmf.joblib").exists()
+
+    @pytest.mark.asyncio
+    async def test_sweep_selects_most_coherent_model(self, corpus):
+        """Test a topic count sweep reports the candidate with the best coherence."""
+        analyzer = TopicModelingAnalyzer(n_topics_range=[2, 3, 4], max_workers=2)
+
+        result = await analyzer.analyze(_repositories(corpus))
+
+        nmf = result["methods"]["nmf"]
+        assert set(nmf["sweep"]) == {2, 3, 4}
+        assert nmf["coherence"] == max(nmf["sweep"].values())
+        assert len(nmf["topics"]) == nmf["n_topics"]
+
+    @pytest.mark.asyncio
+    async def test_fitting_does_not_block_event_loop(self, corpus):
+        """Test other coroutines keep running while models are fitted."""
+        ticks = 0
+        done = asyncio.Event()
+
+        async def ticker():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0)
+
+        async def run():
+            try:
+                return await TopicModelingAnalyzer(n_topics=3).analyze(_repositories(corpus))
+            finally:
+                done.set()
+
+        result, _ = await asyncio.gather(run(), ticker())
+
+        assert ticks > 1
+        assert len(result["methods"]["lda"]["topics"]) == 3
@@ -346,6 +346,15 @@ cache:
         settings = Settings()
         assert settings.is_feature_enabled("unknown_feature") is False
 
+    def test_get_performance_setting(self):
+        """Test reading performance tuning values."""
+        settings = Settings()
+        assert settings.get_performance_setting("cache_warming") is False
+        assert settings.get_performance_setting("unknown", 7) == 7
+
+        settings = Settings(performance={"cache_warming": True})
+        assert settings.get_performance_setting("cache_warming") is True
+
     def test_str_representation(self):
         """Test string representation."""
         settings = Settings(
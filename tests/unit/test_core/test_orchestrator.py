@@ -1,6 +1,7 @@
 """Unit tests for the pipeline orchestrator."""
 
 import asyncio
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -342,3 +343,25 @@ class TestPipelineOrchestrator:
         assert data["duration"] == 10.5
         assert "summary" in data
         assert data["summary"]["successful"] == 2
+
+
+class TestCacheStatsReporting:
+    """Tests for cache statistics in pipeline results."""
+
+    @pytest.mark.asyncio
+    async def test_registered_cache_stats_in_result(self, mock_phase):
+        """Test registered caches are summarized in the pipeline result."""
+        from research_platform.fetchers.cache_stats import CacheStats
+
+        cache = MagicMock()
+        cache.stats = CacheStats()
+        cache.stats.for_key("org_data_x").hits += 2
+
+        orchestrator = PipelineOrchestrator({})
+        orchestrator.register_phase(mock_phase)
+        orchestrator.register_cache("github", cache)
+
+        result = await orchestrator.execute_pipeline()
+
+        assert result.cache_stats["github"]["totals"]["hits"] == 2
+        assert result.to_dict()["cache_stats"]["github"]["namespaces"]["org_data"]["hits"] == 2
@@ -1,6 +1,8 @@
 """Tests for the CacheManager class."""
 
+import asyncio
 import json
+import zlib
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -8,7 +10,8 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from research_platform.config.settings import Settings
-from research_platform.fetchers.cache import CacheManager
+from research_platform.core.exceptions import CacheException
+from research_platform.fetchers.cache import CacheManager, RedisCacheManager, create_cache_manager
 
 
 @pytest.fixture
@@ -168,3 +171,341 @@ class TestCacheManager:
         assert cached["data"] == test_data
         # Verify cached_at is valid ISO format
         datetime.fromisoformat(cached["cached_at"])
+
+
+class TestGetOrCompute:
+    """Tests for single-flight get_or_compute."""
+
+    @pytest.mark.asyncio
+    async def test_miss_computes_and_caches(self, cache_manager):
+        """Test a miss runs the producer and stores its result."""
+
+        async def compute():
+            return {"value": 1}
+
+        result = await cache_manager.get_or_compute("computed", compute, ttl=60)
+
+        assert result == {"value": 1}
+        assert await cache_manager.get("computed") == {"value": 1}
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_producer(self, cache_manager):
+        """Test a fresh entry is returned without calling the producer."""
+        await cache_manager.set("hit", {"cached": True})
+
+        async def compute():
+            raise AssertionError("producer should not run")
+
+        assert await cache_manager.get_or_compute("hit", compute) == {"cached": True}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_are_coalesced(self, cache_manager):
+        """Test concurrent misses for one key run a single producer."""
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"calls": calls}
+
+        results = await asyncio.gather(
+            *[cache_manager.get_or_compute("shared", compute) for _ in range(10)]
+        )
+
+        assert calls == 1
+        assert all(r == {"calls": 1} for r in results)
+        assert cache_manager._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_producer_error_propagates_and_is_not_cached(self, cache_manager):
+        """Test producer failures reach every waiter and leave no entry."""
+
+        async def compute():
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream down")
+
+        results = await asyncio.gather(
+            cache_manager.get_or_compute("failing", compute),
+            cache_manager.get_or_compute("failing", compute),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert await cache_manager.get("failing") is None
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self, cache_manager):
+        """Test an expired entry is served while refreshed in background."""
+        cache_file = cache_manager.cache_dir / "stale.json"
+        with open(cache_file, "w") as f:
+            json.dump(
+                {
+                    "cached_at": (datetime.now() - timedelta(hours=2)).isoformat(),
+                    "ttl": 3600,
+                    "data": {"version": "old"},
+                },
+                f,
+            )
+
+        async def compute():
+            return {"version": "new"}
+
+        result = await cache_manager.get_or_compute("stale", compute, stale_while_revalidate=True)
+        assert result == {"version": "old"}
+
+        await cache_manager._inflight["stale"]
+        assert await cache_manager.get("stale") == {"version": "new"}
+
+    @pytest.mark.asyncio
+    async def test_expired_without_revalidate_waits_for_producer(self, cache_manager):
+        """Test an expired entry is recomputed when SWR is off."""
+        cache_file = cache_manager.cache_dir / "expired.json"
+        with open(cache_file, "w") as f:
+            json.dump(
+                {
+                    "cached_at": (datetime.now() - timedelta(hours=2)).isoformat(),
+                    "ttl": 3600,
+                    "data": {"version": "old"},
+                },
+                f,
+            )
+
+        async def compute():
+            return {"version": "new"}
+
+        assert await cache_manager.get_or_compute("expired", compute) == {"version": "new"}
+
+
+class FakeRedis:
+    """In-process stand-in for the redis.asyncio client API used by the cache."""
+
+    def __init__(self):
+        self.store: dict[str, bytes] = {}
+        self.expiry: dict[str, int] = {}
+        self.pipelines_executed = 0
+
+    async def get(self, name):
+        return self.store.get(name)
+
+    async def set(self, name, value, ex=None):
+        self.store[name] = value
+        self.expiry[name] = ex
+
+    async def delete(self, *names):
+        for name in names:
+            self.store.pop(name, None)
+
+    async def scan_iter(self, match=None):
+        prefix = match.rstrip("*") if match else ""
+        for name in list(self.store):
+            if name.startswith(prefix):
+                yield name
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def aclose(self):
+        pass
+
+
+class FakePipeline:
+    """Queues commands and runs them on execute()."""
+
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def get(self, name):
+        self.commands.append(("get", (name,), {}))
+        return self
+
+    def set(self, name, value, ex=None):
+        self.commands.append(("set", (name, value), {"ex": ex}))
+        return self
+
+    async def execute(self):
+        self.client.pipelines_executed += 1
+        return [await getattr(self.client, cmd)(*args, **kw) for cmd, args, kw in self.commands]
+
+
+@pytest.fixture
+def redis_cache(cache_settings):
+    """Create a RedisCacheManager backed by an in-process fake."""
+    cache_settings.cache.redis_url = "redis://localhost:6379/0"
+    return RedisCacheManager(cache_settings, client=FakeRedis())
+
+
+class TestRedisCacheManager:
+    """Tests for the Redis cache backend."""
+
+    @pytest.mark.asyncio
+    async def test_set_and_get(self, redis_cache):
+        """Test round trip through the Redis backend."""
+        await redis_cache.set("key", {"value": [1, 2, 3]})
+
+        assert await redis_cache.get("key") == {"value": [1, 2, 3]}
+
+    @pytest.mark.asyncio
+    async def test_payload_is_compressed_with_server_ttl(self, redis_cache):
+        """Test values are compressed and given a server-side expiry."""
+        await redis_cache.set("key", {"text": "a" * 1000}, ttl=60)
+
+        redis_key = "research_platform:cache:key"
+        payload = redis_cache.client.store[redis_key]
+        assert len(payload) < 1000
+        assert json.loads(zlib.decompress(payload))["data"] == {"text": "a" * 1000}
+        assert redis_cache.client.expiry[redis_key] == 120
+
+    @pytest.mark.asyncio
+    async def test_batch_operations_are_pipelined(self, redis_cache):
+        """Test get_many/set_many use a single pipeline each."""
+        await redis_cache.set_many({"a": {"n": 1}, "b": {"n": 2}})
+        result = await redis_cache.get_many(["a", "b", "missing"])
+
+        assert result == {"a": {"n": 1}, "b": {"n": 2}}
+        assert redis_cache.client.pipelines_executed == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_evicted(self, redis_cache):
+        """Test logically expired entries are not returned by get."""
+        redis_key = "research_platform:cache:old"
+        redis_cache.client.store[redis_key] = zlib.compress(
+            json.dumps(
+                {
+                    "cached_at": (datetime.now() - timedelta(hours=2)).isoformat(),
+                    "ttl": 3600,
+                    "data": {"old": True},
+                }
+            ).encode()
+        )
+
+        assert await redis_cache.get("old") is None
+        assert redis_key not in redis_cache.client.store
+
+    @pytest.mark.asyncio
+    async def test_get_or_compute_uses_backend(self, redis_cache):
+        """Test single-flight computation stores into Redis."""
+
+        async def compute():
+            return {"computed": True}
+
+        assert await redis_cache.get_or_compute("c", compute) == {"computed": True}
+        assert "research_platform:cache:c" in redis_cache.client.store
+
+    @pytest.mark.asyncio
+    async def test_clear_all(self, redis_cache):
+        """Test clearing removes every prefixed key."""
+        await redis_cache.set_many({"a": {}, "b": {}})
+        redis_cache.client.store["other:key"] = b"x"
+
+        await redis_cache.clear()
+
+        assert list(redis_cache.client.store) == ["other:key"]
+
+    @pytest.mark.asyncio
+    async def test_clear_key_counts_eviction(self, redis_cache):
+        """Test clearing one key records an eviction like the file backend."""
+        await redis_cache.set("a", {})
+
+        await redis_cache.clear("a")
+
+        assert redis_cache.stats.for_key("a").evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_get_many_degrades_to_misses(self, redis_cache):
+        """Test a failed pipeline counts misses instead of raising."""
+        with patch.object(
+            FakePipeline, "execute", side_effect=ConnectionError("Connection refused")
+        ):
+            assert await redis_cache.get_many(["a", "b"]) == {}
+
+        totals = redis_cache.stats.totals()
+        assert (totals["misses"], totals["errors"]) == (2, 2)
+
+    def test_missing_redis_package_raises(self, cache_settings):
+        """Test a helpful error when redis is not installed."""
+        cache_settings.cache.redis_url = "redis://localhost:6379/0"
+        with patch.dict("sys.modules", {"redis": None, "redis.asyncio": None}):
+            with pytest.raises(CacheException):
+                RedisCacheManager(cache_settings)
+
+    def test_create_cache_manager_selects_backend(self, cache_settings):
+        """Test the factory picks the file backend without a Redis URL."""
+        cache_settings.cache.redis_url = None
+        assert type(create_cache_manager(cache_settings)) is CacheManager
+
+
+class TestCacheInstrumentation:
+    """Tests for cache statistics recorded by CacheManager."""
+
+    @pytest.mark.asyncio
+    async def test_hits_misses_and_bytes(self, cache_manager):
+        """Test lookups and writes are counted per namespace."""
+        await cache_manager.get("readme_repo")
+        await cache_manager.set("readme_repo", {"text": "hello"})
+        await cache_manager.get("readme_repo")
+
+        stats = cache_manager.stats.for_key("readme_repo")
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.bytes_written > 0
+        assert stats.bytes_read == stats.bytes_written
+        assert stats.get_latency.count == 2
+        assert stats.set_latency.count == 1
+
+    @pytest.mark.asyncio
+    async def test_expiration_counted(self, cache_manager):
+        """Test expired reads count as expiration, miss and eviction."""
+        cache_file = cache_manager.cache_dir / "doi_old.json"
+        with open(cache_file, "w") as f:
+            json.dump(
+                {
+                    "cached_at": (datetime.now() - timedelta(hours=2)).isoformat(),
+                    "ttl": 3600,
+                    "data": {},
+                },
+                f,
+            )
+
+        await cache_manager.get("doi_old")
+
+        stats = cache_manager.stats.for_key("doi_old")
+        assert stats.expirations == 1
+        assert stats.misses == 1
+        assert stats.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_counted(self, cache_manager):
+        """Test unreadable entries and failed writes are counted."""
+        (cache_manager.cache_dir / "bad.json").write_text("not json")
+        await cache_manager.get("bad")
+
+        with patch("aiofiles.open", side_effect=PermissionError("No write access")):
+            await cache_manager.set("bad", {"data": "test"})
+
+        assert cache_manager.stats.for_key("bad").errors == 2
+
+
+class TestExpiryAndRefresh:
+    """Tests for time_to_expiry and refresh."""
+
+    @pytest.mark.asyncio
+    async def test_time_to_expiry(self, cache_manager):
+        """Test remaining lifetime of cached entries."""
+        assert await cache_manager.time_to_expiry("absent") is None
+
+        await cache_manager.set("present", {"a": 1}, ttl=600)
+        remaining = await cache_manager.time_to_expiry("present")
+        assert 590 < remaining <= 600
+
+    @pytest.mark.asyncio
+    async def test_refresh_overwrites_fresh_entry(self, cache_manager):
+        """Test refresh recomputes even when the entry is fresh."""
+        await cache_manager.set("key", {"version": 1})
+
+        async def compute():
+            return {"version": 2}
+
+        assert await cache_manager.refresh("key", compute) == {"version": 2}
+        assert await cache_manager.get("key") == {"version": 2}
@@ -0,0 +1,86 @@
+"""Tests for cache statistics."""
+
+import json
+
+import pytest
+
+from research_platform.fetchers.cache_stats import CacheStats, LatencyHistogram, key_namespace
+
+
+class TestKeyNamespace:
+    """Tests for namespace derivation."""
+
+    @pytest.mark.parametrize(
+        "key,namespace",
+        [
+            ("org_data_test-org", "org_data"),
+            ("readme_repo", "readme"),
+            ("tree_org__repo", "tree"),
+            ("releases_org__repo", "releases"),
+            ("doi_10.1000_xyz", "doi"),
+            ("arxiv_2401.00001", "arxiv"),
+            ("analysis:complexity", "analysis"),
+            ("custom:thing", "custom"),
+            ("unrelated", "other"),
+        ],
+    )
+    def test_key_namespace(self, key, namespace):
+        """Test keys map to their reporting namespace."""
+        assert key_namespace(key) == namespace
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_observe_buckets(self):
+        """Test observations land in the right buckets."""
+        histogram = LatencyHistogram()
+        histogram.observe(0.0005)  # 0.5ms
+        histogram.observe(0.003)  # 3ms
+        histogram.observe(5.0)  # 5s
+
+        data = histogram.to_dict()
+        assert data["count"] == 3
+        assert data["buckets"]["<=1ms"] == 1
+        assert data["buckets"]["<=5ms"] == 1
+        assert data["buckets"][">1000ms"] == 1
+        assert data["max_ms"] == 5000.0
+
+
+class TestCacheStats:
+    """Tests for CacheStats."""
+
+    def test_totals_and_hit_rate(self):
+        """Test counters aggregate across namespaces."""
+        stats = CacheStats()
+        stats.for_key("readme_a").hits += 3
+        stats.for_key("readme_b").misses += 1
+        stats.for_key("doi_x").misses += 4
+
+        totals = stats.totals()
+        assert totals["hits"] == 3
+        assert totals["misses"] == 5
+        assert totals["hit_rate"] == 0.375
+        assert stats.for_key("readme_a").hit_rate == 0.75
+
+    def test_summary_lines(self):
+        """Test one summary line per namespace."""
+        stats = CacheStats()
+        stats.for_key("readme_a").hits += 1
+        stats.for_key("arxiv_b").misses += 1
+
+        lines = stats.summary_lines()
+        assert len(lines) == 2
+        assert lines[0].startswith("cache[arxiv]")
+
+    def test_export(self, temp_dir):
+        """Test statistics export to JSON."""
+        stats = CacheStats()
+        stats.for_key("org_data_x").bytes_written += 100
+
+        output = temp_dir / "reports" / "cache_stats.json"
+        stats.export(output)
+
+        data = json.loads(output.read_text())
+        assert data["namespaces"]["org_data"]["bytes_written"] == 100
+        assert data["totals"]["bytes_written"] == 100
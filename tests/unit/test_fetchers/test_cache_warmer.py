@@ -0,0 +1,170 @@
+"""Tests for predictive cache warming."""
+
+import logging
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from research_platform.config.settings import CacheConfig, Settings
+from research_platform.fetchers.cache import CacheManager
+from research_platform.fetchers.cache_warmer import (
+    CacheWarmer,
+    PushHistory,
+    WarmupTarget,
+    change_probability,
+    repository_cache_key,
+)
+from research_platform.models.repository import Repository
+
+
+@pytest.fixture
+def warm_settings(temp_dir):
+    """Settings with cache warming enabled."""
+    return Settings(
+        cache=CacheConfig(directory=temp_dir / "cache", ttl=3600),
+        performance={"cache_warming": True, "max_concurrent_requests": 2},
+    )
+
+
+@pytest.fixture
+def warmer(warm_settings):
+    """Create a CacheWarmer over a file cache."""
+    return CacheWarmer(CacheManager(warm_settings), warm_settings)
+
+
+def make_target(key, calls, probability=0.5):
+    """Create a target that records when it is computed."""
+
+    async def compute():
+        calls.append(key)
+        return {"key": key}
+
+    return WarmupTarget(key=key, compute=compute, change_probability=probability)
+
+
+class TestPushHistory:
+    """Tests for push frequency estimation."""
+
+    def test_frequency_from_history(self, temp_dir):
+        """Test frequency is derived from recorded pushes."""
+        now = datetime(2024, 1, 11, tzinfo=timezone.utc)
+        history = PushHistory(temp_dir / "history.json")
+        repo = Repository(id=1, name="r", full_name="org/r")
+        for day in (1, 6, 11):
+            repo.pushed_at = datetime(2024, 1, day, tzinfo=timezone.utc)
+            history.record(repo)
+
+        assert history.pushes_per_day(repo, now) == pytest.approx(0.2)
+
+    def test_frequency_fallback_and_persistence(self, temp_dir):
+        """Test fallback to time since last push and round trip to disk."""
+        now = datetime(2024, 1, 11, tzinfo=timezone.utc)
+        path = temp_dir / "history.json"
+        history = PushHistory(path)
+        repo = Repository(id=1, name="r", full_name="org/r", pushed_at=datetime(2024, 1, 1))
+        history.record(repo)
+        history.save()
+
+        reloaded = PushHistory(path)
+        assert reloaded.pushes == history.pushes
+        assert reloaded.pushes_per_day(repo, now) == pytest.approx(0.1)
+
+    def test_change_probability(self):
+        """Test Poisson change probability bounds."""
+        assert change_probability(0.0, 1.0) == 0.0
+        assert 0.6 < change_probability(1.0, 1.0) < 0.7
+
+
+class TestCacheWarmer:
+    """Tests for CacheWarmer."""
+
+    def test_enabled_flag(self, warm_settings, warmer):
+        """Test the performance.cache_warming flag is honoured."""
+        assert warmer.enabled is True
+        warm_settings.performance["cache_warming"] = False
+        assert warmer.enabled is False
+
+    @pytest.mark.asyncio
+    async def test_plan_skips_fresh_entries(self, warmer):
+        """Test entries fresh beyond the horizon are not planned."""
+        await warmer.cache.set("fresh", {"x": 1}, ttl=7200)
+        await warmer.cache.set("expiring", {"x": 1}, ttl=60)
+        calls = []
+        targets = [make_target(k, calls) for k in ("fresh", "expiring", "missing")]
+
+        planned = await warmer.plan(targets, horizon=3600)
+
+        assert {p["target"].key for p in planned} == {"expiring", "missing"}
+
+    @pytest.mark.asyncio
+    async def test_warm_orders_by_change_probability_within_budget(self, warmer):
+        """Test the most likely to change entries are refreshed first."""
+        calls = []
+        targets = [
+            make_target("rarely", calls, probability=0.1),
+            make_target("often", calls, probability=0.9),
+            make_target("sometimes", calls, probability=0.5),
+        ]
+
+        summary = await warmer.warm(targets, budget=2)
+
+        assert set(calls) == {"often", "sometimes"}
+        assert summary["warmed"] == 2
+        assert summary["skipped_over_budget"] == 1
+        assert await warmer.cache.get("often") == {"key": "often"}
+
+    @pytest.mark.asyncio
+    async def test_budget_counts_api_requests(self, warmer):
+        """Test the budget is spent per API request, not per target."""
+        calls = []
+        targets = [make_target(key, calls) for key in ("a", "b", "c")]
+        for target in targets:
+            target.cost = 2
+
+        summary = await warmer.warm(targets, budget=5)
+
+        assert len(calls) == 2
+        assert summary["requests"] == 4
+        assert summary["skipped_over_budget"] == 1
+
+    @pytest.mark.asyncio
+    async def test_warm_reports_failures(self, warmer, caplog):
+        """Test producer failures are reported, not raised, and logged once."""
+
+        async def failing():
+            raise RuntimeError("boom")
+
+        with caplog.at_level(logging.WARNING):
+            summary = await warmer.warm([WarmupTarget(key="bad", compute=failing)], budget=5)
+
+        assert summary["failed"] == ["bad"]
+        assert summary["warmed"] == 0
+        assert len([r for r in caplog.records if "boom" in r.getMessage()]) == 1
+
+    @pytest.mark.asyncio
+    async def test_repository_targets(self, warmer):
+        """Test per-repository targets use stable keys and push frequency."""
+        recent = Repository(
+            id=1,
+            name="busy",
+            full_name="org/busy",
+            pushed_at=datetime.now(timezone.utc) - timedelta(hours=12),
+        )
+        stale = Repository(
+            id=2,
+            name="quiet",
+            full_name="org/quiet",
+            pushed_at=datetime.now(timezone.utc) - timedelta(days=300),
+        )
+
+        async def readme(repo):
+            return {"content": repo.name}
+
+        targets = warmer.repository_targets([recent, stale], {"readme": readme})
+
+        assert [t.key for t in targets] == [
+            repository_cache_key("readme", "org/busy"),
+            repository_cache_key("readme", "org/quiet"),
+        ]
+        assert targets[0].change_probability > targets[1].change_probability
+        assert await targets[0].compute() == {"content": "busy"}
@@ -12,9 +12,14 @@ from research_platform.models.repository import Repository
 
 
 @pytest.fixture
-def github_fetcher(test_settings):
-    """Create GitHubFetcher instance."""
-    return GitHubFetcher(test_settings)
+def github_fetcher(test_settings, temp_dir):
+    """Create GitHubFetcher instance with a temporary cache and no API access."""
+    test_settings.cache.directory = temp_dir / "cache"
+    fetcher = GitHubFetcher(test_settings)
+    fetcher.github = Mock()
+    lazy_repo = fetcher.github.withLazy.return_value.get_repo.return_value
+    lazy_repo.get_readme.return_value.decoded_content = b"# Test README\nThis is a test"
+    return fetcher
 
 
 @pytest.fixture
@@ -349,11 +354,9 @@ class TestGitHubFetcher:
                 with patch.object(github_fetcher.cache, "set") as mock_set:
                     await github_fetcher.fetch("test-org")
 
-                    # Verify cache.set was called
-                    mock_set.assert_called_once()
-                    call_args = mock_set.call_args
-                    assert call_args[0][0] == "org_data_test-org"  # cache key
-                    assert "repos" in call_args[0][1]  # cached data
+                    # Verify the organization data was cached
+                    cached = {call.args[0]: call.args[1] for call in mock_set.call_args_list}
+                    assert "repos" in cached["org_data_test-org"]
 
     @pytest.mark.asyncio
     async def test_readme_truncation(self, github_fetcher):
@@ -395,3 +398,81 @@ class TestGitHubFetcher:
 
         assert len(repo_model.metadata["readme"]) == 1000
         assert repo_model.metadata["readme"] == "A" * 1000
+
+
+class TestCacheWarming:
+    """Tests for GitHubFetcher.warm_cache."""
+
+    @pytest.mark.asyncio
+    async def test_warm_cache_disabled_by_default(self, github_fetcher, sample_repositories):
+        """Test warming is a no-op unless performance.cache_warming is set."""
+        assert await github_fetcher.warm_cache(sample_repositories) is None
+
+    @pytest.mark.asyncio
+    async def test_warm_cache_respects_rate_budget(self, test_settings, temp_dir):
+        """Test warming spends at most the remaining rate budget."""
+        test_settings.cache.directory = temp_dir / "cache"
+        test_settings.performance = {"cache_warming": True, "warming_budget": 100}
+        fetcher = GitHubFetcher(test_settings)
+        fetcher.github = Mock()
+        fetcher.github.get_rate_limit.return_value.resources.core.remaining = 502
+        lazy_repo = fetcher.github.withLazy.return_value.get_repo.return_value
+        lazy_repo.get_readme.return_value.decoded_content = b"# Hi"
+
+        repo = Repository(id=1, name="r", full_name="org/r", pushed_at=datetime(2024, 1, 1))
+        summary = await fetcher.warm_cache([repo])
+
+        assert summary["candidates"] == 3
+        assert summary["warmed"] + len(summary["failed"]) == 2
+        assert summary["skipped_over_budget"] == 1
+
+    @pytest.mark.asyncio
+    async def test_warmed_records_are_read_from_cache(self, test_settings, temp_dir):
+        """Test the fetch reads the README warm_cache stored, without another request."""
+        test_settings.cache.directory = temp_dir / "cache"
+        test_settings.performance = {"cache_warming": True, "warming_budget": 10}
+        fetcher = GitHubFetcher(test_settings)
+        fetcher.github = Mock()
+        fetcher.github.get_rate_limit.return_value.resources.core.remaining = 5000
+        lazy_repo = fetcher.github.withLazy.return_value.get_repo.return_value
+        lazy_repo.get_readme.return_value.decoded_content = b"# Warmed"
+        lazy_repo.get_git_tree.return_value.tree = [Mock(path="src", type="tree", size=None)]
+        lazy_repo.get_releases.return_value.get_page.return_value = []
+
+        repo = Repository(id=1, name="r", full_name="org/r", pushed_at=datetime(2024, 1, 1))
+        summary = await fetcher.warm_cache([repo])
+        record = await fetcher.repository_record("readme", repo)
+
+        assert summary["warmed"] == 3
+        assert summary["requests"] == 3
+        assert record == {"content": "# Warmed"}
+        assert lazy_repo.get_readme.call_count == 1
+        assert await fetcher.repository_record("tree", repo) == {
+            "entries": [{"path": "src", "type": "tree", "size": None}]
+        }
+
+
+class TestRepositoryRecords:
+    """Tests for reading per-repository records through the cache."""
+
+    @pytest.mark.asyncio
+    async def test_convert_reads_readme_through_cache(self, github_fetcher, mock_github_repo_full):
+        """Test conversion takes the README from the cache instead of the repository."""
+        await github_fetcher.cache.set("readme_test-org__test-repo", {"content": "# Cached README"})
+
+        repo_model = await github_fetcher._convert_to_model(mock_github_repo_full)
+
+        assert repo_model.metadata["readme"] == "# Cached README"
+        mock_github_repo_full.get_readme.assert_not_called()
+        github_fetcher.github.withLazy.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_readme_is_cached(self, github_fetcher, sample_repositories):
+        """Test a 404 is cached as an absent README rather than retried."""
+        lazy_repo = github_fetcher.github.withLazy.return_value.get_repo.return_value
+        lazy_repo.get_readme.side_effect = GithubException(404, {"message": "Not Found"}, None)
+        repo = sample_repositories[0]
+
+        assert await github_fetcher.repository_record("readme", repo) == {"content": None}
+        assert await github_fetcher.repository_record("readme", repo) == {"content": None}
+        assert lazy_repo.get_readme.call_count == 1
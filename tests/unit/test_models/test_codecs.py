@@ -0,0 +1,65 @@
+"""Tests for generated model serializers."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from research_platform.models.codecs import build_decoder, build_encoder, stable_id
+
+
+@dataclass
+class Record:
+    """Small dataclass used to exercise the code generator."""
+
+    name: str
+    created_at: datetime | None = None
+    tags: list[str] = field(default_factory=list)
+    extra: dict = field(default_factory=dict)
+
+
+class TestStableId:
+    """Tests for content-derived ids."""
+
+    def test_stable_id_is_deterministic(self):
+        """Test ids do not depend on the process hash seed."""
+        assert stable_id("org/repo") == stable_id("org/repo")
+        assert stable_id("org/repo") == 364613746
+        assert stable_id("org/other") != stable_id("org/repo")
+
+    def test_stable_id_range(self):
+        """Test ids stay within the configured range."""
+        assert 0 <= stable_id("x" * 1000) < 10**9
+
+
+class TestGeneratedCodecs:
+    """Tests for build_encoder / build_decoder."""
+
+    def test_encoder_formats_datetimes_and_copies_containers(self):
+        """Test datetimes become ISO strings and top-level containers are copied."""
+        record = Record(name="a", created_at=datetime(2024, 1, 2), tags=["x"])
+
+        data = build_encoder(Record)(record)
+
+        assert data == {
+            "name": "a",
+            "created_at": "2024-01-02T00:00:00",
+            "tags": ["x"],
+            "extra": {},
+        }
+        assert data["tags"] is not record.tags
+
+    def test_decoder_parses_once_and_does_not_mutate(self):
+        """Test the decoder leaves its input untouched."""
+        data = {"name": "a", "created_at": "2024-01-02T00:00:00Z", "unknown": 1}
+        original = dict(data)
+
+        kwargs = build_decoder(Record, extras_field="extra")(data)
+
+        assert data == original
+        assert kwargs["created_at"].year == 2024
+        assert kwargs["extra"] == {"unknown": 1}
+
+    def test_decoder_drops_unknown_keys_without_extras_field(self):
+        """Test unknown keys are dropped when no extras field is given."""
+        kwargs = build_decoder(Record)({"name": "a", "unknown": 1})
+
+        assert kwargs == {"name": "a"}
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 import pytest
 
 from research_platform.models.repository import Repository
+from research_platform.storage.blobs import BlobStore
 
 
 class TestRepository:
@@ -232,3 +233,73 @@ class TestRepository:
         # Should not raise errors
         assert repo.age_days == 0
         assert repo.days_since_update == 0
+
+    def test_repository_is_slotted(self):
+        """Test instances carry no per-instance __dict__."""
+        repo = Repository(id=1, name="test", full_name="org/test")
+
+        assert not hasattr(repo, "__dict__")
+        with pytest.raises(AttributeError):
+            repo.unknown_attribute = 1
+
+    def test_repository_interns_shared_strings(self):
+        """Test language and topics are interned."""
+        language = "".join(["Pyt", "hon"])
+        topic = "".join(["fin", "ance"])
+        repo1 = Repository(id=1, name="a", full_name="org/a", language=language, topics=[topic])
+        repo2 = Repository(id=2, name="b", full_name="org/b", language="Python", topics=["finance"])
+
+        assert repo1.language is repo2.language
+        assert repo1.topics[0] is repo2.topics[0]
+
+    def test_from_dict_resolves_blobs_lazily(self, temp_dir):
+        """Test externalized heavy fields are resolved on first access."""
+        blobs = BlobStore(temp_dir / "blobs")
+        code = "import numpy as np\n" * 50
+        record = blobs.externalize(
+            {
+                "id": 1,
+                "name": "test",
+                "full_name": "org/test",
+                "metadata": {"code_files": {"main.py": code}, "license": "MIT"},
+            }
+        )
+
+        repo = Repository.from_dict(record, blobs=blobs)
+
+        assert repo.metadata["license"] == "MIT"
+        assert repo.metadata["code_files"] == {"main.py": code}
+
+    def test_from_dict_does_not_mutate_input(self):
+        """Test from_dict leaves the caller's record untouched."""
+        metadata = {"license": "MIT"}
+        data = {
+            "name": "test",
+            "full_name": "org/test",
+            "created_at": "2023-06-01T00:00:00Z",
+            "metadata": metadata,
+            "url": "https://github.com/org/test",
+        }
+
+        repo = Repository.from_dict(data)
+
+        assert data["created_at"] == "2023-06-01T00:00:00Z"
+        assert metadata == {"license": "MIT"}
+        assert repo.metadata == {"license": "MIT", "url": "https://github.com/org/test"}
+
+    def test_from_dict_derives_stable_id(self):
+        """Test a missing id is derived from full_name deterministically."""
+        repo1 = Repository.from_dict({"name": "test", "full_name": "org/test"})
+        repo2 = Repository.from_dict({"name": "test", "full_name": "org/test"})
+
+        assert repo1.id == repo2.id
+        assert 0 <= repo1.id < 10**9
+
+    def test_batch_round_trip(self, sample_repository):
+        """Test to_dicts / from_dicts round-trip a list of repositories."""
+        records = Repository.to_dicts([sample_repository, sample_repository])
+        restored = Repository.from_dicts(records)
+
+        assert len(restored) == 2
+        assert restored[0].to_dict() == sample_repository.to_dict()
+        assert records[0]["metadata"] is not sample_repository.metadata
@@ -0,0 +1,108 @@
+"""Tests for the columnar repository table."""
+
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from research_platform.models.repository import Repository
+from research_platform.models.table import CategoricalColumn, RepositoryTable
+
+
+@pytest.fixture
+def records():
+    """Repository records as stored in data/repos.json."""
+    return [
+        {"name": "a", "language": "Python", "license": "MIT", "topics": ["finance", "ml"],
+         "stars": 5, "forks": 1, "archived": False, "pushed_at": "2024-03-01T00:00:00Z"},
+        {"name": "b", "language": "R", "license": "MIT", "topics": ["finance"],
+         "stars": 10, "forks": 0, "archived": True, "pushed_at": None},
+        {"name": "c", "language": "Python", "license": "GPL", "topics": [],
+         "stars": 5, "forks": 3, "archived": False, "pushed_at": "2024-05-01T00:00:00Z"},
+        {"name": "d", "language": "Unknown", "license": "MIT", "topics": ["ml", "stats"],
+         "stars": 0, "forks": 0, "archived": False, "pushed_at": "2024-01-01T00:00:00Z"},
+    ]  # fmt: skip
+
+
+class TestCategoricalColumn:
+    """Tests for dictionary-encoded columns."""
+
+    def test_encoding_and_counts(self):
+        """Test values map to codes and counts match Counter."""
+        values = ["x", "y", "x", None, "y", "x"]
+        column = CategoricalColumn.from_values(values)
+
+        assert column.categories == ["x", "y", None]
+        assert column.codes.tolist() == [0, 1, 0, 2, 1, 0]
+        assert column.counts() == dict(Counter(values))
+        assert column[1] == "y"
+
+    def test_most_common_matches_counter_ties(self):
+        """Test ranking ties keep first-seen order like Counter.most_common."""
+        values = ["b", "a", "a", "b", "c"]
+        column = CategoricalColumn.from_values(values)
+
+        assert column.most_common(2) == dict(Counter(values).most_common(2))
+
+
+class TestRepositoryTable:
+    """Tests for RepositoryTable."""
+
+    def test_summary(self, records):
+        """Test organization totals."""
+        summary = RepositoryTable.from_records(records).summary()
+
+        assert summary["total_repos"] == 4
+        assert summary["archived_repos"] == 1
+        assert summary["active_repos"] == 3
+        assert summary["total_stars"] == 20
+        assert summary["avg_forks"] == 1.0
+        assert isinstance(summary["total_stars"], int)
+
+    def test_empty_summary(self):
+        """Test an empty table."""
+        summary = RepositoryTable.from_records([]).summary()
+
+        assert summary["total_repos"] == 0
+        assert summary["avg_stars"] == 0
+
+    def test_categorical_aggregations(self, records):
+        """Test language, license and topic counts."""
+        table = RepositoryTable.from_records(records)
+
+        assert table.language.most_common(exclude=("Unknown",)) == {"Python": 2, "R": 1}
+        assert table.license.counts() == {"MIT": 3, "GPL": 1}
+        assert table.topics.most_common(2) == {"finance": 2, "ml": 2}
+        assert table.topics.mask("ml").tolist() == [True, False, False, True]
+
+    def test_top_k_is_stable_and_skips_missing(self, records):
+        """Test top-k order matches a stable descending sort."""
+        table = RepositoryTable.from_records(records)
+
+        assert table.names[table.top_k("stars", 3)].tolist() == ["b", "a", "c"]
+        assert table.names[table.top_k("pushed_at", 10)].tolist() == ["c", "a", "d"]
+
+    def test_filter_and_group_by(self, records):
+        """Test boolean filtering and per-category aggregation."""
+        table = RepositoryTable.from_records(records)
+        active = table.filter(~table.flags["archived"])
+
+        assert len(active) == 3
+        assert active.topics[2] == ["ml", "stats"]
+        assert active.group_by("language", "stars") == {"Python": 10.0, "Unknown": 0.0}
+        assert table.group_by("license", "forks", agg="mean") == {
+            "MIT": pytest.approx(1 / 3),
+            "GPL": 3.0,
+        }
+
+    def test_from_repositories(self):
+        """Test building from Repository objects uses metadata license."""
+        repos = [
+            Repository(id=1, name="a", full_name="o/a", stars=3, metadata={"license": "MIT"}),
+            Repository(id=2, name="b", full_name="o/b", stars=4, archived=True),
+        ]
+        table = RepositoryTable.from_repositories(repos)
+
+        assert table.license.counts() == {"MIT": 1, None: 1}
+        assert np.array_equal(table.numeric["stars"], [3, 4])
+        assert table.summary()["archived_repos"] == 1
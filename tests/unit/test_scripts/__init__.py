@@ -0,0 +1 @@
+"""Tests for build scripts."""
@@ -0,0 +1,10 @@
+"""Make the build scripts importable (they import each other by module name)."""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parents[3]
+
+for path in (ROOT, ROOT / "scripts"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
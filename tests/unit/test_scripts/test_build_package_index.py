@@ -0,0 +1,47 @@
+"""Tests for the package index build script."""
+
+import json
+
+from build_package_index import build_package_index, main
+
+from src.research_platform.storage.package_index import PackageIndex
+
+
+def write_snapshot(path, packages):
+    """Write a PyPI-only registry snapshot."""
+    path.write_text(json.dumps({"pypi": packages}), encoding="utf-8")
+    return path
+
+
+def test_build_replaces_the_index(temp_dir):
+    """Test a rebuild drops packages that left the snapshot."""
+    output = temp_dir / "package_index.db"
+    build_package_index(write_snapshot(temp_dir / "old.json", {"scipy": ["numpy"]}), output)
+
+    count = build_package_index(
+        write_snapshot(temp_dir / "new.json", {"Pandas": ["numpy"]}), output
+    )
+
+    assert count == 1
+    with PackageIndex(output) as index:
+        assert index.requirements("pypi", ["pandas", "scipy"]) == {"pandas": ("numpy",)}
+
+
+def test_update_keeps_existing_packages(temp_dir):
+    """Test --update adds to the index instead of rebuilding it."""
+    output = temp_dir / "package_index.db"
+    build_package_index(write_snapshot(temp_dir / "old.json", {"scipy": ["numpy"]}), output)
+
+    snapshot = write_snapshot(temp_dir / "new.json", {"pandas": ["numpy"]})
+    assert main([str(snapshot), "--output", str(output), "--update"]) == 0
+
+    with PackageIndex(output) as index:
+        assert len(index) == 2
+
+
+def test_missing_snapshot(temp_dir):
+    """Test a missing snapshot is an error and creates no index."""
+    output = temp_dir / "package_index.db"
+
+    assert main([str(temp_dir / "missing.json"), "--output", str(output)]) == 1
+    assert not output.exists()
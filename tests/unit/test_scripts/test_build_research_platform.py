@@ -0,0 +1,25 @@
+"""Tests for the platform build orchestration script."""
+
+import asyncio
+import json
+
+import build_research_platform
+from build_research_platform import ResearchPlatformBuilder
+
+from src.research_platform.config.settings import CacheConfig, Settings
+from src.research_platform.fetchers.cache import CacheManager
+
+
+def test_registered_cache_stats_are_reported(temp_dir, monkeypatch):
+    """Test registered caches are logged and exported at the end of a build."""
+    monkeypatch.setattr(build_research_platform, "CACHE_STATS_DIR", temp_dir / "stats")
+    cache = CacheManager(Settings(cache=CacheConfig(directory=temp_dir / "cache")))
+    asyncio.run(cache.get("readme_org__alpha"))
+    builder = ResearchPlatformBuilder("org", "token")
+
+    builder.register_cache("github", cache)
+    stats = builder.report_cache_stats()
+
+    assert stats["github"]["namespaces"]["readme"]["misses"] == 1
+    assert json.loads((temp_dir / "stats" / "github.json").read_text()) == stats["github"]
+    assert any("cache[readme]" in line for line in builder.build_log)
@@ -0,0 +1,15 @@
+"""Tests for the repository overview script."""
+
+from create_repo_overview import load_repositories
+
+from src.research_platform.storage.datastore import DataStore
+
+
+def test_load_repositories_sees_upserts(temp_dir):
+    """Test repositories come from the dataset, including single-record upserts."""
+    store = DataStore(temp_dir)
+    store.write([{"name": "alpha", "stars": 1}])
+
+    store.upsert({"name": "alpha", "stars": 5})
+
+    assert [(r["name"], r["stars"]) for r in load_repositories(str(temp_dir))] == [("alpha", 5)]
@@ -0,0 +1,82 @@
+"""Tests for the research data fetch script."""
+
+import asyncio
+from unittest.mock import Mock
+
+from fetch_org_data_research import fetch_repo_data, read_repository_records, tree_contents
+
+from src.research_platform.config.settings import CacheConfig, Settings
+from src.research_platform.fetchers.github_fetcher import GitHubFetcher
+
+
+def make_github_repo(name="alpha"):
+    """PyGithub repository whose resource reads must not be used."""
+    repo = Mock()
+    repo.id = 1
+    repo.name = name
+    repo.full_name = f"org/{name}"
+    repo.default_branch = "main"
+    repo.description = "Option pricing"
+    repo.license = None
+    repo.get_topics.return_value = []
+    repo.get_contributors.return_value.totalCount = 3
+    return repo
+
+
+def test_tree_contents():
+    """Test git tree entries become contents listings down to the walked depth."""
+    tree = {
+        "entries": [
+            {"path": "notebooks", "type": "tree", "size": None},
+            {"path": "notebooks/demo.ipynb", "type": "blob", "size": 120},
+            {"path": "a/b/c/d/deep.py", "type": "blob", "size": 5},
+        ]
+    }
+
+    assert tree_contents(tree) == [
+        {"name": "notebooks", "path": "notebooks", "type": "dir", "size": 0},
+        {"name": "demo.ipynb", "path": "notebooks/demo.ipynb", "type": "file", "size": 120},
+    ]
+
+
+def test_fetch_repo_data_uses_records():
+    """Test README, release and contents come from the cached records."""
+    repo = make_github_repo()
+    records = {
+        "readme": {"content": "# Alpha\n\nOption pricing models."},
+        "tree": {"entries": [{"path": "README.md", "type": "blob", "size": 30}]},
+        "releases": {"releases": [{"tag": "v2", "name": "Two", "published_at": None}]},
+    }
+
+    data = fetch_repo_data(repo, records=records)
+
+    assert data["readme"] == "# Alpha\n\nOption pricing models."
+    assert data["latest_release"]["tag"] == "v2"
+    assert data["research_metadata"] is not None
+    repo.get_readme.assert_not_called()
+    repo.get_releases.assert_not_called()
+    repo.get_contents.assert_not_called()
+
+
+def test_fetch_repo_data_without_readme():
+    """Test a missing README record gives the placeholder text."""
+    data = fetch_repo_data(make_github_repo(), records={"readme": {"content": None}})
+
+    assert data["readme"] == "No README available"
+    assert data["latest_release"] is None
+
+
+def test_read_repository_records(temp_dir):
+    """Test records are read through the fetcher's cache and failures are left out."""
+    fetcher = GitHubFetcher(Settings(cache=CacheConfig(directory=temp_dir / "cache")))
+    fetcher.github = Mock()
+    lazy_repo = fetcher.github.withLazy.return_value.get_repo.return_value
+    lazy_repo.get_readme.return_value.decoded_content = b"# Alpha"
+    lazy_repo.get_git_tree.side_effect = RuntimeError("boom")
+    lazy_repo.get_releases.return_value.get_page.return_value = []
+
+    records = asyncio.run(read_repository_records(fetcher, [make_github_repo()], []))
+
+    assert records == {
+        "org/alpha": {"readme": {"content": "# Alpha"}, "releases": {"releases": []}}
+    }
@@ -0,0 +1,50 @@
+"""Tests for the markdown page templates."""
+
+from pathlib import Path
+
+import pytest
+from generate_markdown import setup_jinja_env
+
+ROOT = Path(__file__).parents[3]
+
+
+@pytest.fixture
+def template(monkeypatch):
+    """The repository page template, loaded as generate_markdown loads it."""
+    monkeypatch.chdir(ROOT)
+    return setup_jinja_env().get_template("repo_research.md.j2")
+
+
+def table_rows(page, header):
+    """Lines of the markdown table starting at header, up to the first blank line."""
+    lines = page.splitlines()
+    start = lines.index(header)
+    end = lines.index("", start)
+    return lines[start:end]
+
+
+def test_dependencies_table_has_no_blank_lines(template):
+    """Test dependency rows directly follow the table header."""
+    dependencies = [
+        {"package": "numpy", "specifier": ">=1.24", "manifest": "requirements.txt", "used_by": 3},
+        {"package": "pandas", "specifier": None, "manifest": "pyproject.toml", "used_by": 1},
+    ]
+
+    page = template.render(repo={"name": "alpha"}, dependencies=dependencies)
+
+    assert table_rows(page, "| Package | Version | Manifest | Used by |")[2:] == [
+        "| `numpy` | >=1.24 | requirements.txt | 3 repo(s) |",
+        "| `pandas` | any | pyproject.toml | 1 repo(s) |",
+    ]
+
+
+def test_related_table_has_no_blank_lines(template):
+    """Test related repository rows directly follow the table header."""
+    related = [{"repo": "beta", "score": 0.812}, {"repo": "gamma", "score": 0.4}]
+
+    page = template.render(repo={"name": "alpha"}, related=related)
+
+    assert table_rows(page, "| Repository | Similarity |")[2:] == [
+        "| [beta](beta.md) | 81% |",
+        "| [gamma](gamma.md) | 40% |",
+    ]
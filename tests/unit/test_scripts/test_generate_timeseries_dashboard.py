@@ -0,0 +1,62 @@
+"""Tests for the time-series dashboard charts."""
+
+import pytest
+
+pytest.importorskip("plotly")
+
+from generate_timeseries_dashboard import (  # noqa: E402
+    create_issues_trend_chart,
+    create_stars_forks_chart,
+    record_snapshot,
+)
+
+from src.research_platform.models.repository import Repository  # noqa: E402
+from src.research_platform.storage.timeseries import MetricsStore  # noqa: E402
+
+
+@pytest.fixture
+def repositories():
+    """Two repositories, one with open issues."""
+    return [
+        Repository(
+            id=1,
+            name="pricing-engine",
+            full_name="org/pricing-engine",
+            stars=40,
+            forks=7,
+            open_issues=3,
+        ),
+        Repository(id=2, name="risk-notebooks", full_name="org/risk-notebooks", stars=5),
+    ]
+
+
+@pytest.fixture
+def store(temp_dir, repositories):
+    """Metrics store holding today's snapshot."""
+    store = MetricsStore(temp_dir / "metrics.npz")
+    record_snapshot(repositories, store)
+    return store
+
+
+def test_stars_forks_chart_keeps_per_repository_bars(store, repositories, temp_dir):
+    """Test the popularity chart shows repositories next to the organization history."""
+    output = temp_dir / "stars_forks.html"
+
+    create_stars_forks_chart(store, repositories, output)
+
+    html = output.read_text()
+    assert "Stars by Repository" in html
+    assert "pricing-engine" in html and "risk-notebooks" in html
+    assert "Total Stars" in html
+
+
+def test_issues_chart_keeps_per_repository_bars(store, repositories, temp_dir):
+    """Test the issues chart lists repositories with open issues and the trend."""
+    output = temp_dir / "issues.html"
+
+    create_issues_trend_chart(store, repositories, output)
+
+    html = output.read_text()
+    assert "Open Issues by Repository" in html
+    assert "pricing-engine" in html and "risk-notebooks" not in html
+    assert "Open Issues Over Time" in html
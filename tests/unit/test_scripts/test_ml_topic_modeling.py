@@ -0,0 +1,50 @@
+"""Tests for the ML topic modeling script."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+
+from ml_topic_modeling import MLTopicModeler  # noqa: E402
+
+THEMES = [
+    "portfolio risk volatility returns asset pricing hedge equity",
+    "neural network deep learning training gradient layer tensor",
+    "blockchain ledger token smart contract crypto wallet mining",
+]
+
+
+@pytest.fixture
+def documents():
+    """Thirty README texts drawn from three themes."""
+    rng = np.random.default_rng(0)
+    return [" ".join(rng.choice(THEMES[i % 3].split(), size=20)) for i in range(30)]
+
+
+class TestMLTopicModeler:
+    """Tests for MLTopicModeler."""
+
+    @pytest.mark.parametrize("persist", [False, True])
+    def test_extract_topics_lda(self, documents, temp_dir, persist):
+        """Test LDA topics are extracted end to end, with and without a model directory."""
+        modeler = MLTopicModeler(n_topics=3, model_dir=temp_dir if persist else None)
+        names = [f"repo{i}" for i in range(len(documents))]
+
+        results = modeler.extract_topics_lda(documents, names)
+
+        assert "error" not in results
+        assert results["method"] == "LDA"
+        assert results["n_topics"] == 3
+        assert len(results["repository_topics"]) == len(documents)
+        assert all(topic["words"] for topic in results["topics"])
+        assert (temp_dir / "lda.joblib").exists() == persist
+
+    def test_extract_topics_nmf_accepts_tokens(self, documents):
+        """Test corpus token lists are modeled like texts."""
+        modeler = MLTopicModeler(n_topics=3)
+        names = [f"repo{i}" for i in range(len(documents))]
+
+        results = modeler.extract_topics_nmf([doc.split() for doc in documents], names)
+
+        assert results["n_topics"] == 3
+        assert results["vocabulary_size"] > 0
@@ -0,0 +1,134 @@
+"""Tests for the content-addressed blob store."""
+
+import json
+
+import pytest
+
+from research_platform.storage.blobs import BLOB_KEY, BlobStore, LazyBlobDict, is_blob_ref
+
+LONG_README = "# Project\n\n" + "Research code for portfolio optimization. " * 20
+
+
+@pytest.fixture
+def blob_store(temp_dir):
+    """Create a BlobStore in a temporary directory."""
+    return BlobStore(temp_dir / "blobs")
+
+
+class TestBlobStore:
+    """Tests for BlobStore storage."""
+
+    def test_put_and_get(self, blob_store):
+        """Test storing and reading text by digest."""
+        digest = blob_store.put("hello world")
+
+        assert digest == BlobStore.digest("hello world")
+        assert digest in blob_store
+        assert blob_store.get_text(digest) == "hello world"
+
+    def test_put_deduplicates(self, blob_store):
+        """Test identical content is stored once."""
+        first = blob_store.put(LONG_README)
+        second = blob_store.put(LONG_README)
+
+        assert first == second
+        assert len(list(blob_store.root.glob("??/*"))) == 1
+
+    def test_blobs_are_compressed(self, blob_store):
+        """Test blobs take less space than the raw text."""
+        digest = blob_store.put(LONG_README)
+        assert blob_store.path_for(digest).stat().st_size < len(LONG_README)
+
+    def test_missing_blob_raises_key_error(self, blob_store):
+        """Test reading an unknown digest."""
+        with pytest.raises(KeyError):
+            blob_store.get_bytes("0" * 64)
+
+
+class TestRecordExternalization:
+    """Tests for externalizing repository records."""
+
+    def test_externalize_and_hydrate_round_trip(self, blob_store):
+        """Test heavy fields are replaced by references and restored."""
+        record = {
+            "name": "repo",
+            "readme": LONG_README,
+            "metadata": {
+                "license": "MIT",
+                "requirements_txt": "numpy\n" * 100,
+                "code_files": {"main.py": "print('x')\n" * 50, "tiny.py": "pass"},
+            },
+        }
+
+        stored = blob_store.externalize(record)
+
+        assert is_blob_ref(stored["readme"])
+        assert is_blob_ref(stored["metadata"]["requirements_txt"])
+        assert is_blob_ref(stored["metadata"]["code_files"]["main.py"])
+        assert stored["metadata"]["code_files"]["tiny.py"] == "pass"
+        assert stored["metadata"]["license"] == "MIT"
+        assert record["readme"] == LONG_README  # input untouched
+        assert blob_store.hydrate(stored) == record
+
+    def test_short_sentinels_stay_inline(self, blob_store):
+        """Test short values such as sentinels are not externalized."""
+        stored = blob_store.externalize({"readme": "No README available"})
+        assert stored["readme"] == "No README available"
+
+    def test_resolve_passes_plain_values_through(self, blob_store):
+        """Test resolve leaves non-reference values alone."""
+        assert blob_store.resolve("inline text") == "inline text"
+        assert blob_store.resolve(None) is None
+
+    def test_garbage_collect_removes_unreferenced(self, blob_store):
+        """Test unreferenced blobs are deleted."""
+        kept = blob_store.externalize({"readme": LONG_README})
+        orphan = blob_store.put("orphan " * 100)
+
+        removed = blob_store.garbage_collect(blob_store.referenced([kept]))
+
+        assert removed == 1
+        assert orphan not in blob_store
+        assert kept["readme"][BLOB_KEY] in blob_store
+
+
+class TestLazyBlobDict:
+    """Tests for lazily resolved record fields."""
+
+    def test_resolves_on_access(self, blob_store):
+        """Test references are resolved when read and cached in place."""
+        lazy = LazyBlobDict({"readme": blob_store.ref(LONG_README)}, store=blob_store)
+
+        assert is_blob_ref(lazy.raw()["readme"])
+        assert lazy["readme"] == LONG_README
+        assert lazy.raw()["readme"] == LONG_README
+
+    def test_get_items_and_pop_resolve(self, blob_store):
+        """Test the read helpers return resolved text."""
+        lazy = LazyBlobDict(
+            {"readme": blob_store.ref(LONG_README), "license": "MIT"}, store=blob_store
+        )
+
+        assert lazy.get("readme") == LONG_README
+        assert lazy.get("missing", "x") == "x"
+        assert dict(lazy.items()) == {"readme": LONG_README, "license": "MIT"}
+        assert lazy.pop("readme") == LONG_README
+        assert "readme" not in lazy
+
+    def test_copies_resolve(self, blob_store):
+        """Test dict(), unpacking, copy() and json.dumps never expose references."""
+        metadata = LazyBlobDict({"readme": blob_store.ref(LONG_README)}, store=blob_store)
+
+        assert dict(metadata) == {"readme": LONG_README}
+        assert {**metadata} == {"readme": LONG_README}
+        assert json.loads(json.dumps(metadata)) == {"readme": LONG_README}
+
+    def test_copy_and_setdefault(self, blob_store):
+        """Test copy() stays lazy and setdefault() returns resolved text."""
+        metadata = LazyBlobDict({"readme": blob_store.ref(LONG_README)}, store=blob_store)
+
+        copied = metadata.copy()
+        assert isinstance(copied, LazyBlobDict)
+        assert copied["readme"] == LONG_README
+        assert metadata.setdefault("readme", "") == LONG_README
+        assert metadata.setdefault("license", "MIT") == "MIT"
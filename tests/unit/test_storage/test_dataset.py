@@ -0,0 +1,121 @@
+"""Tests for the partitioned repository dataset."""
+
+import json
+
+import pytest
+
+from research_platform.storage.dataset import RepositoryDataset, load_repository_records
+
+
+@pytest.fixture
+def records():
+    """Repository records as stored in data/repos.json."""
+    return [
+        {
+            "name": f"repo-{i}",
+            "full_name": f"org/repo-{i}",
+            "stars": i,
+            "language": "Python" if i % 2 else "R",
+            "archived": i == 3,
+            "readme": f"# Repo {i}\n" * 10,
+            "research_metadata": {"publications": [{"doi": f"10.1/{i}"}]} if i % 3 == 0 else {},
+        }
+        for i in range(20)
+    ]
+
+
+@pytest.fixture
+def dataset(temp_dir, records):
+    """Dataset written from the records."""
+    dataset = RepositoryDataset(temp_dir / "repos", num_shards=4)
+    dataset.write(records)
+    return dataset
+
+
+class TestRepositoryDataset:
+    """Tests for RepositoryDataset."""
+
+    def test_round_trip_preserves_order(self, dataset, records):
+        """Test reading everything returns the records in write order."""
+        assert dataset.load() == records
+        assert len(dataset) == 20
+
+    def test_projection_reads_only_requested_groups(self, dataset, temp_dir):
+        """Test projected reads return only the requested fields."""
+        (temp_dir / "repos" / "readme").rename(temp_dir / "readme-moved")
+
+        loaded = dataset.load(columns=["name", "stars"])
+
+        assert loaded[0] == {"name": "repo-0", "stars": 0}
+        assert set(dataset.load(columns=["*"])[0]) == {
+            "name",
+            "full_name",
+            "stars",
+            "language",
+            "archived",
+        }
+
+    def test_filters(self, dataset):
+        """Test ANDed predicates on core fields."""
+        loaded = dataset.load(
+            columns=["name"],
+            filters=[("language", "==", "Python"), ("stars", ">=", 15), ("archived", "==", False)],
+        )
+
+        assert [r["name"] for r in loaded] == ["repo-15", "repo-17", "repo-19"]
+        assert dataset.load(filters=[("stars", "in", [2, 4])])[1]["name"] == "repo-4"
+
+    def test_statistics_skip_shards(self, dataset):
+        """Test shards whose min/max exclude a filter are not opened."""
+        opened = []
+        read_shard = dataset._read_shard
+
+        def tracking(shard, *args):
+            opened.append(shard)
+            return read_shard(shard, *args)
+
+        dataset._read_shard = tracking
+        assert dataset.load(filters=[("stars", ">", 100)]) == []
+        assert opened == []
+
+    def test_upsert_rewrites_one_shard(self, dataset, records):
+        """Test updating and inserting single repositories."""
+        updated = dict(records[5], stars=500)
+        dataset.upsert(updated)
+        dataset.upsert({"name": "new", "full_name": "org/new", "stars": 1})
+
+        loaded = dataset.load(columns=["name", "stars"])
+        assert loaded[5] == {"name": "repo-5", "stars": 500}
+        assert loaded[-1] == {"name": "new", "stars": 1}
+        assert dataset.get("org/repo-5")["readme"] == records[5]["readme"]
+
+    def test_delete(self, dataset):
+        """Test removing a repository."""
+        assert dataset.delete("org/repo-0") is True
+        assert dataset.delete("org/missing") is False
+        assert dataset.get("org/repo-0") is None
+        assert len(dataset) == 19
+
+
+class TestLoadRepositoryRecords:
+    """Tests for load_repository_records."""
+
+    def test_prefers_dataset(self, temp_dir, records):
+        """Test the dataset is used when present."""
+        RepositoryDataset(temp_dir / "repos").write(records[:2])
+        (temp_dir / "repos.json").write_text(json.dumps(records))
+
+        assert len(load_repository_records(temp_dir)) == 2
+
+    def test_falls_back_to_json(self, temp_dir, records):
+        """Test repos.json is read with the same projection and filters."""
+        (temp_dir / "repos.json").write_text(json.dumps(records))
+
+        loaded = load_repository_records(temp_dir, ["name"], [("stars", "<", 2)])
+
+        assert loaded == [{"name": "repo-0"}, {"name": "repo-1"}]
+
+    def test_missing_data(self, temp_dir):
+        """Test a clear error when no data exists."""
+        with pytest.raises(FileNotFoundError):
+            load_repository_records(temp_dir)
@@ -0,0 +1,102 @@
+"""Tests for the memoized repository data store."""
+
+import json
+
+import pytest
+
+from research_platform.storage.blobs import BlobStore
+from research_platform.storage.datastore import DataStore, get_datastore
+
+
+@pytest.fixture
+def records():
+    """Repository records as stored in data/repos.json."""
+    return [
+        {
+            "name": f"repo-{i}",
+            "full_name": f"org/repo-{i}",
+            "stars": i,
+            "language": "Python" if i % 2 else "R",
+            "created_at": "2024-01-01T00:00:00Z",
+            "metadata": {"readme": f"# Repo {i}\n" * 100},
+        }
+        for i in range(10)
+    ]
+
+
+@pytest.fixture
+def store(temp_dir, records):
+    """Store over a data directory with the records written."""
+    store = DataStore(temp_dir)
+    store.write([store.blobs.externalize(r) for r in records])
+    return store
+
+
+class TestDataStore:
+    """Tests for DataStore."""
+
+    def test_views_are_loaded_once(self, store):
+        """Test repeated access returns the same shared objects."""
+        assert store.records() is store.records()
+        assert store.repositories() is store.repositories()
+        assert store.table() is store.table()
+        assert len(store.repositories()) == 10
+        assert store.table().numeric["stars"].sum() == 45
+
+    def test_projection_served_from_full_records(self, store, temp_dir):
+        """Test projections reuse already loaded records instead of reading again."""
+        store.records()
+        (temp_dir / "repos" / "core").rename(temp_dir / "core-moved")
+
+        assert store.records(["name", "stars"])[3] == {"name": "repo-3", "stars": 3}
+
+    def test_repositories_resolve_blobs_lazily(self, store, records):
+        """Test heavy fields are resolved from the blob store on access."""
+        repo = store.repositories()[2]
+
+        assert repo.metadata.raw()["readme"] != records[2]["metadata"]["readme"]
+        assert repo.metadata["readme"] == records[2]["metadata"]["readme"]
+
+    def test_export_is_self_contained(self, store, records, temp_dir):
+        """Test repos.json holds the text of externalized fields, not blob references."""
+        with open(temp_dir / "repos.json", encoding="utf-8") as f:
+            exported = json.load(f)
+
+        assert exported == records
+        assert store.records()[0]["metadata"]["readme"] != records[0]["metadata"]["readme"]
+
+    def test_write_invalidates(self, store, records):
+        """Test writing through the store drops cached views."""
+        before = store.records()
+        store.write(records[:4])
+
+        assert store.records() is not before
+        assert len(store.records()) == 4
+        assert len(store.table()) == 4
+
+    def test_external_write_invalidates(self, store, temp_dir, records):
+        """Test a dataset rewritten by another writer is picked up."""
+        before = store.repositories()
+        DataStore(temp_dir).upsert({**records[0], "stars": 100})
+
+        assert store.repositories() is not before
+        assert store.records()[0]["stars"] == 100
+
+    def test_falls_back_to_repos_json(self, temp_dir, records):
+        """Test records load from repos.json when no dataset exists."""
+        with open(temp_dir / "repos.json", "w", encoding="utf-8") as f:
+            json.dump(records, f)
+
+        store = DataStore(temp_dir, blobs=BlobStore(temp_dir / "blobs"))
+
+        assert [r["name"] for r in store.records()] == [r["name"] for r in records]
+
+    def test_missing_data(self, temp_dir):
+        """Test a missing data directory raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            DataStore(temp_dir).records()
+
+    def test_get_datastore_is_shared(self, temp_dir):
+        """Test the process-wide store is reused per data directory."""
+        assert get_datastore(temp_dir) is get_datastore(str(temp_dir))
+        assert get_datastore(temp_dir) is not get_datastore(temp_dir / "other")
@@ -0,0 +1,111 @@
+"""Tests for the reverse-dependency index."""
+
+import sqlite3
+
+from research_platform.storage.dependency_index import DependencyIndex
+
+
+class TestDependencyIndex:
+    """Tests for DependencyIndex."""
+
+    def test_dependents_and_dependencies(self, temp_dir):
+        """Test both directions of the index, with usage counts."""
+        with DependencyIndex(temp_dir / "deps.db") as index:
+            index.update(
+                "a", "f1", [("numpy", "requirements", ">=1.24"), ("pandas", "pyproject", "")]
+            )
+            index.update("b", "f2", [("numpy", "requirements", "==1.26")])
+
+            assert index.dependents("numpy") == [
+                {"repo": "a", "manifest": "requirements", "specifier": ">=1.24"},
+                {"repo": "b", "manifest": "requirements", "specifier": "==1.26"},
+            ]
+            assert index.dependencies("a") == [
+                {
+                    "package": "numpy",
+                    "manifest": "requirements",
+                    "specifier": ">=1.24",
+                    "used_by": 2,
+                },
+                {"package": "pandas", "manifest": "pyproject", "specifier": "", "used_by": 1},
+            ]
+            assert index.package_usage() == [("numpy", 2), ("pandas", 1)]
+            assert index.totals() == {"repositories": 2, "packages": 2, "dependencies": 3}
+
+    def test_unchanged_fingerprint_is_skipped(self, temp_dir):
+        """Test a repository is only re-indexed when its manifests change."""
+        with DependencyIndex(temp_dir / "deps.db") as index:
+            assert index.update("a", "f1", [("numpy", "requirements", "")])
+            assert not index.update("a", "f1", [("scipy", "requirements", "")])
+            assert index.update("a", "f2", [("scipy", "requirements", "")])
+
+            assert index.dependents("numpy") == []
+            assert index.package_usage() == [("scipy", 1)]
+
+    def test_version_drift(self, temp_dir):
+        """Test packages declared with several specifiers are reported."""
+        with DependencyIndex(temp_dir / "deps.db") as index:
+            index.update(
+                "a", "f1", [("numpy", "requirements", ">=1.24"), ("scipy", "requirements", "")]
+            )
+            index.update(
+                "b", "f2", [("numpy", "pyproject", "==1.26"), ("scipy", "requirements", "")]
+            )
+            index.update("c", "f3", [("numpy", "requirements", ">=1.24")])
+
+            assert index.version_drift() == {"numpy": {"==1.26": ["b"], ">=1.24": ["a", "c"]}}
+
+            index.remove("b")
+            assert index.version_drift() == {}
+            assert index.repos() == ["a", "c"]
+
+    def test_lock_file_pins_are_not_drift(self, temp_dir):
+        """Test exact versions pinned by lock files do not count as drift."""
+        with DependencyIndex(temp_dir / "deps.db") as index:
+            index.update(
+                "a", "f1", [("numpy", "pyproject", "^1.24"), ("numpy", "poetry_lock", "==1.26.4")]
+            )
+            index.update(
+                "b", "f2", [("numpy", "pyproject", "^1.24"), ("numpy", "poetry_lock", "==1.26.0")]
+            )
+
+            assert index.version_drift() == {}
+
+            index.update("c", "f3", [("numpy", "requirements", ">=2.0")])
+            assert index.version_drift() == {"numpy": {">=2.0": ["c"], "^1.24": ["a", "b"]}}
+
+    def test_lock_file_pins_are_not_usage(self, temp_dir):
+        """Test packages only pinned by a lock file are left out of usage and totals."""
+        with DependencyIndex(temp_dir / "deps.db") as index:
+            index.update(
+                "a", "f1", [("numpy", "pyproject", "^1.24"), ("six", "poetry_lock", "==1.16.0")]
+            )
+
+            assert index.package_usage() == [("numpy", 1)]
+            assert index.totals() == {"repositories": 1, "packages": 1, "dependencies": 1}
+            assert index.dependencies("a")[1] == {
+                "package": "six",
+                "manifest": "poetry_lock",
+                "specifier": "==1.16.0",
+                "used_by": 0,
+            }
+
+    def test_older_index_version_is_emptied(self, temp_dir):
+        """Test an index written by an older version is re-indexed from scratch."""
+        with DependencyIndex(temp_dir / "deps.db") as index:
+            index.update("a", "f1", [("numpy", "requirements", "")])
+        with sqlite3.connect(temp_dir / "deps.db") as conn:
+            conn.execute("PRAGMA user_version = 1")
+
+        with DependencyIndex(temp_dir / "deps.db") as index:
+            assert index.fingerprint("a") is None
+            assert index.package_usage() == []
+
+    def test_persists_across_connections(self, temp_dir):
+        """Test the index is reloaded from disk."""
+        with DependencyIndex(temp_dir / "deps.db") as index:
+            index.update("a", "f1", [("numpy", "requirements", "")])
+
+        with DependencyIndex(temp_dir / "deps.db") as index:
+            assert index.fingerprint("a") == "f1"
+            assert index.dependents("numpy")[0]["repo"] == "a"
@@ -0,0 +1,136 @@
+"""Tests for the citation history snapshot log."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from research_platform.storage.history import (
+    DAY_SECONDS,
+    CitationHistoryLog,
+    snapshot_metrics,
+)
+
+# Fixed reference time (2025-01-01T00:00:00Z)
+NOW = 1735689600
+
+
+@pytest.fixture
+def log(temp_dir):
+    """Empty history log."""
+    with CitationHistoryLog(temp_dir / "history.db") as log:
+        yield log
+
+
+def daily(log, days, repo="repo-a"):
+    """Append one snapshot per day for the given number of days before NOW."""
+    for day in range(days, 0, -1):
+        log.append({repo: {"external_citations": days - day, "stars": 1}}, NOW - day * DAY_SECONDS)
+
+
+class TestCitationHistoryLog:
+    """Tests for CitationHistoryLog."""
+
+    def test_append_and_series(self, log):
+        """Test snapshots are returned oldest first with all metrics."""
+        log.append({"repo-a": {"external_citations": 5}}, NOW)
+        log.append({"repo-a": {"external_citations": 3}}, NOW - DAY_SECONDS)
+
+        series = log.series("repo-a")
+
+        assert [s["external_citations"] for s in series] == [3, 5]
+        assert series[0]["stars"] == 0
+        assert series[1]["timestamp"] == datetime.fromtimestamp(NOW).isoformat()
+
+    def test_growth_over_window(self, log):
+        """Test growth uses the first and last snapshot inside the window."""
+        daily(log, 30)
+
+        growth = log.growth("repo-a", start=NOW - 10 * DAY_SECONDS)
+
+        assert growth["delta"]["external_citations"] == 9
+        assert growth["seconds"] == 9 * DAY_SECONDS
+        assert growth["snapshots"] == 10
+        assert log.growth("repo-a", start=NOW) is None
+        assert log.growth("missing") is None
+
+    def test_compact_downsamples_old_snapshots(self, log):
+        """Test old snapshots keep one point per week, then per month."""
+        daily(log, 500)
+        latest = log.series("repo-a")[-1]
+
+        removed = log.compact(now=NOW)
+        series = log.series("repo-a")
+
+        assert removed > 0
+        assert len(log) < 200
+        # Recent snapshots are untouched
+        assert len(log.series("repo-a", start=NOW - 90 * DAY_SECONDS)) == 90
+        # Older ones are at least a week apart (end-of-month points can be 5 weeks apart)
+        old = [s for s in series if s["timestamp"] < series[-90]["timestamp"]]
+        gaps = [
+            datetime.fromisoformat(b["timestamp"]) - datetime.fromisoformat(a["timestamp"])
+            for a, b in zip(old, old[1:])
+        ]
+        assert all(7 <= gap.days <= 35 for gap in gaps)
+        assert series[-1] == latest
+        # Counters keep their end-of-period values, so total growth is preserved
+        assert log.growth("repo-a")["delta"]["external_citations"] == (
+            latest["external_citations"] - series[0]["external_citations"]
+        )
+
+    def test_compact_if_due(self, log):
+        """Test automatic compaction runs at most once per interval."""
+        daily(log, 200)
+
+        assert log.compact_if_due(now=NOW) > 0
+        daily(log, 200, repo="repo-b")
+        assert log.compact_if_due(now=NOW + DAY_SECONDS) == 0
+        assert log.compact_if_due(now=NOW + 8 * DAY_SECONDS) > 0
+
+    def test_import_json(self, log, temp_dir):
+        """Test migrating the legacy JSON history."""
+        legacy = {
+            "repo-a": [
+                {"timestamp": "2024-12-01T10:00:00", "external_citations": 1, "stars": 2},
+                {"timestamp": "2024-12-08T10:00:00.123456", "external_citations": 4, "stars": 3},
+            ]
+        }
+        path = temp_dir / "citation_history.json"
+        path.write_text(json.dumps(legacy), encoding="utf-8")
+
+        assert log.import_json(path) == 2
+        assert log.growth("repo-a")["delta"]["external_citations"] == 3
+
+    def test_persists_across_connections(self, temp_dir):
+        """Test snapshots survive reopening the database."""
+        with CitationHistoryLog(temp_dir / "history.db") as log:
+            log.append({"repo-a": {"stars": 1}}, NOW)
+
+        with CitationHistoryLog(temp_dir / "history.db") as log:
+            assert log.repos() == ["repo-a"]
+
+
+class TestSnapshotMetrics:
+    """Tests for snapshot_metrics."""
+
+    def test_counts_publications_and_citations(self):
+        """Test counters are derived from research metadata."""
+        records = [
+            {
+                "name": "repo-a",
+                "stars": 3,
+                "research_metadata": {"publications": [{"citation_count": 2}, {}]},
+            },
+            {"name": "repo-b", "research_metadata": None},
+        ]
+
+        snapshots = snapshot_metrics(records)
+
+        assert snapshots["repo-a"] == {
+            "external_citations": 2,
+            "publications_count": 2,
+            "stars": 3,
+            "forks": 0,
+        }
+        assert snapshots["repo-b"]["publications_count"] == 0
@@ -0,0 +1,42 @@
+"""Tests for the local package index snapshot."""
+
+import json
+
+from research_platform.storage.package_index import PackageIndex, requirement_names
+
+
+class TestPackageIndex:
+    """Tests for PackageIndex."""
+
+    def test_requirement_names(self):
+        """Test names are normalized and extras-only requirements skipped."""
+        requirements = [
+            "numpy>=1.22",
+            "python_dateutil (>=2.8)",
+            'pytest; extra == "test"',
+            "tzdata>=2022.1",
+        ]
+
+        assert requirement_names("pypi", requirements) == ["numpy", "python-dateutil", "tzdata"]
+        assert requirement_names("npm", {"@babel/core": "^7.0", "react": "18"}) == [
+            "@babel/core",
+            "react",
+        ]
+
+    def test_import_and_lookup(self, temp_dir):
+        """Test a JSON snapshot is imported and looked up by normalized name."""
+        snapshot = {
+            "pypi": {"Pandas": ["numpy>=1.22", "python-dateutil"], "numpy": []},
+            "npm": {"react": {"loose-envify": "^1.1"}},
+        }
+        path = temp_dir / "snapshot.json"
+        path.write_text(json.dumps(snapshot), encoding="utf-8")
+
+        with PackageIndex(temp_dir / "index.db") as index:
+            assert index.import_json(path) == 3
+            assert len(index) == 3
+            assert index.requirements("pypi", ["pandas", "numpy", "missing"]) == {
+                "pandas": ("numpy", "python-dateutil"),
+                "numpy": (),
+            }
+            assert index.requirements("npm", ["react"]) == {"react": ("loose-envify",)}
@@ -0,0 +1,58 @@
+"""Tests for the per-content result cache."""
+
+import pytest
+
+from research_platform.storage.results import ResultCache
+
+
+@pytest.fixture
+def cache(temp_dir):
+    """Empty result cache."""
+    with ResultCache(temp_dir / "results.sqlite", namespace="test", version="1") as cache:
+        yield cache
+
+
+class TestResultCache:
+    """Tests for ResultCache."""
+
+    def test_round_trip(self, cache):
+        """Test stored results are returned for their keys only."""
+        cache.put_many({"a": {"loc": 3, "blocks": [1, 2]}, "b": {"loc": 0}})
+
+        assert cache.get_many(["a", "c"]) == {"a": {"loc": 3, "blocks": [1, 2]}}
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert len(cache) == 2
+
+    def test_other_version_is_a_miss(self, cache, temp_dir):
+        """Test entries written by another analyzer version are ignored and replaced."""
+        cache.put_many({"a": {"loc": 3}})
+
+        with ResultCache(temp_dir / "results.sqlite", namespace="test", version="2") as newer:
+            assert newer.get_many(["a"]) == {}
+            newer.put_many({"a": {"loc": 4}})
+            assert newer.get_many(["a"]) == {"a": {"loc": 4}}
+
+        assert cache.get_many(["a"]) == {}
+
+    def test_namespaces_are_separate(self, cache, temp_dir):
+        """Test caches sharing a file do not see each other's entries."""
+        cache.put_many({"a": 1})
+
+        with ResultCache(temp_dir / "results.sqlite", namespace="other", version="1") as other:
+            assert other.get_many(["a"]) == {}
+
+    def test_many_keys(self, cache):
+        """Test lookups larger than one SQL batch."""
+        cache.put_many({str(i): i for i in range(1200)})
+
+        assert len(cache.get_many(str(i) for i in range(0, 2400, 2))) == 600
+
+    def test_prune(self, cache, temp_dir):
+        """Test pruning removes stale versions and long-unused entries."""
+        cache.put_many({"a": 1})
+        with ResultCache(temp_dir / "results.sqlite", namespace="test", version="0") as old:
+            old.put_many({"b": 2})
+
+        assert cache.prune() == 1
+        assert cache.prune(max_age_days=-1) == 1
+        assert len(cache) == 0
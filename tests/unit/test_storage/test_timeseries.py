@@ -0,0 +1,95 @@
+"""Tests for the daily metrics store."""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from research_platform.storage.timeseries import MetricsStore
+
+
+@pytest.fixture
+def store(temp_dir):
+    """Store with three days of snapshots; repo-c appears on the second day."""
+    store = MetricsStore(temp_dir / "metrics.npz")
+    store.record({"repo-a": {"stars": 1, "forks": 2}, "repo-b": {"stars": 5}}, "2025-01-01")
+    store.record({"repo-a": {"stars": 3}}, "2025-01-03")
+    store.record({"repo-a": {"stars": 2}, "repo-c": {"stars": 10}}, "2025-01-02")
+    return store
+
+
+class TestMetricsStore:
+    """Tests for MetricsStore."""
+
+    def test_repository_series(self, store):
+        """Test a repository's series holds only the days it was observed, in date order."""
+        dates, values = store.series("stars", "repo-a")
+        assert dates == ["2025-01-01", "2025-01-02", "2025-01-03"]
+        assert values.tolist() == [1, 2, 3]
+        dates, values = store.series("stars", "repo-b")
+        assert dates == ["2025-01-01"]
+        assert values.tolist() == [5]
+        assert store.series("stars", "missing")[0] == []
+
+    def test_total_carries_values_forward(self, store):
+        """Test organization totals use each repository's latest value as of the day."""
+        dates, values = store.series("stars")
+
+        assert values.tolist() == [6, 17, 18]
+        assert store.series("stars", start="2025-01-02", end="2025-01-02")[1].tolist() == [17]
+
+    def test_recording_a_day_again_overwrites(self, store):
+        """Test snapshots are upserted per day."""
+        store.record({"repo-a": {"stars": 7}}, date(2025, 1, 3))
+
+        assert len(store) == 3
+        assert store.series("stars", "repo-a")[1].tolist() == [1, 2, 7]
+
+    def test_round_trip(self, store, temp_dir):
+        """Test saving and loading restores every metric and observation."""
+        store.save()
+        loaded = MetricsStore(temp_dir / "metrics.npz")
+
+        assert loaded.repos == ["repo-a", "repo-b", "repo-c"]
+        for metric in store.metrics:
+            np.testing.assert_array_equal(loaded.values[metric], store.values[metric])
+        np.testing.assert_array_equal(loaded.observed, store.observed)
+        assert loaded.latest("stars") == {"repo-a": 3, "repo-b": 5, "repo-c": 10}
+
+    def test_saved_deltas_compress(self, temp_dir):
+        """Test a slowly changing history stays small on disk."""
+        store = MetricsStore(temp_dir / "metrics.npz")
+        start = date(2024, 1, 1)
+        for day in range(365):
+            store.record(
+                {f"repo-{i}": {"stars": 100 * i + day // 30} for i in range(50)},
+                start + timedelta(days=day),
+            )
+        store.save()
+
+        assert (temp_dir / "metrics.npz").stat().st_size < 20_000
+
+    def test_rollup(self, temp_dir):
+        """Test weekly and monthly rollups with different aggregations."""
+        store = MetricsStore(temp_dir / "metrics.npz")
+        start = date(2025, 1, 27)  # Monday
+        for day in range(14):
+            store.record({"repo-a": {"stars": day}}, start + timedelta(days=day))
+
+        weeks, last = store.rollup("stars", "week", "last")
+        assert weeks == ["2025-01-27", "2025-02-03"]
+        assert last.tolist() == [6, 13]
+        assert store.rollup("stars", "week", "sum")[1].tolist() == [21, 70]
+
+        months, mean = store.rollup("stars", "month", "mean")
+        assert months == ["2025-01-01", "2025-02-01"]
+        assert mean.tolist() == [2.0, 9.0]
+
+        with pytest.raises(ValueError):
+            store.rollup("stars", "year")
+
+    def test_rate(self, store):
+        """Test average change per day and per 30 days."""
+        assert store.rate("stars", "repo-a") == 1.0
+        assert store.rate("stars", "repo-a", per_days=30) == 30.0
+        assert store.rate("stars", "repo-b") is None